@@ -822,11 +822,20 @@ def copy_db() -> None:
         typer.echo("Pre-release database not found in the cache directory.")
 
 
-async def _migration(*, test: bool, fix: bool) -> None:
+async def _migration(*, test: bool, fix: bool, check: bool) -> None:
     await initialize_services(fix_migration=fix)
     db_service = get_db_service()
     if not test:
         await db_service.run_migrations()
+    if check:
+        from alembic.util.exc import AutogenerateDiffsDetected, CommandError
+
+        try:
+            await db_service.check_migrations()
+        except (AutogenerateDiffsDetected, CommandError) as exc:
+            typer.echo(f"There's a mismatch between the models and the database.\n{exc}", err=True)
+            raise typer.Exit(1) from exc
+        typer.echo("The database schema matches the models.")
     results = await db_service.run_migrations_test()
     display_results(results)
 
@@ -838,6 +847,11 @@ def migration(
         default=False,
         help="Fix migrations. This is a destructive operation, and should only be used if you know what you are doing.",
     ),
+    check: bool = typer.Option(  # noqa: FBT001
+        default=False,
+        help="Compare the database schema with the models using Alembic autogenerate, which startup skips when "
+        "the database is at the head revision.",
+    ),
 ) -> None:
     """Run or test migrations."""
     if fix and not typer.confirm(
@@ -845,7 +859,7 @@ def migration(
     ):
         raise typer.Abort
 
-    asyncio.run(_migration(test=test, fix=fix))
+    asyncio.run(_migration(test=test, fix=fix, check=check))
 
 
 @app.command()
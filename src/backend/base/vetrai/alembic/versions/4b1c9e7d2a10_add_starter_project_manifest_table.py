@@ -0,0 +1,42 @@
+"""add starter_project_manifest table.
+
+Revision ID: 4b1c9e7d2a10
+Revises: 369268b9af8b
+Create Date: 2026-10-19 10:00:00.000000
+
+Phase: EXPAND
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b1c9e7d2a10"  # pragma: allowlist secret
+down_revision: str | None = "369268b9af8b"  # pragma: allowlist secret
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    from vetrai.utils import migration
+
+    conn = op.get_bind()
+    if not migration.table_exists("starter_project_manifest", conn):
+        op.create_table(
+            "starter_project_manifest",
+            sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("name"),
+        )
+
+
+def downgrade() -> None:
+    from vetrai.utils import migration
+
+    conn = op.get_bind()
+    if migration.table_exists("starter_project_manifest", conn):
+        op.drop_table("starter_project_manifest")
@@ -22,6 +22,7 @@ from vetrai.api.utils import (
     format_exception_message,
     get_top_level_vertices,
     parse_exception,
+    patch_cached_graph,
 )
 from vetrai.api.v1.schemas import FlowDataRequest, ResultDataResponse, VertexBuildResponse
 from vetrai.events.event_manager import EventManager
@@ -29,7 +30,7 @@ from vetrai.exceptions.component import ComponentBuildError
 from vetrai.schema.message import ErrorMessage
 from vetrai.schema.schema import OutputValue
 from vetrai.services.database.models.flow.model import Flow
-from vetrai.services.deps import get_chat_service, get_telemetry_service, session_scope
+from vetrai.services.deps import get_chat_service, get_settings_service, get_telemetry_service, session_scope
 from vetrai.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from vetrai.services.telemetry.schema import ComponentInputsPayload, ComponentPayload, PlaygroundPayload
 
@@ -282,6 +283,19 @@ async def generate_flow_events(
         else:
             effective_session_id = flow_id_str
 
+        if get_settings_service().settings.incremental_graph_builds:
+            graph = await patch_cached_graph(
+                flow_id,
+                fresh_session,
+                chat_service,
+                payload=data.model_dump() if data else None,
+                flow_name=flow_name,
+                user_id=str(current_user.id),
+                session_id=effective_session_id,
+            )
+            if graph is not None:
+                return graph
+
         if not data:
             return await build_graph_from_db(
                 flow_id=flow_id,
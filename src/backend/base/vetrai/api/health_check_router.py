@@ -1,11 +1,13 @@
 import uuid
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import JSONResponse
 from lfx.log.logger import logger
 from pydantic import BaseModel
 from sqlmodel import select
 
 from vetrai.api.utils import DbSession
+from vetrai.initial_setup.startup import StartupPhase, startup_state
 from vetrai.services.database.models.flow.model import Flow
 from vetrai.services.deps import get_chat_service
 
@@ -34,6 +36,17 @@ async def health():
     return {"status": "ok"}
 
 
+# /health/ready reports the startup phase without touching any service.
+# It returns 503 while critical startup steps are running, and 200 once the instance is
+# "serving" (background warmup may still be in progress) or fully "warm".
+@health_check_router.get("/health/ready")
+async def readiness():
+    content = startup_state.to_dict()
+    if startup_state.phase == StartupPhase.STARTING:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+    return content
+
+
 # /health_check evaluates key services
 # It's a reliable health check for a vetrai instance
 @health_check_router.get("/health_check")
@@ -10,8 +10,10 @@ from vetrai.api.utils.core import (
     API_WORDS,
     MAX_PAGE_SIZE,
     MIN_PAGE_SIZE,
+    ApiKeyDbReadSession,
     CurrentActiveMCPUser,
     CurrentActiveUser,
+    DbReadSession,
     DbSession,
     EventDeliveryType,
     ValidatedFileName,
@@ -34,6 +36,7 @@ from vetrai.api.utils.core import (
     has_api_terms,
     parse_exception,
     parse_value,
+    patch_cached_graph,
     raise_error_if_astra_cloud_env,
     remove_api_keys,
     validate_is_component,
@@ -46,9 +49,11 @@ __all__ = [
     "API_WORDS",
     "MAX_PAGE_SIZE",
     "MIN_PAGE_SIZE",
+    "ApiKeyDbReadSession",
     "CurrentActiveMCPUser",
     # Type annotations
     "CurrentActiveUser",
+    "DbReadSession",
     "DbSession",
     # Enums
     "EventDeliveryType",
@@ -73,6 +78,7 @@ __all__ = [
     "has_api_terms",
     "parse_exception",
     "parse_value",
+    "patch_cached_graph",
     "raise_error_if_astra_cloud_env",
     "remove_api_keys",
     "validate_is_component",
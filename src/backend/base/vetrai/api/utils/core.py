@@ -15,12 +15,13 @@ from lfx.utils.validate_cloud import raise_error_if_astra_cloud_disable_componen
 from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from vetrai.services.auth.utils import get_current_active_user, get_current_active_user_mcp
+from vetrai.services.auth.utils import api_key_security, get_current_active_user, get_current_active_user_mcp
 from vetrai.services.database.models.flow.model import Flow
 from vetrai.services.database.models.message.model import MessageTable
 from vetrai.services.database.models.transactions.model import TransactionTable
-from vetrai.services.database.models.user.model import User
+from vetrai.services.database.models.user.model import User, UserRead
 from vetrai.services.database.models.vertex_builds.model import VertexBuildTable
+from vetrai.services.deps import get_db_service
 from vetrai.services.store.utils import get_lf_version_from_pypi
 from vetrai.utils.constants import VETRAI_GLOBAL_VAR_HEADER_PREFIX
 
@@ -34,6 +35,9 @@ API_WORDS = ["api", "key", "token"]
 MAX_PAGE_SIZE = 50
 MIN_PAGE_SIZE = 1
 
+# Flows whose cached graph a build took to patch, so that concurrent builds of a flow do not patch and run it too
+_flows_being_patched: set[str] = set()
+
 CurrentActiveUser = Annotated[User, Depends(get_current_active_user)]
 CurrentActiveMCPUser = Annotated[User, Depends(get_current_active_user_mcp)]
 # DbSession with auto-commit for write operations
@@ -42,6 +46,22 @@ DbSession = Annotated[AsyncSession, Depends(injectable_session_scope)]
 DbSessionReadOnly = Annotated[AsyncSession, Depends(injectable_session_scope_readonly)]
 
 
+async def injectable_read_session(current_user: CurrentActiveUser):
+    async with get_db_service().read_session(current_user.id) as session:
+        yield session
+
+
+async def injectable_api_key_read_session(api_key_user: Annotated[UserRead, Depends(api_key_security)]):
+    async with get_db_service().read_session(api_key_user.id) as session:
+        yield session
+
+
+# DbReadSession for read-heavy endpoints: reads from the read replica if one is set, except right after the
+# user wrote, when the replica may not have the writes yet. Nothing is committed.
+DbReadSession = Annotated[AsyncSession, Depends(injectable_read_session)]
+ApiKeyDbReadSession = Annotated[AsyncSession, Depends(injectable_api_key_read_session)]
+
+
 def _get_validated_file_name(file_name: str = Path()) -> str:
     """Validate file_name path parameter to prevent path traversal attacks."""
     if ".." in file_name or "/" in file_name or "\\" in file_name:
@@ -190,6 +210,11 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     session_id = kwargs.get("session_id") or str_flow_id
 
     graph = Graph.from_payload(payload, str_flow_id, flow_name, kwargs.get("user_id"))
+    await _initialize_graph_run(graph, session_id)
+    return graph
+
+
+async def _initialize_graph_run(graph: Graph, session_id: str) -> None:
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -200,6 +225,77 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
 
     graph.session_id = session_id
     await graph.initialize_run()
+
+
+async def patch_cached_graph(
+    flow_id: uuid.UUID,
+    session: AsyncSession,
+    chat_service: ChatService,
+    *,
+    payload: dict | None,
+    flow_name: str | None,
+    user_id: str,
+    session_id: str,
+) -> Graph | None:
+    """Update the cached graph of the previous build of a flow to the current version of the flow.
+
+    Only the components that were added or changed are instantiated again. `payload` is the flow data sent by the
+    client, or None to use the data saved in the database.
+
+    Returns None if the flow must be built again instead: nothing is cached for it, its graph is still running or
+    taken by another build, it belongs to another user or it cannot be patched.
+    """
+    flow_id_str = str(flow_id)
+    cached = await chat_service.get_cache(flow_id_str)
+    graph = cached.get("result") if isinstance(cached, dict) else None
+    if (
+        not isinstance(graph, Graph)
+        or graph.user_id != user_id
+        or graph.run_manager.vertices_being_run
+        or flow_id_str in _flows_being_patched
+    ):
+        return None
+
+    # The graph is taken before the first await, and it stays out of the cache until the build caches it again
+    # with the vertices it runs, so no other build can patch or run it in between
+    _flows_being_patched.add(flow_id_str)
+    try:
+        await chat_service.clear_cache(flow_id_str)
+        return await _patch_graph(graph, flow_id, session, payload=payload, flow_name=flow_name, session_id=session_id)
+    finally:
+        _flows_being_patched.discard(flow_id_str)
+
+
+async def _patch_graph(
+    graph: Graph,
+    flow_id: uuid.UUID,
+    session: AsyncSession,
+    *,
+    payload: dict | None,
+    flow_name: str | None,
+    session_id: str,
+) -> Graph | None:
+    flow_id_str = str(flow_id)
+    if payload is None or not flow_name:
+        flow = await session.get(Flow, flow_id)
+        if flow is None or not flow.data:
+            return None
+        payload = flow.data if payload is None else payload
+        flow_name = flow.name
+
+    try:
+        affected = graph.patch(payload)
+    except Exception:  # noqa: BLE001
+        # The graph may be half updated, it is left out of the cache
+        await logger.adebug(f"Could not patch the graph of flow {flow_id_str}, building it again", exc_info=True)
+        return None
+    if affected is None:
+        return None
+
+    await logger.adebug(f"Patched the graph of flow {flow_id_str}, {len(affected)} vertices affected")
+    graph.flow_name = flow_name
+    graph.set_run_id()
+    await _initialize_graph_run(graph, session_id)
     return graph
 
 
@@ -332,6 +428,10 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
 
+    from vetrai.api.v1.mcp_utils import invalidate_mcp_tools_cache
+
+    invalidate_mcp_tools_cache(flow_id)
+
 
 def custom_params(
     page: int | None = Query(None),
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import time
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
@@ -321,6 +322,8 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
         - Tracks and logs timing metrics for queue time and client processing time
         - Notifies client consumption via client_consumed_queue
     """
+    # Checked once, so streams of many small events do not format debug logs that are discarded
+    debug_logging = logger.is_enabled_for(logging.DEBUG)
     while True:
         event_id, value, put_time = await queue.get()
         if value is None:
@@ -329,11 +332,12 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
         yield value
         get_time_yield = time.time()
         client_consumed_queue.put_nowait(event_id)
-        await logger.adebug(
-            f"consumed event {event_id} "
-            f"(time in queue, {get_time - put_time:.4f}, "
-            f"client {get_time_yield - get_time:.4f})"
-        )
+        if debug_logging:
+            await logger.adebug(
+                f"consumed event {event_id} "
+                f"(time in queue, {get_time - put_time:.4f}, "
+                f"client {get_time_yield - get_time:.4f})"
+            )
 
 
 async def run_flow_generator(
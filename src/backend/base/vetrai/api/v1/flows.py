@@ -21,10 +21,19 @@ from lfx.log import logger
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from vetrai.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from vetrai.api.utils import (
+    CurrentActiveUser,
+    DbReadSession,
+    DbSession,
+    cascade_delete_flow,
+    remove_api_keys,
+    validate_is_component,
+)
+from vetrai.api.v1.mcp_utils import invalidate_mcp_tools_cache
 from vetrai.api.v1.schemas import FlowListCreate
 from vetrai.helpers.user import get_user_by_flow_id_or_endpoint_name
 from vetrai.initial_setup.constants import STARTER_FOLDER_NAME
+from vetrai.initial_setup.setup import request_flow_fs_resync
 from vetrai.services.auth.utils import get_current_active_user
 from vetrai.services.database.models.flow.model import (
     AccessTypeEnum,
@@ -138,22 +147,29 @@ async def _verify_fs_path(path: str | None, user_id: UUID, storage_service: Stor
             await safe_path.touch()
 
 
-async def _save_flow_to_fs(flow: Flow, user_id: UUID, storage_service: StorageService) -> None:
-    """Save flow data to the filesystem at the validated path."""
-    if not flow.fs_path:
-        return
+async def _save_flow_to_fs(
+    flow: Flow, user_id: UUID, storage_service: StorageService, *, fs_path_changed: bool = False
+) -> None:
+    """Save flow data to the filesystem at the validated path.
 
-    try:
-        safe_path = _get_safe_flow_path(flow.fs_path, user_id, storage_service)
-        await safe_path.parent.mkdir(parents=True, exist_ok=True)
-        # async_open expects a string path, not a Path object
-        async with async_open(str(safe_path), "w") as f:
-            await f.write(flow.model_dump_json())
-    except HTTPException:
-        raise
-    except OSError as e:
-        await logger.aexception("Failed to write flow %s to path %s", flow.name, flow.fs_path)
-        raise HTTPException(status_code=500, detail=f"Failed to write flow to filesystem: {e}") from e
+    Pass ``fs_path_changed`` when the ``fs_path`` of the flow was added, changed or removed, so the flow sync
+    reloads which files it watches.
+    """
+    if flow.fs_path:
+        try:
+            safe_path = _get_safe_flow_path(flow.fs_path, user_id, storage_service)
+            await safe_path.parent.mkdir(parents=True, exist_ok=True)
+            # async_open expects a string path, not a Path object
+            async with async_open(str(safe_path), "w") as f:
+                await f.write(flow.model_dump_json())
+        except HTTPException:
+            raise
+        except OSError as e:
+            await logger.aexception("Failed to write flow %s to path %s", flow.name, flow.fs_path)
+            raise HTTPException(status_code=500, detail=f"Failed to write flow to filesystem: {e}") from e
+    if fs_path_changed:
+        # The path may be outside the directories the flow sync is watching
+        request_flow_fs_resync()
 
 
 async def _new_flow(
@@ -280,7 +296,7 @@ async def _new_flow(
         # Persist and refresh
         await session.flush()
         await session.refresh(db_flow)
-        await _save_flow_to_fs(db_flow, user_id, storage_service)
+        await _save_flow_to_fs(db_flow, user_id, storage_service, fs_path_changed=bool(db_flow.fs_path))
 
         # Convert to FlowRead while session is still active
         return FlowRead.model_validate(db_flow, from_attributes=True)
@@ -324,7 +340,7 @@ async def create_flow(
 async def read_flows(
     *,
     current_user: CurrentActiveUser,
-    session: DbSession,
+    session: DbReadSession,
     remove_example_flows: bool = False,
     components_only: bool = False,
     get_all: bool = True,
@@ -483,6 +499,7 @@ async def update_flow(
         if settings_service.settings.remove_api_keys:
             update_data = remove_api_keys(update_data)
 
+        previous_fs_path = db_flow.fs_path
         for key, value in update_data.items():
             setattr(db_flow, key, value)
 
@@ -512,7 +529,10 @@ async def update_flow(
         session.add(db_flow)
         await session.flush()
         await session.refresh(db_flow)
-        await _save_flow_to_fs(db_flow, current_user.id, storage_service)
+        await _save_flow_to_fs(
+            db_flow, current_user.id, storage_service, fs_path_changed=db_flow.fs_path != previous_fs_path
+        )
+        invalidate_mcp_tools_cache(db_flow.id)
 
         # Convert to FlowRead while session is still active to avoid detached instance errors
         flow_read = FlowRead.model_validate(db_flow, from_attributes=True)
@@ -675,6 +695,7 @@ async def _update_existing_flow(
     if settings_service.settings.remove_api_keys:
         update_data = remove_api_keys(update_data)
 
+    previous_fs_path = existing_flow.fs_path
     for key, value in update_data.items():
         setattr(existing_flow, key, value)
 
@@ -685,7 +706,10 @@ async def _update_existing_flow(
     session.add(existing_flow)
     await session.flush()
     await session.refresh(existing_flow)
-    await _save_flow_to_fs(existing_flow, user_id, storage_service)
+    await _save_flow_to_fs(
+        existing_flow, user_id, storage_service, fs_path_changed=existing_flow.fs_path != previous_fs_path
+    )
+    invalidate_mcp_tools_cache(existing_flow.id)
 
     return FlowRead.model_validate(existing_flow, from_attributes=True)
 
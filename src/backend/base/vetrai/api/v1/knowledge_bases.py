@@ -6,6 +6,7 @@ from pathlib import Path
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 from langchain_chroma import Chroma
+from lfx.base.vectorstores.registry import invalidate_vector_stores
 from lfx.log import logger
 from pydantic import BaseModel
 
@@ -396,7 +397,8 @@ async def delete_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -
         if not kb_path.exists() or not kb_path.is_dir():
             raise HTTPException(status_code=404, detail=f"Knowledge base '{kb_name}' not found")
 
-        # Delete the entire knowledge base directory
+        # Close the vector store clients that runs keep open on the knowledge base, then delete its directory
+        invalidate_vector_stores(kb_path)
         shutil.rmtree(kb_path)
 
     except HTTPException:
@@ -426,7 +428,8 @@ async def delete_knowledge_bases_bulk(request: BulkDeleteRequest, current_user:
                 continue
 
             try:
-                # Delete the entire knowledge base directory
+                # Close the vector store clients that runs keep open on the knowledge base, then delete its directory
+                invalidate_vector_stores(kb_path)
                 shutil.rmtree(kb_path)
                 deleted_count += 1
             except (OSError, PermissionError) as e:
@@ -53,6 +53,7 @@ from vetrai.api.v1.mcp_utils import (
     handle_list_tools,
     handle_mcp_errors,
     handle_read_resource,
+    invalidate_mcp_tools_cache,
 )
 from vetrai.api.v1.schemas import (
     AuthSettings,
@@ -530,6 +531,7 @@ async def update_project_mcp_settings(
                     flow.updated_at = datetime.now(timezone.utc)
                     session.add(flow)
                     updated_flows.append(flow)
+                    invalidate_mcp_tools_cache(flow.id)
 
             await session.flush()
 
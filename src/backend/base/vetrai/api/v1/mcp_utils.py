@@ -7,18 +7,20 @@ import asyncio
 import base64
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
+from datetime import datetime
 from functools import wraps
 from pathlib import Path
 from typing import Any, ParamSpec, TypeVar
 from urllib.parse import quote, unquote, urlparse
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from cachetools import LRUCache
 from lfx.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
 from lfx.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
 from lfx.log.logger import logger
 from lfx.utils.helpers import build_content_type_from_extension
 from mcp import types
-from sqlmodel import select
+from sqlmodel import col, select
 
 from vetrai.api.v1.endpoints import simple_run_flow
 from vetrai.api.v1.schemas import SimplifiedAPIRequest
@@ -34,6 +36,24 @@ P = ParamSpec("P")
 
 MCP_SERVERS_FILE = "_mcp_servers"
 
+# Columns of the flows that MCP tools are named and described from, without their data
+_FLOW_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.description,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.user_id,
+    Flow.updated_at,
+)
+_SCHEMA_BATCH_SIZE = 200
+
+# Input schemas of flows, keyed by flow id, with the `updated_at` of the flow version they were built from.
+# Building one builds the graph of the flow, which dominated listing the tools of large projects.
+_input_schema_cache: LRUCache[UUID, tuple[datetime | None, dict]] = LRUCache(maxsize=10_000)
+# Tool listings per (project id, mcp_enabled_only), with the header columns of the flows they were built from
+_tool_listing_cache: LRUCache[tuple[Any, bool], tuple[tuple, list[types.Tool]]] = LRUCache(maxsize=256)
+
 # Create context variables
 current_user_ctx: ContextVar[User] = ContextVar("current_user_ctx")
 # Carries per-request variables injected via HTTP headers (e.g., X-Vetrai-Global-Var-*)
@@ -319,6 +339,45 @@ async def handle_call_tool(
         raise
 
 
+def invalidate_mcp_tools_cache(flow_id: UUID | None = None) -> None:
+    """Drop the cached MCP tool listings, and the cached input schema of `flow_id`, or of every flow if None.
+
+    Listings and schemas are keyed by the flows' `updated_at`, so they are never served stale. Dropping them when a
+    flow is saved, deleted or has its MCP settings changed frees what can no longer be served.
+    """
+    _tool_listing_cache.clear()
+    if flow_id is None:
+        _input_schema_cache.clear()
+    else:
+        _input_schema_cache.pop(flow_id, None)
+
+
+async def _get_input_schemas(session, flows) -> dict[UUID, dict]:
+    """Return the input schemas of `flows`, building those that are not cached for their `updated_at`."""
+    schemas: dict[UUID, dict] = {}
+    stale = []
+    for flow in flows:
+        cached = _input_schema_cache.get(flow.id)
+        if cached is not None and cached[0] == flow.updated_at:
+            schemas[flow.id] = cached[1]
+        else:
+            stale.append(flow.id)
+
+    # Only the flows whose schema is not cached have their data loaded and their graph built
+    for start in range(0, len(stale), _SCHEMA_BATCH_SIZE):
+        batch = stale[start : start + _SCHEMA_BATCH_SIZE]
+        for flow in (await session.exec(select(Flow).where(col(Flow.id).in_(batch)))).all():
+            try:
+                schema = json_schema_from_flow(flow)
+            except Exception as e:  # noqa: BLE001
+                msg = f"Error in listing tools: {e!s} from flow: {flow.name}"
+                await logger.awarning(msg)
+                continue
+            _input_schema_cache[flow.id] = (flow.updated_at, schema)
+            schemas[flow.id] = schema
+    return schemas
+
+
 async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     """Handle listing tools for MCP.
 
@@ -329,23 +388,32 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
-            # Build query based on parameters
+            # Build query based on parameters, selecting only the header columns the tools are named from
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = select(*_FLOW_HEADER_COLUMNS).where(
+                    Flow.folder_id == project_id,
+                    Flow.is_component == False,  # noqa: E712
+                )
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
             else:
                 # Get all flows
-                flows_query = select(Flow)
+                flows_query = select(*_FLOW_HEADER_COLUMNS)
 
-            flows = (await session.exec(flows_query)).all()
+            flows = [flow for flow in (await session.exec(flows_query)).all() if flow.user_id is not None]
+
+            # The listing only changes when a flow is added, removed, renamed or updated
+            listing_key = (project_id, mcp_enabled_only)
+            fingerprint = tuple(tuple(flow) for flow in flows)
+            cached = _tool_listing_cache.get(listing_key)
+            if cached is not None and cached[0] == fingerprint:
+                return list(cached[1])
+
+            schemas = await _get_input_schemas(session, flows)
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 # For project-specific tools, use action names if available
                 if project_id:
                     base_name = (
@@ -373,18 +441,17 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                         f"{flow.id}: {flow.description}" if flow.description else f"Tool generated from flow: {name}"
                     )
 
-                try:
-                    tool = types.Tool(
-                        name=name,
-                        description=description,
-                        inputSchema=json_schema_from_flow(flow),
-                    )
-                    tools.append(tool)
-                    existing_names.add(name)
-                except Exception as e:  # noqa: BLE001
-                    msg = f"Error in listing tools: {e!s} from flow: {base_name}"
-                    await logger.awarning(msg)
+                if flow.id not in schemas:
+                    # Building the schema failed, which was logged
                     continue
+                tool = types.Tool(
+                    name=name,
+                    description=description,
+                    inputSchema=schemas[flow.id],
+                )
+                tools.append(tool)
+                existing_names.add(name)
+            _tool_listing_cache[listing_key] = (fingerprint, list(tools))
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         await logger.aexception(msg)
@@ -7,7 +7,7 @@ from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import delete
 from sqlmodel import col, select
 
-from vetrai.api.utils import DbSession, custom_params
+from vetrai.api.utils import DbReadSession, DbSession, custom_params
 from vetrai.schema.message import MessageResponse
 from vetrai.services.auth.utils import get_current_active_user
 from vetrai.services.database.models.flow.model import Flow
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
 
 @router.get("/builds", dependencies=[Depends(get_current_active_user)])
-async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
+async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbReadSession) -> VertexBuildMapModel:
     try:
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
@@ -65,7 +65,7 @@ async def get_message_sessions(
 
 @router.get("/messages")
 async def get_messages(
-    session: DbSession,
+    session: DbReadSession,
     current_user: Annotated[User, Depends(get_current_active_user)],
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
@@ -191,7 +191,7 @@ async def delete_messages_session(
 @router.get("/transactions", dependencies=[Depends(get_current_active_user)])
 async def get_transactions(
     flow_id: Annotated[UUID, Query()],
-    session: DbSession,
+    session: DbReadSession,
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionLogsResponse]:
     try:
@@ -1,11 +1,13 @@
 import asyncio
 import json
+import logging
 import time
 import uuid
 from collections.abc import AsyncGenerator
 from typing import Annotated, Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from lfx.log.logger import logger
 from lfx.schema.openai_responses_schemas import create_openai_error
@@ -48,6 +50,167 @@ def has_chat_output(flow_data: dict | None) -> bool:
     return any(node.get("data", {}).get("type") in ["ChatOutput", "Chat Output"] for node in flow_data["nodes"])
 
 
+class ResponsesStream:
+    """Converts the events of a flow run to the chunks of an OpenAI Responses API stream.
+
+    Token events are forwarded as text deltas as they arrive. The text of `add_message` events is only diffed
+    against what was already sent for messages that are not streamed token by token.
+    """
+
+    def __init__(self, request: OpenAIResponsesRequest, response_id: str, created: int) -> None:
+        self.request = request
+        self.include_results = bool(request.include and "tool_call.results" in request.include)
+        self.sent_len = 0
+        self._tool_call_counter = 0
+        self._seen_tool_steps: set[tuple[str | None, int, int]] = set()
+        self._emitted_tool_calls: set[tuple[str, str]] = set()
+        self._streamed_message_ids: set[str] = set()
+        self._previous_content = ""
+        # Text chunks differ only by their content, so they are built around an envelope encoded once
+        envelope = OpenAIResponsesStreamChunk(
+            id=response_id, created=created, model=request.model, delta={"content": ""}
+        ).model_dump_json()
+        delta_start = envelope.rindex('{"content":""}')
+        self._chunk_prefix = "data: " + envelope[:delta_start] + '{"content":'
+        self._chunk_suffix = "}" + envelope[delta_start + len('{"content":""}') :] + "\n\n"
+
+    def text_chunk(self, content: str) -> str:
+        self.sent_len += len(content)
+        return f"{self._chunk_prefix}{json.dumps(content, ensure_ascii=False)}{self._chunk_suffix}"
+
+    def token_chunk(self, data: dict) -> str | None:
+        """Return the chunk of a token event, or None if it has no text."""
+        if message_id := data.get("id"):
+            self._streamed_message_ids.add(message_id)
+        token = data.get("chunk", "")
+        if not token or not isinstance(token, str):
+            return None
+        return self.text_chunk(token)
+
+    def error_chunk(self, data: dict) -> str:
+        data = jsonable_encoder(data)
+        error_response = create_openai_error(
+            message=data.get("error", "Unknown error"),
+            type_="processing_error",
+        )
+        return f"data: {json.dumps(error_response)}\n\n"
+
+    def message_chunks(self, data: dict) -> list[str]:
+        """Return the chunks of the new tool calls and of the new text of an `add_message` event."""
+        data = jsonable_encoder(data)
+        message_id = data.get("id")
+        chunks = self._tool_call_chunks(message_id, data.get("content_blocks", []))
+
+        text = data.get("text", "")
+        properties = data.get("properties", {})
+        message_state = properties.get("state") if isinstance(properties, dict) else None
+        # Complete messages were already streamed through token events, and so were the messages with tokens
+        if message_state == "complete" or message_id in self._streamed_message_ids or not isinstance(text, str):
+            return chunks
+
+        # Extract text content for streaming (only AI responses)
+        if (
+            text
+            and data.get("sender", "") in ["Machine", "AI", "Agent"]
+            and text != self.request.input
+            and data.get("sender_name", "") in ["Agent", "AI"]
+        ):
+            # Only the new text is sent, or the full text if the content was reset
+            content = text.removeprefix(self._previous_content)
+            self._previous_content = text
+            if content:
+                chunks.append(self.text_chunk(content))
+        return chunks
+
+    def _tool_call_chunks(self, message_id: str | None, content_blocks: list[dict]) -> list[str]:
+        chunks: list[str] = []
+        for block_index, block in enumerate(content_blocks):
+            if block.get("title") != "Agent Steps":
+                continue
+            for step_index, step in enumerate(block.get("contents", [])):
+                # Messages are sent again with every step so far, so only the steps not seen yet are read
+                step_key = (message_id, block_index, step_index)
+                if step.get("type") != "tool_use" or step_key in self._seen_tool_steps:
+                    continue
+                tool_name = step.get("name", "")
+                tool_input = step.get("tool_input", {})
+                tool_output = step.get("output")
+                # Only emit finished tool calls with explicit tool names and meaningful arguments
+                if not tool_name or tool_input is None or tool_output is None:
+                    continue
+                self._seen_tool_steps.add(step_key)
+                # Chat Output sends the steps of the agent message again, in a message of its own
+                signature = (tool_name, json.dumps(tool_input, sort_keys=True))
+                if signature in self._emitted_tool_calls:
+                    continue
+                self._emitted_tool_calls.add(signature)
+                chunks.extend(self._tool_call_events(tool_name, tool_input, tool_output))
+        return chunks
+
+    def _tool_call_events(self, tool_name: str, tool_input: Any, tool_output: Any) -> list[str]:
+        self._tool_call_counter += 1
+        call_id = f"call_{self._tool_call_counter}"
+        tool_id = f"fc_{self._tool_call_counter}"
+        arguments_str = json.dumps(tool_input)
+        if self.include_results:
+            # Format with detailed results
+            tool_done_item: dict[str, Any] = {
+                "id": f"{tool_name}_{tool_id}",
+                "inputs": tool_input,  # Raw inputs as-is
+                "status": "completed",
+                "type": "tool_call",
+                "tool_name": f"{tool_name}",
+                "results": tool_output,  # Raw output as-is
+            }
+            tool_done_event = {
+                "type": "response.output_item.done",
+                "item": tool_done_item,
+                "output_index": 0,
+                "sequence_number": self._tool_call_counter + 5,
+            }
+        else:
+            # Regular function call format
+            tool_done_event = {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": tool_id,
+                    "type": "function_call",  # Match OpenAI format
+                    "status": "completed",
+                    "arguments": arguments_str,
+                    "call_id": call_id,
+                    "name": tool_name,
+                },
+            }
+        events = [
+            {
+                "type": "response.output_item.added",
+                "item": {
+                    "id": tool_id,
+                    "type": "function_call",  # OpenAI uses "function_call"
+                    "status": "in_progress",  # OpenAI includes status
+                    "name": tool_name,
+                    "arguments": "",  # Start with empty, build via deltas
+                    "call_id": call_id,
+                },
+            },
+            # The arguments of a tool call are known when the tool starts, so they are sent in a single delta
+            {
+                "type": "response.function_call_arguments.delta",
+                "delta": arguments_str,
+                "item_id": tool_id,
+                "output_index": 0,
+            },
+            {
+                "type": "response.function_call_arguments.done",
+                "arguments": arguments_str,
+                "item_id": tool_id,
+                "output_index": 0,
+            },
+            tool_done_event,
+        ]
+        return [f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events]
+
+
 async def run_flow_for_openai_responses(
     flow: FlowRead,
     request: OpenAIResponsesRequest,
@@ -98,7 +261,8 @@ async def run_flow_for_openai_responses(
         # Handle streaming response
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        # The events are consumed in this process, so they are passed as they are rather than encoded to JSON
+        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, encoder="structured")
 
         async def openai_stream_generator() -> AsyncGenerator[str, None]:
             """Convert Vetrai events to OpenAI Responses API streaming format."""
@@ -129,246 +293,26 @@ async def run_flow_for_openai_responses(
                 )
                 yield f"data: {initial_chunk.model_dump_json()}\n\n"
 
-                tool_call_counter = 0
-                processed_tools = set()  # Track processed tool calls to avoid duplicates
-                previous_content = ""  # Track content already sent to calculate deltas
+                response_stream = ResponsesStream(request, response_id, created_timestamp)
+                # Checked once, so per-token debug logs cost nothing when debug logging is off
+                debug_logging = logger.is_enabled_for(logging.DEBUG)
 
                 async for event_data in consume_and_yield(asyncio_queue, asyncio_queue_client_consumed):
                     if event_data is None:
                         await logger.adebug("[OpenAIResponses][stream] received None event_data; breaking loop")
                         break
 
-                    content = ""
-                    token_data = {}
-
-                    # Parse byte string events as JSON
-                    if isinstance(event_data, bytes):
-                        try:
-                            import json
-
-                            event_str = event_data.decode("utf-8")
-                            parsed_event = json.loads(event_str)
-
-                            if isinstance(parsed_event, dict):
-                                event_type = parsed_event.get("event")
-                                data = parsed_event.get("data", {})
-                                await logger.adebug(
-                                    "[OpenAIResponses][stream] event: %s keys=%s",
-                                    event_type,
-                                    list(data.keys()) if isinstance(data, dict) else type(data),
-                                )
-
-                                # Handle add_message events
-                                if event_type == "token":
-                                    token_data = data.get("chunk", "")
-                                    await logger.adebug(
-                                        "[OpenAIResponses][stream] token: token_data=%s",
-                                        token_data,
-                                    )
-                                if event_type == "error":
-                                    error_message = data.get("error", "Unknown error")
-                                    await logger.adebug(f"[OpenAIResponses][stream] error event: {error_message}")
-                                    error_response = create_openai_error(
-                                        message=error_message,
-                                        type_="processing_error",
-                                    )
-                                    yield f"data: {json.dumps(error_response)}\n\n"
-
-                                if event_type == "add_message":
-                                    sender_name = data.get("sender_name", "")
-                                    text = data.get("text", "")
-                                    sender = data.get("sender", "")
-                                    content_blocks = data.get("content_blocks", [])
-
-                                    # Get message state from properties
-                                    properties = data.get("properties", {})
-                                    message_state = properties.get("state") if isinstance(properties, dict) else None
-
-                                    await logger.adebug(
-                                        (
-                                            "[OpenAIResponses][stream] add_message: "
-                                            "sender=%s sender_name=%s text_len=%d state=%s"
-                                        ),
-                                        sender,
-                                        sender_name,
-                                        len(text) if isinstance(text, str) else -1,
-                                        message_state,
-                                    )
-
-                                    # Skip processing text content if state is "complete"
-                                    # All content has already been streamed via token events
-                                    if message_state == "complete":
-                                        await logger.adebug(
-                                            "[OpenAIResponses][stream] skipping add_message with state=complete"
-                                        )
-                                        # Still process content_blocks for tool calls, but skip text content
-                                        text = ""
-
-                                    # Look for Agent Steps in content_blocks
-                                    for block in content_blocks:
-                                        if block.get("title") == "Agent Steps":
-                                            contents = block.get("contents", [])
-                                            for step in contents:
-                                                # Look for tool_use type items
-                                                if step.get("type") == "tool_use":
-                                                    tool_name = step.get("name", "")
-                                                    tool_input = step.get("tool_input", {})
-                                                    tool_output = step.get("output")
-
-                                                    # Only emit tool calls with explicit tool names and
-                                                    # meaningful arguments
-                                                    if tool_name and tool_input is not None and tool_output is not None:
-                                                        # Create unique identifier for this tool call
-                                                        tool_signature = (
-                                                            f"{tool_name}:{hash(str(sorted(tool_input.items())))}"
-                                                        )
-
-                                                        # Skip if we've already processed this tool call
-                                                        if tool_signature in processed_tools:
-                                                            continue
-
-                                                        processed_tools.add(tool_signature)
-                                                        tool_call_counter += 1
-                                                        call_id = f"call_{tool_call_counter}"
-                                                        tool_id = f"fc_{tool_call_counter}"
-                                                        tool_call_event = {
-                                                            "type": "response.output_item.added",
-                                                            "item": {
-                                                                "id": tool_id,
-                                                                "type": "function_call",  # OpenAI uses "function_call"
-                                                                "status": "in_progress",  # OpenAI includes status
-                                                                "name": tool_name,
-                                                                "arguments": "",  # Start with empty, build via deltas
-                                                                "call_id": call_id,
-                                                            },
-                                                        }
-                                                        yield (
-                                                            f"event: response.output_item.added\n"
-                                                            f"data: {json.dumps(tool_call_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments as delta events (like OpenAI)
-                                                        arguments_str = json.dumps(tool_input)
-                                                        arg_delta_event = {
-                                                            "type": "response.function_call_arguments.delta",
-                                                            "delta": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.delta\n"
-                                                            f"data: {json.dumps(arg_delta_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments done event
-                                                        arg_done_event = {
-                                                            "type": "response.function_call_arguments.done",
-                                                            "arguments": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.done\n"
-                                                            f"data: {json.dumps(arg_done_event)}\n\n"
-                                                        )
-                                                        await logger.adebug(
-                                                            "[OpenAIResponses][stream] tool_call.args.done name=%s",
-                                                            tool_name,
-                                                        )
-
-                                                        # If there's output, send completion event
-                                                        if tool_output is not None:
-                                                            # Check if include parameter requests tool_call.results
-                                                            include_results = (
-                                                                request.include
-                                                                and "tool_call.results" in request.include
-                                                            )
-
-                                                            if include_results:
-                                                                # Format with detailed results
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": f"{tool_name}_{tool_id}",
-                                                                        "inputs": tool_input,  # Raw inputs as-is
-                                                                        "status": "completed",
-                                                                        "type": "tool_call",
-                                                                        "tool_name": f"{tool_name}",
-                                                                        "results": tool_output,  # Raw output as-is
-                                                                    },
-                                                                    "output_index": 0,
-                                                                    "sequence_number": tool_call_counter + 5,
-                                                                }
-                                                            else:
-                                                                # Regular function call format
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": tool_id,
-                                                                        "type": "function_call",  # Match OpenAI format
-                                                                        "status": "completed",
-                                                                        "arguments": arguments_str,
-                                                                        "call_id": call_id,
-                                                                        "name": tool_name,
-                                                                    },
-                                                                }
-
-                                                            yield (
-                                                                f"event: response.output_item.done\n"
-                                                                f"data: {json.dumps(tool_done_event)}\n\n"
-                                                            )
-                                                            await logger.adebug(
-                                                                "[OpenAIResponses][stream] tool_call.done name=%s",
-                                                                tool_name,
-                                                            )
-
-                                    # Extract text content for streaming (only AI responses)
-                                    if (
-                                        sender in ["Machine", "AI", "Agent"]
-                                        and text != request.input
-                                        and sender_name in ["Agent", "AI"]
-                                    ):
-                                        # Calculate delta: only send newly generated content
-                                        if text.startswith(previous_content):
-                                            content = text[len(previous_content) :]
-                                            previous_content = text
-                                            await logger.adebug(
-                                                "[OpenAIResponses][stream] delta computed len=%d total_len=%d",
-                                                len(content),
-                                                len(previous_content),
-                                            )
-                                        else:
-                                            # If text doesn't start with previous content, send full text
-                                            # This handles cases where the content might be reset
-                                            content = text
-                                            previous_content = text
-                                            await logger.adebug(
-                                                "[OpenAIResponses][stream] content reset; sending full text len=%d",
-                                                len(content),
-                                            )
-
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            await logger.adebug("[OpenAIResponses][stream] failed to decode event bytes; skipping")
-                            continue
-
-                    # Only send chunks with actual content
-                    if content or token_data:
-                        if isinstance(token_data, str):
-                            content = token_data
-                            await logger.adebug(
-                                f"[OpenAIResponses][stream] sent chunk with content={content}",
-                            )
-                        chunk = OpenAIResponsesStreamChunk(
-                            id=response_id,
-                            created=created_timestamp,
-                            model=request.model,
-                            delta={"content": content},
-                        )
-                        yield f"data: {chunk.model_dump_json()}\n\n"
-                        await logger.adebug(
-                            "[OpenAIResponses][stream] sent chunk with delta_len=%d",
-                            len(content),
-                        )
+                    event_type, data = event_data
+                    if debug_logging:
+                        await logger.adebug("[OpenAIResponses][stream] event: %s", event_type)
+                    if event_type == "token":
+                        if chunk := response_stream.token_chunk(data):
+                            yield chunk
+                    elif event_type == "add_message":
+                        for chunk in response_stream.message_chunks(data):
+                            yield chunk
+                    elif event_type == "error":
+                        yield response_stream.error_chunk(data)
 
                 # Send final completion chunk
                 final_chunk = OpenAIResponsesStreamChunk(
@@ -383,7 +327,7 @@ async def run_flow_for_openai_responses(
                 await logger.adebug(
                     "[OpenAIResponses][stream] completed: response_id=%s total_sent_len=%d",
                     response_id,
-                    len(previous_content),
+                    response_stream.sent_len,
                 )
 
             except Exception as e:  # noqa: BLE001
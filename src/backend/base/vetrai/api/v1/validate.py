@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from lfx.base.prompts.api_utils import process_prompt_template
+from lfx.custom.template_cache import get_template_cache
 from lfx.custom.validate import validate_code
 from lfx.log.logger import logger
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/validate", tags=["Validate"])
 @router.post("/code", status_code=200, dependencies=[Depends(get_current_active_user)])
 async def post_validate_code(code: Code) -> CodeValidationResponse:
     try:
-        errors = validate_code(code.code)
+        errors = get_template_cache().get_or_build("validation", code.code, lambda: validate_code(code.code))
         return CodeValidationResponse(
             imports=errors.get("imports", {}),
             function=errors.get("function", {}),
@@ -5,7 +5,7 @@ import os
 import time
 import traceback
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import lru_cache, partial
 from typing import Any
@@ -32,8 +32,8 @@ from vetrai.services.auth.utils import get_current_user_for_websocket
 from vetrai.services.database.models.flow.model import Flow
 from vetrai.services.database.models.message.model import MessageTable
 from vetrai.services.database.models.user.model import User
-from vetrai.services.deps import get_variable_service, session_scope
-from vetrai.utils.voice_utils import BYTES_PER_24K_FRAME, VAD_SAMPLE_RATE_16K, resample_24k_to_16k
+from vetrai.services.deps import get_settings_service, get_variable_service, session_scope
+from vetrai.utils.voice_utils import VadPipeline, get_vad_worker
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -41,6 +41,11 @@ SILENCE_THRESHOLD = 0.1
 PREFIX_PADDING_MS = 100
 SILENCE_DURATION_MS = 300
 AUDIO_SAMPLE_THRESHOLD = 100
+# Queue bounds. Outgoing websocket messages and transcripts apply backpressure when full, while barge-in
+# detection drops the oldest audio because only recent audio matters for it.
+SEND_QUEUE_MAXSIZE = 1024
+MESSAGE_QUEUE_MAXSIZE = 256
+VAD_QUEUE_MAXSIZE = 50
 SESSION_INSTRUCTIONS = """
 Your instructions will be divided into three mutually exclusive sections: "Permanent", "Default", and "Additional".
 "Permanent" instructions are to never be overrided, superceded or otherwise ignored.
@@ -327,26 +332,126 @@ async def process_message_queue(queue_key, session):
         await logger.aerror(traceback.format_exc())
 
 
+def put_dropping_oldest(queue: asyncio.Queue, item) -> bool:
+    """Puts an item in a bounded queue, dropping the oldest queued item when it is full.
+
+    Returns True if an item was dropped.
+    """
+    dropped = False
+    while True:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            dropped = True
+        else:
+            return dropped
+
+
+# Audio frames are the only messages a full send queue may drop: a lost frame is a short gap in the audio, while
+# a lost control message (session updates, response creation or cancellation, tool results) breaks the session
+DROPPABLE_MESSAGE_TYPES = frozenset({"input_audio_buffer.append"})
+
+
+class _SendQueue(asyncio.Queue):
+    """Outgoing message queue of a websocket that can drop its oldest queued audio frame."""
+
+    def __init__(self, maxsize: int, payload_of=lambda item: item) -> None:
+        super().__init__(maxsize=maxsize)
+        self.payload_of = payload_of
+
+    def drop_oldest_audio_frame(self) -> bool:
+        """Removes the oldest queued audio frame, returning False if no audio frame is queued."""
+        for index, item in enumerate(self._queue):
+            payload = self.payload_of(item)
+            if payload is not None and payload.get("type") in DROPPABLE_MESSAGE_TYPES:
+                del self._queue[index]
+                self.task_done()
+                return True
+        return False
+
+
 class SendQueues:
-    def __init__(self, openai_ws: websockets.WebSocketClientProtocol, client_ws: WebSocket, log_event):
+    """Bounded outgoing message queues for the OpenAI and client websockets.
+
+    The async senders wait for room in the queue, which slows down the reader feeding them. The sync senders
+    are for callers that cannot wait. When the queue is full, an audio frame sent by them makes room by dropping
+    the oldest queued audio frame, and is dropped itself if there is none. Other messages are never dropped: they
+    wait for room in a background task. Messages are queued in the order they were sent either way.
+    """
+
+    def __init__(
+        self,
+        openai_ws: websockets.WebSocketClientProtocol,
+        client_ws: WebSocket,
+        log_event,
+        maxsize: int = SEND_QUEUE_MAXSIZE,
+    ):
         self.openai_ws: websockets.WebSocketClientProtocol = openai_ws
-        self.openai_send_q: asyncio.Queue[tuple] = asyncio.Queue()
+        self.openai_send_q: _SendQueue = _SendQueue(maxsize, payload_of=lambda item: item[0])
         self.openai_writer_task: asyncio.Task = asyncio.create_task(self.__openai_writer())
 
         self.block: asyncio.Event = asyncio.Event()
         self.block.set()
 
         self.client_ws: WebSocket = client_ws
-        self.client_send_q: asyncio.Queue[dict] = asyncio.Queue()
+        self.client_send_q: _SendQueue = _SendQueue(maxsize)
         self.client_writer_task: asyncio.Task = asyncio.create_task(self.__client_writer())
         self.log_event = log_event
+        self.dropped_messages = 0
+        # Messages waiting for room in a full queue, and the tasks putting them in order
+        self._overflow: dict[int, deque] = {id(self.openai_send_q): deque(), id(self.client_send_q): deque()}
+        self._overflow_tasks: set[asyncio.Task] = set()
+
+    def _drop(self, payload, direction: str) -> None:
+        self.dropped_messages += 1
+        logger.warning(f"{direction} send queue is full, dropping {payload.get('type')} message")
+
+    def _enqueue(self, queue: _SendQueue, item, payload, direction: str, *, wait: bool) -> asyncio.Future | None:
+        """Puts a message in a send queue, returning a future set once it is queued if it has to wait for room."""
+        overflow = self._overflow[id(queue)]
+        # Once a message waits for room, later messages wait behind it to keep their order
+        if not overflow:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                pass
+            else:
+                return None
+        if not wait and payload.get("type") in DROPPABLE_MESSAGE_TYPES:
+            self._drop(payload, direction)
+            if not queue.drop_oldest_audio_frame():
+                return None
+            if not overflow:
+                queue.put_nowait(item)
+                return None
+        queued = asyncio.get_running_loop().create_future()
+        overflow.append((item, queued))
+        if len(overflow) == 1:
+            task = asyncio.create_task(self._put_overflow(queue, overflow))
+            self._overflow_tasks.add(task)
+            task.add_done_callback(self._overflow_tasks.discard)
+        return queued
+
+    async def _put_overflow(self, queue: _SendQueue, overflow: deque) -> None:
+        while overflow:
+            item, queued = overflow[0]
+            await queue.put(item)
+            overflow.popleft()
+            if not queued.done():
+                queued.set_result(None)
 
     def openai_send(self, payload, *, is_blocking=False):
         try:
-            self.openai_send_q.put_nowait([payload, is_blocking])
+            self._enqueue(self.openai_send_q, [payload, is_blocking], payload, LF_TO_OPENAI, wait=False)
         except Exception:  # noqa: BLE001
             logger.error(traceback.format_exc())
 
+    async def aopenai_send(self, payload, *, is_blocking=False):
+        queued = self._enqueue(self.openai_send_q, [payload, is_blocking], payload, LF_TO_OPENAI, wait=True)
+        if queued is not None:
+            await queued
+
     def openai_unblock(self):
         logger.trace("OPENAI UNBLOCKING")
         self.block.set()
@@ -369,11 +474,17 @@ class SendQueues:
 
     def client_send(self, payload):
         try:
-            self.client_send_q.put_nowait(payload)
+            self._enqueue(self.client_send_q, payload, payload, LF_TO_CLIENT, wait=False)
             self.log_event(payload, LF_TO_OPENAI)
         except Exception:  # noqa: BLE001
             logger.error(traceback.format_exc())
 
+    async def aclient_send(self, payload):
+        queued = self._enqueue(self.client_send_q, payload, payload, LF_TO_CLIENT, wait=True)
+        if queued is not None:
+            await queued
+        self.log_event(payload, LF_TO_OPENAI)
+
     async def __client_writer(self):
         try:
             while True:
@@ -386,10 +497,25 @@ class SendQueues:
             await logger.aerror(traceback.format_exc())
 
     async def close(self):
-        self.openai_send_q.put_nowait(None)
-        self.client_send_q.put_nowait(None)
-        await self.openai_writer_task
-        await self.client_writer_task
+        # Messages still waiting for room cannot be sent once the writers stop
+        for task in self._overflow_tasks:
+            task.cancel()
+        for overflow in self._overflow.values():
+            for _, queued in overflow:
+                queued.cancel()
+            overflow.clear()
+        for queue, writer_task, sentinel in (
+            (self.openai_send_q, self.openai_writer_task, [None, False]),
+            (self.client_send_q, self.client_writer_task, None),
+        ):
+            try:
+                queue.put_nowait(sentinel)
+            except asyncio.QueueFull:
+                # The peer stopped reading, so pending messages cannot be flushed anyway
+                writer_task.cancel()
+        await asyncio.gather(self.openai_writer_task, self.client_writer_task, return_exceptions=True)
+        if self.dropped_messages:
+            await logger.awarning(f"Dropped {self.dropped_messages} voice mode message(s) on full send queues")
 
 
 def get_create_response(send_handler: SendQueues, session_id):
@@ -512,7 +638,7 @@ tts_config_cache: dict[str, TTSConfig] = {}
 
 # --- Global Queues and Message Processing ---
 
-message_queues: dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+message_queues: dict[str, asyncio.Queue] = defaultdict(partial(asyncio.Queue, maxsize=MESSAGE_QUEUE_MAXSIZE))
 message_tasks: dict[str, asyncio.Task] = {}
 last_sender_by_session: defaultdict[str, str | None] = defaultdict(lambda: None)
 
@@ -770,35 +896,37 @@ async def flow_as_tool_websocket(
             msg_handler.openai_send(session_update)
 
             # Setup for VAD processing.
-            vad_queue: asyncio.Queue = asyncio.Queue()
-            vad_audio_buffer = bytearray()
+            vad_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=VAD_QUEUE_MAXSIZE)
             bot_speaking_flag = [False]
+            # Set when the VAD queue drops chunks, which leaves a gap right before the oldest queued chunk
+            vad_chunks_dropped = [False]
 
             async def process_vad_audio() -> None:
-                nonlocal vad_audio_buffer
                 last_speech_time = datetime.now(tz=timezone.utc)
-                vad = get_vad()
+                pipeline = VadPipeline(get_vad())
+                # Waiting for more 20ms chunks is opt-in, since it delays barge-in
+                batch_chunks = get_settings_service().settings.voice_mode_vad_batch_chunks
                 while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
-                    has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
+                    # Decode, resample and classify everything queued so far in one batch off the event loop
+                    chunks = [await vad_queue.get()]
+                    while len(chunks) < batch_chunks:
+                        chunks.append(await vad_queue.get())
+                    while not vad_queue.empty():
+                        chunks.append(vad_queue.get_nowait())
+                    if vad_chunks_dropped[0]:
+                        # The batch does not follow the audio processed so far
+                        vad_chunks_dropped[0] = False
+                        pipeline.reset()
+                    try:
+                        has_speech = await get_vad_worker().submit(pipeline, chunks)
+                    except Exception as e:  # noqa: BLE001
+                        await logger.aerror(f"[ERROR] VAD processing failed: {e}")
+                        continue
                     if has_speech:
+                        logger.trace("!", end="")
+                        if bot_speaking_flag[0]:
+                            msg_handler.openai_send({"type": "response.cancel"})
+                            bot_speaking_flag[0] = False
                         last_speech_time = datetime.now(tz=timezone.utc)
                         logger.trace(".", end="")
                     else:
@@ -940,9 +1068,10 @@ async def flow_as_tool_websocket(
                             # Ensure we're adding to an integer
                             num_audio_samples += len(base64_data)
                             event = {"type": "input_audio_buffer.append", "audio": base64_data}
-                            msg_handler.openai_send(event)
-                            if voice_config.barge_in_enabled:
-                                await vad_queue.put(base64_data)
+                            await msg_handler.aopenai_send(event)
+                            # Barge-in only needs recent audio, so a lagging VAD skips the oldest chunks
+                            if voice_config.barge_in_enabled and put_dropping_oldest(vad_queue, base64_data):
+                                vad_chunks_dropped[0] = True
                         elif msg.get("type") == "response.create":
                             create_response(msg)
                         elif msg.get("type") == "input_audio_buffer.commit":
@@ -991,7 +1120,7 @@ async def flow_as_tool_websocket(
                         do_forward = do_forward and event_type.find("flow.") != 0
 
                         if do_forward:
-                            msg_handler.client_send(event)
+                            await msg_handler.aclient_send(event)
                         if event_type == "response.created":
                             responses[response_id] = Response(response_id, use_elevenlabs=voice_config.use_elevenlabs)
                             if function_call:
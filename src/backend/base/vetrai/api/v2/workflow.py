@@ -40,11 +40,11 @@ from lfx.schema.workflow import (
     WorkflowStopRequest,
     WorkflowStopResponse,
 )
-from lfx.services.deps import get_settings_service, injectable_session_scope_readonly
+from lfx.services.deps import get_settings_service
 from pydantic_core import ValidationError as PydanticValidationError
 from sqlalchemy.exc import OperationalError
 
-from vetrai.api.utils import extract_global_variables_from_headers
+from vetrai.api.utils import ApiKeyDbReadSession, extract_global_variables_from_headers
 from vetrai.api.v1.schemas import RunResponse
 from vetrai.api.v2.converters import (
     create_error_response,
@@ -499,15 +499,15 @@ async def execute_workflow_background(
 )
 async def get_workflow_status(
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
+    session: ApiKeyDbReadSession,
     job_id: Annotated[JobId | None, Query(description="Job ID to query")] = None,
-    session: Annotated[object, Depends(injectable_session_scope_readonly)] = None,
 ) -> WorkflowExecutionResponse | WorkflowJobResponse:
     """Get workflow job status and results.
 
     Args:
         api_key_user: Authenticated user from API key
         job_id: Optional job ID to query specific job
-        session: Database session for querying vertex builds
+        session: Database session for querying the job and its vertex builds, on the read replica if one is set
 
     Returns:
         WorkflowExecutionResponse or reconstructed results
@@ -532,7 +532,7 @@ async def get_workflow_status(
 
     job_service = get_job_service()
     try:
-        job = await job_service.get_job_by_job_id(job_id=job_id)
+        job = await job_service.get_job_by_job_id(job_id=job_id, session=session)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
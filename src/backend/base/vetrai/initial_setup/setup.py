@@ -1,12 +1,15 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import re
 import shutil
 import zipfile
 from collections import defaultdict
+from collections.abc import Iterable
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -48,6 +51,7 @@ from vetrai.services.database.models.folder.constants import (
     LEGACY_FOLDER_NAMES,
 )
 from vetrai.services.database.models.folder.model import Folder, FolderCreate, FolderRead
+from vetrai.services.database.models.starter_project.model import StarterProjectManifest
 from vetrai.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
 
 # In the folder ./starter_projects we have a few JSON files that represent
@@ -1077,6 +1081,124 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
     return None
 
 
+def get_types_fingerprint(all_types_dict: dict) -> str:
+    """Hash the component templates that starter projects are updated against."""
+    return hashlib.sha256(orjson.dumps(all_types_dict, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+def get_starter_project_hash(project: dict, types_fingerprint: str) -> str:
+    """Hash a starter project together with the component templates it is provisioned with.
+
+    A project must be reprovisioned when either its file or any component template changes.
+    """
+    digest = hashlib.sha256(types_fingerprint.encode())
+    digest.update(orjson.dumps(project, default=str))
+    return digest.hexdigest()
+
+
+async def update_changed_starter_projects(
+    session: AsyncSession,
+    folder_id: UUID,
+    starter_projects: list[tuple[anyio.Path, dict]],
+    all_types_dict: dict,
+) -> None:
+    """Reprovision only the starter projects whose content hash changed since the last boot.
+
+    The hashes are kept in the ``starter_project_manifest`` table. When every hash matches and
+    every project is present in the starter folder, no rows are written.
+    """
+    await logger.adebug("Updating starter projects")
+    types_fingerprint = get_types_fingerprint(all_types_dict)
+    manifest = {row.name: row for row in (await session.exec(select(StarterProjectManifest))).all()}
+
+    existing_flow_ids: dict[str, list[UUID]] = defaultdict(list)
+    for flow_id, flow_name in (await session.exec(select(Flow.id, Flow.name).where(Flow.folder_id == folder_id))).all():
+        existing_flow_ids[flow_name].append(flow_id)
+
+    project_names = {project.get("name") for _, project in starter_projects}
+    stale_flow_ids = [
+        flow_id for name, flow_ids in existing_flow_ids.items() if name not in project_names for flow_id in flow_ids
+    ]
+    changed_projects = []
+    for project_path, project in starter_projects:
+        name = project.get("name")
+        entry = manifest.get(name)
+        is_provisioned = len(existing_flow_ids.get(name, [])) == 1
+        if (
+            entry is not None
+            and is_provisioned
+            and entry.content_hash == get_starter_project_hash(project, types_fingerprint)
+        ):
+            continue
+        changed_projects.append((project_path, project))
+        stale_flow_ids.extend(existing_flow_ids.get(name, []))
+
+    stale_manifest_names = set(manifest) - project_names
+    if not changed_projects and not stale_flow_ids and not stale_manifest_names:
+        await logger.adebug("Starter projects are up to date")
+        return
+
+    if stale_flow_ids:
+        for flow in (await session.exec(select(Flow).where(col(Flow.id).in_(stale_flow_ids)))).all():
+            await session.delete(flow)
+    for name in stale_manifest_names:
+        await session.delete(manifest[name])
+
+    successfully_updated_projects = 0
+    for project_path, project in changed_projects:
+        (
+            project_name,
+            project_description,
+            project_is_component,
+            updated_at_datetime,
+            project_data,
+            project_icon,
+            project_icon_bg_color,
+            project_gradient,
+            project_tags,
+        ) = get_project_data(project)
+        updated_project_data = update_projects_components_with_latest_component_versions(
+            project_data.copy(), all_types_dict
+        )
+        updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
+        if updated_project_data != project_data:
+            project_data = updated_project_data
+            await update_project_file(project_path, project, updated_project_data)
+
+        try:
+            # Create the updated starter project
+            create_new_project(
+                session=session,
+                project_name=project_name,
+                project_description=project_description,
+                project_is_component=project_is_component,
+                updated_at_datetime=updated_at_datetime,
+                project_data=project_data,
+                project_icon=project_icon,
+                project_icon_bg_color=project_icon_bg_color,
+                project_gradient=project_gradient,
+                project_tags=project_tags,
+                new_folder_id=folder_id,
+            )
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Error while creating starter project {project_name}")
+            continue
+
+        # Hash the project as it is now stored on disk, so the next boot sees a match
+        content_hash = get_starter_project_hash(project, types_fingerprint)
+        if entry := manifest.get(project_name):
+            entry.content_hash = content_hash
+            entry.updated_at = datetime.now(tz=timezone.utc)
+            session.add(entry)
+        else:
+            session.add(StarterProjectManifest(name=project_name, content_hash=content_hash))
+        successfully_updated_projects += 1
+    await logger.adebug(
+        f"Successfully updated {successfully_updated_projects} starter projects, "
+        f"{len(starter_projects) - len(changed_projects)} unchanged"
+    )
+
+
 async def create_or_update_starter_projects(all_types_dict: dict) -> None:
     """Create or update starter projects.
 
@@ -1094,54 +1216,7 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
         starter_projects = await load_starter_projects()
 
         if get_settings_service().settings.update_starter_projects:
-            await logger.adebug("Updating starter projects")
-            # 1. Delete all existing starter projects
-            successfully_updated_projects = 0
-            await delete_starter_projects(session, new_folder.id)
-            # Profile pictures are now served directly from the package installation directory
-            # No need to copy them to config_dir
-
-            # 2. Update all starter projects with the latest component versions (this modifies the actual file data)
-            for project_path, project in starter_projects:
-                (
-                    project_name,
-                    project_description,
-                    project_is_component,
-                    updated_at_datetime,
-                    project_data,
-                    project_icon,
-                    project_icon_bg_color,
-                    project_gradient,
-                    project_tags,
-                ) = get_project_data(project)
-                updated_project_data = update_projects_components_with_latest_component_versions(
-                    project_data.copy(), all_types_dict
-                )
-                updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
-                if updated_project_data != project_data:
-                    project_data = updated_project_data
-                    await update_project_file(project_path, project, updated_project_data)
-
-                try:
-                    # Create the updated starter project
-                    create_new_project(
-                        session=session,
-                        project_name=project_name,
-                        project_description=project_description,
-                        project_is_component=project_is_component,
-                        updated_at_datetime=updated_at_datetime,
-                        project_data=project_data,
-                        project_icon=project_icon,
-                        project_icon_bg_color=project_icon_bg_color,
-                        project_gradient=project_gradient,
-                        project_tags=project_tags,
-                        new_folder_id=new_folder.id,
-                    )
-                except Exception:  # noqa: BLE001
-                    await logger.aexception(f"Error while creating starter project {project_name}")
-
-                successfully_updated_projects += 1
-            await logger.adebug(f"Successfully updated {successfully_updated_projects} starter projects")
+            await update_changed_starter_projects(session, new_folder.id, starter_projects, all_types_dict)
         else:
             # Even if we're not updating starter projects, we still need to create any that don't exist
             await logger.adebug("Creating new starter projects")
@@ -1276,58 +1351,177 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
-async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
-    storage_service = get_storage_service()
+@dataclass(frozen=True)
+class _FlowFileState:
+    mtime: float
+    size: int
+    digest: str
+
+
+_fs_resync_event: asyncio.Event | None = None
+
+
+def _get_fs_resync_event() -> asyncio.Event:
+    global _fs_resync_event  # noqa: PLW0603
+    if _fs_resync_event is None:
+        _fs_resync_event = asyncio.Event()
+    return _fs_resync_event
+
+
+def request_flow_fs_resync() -> None:
+    """Ask the flow sync task to reload which flows are stored on the file system.
+
+    Called when a flow's ``fs_path`` may have changed, so the watcher starts watching new locations.
+    """
+    _get_fs_resync_event().set()
+
+
+async def get_fs_flow_paths(session: AsyncSession, storage_service) -> dict[UUID, anyio.Path]:
+    """Return the resolved file path of every flow stored on the file system.
+
+    Only the columns needed for bookkeeping are selected.
+    """
+    stmt = select(Flow.id, Flow.fs_path, Flow.user_id).where(col(Flow.fs_path).is_not(None))
+    paths = {}
+    for flow_id, fs_path, user_id in (await session.exec(stmt)).all():
+        # Resolve path: if relative, construct full path using user's flows directory
+        if not Path(fs_path).is_absolute():
+            path = storage_service.data_dir / "flows" / str(user_id) / fs_path
+        else:
+            path = anyio.Path(fs_path)
+        paths[flow_id] = path
+    return paths
+
+
+async def sync_flow_from_file(
+    session: AsyncSession, flow_id: UUID, path: anyio.Path, known: _FlowFileState | None
+) -> _FlowFileState | None:
+    """Update a flow from its file if the file changed since ``known``.
+
+    The file is only read when its mtime or size changed, and the flow is only written when
+    the file content hash changed and a field actually differs from the stored value.
+
+    Returns:
+        The new state of the file, or ``None`` if the file does not exist.
+    """
+    if not await path.exists():
+        return None
+    stat = await path.stat()
+    if known is not None and known.mtime == stat.st_mtime and known.size == stat.st_size:
+        return known
+    content = await path.read_bytes()
+    state = _FlowFileState(mtime=stat.st_mtime, size=stat.st_size, digest=hashlib.sha256(content).hexdigest())
+    if known is not None and known.digest == state.digest:
+        return state
+
+    update_data = orjson.loads(content)
+    flow = await session.get(Flow, flow_id)
+    if flow is None:
+        return state
     try:
-        while True:
+        changed = False
+        for field_name in ("name", "description", "data", "locked"):
+            if (new_value := update_data.get(field_name)) and getattr(flow, field_name) != new_value:
+                setattr(flow, field_name, new_value)
+                changed = True
+        if (folder_id := update_data.get("folder_id")) and flow.folder_id != UUID(folder_id):
+            flow.folder_id = UUID(folder_id)
+            changed = True
+        if changed:
+            await session.flush()
+            await logger.adebug(f"Updated flow {flow_id} from {path}")
+    except Exception:  # noqa: BLE001
+        await logger.aexception(f"Couldn't update flow {flow_id} in database from path {path}")
+    return state
+
+
+async def _sync_flow_files(
+    flow_paths: dict[UUID, anyio.Path],
+    file_states: dict[UUID, _FlowFileState],
+    flow_ids: Iterable[UUID],
+) -> None:
+    async with session_scope() as session:
+        for flow_id in flow_ids:
+            path = flow_paths[flow_id]
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        # Resolve path: if relative, construct full path using user's flows directory
-                        fs_path_str = flow.fs_path
-                        if not Path(fs_path_str).is_absolute():
-                            # Relative path - construct full path
-                            path = storage_service.data_dir / "flows" / str(flow.user_id) / fs_path_str
-                        else:
-                            # Absolute path - use as-is
-                            path = anyio.Path(fs_path_str)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.flush()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
-            except asyncio.CancelledError:
-                await logger.adebug("Flow sync cancelled")
-                break
-            except (sa.exc.OperationalError, ValueError) as e:
-                if "no active connection" in str(e) or "connection is closed" in str(e):
-                    await logger.adebug("Database connection lost, assuming shutdown")
-                    break  # Exit gracefully, don't error
-                raise  # Re-raise if it's a real connection problem
+                state = await sync_flow_from_file(session, flow_id, path, file_states.get(flow_id))
             except Exception:  # noqa: BLE001
-                await logger.aexception("Error while syncing flows from database")
-                break
+                await logger.aexception(f"Error while handling flow file {path}")
+                continue
+            if state is None:
+                file_states.pop(flow_id, None)
+            else:
+                file_states[flow_id] = state
+
+
+async def _load_fs_flow_paths() -> dict[UUID, anyio.Path]:
+    async with session_scope() as session:
+        return await get_fs_flow_paths(session, get_storage_service())
+
+
+async def _poll_flows_from_fs(file_states: dict[UUID, _FlowFileState]) -> None:
+    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
+    while True:
+        flow_paths = await _load_fs_flow_paths()
+        await _sync_flow_files(flow_paths, file_states, flow_paths)
+        for flow_id in set(file_states) - set(flow_paths):
+            del file_states[flow_id]
+        await asyncio.sleep(fs_flows_polling_interval)
+
+
+async def _watch_flows_from_fs(file_states: dict[UUID, _FlowFileState], awatch) -> None:
+    debounce = get_settings_service().settings.fs_flows_watch_debounce
+    flows_dir = get_storage_service().data_dir / "flows"
+    await flows_dir.mkdir(parents=True, exist_ok=True)
+    resync_event = _get_fs_resync_event()
+    while True:
+        resync_event.clear()
+        flow_paths = await _load_fs_flow_paths()
+        await _sync_flow_files(flow_paths, file_states, flow_paths)
+
+        # Watch the flows directory recursively and the directories of flows stored elsewhere
+        watch_dirs = {Path(str(flows_dir))}
+        for path in flow_paths.values():
+            if not Path(str(path)).is_relative_to(Path(str(flows_dir))) and await path.parent.exists():
+                watch_dirs.add(Path(str(path.parent)))
+        await logger.adebug(f"Watching {len(watch_dirs)} directories for {len(flow_paths)} flows")
+
+        async for changes in awatch(*watch_dirs, debounce=debounce, stop_event=resync_event):
+            changed_paths = {Path(changed_path) for _, changed_path in changes}
+            path_to_flow = {Path(str(path)): flow_id for flow_id, path in flow_paths.items()}
+            if changed_paths - set(path_to_flow):
+                # A file we don't track yet changed, so a flow may have been pointed at it
+                flow_paths = await _load_fs_flow_paths()
+                path_to_flow = {Path(str(path)): flow_id for flow_id, path in flow_paths.items()}
+            flow_ids = [path_to_flow[path] for path in changed_paths if path in path_to_flow]
+            if flow_ids:
+                await _sync_flow_files(flow_paths, file_states, flow_ids)
 
-            await asyncio.sleep(fs_flows_polling_interval)
+
+async def sync_flows_from_fs():
+    """Keep flows that have an ``fs_path`` in sync with their files.
+
+    Uses filesystem notifications through ``watchfiles`` when available and enabled, so an idle
+    instance does no work at all. Otherwise falls back to polling file metadata.
+    """
+    file_states: dict[UUID, _FlowFileState] = {}
+    awatch = None
+    if get_settings_service().settings.fs_flows_watch:
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            await logger.adebug("watchfiles is not installed, falling back to polling for flow sync")
+    try:
+        if awatch is not None:
+            await _watch_flows_from_fs(file_states, awatch)
+        else:
+            await _poll_flows_from_fs(file_states)
     except asyncio.CancelledError:
         await logger.adebug("Flow sync task cancelled")
+    except (sa.exc.OperationalError, ValueError) as e:
+        if "no active connection" in str(e) or "connection is closed" in str(e):
+            await logger.adebug("Database connection lost, assuming shutdown")
+            return
+        raise  # Re-raise if it's a real connection problem
+    except Exception:  # noqa: BLE001
+        await logger.aexception("Error while syncing flows from database")
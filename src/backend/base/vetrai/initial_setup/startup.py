@@ -0,0 +1,207 @@
+"""Dependency-aware application startup.
+
+The application lifespan declares its startup work as a small DAG of named steps. Steps whose dependencies
+are satisfied run concurrently, each step's duration is logged and exported as a metric, and the current
+readiness phase is tracked so the readiness endpoint can tell "serving" apart from "fully warmed".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+STARTUP_STEP_DURATION_METRIC = "startup_step_duration_seconds"
+
+
+class StartupPhase(str, Enum):
+    STARTING = "starting"
+    """Critical steps are still running; the instance must not receive traffic."""
+    SERVING = "serving"
+    """Critical steps finished; background warmup may still be running."""
+    WARM = "warm"
+    """Every startup and warmup step has finished."""
+
+
+class StartupStepError(RuntimeError):
+    """Raised when a critical startup step fails."""
+
+    def __init__(self, step_name: str, exc: BaseException):
+        super().__init__(f"Startup step '{step_name}' failed: {exc}")
+        self.step_name = step_name
+
+
+@dataclass
+class StartupStep:
+    """A named unit of startup work.
+
+    Args:
+        name: Unique step name, used for dependencies, logs and metrics.
+        func: Coroutine function receiving the results of the steps completed so far.
+        depends_on: Names of the steps that must complete before this one starts.
+        critical: Whether a failure aborts startup. Failed non-critical steps are logged
+            and their dependents are skipped.
+    """
+
+    name: str
+    func: Callable[[dict[str, Any]], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    critical: bool = True
+
+
+@dataclass
+class StartupState:
+    """Readiness state shared between the lifespan and the readiness endpoint."""
+
+    phase: StartupPhase = StartupPhase.STARTING
+    durations: dict[str, float] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: set[str] = field(default_factory=set)
+
+    def reset(self) -> None:
+        self.phase = StartupPhase.STARTING
+        self.durations.clear()
+        self.failed.clear()
+        self.skipped.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.phase.value,
+            "steps": {name: round(duration, 4) for name, duration in self.durations.items()},
+            "failed": sorted(self.failed),
+            "skipped": sorted(self.skipped),
+        }
+
+
+startup_state = StartupState()
+
+
+class _SkippedStepError(Exception):
+    """Internal marker raised when a dependency of a step did not complete."""
+
+
+def _validate_steps(steps: Iterable[StartupStep], completed: Iterable[str]) -> dict[str, StartupStep]:
+    by_name: dict[str, StartupStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            msg = f"Duplicate startup step '{step.name}'"
+            raise ValueError(msg)
+        by_name[step.name] = step
+
+    known = set(by_name) | set(completed)
+    for step in by_name.values():
+        if missing := set(step.depends_on) - known:
+            msg = f"Startup step '{step.name}' depends on unknown steps: {sorted(missing)}"
+            raise ValueError(msg)
+
+    # Depth-first search for cycles among the declared steps
+    visiting: set[str] = set()
+    visited: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in visited or name not in by_name:
+            return
+        if name in visiting:
+            msg = f"Startup steps contain a dependency cycle through '{name}'"
+            raise ValueError(msg)
+        visiting.add(name)
+        for dependency in by_name[name].depends_on:
+            visit(dependency)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in by_name:
+        visit(name)
+    return by_name
+
+
+def _record_duration(step_name: str, duration: float) -> None:
+    try:
+        from vetrai.services.deps import get_telemetry_service
+
+        get_telemetry_service().ot.observe_histogram(STARTUP_STEP_DURATION_METRIC, duration, {"step": step_name})
+    except Exception:  # noqa: BLE001
+        logger.debug(f"Could not export duration metric for startup step {step_name}")
+
+
+async def run_startup_steps(
+    steps: Iterable[StartupStep],
+    *,
+    state: StartupState | None = None,
+    results: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Run startup steps concurrently, honoring their declared dependencies.
+
+    Args:
+        steps: The steps to run. Dependencies may also name steps already present in ``results``.
+        state: Readiness state to record durations and failures into.
+        results: Results of previously completed steps. It is updated in place.
+
+    Returns:
+        The mapping of step name to the value returned by the step.
+
+    Raises:
+        StartupStepError: If a critical step fails or is skipped because a dependency failed.
+    """
+    state = state if state is not None else startup_state
+    results = results if results is not None else {}
+    by_name = _validate_steps(steps, results)
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run_step(step: StartupStep) -> Any:
+        for dependency in step.depends_on:
+            if dependency not in tasks:
+                continue
+            try:
+                await asyncio.shield(tasks[dependency])
+            except (StartupStepError, _SkippedStepError) as exc:
+                state.skipped.add(step.name)
+                await logger.awarning(f"Skipping startup step {step.name}: dependency {dependency} did not complete")
+                raise _SkippedStepError(step.name) from exc
+
+        await logger.adebug(f"Starting startup step {step.name}")
+        start = time.perf_counter()
+        try:
+            result = await step.func(results)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            state.failed[step.name] = str(exc)
+            if step.critical:
+                await logger.aerror(f"Critical startup step {step.name} failed: {exc}")
+            else:
+                await logger.awarning(f"Startup step {step.name} failed: {exc}")
+            raise StartupStepError(step.name, exc) from exc
+        duration = time.perf_counter() - start
+        results[step.name] = result
+        state.durations[step.name] = duration
+        _record_duration(step.name, duration)
+        await logger.adebug(f"Startup step {step.name} finished in {duration:.2f}s")
+        return result
+
+    for step in by_name.values():
+        tasks[step.name] = asyncio.create_task(run_step(step), name=f"startup:{step.name}")
+
+    try:
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    except asyncio.CancelledError:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    for step, outcome in zip(by_name.values(), outcomes, strict=True):
+        if isinstance(outcome, StartupStepError) and step.critical:
+            raise outcome
+        if isinstance(outcome, _SkippedStepError) and step.critical:
+            msg = f"Critical startup step '{step.name}' was skipped because a dependency failed"
+            raise StartupStepError(step.name, RuntimeError(msg)) from outcome
+        if isinstance(outcome, BaseException) and not isinstance(outcome, StartupStepError | _SkippedStepError):
+            raise outcome
+    return results
@@ -38,6 +38,7 @@ from vetrai.initial_setup.setup import (
     load_flows_from_directory,
     sync_flows_from_fs,
 )
+from vetrai.initial_setup.startup import StartupPhase, StartupStep, run_startup_steps, startup_state
 from vetrai.middleware import ContentSizeLimitMiddleware
 from vetrai.services.deps import (
     get_queue_service,
@@ -162,63 +163,44 @@ def get_lifespan(*, fix_migration=False, version=None):
 
         temp_dirs: list[TemporaryDirectory] = []
         sync_flows_from_fs_task = None
-        mcp_init_task = None
+        warmup_task = None
+        startup_state.reset()
 
-        try:
-            start_time = asyncio.get_event_loop().time()
-
-            await logger.adebug("Initializing services")
+        async def init_services(_results):
             await initialize_services(fix_migration=fix_migration)
-            await logger.adebug(f"Services initialized in {asyncio.get_event_loop().time() - start_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Setting up LLM caching")
+        async def init_llm_caching(_results):
             setup_llm_caching()
-            await logger.adebug(f"LLM caching setup in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Copying profile pictures")
+        async def copy_pictures(_results):
             await copy_profile_pictures()
-            await logger.adebug(f"Profile pictures copied in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            if get_settings_service().auth_settings.AUTO_LOGIN:
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Initializing default super user")
-                await initialize_auto_login_default_superuser()
-                await logger.adebug(
-                    f"Default super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                )
 
-            await logger.adebug("Initializing super user")
+        async def init_superuser(_results):
             await initialize_auto_login_default_superuser()
-            await logger.adebug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading bundles")
+        async def load_bundles(_results):
+            nonlocal temp_dirs
             temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
             get_settings_service().settings.components_path.extend(bundles_components_paths)
-            await logger.adebug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
-            await logger.adebug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
+        async def cache_types(_results):
+            return await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
 
+        async def create_starter_projects(results):
             # Use file-based lock to prevent multiple workers from creating duplicate starter projects concurrently.
             # Note that it's still possible that one worker may complete this task, release the lock,
             # then another worker pick it up, but the operation is idempotent so worst case it duplicates
             # the initialization work.
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Creating/updating starter projects")
-
             lock_file = Path(tempfile.gettempdir()) / "vetrai_starter_projects.lock"
-            lock = FileLock(lock_file, timeout=1)
+            # Acquired and released in worker threads, so the lock must not be bound to a thread, and waiting for it
+            # doesn't block the event loop while the other startup steps run
+            lock = FileLock(lock_file, timeout=1, thread_local=False)
             try:
-                with lock:
-                    await create_or_update_starter_projects(all_types_dict)
-                    await logger.adebug(
-                        f"Starter projects created/updated in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
+                await asyncio.to_thread(lock.acquire)
+                try:
+                    await create_or_update_starter_projects(results["cache_types"])
+                finally:
+                    await asyncio.to_thread(lock.release)
             except TimeoutError:
                 # Another process has the lock
                 await logger.adebug("Another worker is creating starter projects, skipping")
@@ -227,84 +209,88 @@ def get_lifespan(*, fix_migration=False, version=None):
                     f"Failed to acquire lock for starter projects: {e}. Starter projects may not be created or updated."
                 )
 
+        async def init_agentic_variables(_results):
             # Initialize agentic global variables early (before MCP server and flows)
-            if get_settings_service().settings.agentic_experience:
-                from vetrai.api.utils.mcp.agentic_mcp import initialize_agentic_global_variables
+            from vetrai.api.utils.mcp.agentic_mcp import initialize_agentic_global_variables
 
-                current_time = asyncio.get_event_loop().time()
-                await logger.ainfo("Initializing agentic global variables...")
-                try:
-                    async with session_scope() as session:
-                        await initialize_agentic_global_variables(session)
-                    await logger.adebug(
-                        f"Agentic global variables initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
-                except Exception as e:  # noqa: BLE001
-                    await logger.awarning(f"Failed to initialize agentic global variables: {e}")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting telemetry service")
+            try:
+                async with session_scope() as session:
+                    await initialize_agentic_global_variables(session)
+            except Exception as e:  # noqa: BLE001
+                await logger.awarning(f"Failed to initialize agentic global variables: {e}")
+
+        async def start_telemetry(_results):
             telemetry_service.start()
-            await logger.adebug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting MCP Composer service")
+        async def start_mcp_composer(_results):
             mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
             await mcp_composer_service.start()
-            await logger.adebug(
-                f"started MCP Composer service in {asyncio.get_event_loop().time() - current_time:.2f}s"
-            )
-
-            # Auto-configure Agentic MCP server if enabled (after variables are initialized)
-            if get_settings_service().settings.agentic_experience:
-                from vetrai.api.utils.mcp.agentic_mcp import auto_configure_agentic_mcp_server
 
-                current_time = asyncio.get_event_loop().time()
-                await logger.ainfo("Configuring Agentic MCP server...")
-                try:
-                    async with session_scope() as session:
-                        await auto_configure_agentic_mcp_server(session)
-                    await logger.adebug(
-                        f"Agentic MCP server configured in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
-                except Exception as e:  # noqa: BLE001
-                    await logger.awarning(f"Failed to configure agentic MCP server: {e}")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading flows")
+        async def load_flows(_results):
             await load_flows_from_directory()
-            sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
+
+        async def start_queue(_results):
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
-            await logger.adebug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            total_time = asyncio.get_event_loop().time() - start_time
-            await logger.adebug(f"Total initialization time: {total_time:.2f}s")
+        async def configure_agentic_mcp_server(_results):
+            from vetrai.api.utils.mcp.agentic_mcp import auto_configure_agentic_mcp_server
 
-            async def delayed_init_mcp_servers():
-                await asyncio.sleep(10.0)  # Increased delay to allow starter projects to be created
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Loading MCP servers for projects")
-                try:
-                    await init_mcp_servers()
-                    await logger.adebug(f"MCP servers loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-                except Exception as e:  # noqa: BLE001
-                    await logger.awarning(f"First MCP server initialization attempt failed: {e}")
-                    await asyncio.sleep(5.0)  # Increased retry delay
-                    current_time = asyncio.get_event_loop().time()
-                    await logger.adebug("Retrying MCP servers initialization")
-                    try:
-                        await init_mcp_servers()
-                        await logger.adebug(
-                            f"MCP servers loaded on retry in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                        )
-                    except Exception as e2:  # noqa: BLE001
-                        await logger.aexception(f"Failed to initialize MCP servers after retry: {e2}")
+            async with session_scope() as session:
+                await auto_configure_agentic_mcp_server(session)
+
+        async def load_mcp_servers(_results):
+            try:
+                await init_mcp_servers()
+            except Exception as e:  # noqa: BLE001
+                await logger.awarning(f"First MCP server initialization attempt failed: {e}")
+                await asyncio.sleep(5.0)
+                await logger.adebug("Retrying MCP servers initialization")
+                await init_mcp_servers()
+
+        agentic_experience = get_settings_service().settings.agentic_experience
+        startup_steps = [
+            StartupStep("services", init_services),
+            StartupStep("llm_caching", init_llm_caching, depends_on=("services",)),
+            StartupStep("profile_pictures", copy_pictures, depends_on=("services",)),
+            StartupStep("superuser", init_superuser, depends_on=("services",)),
+            StartupStep("bundles", load_bundles, depends_on=("superuser",)),
+            StartupStep("cache_types", cache_types, depends_on=("bundles",)),
+            StartupStep("starter_projects", create_starter_projects, depends_on=("cache_types",)),
+            StartupStep("telemetry", start_telemetry, depends_on=("services",)),
+            StartupStep("mcp_composer", start_mcp_composer, depends_on=("services",)),
+            # Flows can reference the agentic global variables, so they are loaded once those exist
+            StartupStep(
+                "load_flows",
+                load_flows,
+                depends_on=("bundles", "agentic_variables") if agentic_experience else ("bundles",),
+            ),
+            StartupStep("queue", start_queue, depends_on=("services",)),
+        ]
+        if agentic_experience:
+            startup_steps.append(StartupStep("agentic_variables", init_agentic_variables, depends_on=("superuser",)))
+
+        # Warmup steps run in the background once the instance is serving requests
+        warmup_steps = [
+            StartupStep("mcp_servers", load_mcp_servers, critical=False),
+        ]
+        if agentic_experience:
+            warmup_steps.append(
+                StartupStep(
+                    "agentic_mcp_server", configure_agentic_mcp_server, depends_on=("mcp_servers",), critical=False
+                )
+            )
 
-            # Start the delayed initialization as a background task
-            # Allows the server to start first to avoid race conditions with MCP Server startup
-            mcp_init_task = asyncio.create_task(delayed_init_mcp_servers())
+        async def run_warmup(results):
+            await run_startup_steps(warmup_steps, state=startup_state, results=results)
+            startup_state.phase = StartupPhase.WARM
+            await logger.adebug("Background warmup complete")
+
+        try:
+            start_time = asyncio.get_event_loop().time()
+            results = await run_startup_steps(startup_steps, state=startup_state)
+            sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
 
             # v1 and project MCP server context managers
             from vetrai.api.v1.mcp import start_streamable_http_manager
@@ -313,6 +299,14 @@ def get_lifespan(*, fix_migration=False, version=None):
             await start_streamable_http_manager()
             await start_project_task_group()
 
+            total_time = asyncio.get_event_loop().time() - start_time
+            await logger.adebug(f"Total initialization time: {total_time:.2f}s")
+            startup_state.phase = StartupPhase.SERVING
+
+            # The MCP project task group is running by now, so project servers can be loaded
+            # without racing the server startup.
+            warmup_task = asyncio.create_task(run_warmup(results))
+
             yield
         except asyncio.CancelledError:
             await logger.adebug("Lifespan received cancellation signal")
@@ -365,9 +359,9 @@ def get_lifespan(*, fix_migration=False, version=None):
                     if sync_flows_from_fs_task:
                         sync_flows_from_fs_task.cancel()
                         tasks_to_cancel.append(sync_flows_from_fs_task)
-                    if mcp_init_task and not mcp_init_task.done():
-                        mcp_init_task.cancel()
-                        tasks_to_cancel.append(mcp_init_task)
+                    if warmup_task and not warmup_task.done():
+                        warmup_task.cancel()
+                        tasks_to_cancel.append(warmup_task)
                     if tasks_to_cancel:
                         # Wait for all tasks to complete, capturing exceptions
                         results = await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
@@ -23,6 +23,7 @@ from vetrai.helpers.user import get_user_by_flow_id_or_endpoint_name
 from vetrai.services.database.models.api_key.crud import check_key
 from vetrai.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from vetrai.services.database.models.user.model import User, UserRead
+from vetrai.services.database.session import request_user_id
 from vetrai.services.deps import get_settings_service
 
 if TYPE_CHECKING:
@@ -147,6 +148,7 @@ async def api_key_security(
                 if settings_service.auth_settings.skip_auth_auto_login:
                     result = await get_user_by_username(db, settings_service.auth_settings.SUPERUSER)
                     logger.warning(AUTO_LOGIN_WARNING)
+                    request_user_id.set(result.id)
                     return UserRead.model_validate(result, from_attributes=True)
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -170,6 +172,7 @@ async def api_key_security(
             )
 
         if isinstance(result, User):
+            request_user_id.set(result.id)
             return UserRead.model_validate(result, from_attributes=True)
 
     msg = "Invalid result type"
@@ -376,6 +379,7 @@ async def get_current_user_for_sse(request: Request) -> User | UserRead:
 async def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]):
     if not current_user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
+    request_user_id.set(current_user.id)
     return current_user
 
 
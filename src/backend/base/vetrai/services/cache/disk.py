@@ -1,5 +1,4 @@
 import asyncio
-import pickle
 import time
 from typing import Generic
 
@@ -8,16 +7,29 @@ from lfx.log.logger import logger
 from lfx.services.cache.utils import CACHE_MISS
 
 from vetrai.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from vetrai.services.cache.serializer import CacheSerializer
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
-        self.cache = Cache(cache_dir)
+    def __init__(
+        self,
+        cache_dir,
+        max_size=None,
+        expiration_time=3600,
+        *,
+        size_limit=None,
+        persistent=False,
+        serializer: CacheSerializer | None = None,
+    ) -> None:
+        # size_limit bounds the cache in bytes; diskcache evicts the least recently stored items beyond it
+        self.cache = Cache(cache_dir) if size_limit is None else Cache(cache_dir, size_limit=size_limit)
+        self.persistent = persistent
+        self.serializer = serializer or CacheSerializer()
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
         # Later we should implement endpoints for the frontend to grab
         # output logs from the cache
-        if len(self.cache) > 0:
+        if not persistent and len(self.cache) > 0:
             self.cache.clear()
         self.lock = asyncio.Lock()
         self.max_size = max_size
@@ -35,7 +47,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.touch(key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return self.serializer.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             self.cache.delete(key)  # Log before deleting the expired item
         return CACHE_MISS
@@ -50,8 +62,12 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def _set(self, key, value) -> None:
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
-        await asyncio.to_thread(self.cache.set, key, item)
+        await asyncio.to_thread(self._store, key, value)
+
+    def _store(self, key, value) -> None:
+        # Encoding large values is CPU bound, so it runs in the worker thread with the write
+        encoded = self.serializer.dumps(value) if not isinstance(value, str | bytes) else value
+        self.cache.set(key, {"value": encoded, "time": time.time()})
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -91,5 +107,9 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         return await asyncio.to_thread(self.cache.__contains__, key)
 
     async def teardown(self) -> None:
+        if self.persistent:
+            # Persistent caches are shared with other workers and later restarts
+            self.cache.close()
+            return
         # Clean up the cache directory
         self.cache.clear(retry=True)
@@ -6,6 +6,7 @@ from lfx.log.logger import logger
 from typing_extensions import override
 
 from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.cache.serializer import CacheSerializer
 from vetrai.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
 from vetrai.services.factory import ServiceFactory
 
@@ -30,6 +31,7 @@ class CacheServiceFactory(ServiceFactory):
                 db=settings_service.settings.redis_db,
                 url=settings_service.settings.redis_url,
                 expiration_time=settings_service.settings.redis_cache_expire,
+                serializer=CacheSerializer.from_settings(settings_service.settings, default="dill"),
             )
 
         if settings_service.settings.cache_type == "memory":
@@ -40,5 +42,6 @@ class CacheServiceFactory(ServiceFactory):
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
+                serializer=CacheSerializer.from_settings(settings_service.settings),
             )
         return None
@@ -0,0 +1,230 @@
+"""Encoding of the values stored by the disk and Redis caches.
+
+Every encoded value starts with a small header that names the format and the compression of the payload, so a
+cache can be read after its serializer settings change. Values written before the header existed are plain
+pickles, which are still decoded.
+
+Formats:
+    pickle: pickle protocol 5.
+    dill: dill, which also handles classes created at runtime, like the ones of custom components.
+    msgpack: MessagePack for values made only of dicts with string keys, lists, strings, numbers, booleans and
+        None, which it decodes back to equal values. Other values, like tuples, dataclasses, UUIDs and datetimes,
+        which MessagePack would encode but decode as other types, are pickled instead.
+    graph: pickle protocol 5, but graphs built from flow data are stored as the state of their run
+        (see `Graph.get_run_state`) instead of their vertices, edges and components, and are built again from the
+        flow data when they are read.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from lfx.services.settings.base import Settings
+
+SerializerFormat = Literal["pickle", "dill", "msgpack", "graph"]
+CompressionType = Literal["zstd", "lz4"]
+
+_MAGIC = b"\xc1V"
+_HEADER_SIZE = len(_MAGIC) + 2
+
+_PICKLE, _DILL, _MSGPACK = 0, 1, 2
+_UNCOMPRESSED, _ZSTD, _LZ4 = 0, 1, 2
+_COMPRESSION_IDS = {"zstd": _ZSTD, "lz4": _LZ4}
+
+PICKLE_PROTOCOL = 5
+
+
+def _import_ormsgpack():
+    try:
+        import ormsgpack
+    except ImportError as exc:
+        msg = "The msgpack cache serializer requires ormsgpack. Install it with `uv pip install ormsgpack`."
+        raise ImportError(msg) from exc
+    return ormsgpack
+
+
+def _import_compression(compression: CompressionType):
+    package = "zstandard" if compression == "zstd" else "lz4"
+    try:
+        if compression == "zstd":
+            import zstandard as module
+        else:
+            import lz4.frame as module
+    except ImportError as exc:
+        msg = f"{compression} cache compression requires {package}. Install it with `uv pip install {package}`."
+        raise ImportError(msg) from exc
+    return module
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_json_native(value: Any) -> bool:
+    """Whether a value only holds JSON types, which MessagePack decodes back to equal values of the same types.
+
+    Types are compared exactly, since subclasses like enums would come back as their base type.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type in _JSON_SCALAR_TYPES:
+            continue
+        if item_type is list:
+            stack.extend(item)
+        elif item_type is dict and all(type(key) is str for key in item):
+            stack.extend(item.values())
+        else:
+            return False
+    return True
+
+
+class _GraphStatePickler(pickle.Pickler):
+    """Pickles graphs as the state of their run, so they are built again from their flow data when loaded."""
+
+    def __init__(self, file, graph_class: type, *, drop_unpicklable_builds: bool = False) -> None:
+        super().__init__(file, protocol=PICKLE_PROTOCOL)
+        self.graph_class = graph_class
+        self.drop_unpicklable_builds = drop_unpicklable_builds
+
+    def reducer_override(self, obj):
+        if not isinstance(obj, self.graph_class):
+            return NotImplemented
+        state = obj.get_run_state()
+        if state is None:
+            return NotImplemented
+        if self.drop_unpicklable_builds:
+            # Vertices whose outputs cannot be pickled are built again when they are needed
+            state["vertex_builds"] = {
+                vertex_id: build
+                for vertex_id, build in state["vertex_builds"].items()
+                if _is_picklable(build, self.graph_class)
+            }
+        return type(obj).from_run_state, (state,)
+
+
+def _is_picklable(value: Any, graph_class: type) -> bool:
+    try:
+        _GraphStatePickler(io.BytesIO(), graph_class).dump(value)
+    except Exception:  # noqa: BLE001
+        return False
+    return True
+
+
+class CacheSerializer:
+    """Encodes cache values in a configurable format, compressing the ones above a size threshold.
+
+    Args:
+        serializer: The format of the encoded values.
+        compression: Compression applied to encoded values of at least `compression_threshold` bytes, or None.
+        compression_threshold: Size in bytes from which encoded values are compressed.
+
+    Raises:
+        ImportError: If the package needed by the format or the compression is not installed.
+    """
+
+    def __init__(
+        self,
+        serializer: SerializerFormat = "pickle",
+        compression: CompressionType | None = None,
+        compression_threshold: int = 16 * 1024,
+    ) -> None:
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._ormsgpack = _import_ormsgpack() if serializer == "msgpack" else None
+        self._compressor = _import_compression(compression) if compression else None
+        if serializer == "graph":
+            from lfx.graph.graph.base import Graph
+
+            self._graph_class: type | None = Graph
+        else:
+            self._graph_class = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, default: SerializerFormat = "pickle") -> CacheSerializer:
+        """Creates the serializer configured in the settings, using `default` when none is set."""
+        return cls(
+            serializer=settings.cache_serializer or default,
+            compression=settings.cache_compression,
+            compression_threshold=settings.cache_compression_threshold,
+        )
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value.
+
+        Raises:
+            pickle.PicklingError, TypeError, AttributeError: If the value cannot be pickled.
+        """
+        value_format, payload = self._encode(value)
+        compression = _UNCOMPRESSED
+        if self._compressor is not None and len(payload) >= self.compression_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                compression = _COMPRESSION_IDS[self.compression]
+                payload = compressed
+        return _MAGIC + bytes((value_format, compression)) + payload
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a value encoded by `dumps` with any settings, or a plain pickle.
+
+        Raises:
+            ValueError: If the header names an unknown format or compression.
+            ImportError: If the package needed to decode the value is not installed.
+        """
+        if data[: len(_MAGIC)] != _MAGIC:
+            return pickle.loads(data)
+        value_format, compression = data[len(_MAGIC)], data[len(_MAGIC) + 1]
+        payload = memoryview(data)[_HEADER_SIZE:]
+        if compression == _ZSTD:
+            payload = _import_compression("zstd").ZstdDecompressor().decompress(payload)
+        elif compression == _LZ4:
+            payload = _import_compression("lz4").decompress(payload)
+        elif compression != _UNCOMPRESSED:
+            msg = f"Unknown cache value compression: {compression}"
+            raise ValueError(msg)
+
+        if value_format == _PICKLE:
+            return pickle.loads(payload)
+        if value_format == _DILL:
+            import dill
+
+            return dill.loads(bytes(payload))
+        if value_format == _MSGPACK:
+            return _import_ormsgpack().unpackb(payload)
+        msg = f"Unknown cache value format: {value_format}"
+        raise ValueError(msg)
+
+    def _encode(self, value: Any) -> tuple[int, bytes]:
+        if self.serializer == "dill":
+            import dill
+
+            return _DILL, dill.dumps(value, recurse=True)
+        if self._ormsgpack is not None:
+            if _is_json_native(value):
+                try:
+                    return _MSGPACK, self._ormsgpack.packb(value)
+                except TypeError:
+                    # Integers outside of the 64-bit range
+                    pass
+        elif self._graph_class is not None:
+            return _PICKLE, self._dump_graph_state(value)
+        return _PICKLE, pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+
+    def _dump_graph_state(self, value: Any) -> bytes:
+        buffer = io.BytesIO()
+        try:
+            _GraphStatePickler(buffer, self._graph_class).dump(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            buffer = io.BytesIO()
+            _GraphStatePickler(buffer, self._graph_class, drop_unpicklable_builds=True).dump(value)
+        return buffer.getvalue()
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            # Compressors are not thread safe and the caches encode from worker threads
+            return self._compressor.ZstdCompressor(level=3).compress(payload)
+        return self._compressor.compress(payload)
@@ -5,7 +5,6 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from lfx.log.logger import logger
 from lfx.services.cache.utils import CACHE_MISS
 from typing_extensions import override
@@ -17,6 +16,7 @@ from vetrai.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from vetrai.services.cache.serializer import CacheSerializer
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
@@ -196,7 +196,15 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        serializer: CacheSerializer | None = None,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +214,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            serializer (CacheSerializer, optional): Encodes the cached values. Defaults to dill.
         """
         # Redis is a main dependency, no need to import check
         from redis.asyncio import StrictRedis
@@ -219,6 +228,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.serializer = serializer or CacheSerializer("dill")
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -237,12 +247,12 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         if key is None:
             return CACHE_MISS
         value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        return self.serializer.loads(value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
-            if pickled := dill.dumps(value, recurse=True):
+            if pickled := self.serializer.dumps(value):
                 result = await self._client.setex(str(key), self.expiration_time, pickled)
                 if not result:
                     msg = "RedisCache could not set the value."
@@ -4,6 +4,7 @@ from .flow import Flow
 from .folder import Folder
 from .jobs import Job
 from .message import MessageTable
+from .starter_project import StarterProjectManifest
 from .transactions import TransactionTable
 from .user import User
 from .variable import Variable
@@ -15,6 +16,7 @@ __all__ = [
     "Folder",
     "Job",
     "MessageTable",
+    "StarterProjectManifest",
     "TransactionTable",
     "User",
     "Variable",
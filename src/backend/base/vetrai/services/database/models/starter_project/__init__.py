@@ -0,0 +1,5 @@
+from .model import StarterProjectManifest
+
+__all__ = [
+    "StarterProjectManifest",
+]
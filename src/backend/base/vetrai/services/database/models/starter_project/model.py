@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+
+class StarterProjectManifest(SQLModel, table=True):  # type: ignore[call-arg]
+    """Content hash of a starter project as last provisioned into the database.
+
+    On boot, starter projects whose hash matches the stored one are left untouched.
+    """
+
+    __tablename__ = "starter_project_manifest"
+
+    name: str = Field(primary_key=True)
+    content_hash: str = Field(nullable=False)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
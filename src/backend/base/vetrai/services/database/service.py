@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
 import sqlite3
 import sys
+import threading
 import time
 from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime, timezone
@@ -14,6 +16,9 @@ import anyio
 import sqlalchemy as sa
 from alembic import command, util
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from cachetools import TTLCache
 from lfx.log.logger import logger
 from lfx.services.deps import session_scope
 from sqlalchemy import event, inspect
@@ -23,21 +28,43 @@ from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, select, text
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
+from sqlmodel.orm.session import Session as SQLModelSession
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 from vetrai.initial_setup.constants import STARTER_FOLDER_NAME
 from vetrai.services.base import Service
 from vetrai.services.database import models
 from vetrai.services.database.models.user.crud import get_user_by_username
-from vetrai.services.database.session import NoopSession
+from vetrai.services.database.session import NoopSession, request_user_id
 from vetrai.services.database.utils import Result, TableResults
 from vetrai.services.deps import get_settings_service
 from vetrai.services.utils import teardown_superuser
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from lfx.services.settings.service import SettingsService
 
 
+# Seconds between the checks of workers waiting for another worker to migrate the database
+MIGRATION_POLL_INTERVAL = 1
+
+
+class _WriteTrackingSession(SQLModelSession):
+    """Session of the primary database that records in its `info` whether it wrote anything."""
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _on_flush(session, _flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _on_execute(execute_state) -> None:
+    if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+        execute_state.session.info["wrote"] = True
+
+
 class DatabaseService(Service):
     name = "database_service"
 
@@ -49,29 +76,26 @@ class DatabaseService(Service):
             raise ValueError(msg)
         self.database_url: str = settings_service.settings.database_url
         self._sanitize_database_url()
+        self.replica_url: str | None = settings_service.settings.database_replica_url
+        if self.replica_url:
+            self.replica_url = self._sanitize_url(self.replica_url)
+        # Users that wrote within the lag window of the replica, whose reads go to the primary
+        self._recent_writers: TTLCache = TTLCache(
+            maxsize=10_000, ttl=max(settings_service.settings.database_replica_lag_window, 0.001)
+        )
+        self._recent_writers_lock = threading.Lock()
 
         # This file is in vetrai.services.database.manager.py
         # the ini is in vetrai
         vetrai_dir = Path(__file__).parent.parent.parent
         self.script_location = vetrai_dir / "alembic"
         self.alembic_cfg_path = vetrai_dir / "alembic.ini"
+        self._heads: set[str] | None = None
 
         # register the event listener for sqlite as part of this class.
         # Using decorator will make the method not able to use self
         event.listen(Engine, "connect", self.on_connection)
-        if self.settings_service.settings.database_connection_retry:
-            self.engine = self._create_engine_with_retry()
-        else:
-            self.engine = self._create_engine()
-
-        # Create async session maker for efficient session creation
-        # This is the recommended SQLAlchemy 2.0+ pattern
-        # IMPORTANT: Must use SQLModel's AsyncSession (not SQLAlchemy's) for exec() method
-        self.async_session_maker = async_sessionmaker(
-            self.engine,
-            class_=SQLModelAsyncSession,  # SQLModel's AsyncSession with exec() support
-            expire_on_commit=False,
-        )
+        self._create_engines()
 
         # Check if Alembic should log to stdout or a file.
         # If file, check if the provided path is absolute, cross-platform.
@@ -93,20 +117,44 @@ class DatabaseService(Service):
 
     def reload_engine(self) -> None:
         self._sanitize_database_url()
-        if self.settings_service.settings.database_connection_retry:
-            self.engine = self._create_engine_with_retry()
-        else:
-            self.engine = self._create_engine()
+        self._create_engines()
+
+    def _create_engines(self) -> None:
+        """Create the engine and session maker of the primary database, and of the read replica if one is set."""
+        create_engine = (
+            self._create_engine_with_retry
+            if self.settings_service.settings.database_connection_retry
+            else self._create_engine
+        )
+        self.engine = create_engine()
 
+        # Create async session maker for efficient session creation
+        # This is the recommended SQLAlchemy 2.0+ pattern
+        # IMPORTANT: Must use SQLModel's AsyncSession (not SQLAlchemy's) for exec() method
         self.async_session_maker = async_sessionmaker(
             self.engine,
-            class_=SQLModelAsyncSession,
+            class_=SQLModelAsyncSession,  # SQLModel's AsyncSession with exec() support
             expire_on_commit=False,
+            # Primary sessions record their writes for read-your-writes routing when there is a replica
+            sync_session_class=_WriteTrackingSession if self.replica_url else None,
+        )
+
+        # The replica has a pool of its own, so read-heavy endpoints do not compete with writes for connections
+        self.replica_engine: AsyncEngine | None = create_engine(self.replica_url) if self.replica_url else None
+        self.replica_session_maker = (
+            async_sessionmaker(self.replica_engine, class_=SQLModelAsyncSession, expire_on_commit=False)
+            if self.replica_engine is not None
+            else None
         )
 
     def _sanitize_database_url(self):
         """Create the engine for the database."""
-        url_components = self.database_url.split("://", maxsplit=1)
+        self.database_url = self._sanitize_url(self.database_url)
+
+    @staticmethod
+    def _sanitize_url(database_url: str) -> str:
+        """Return `database_url` with the async driver of its dialect."""
+        url_components = database_url.split("://", maxsplit=1)
 
         driver = url_components[0]
 
@@ -121,7 +169,7 @@ class DatabaseService(Service):
                 )
             driver = "postgresql+psycopg"
 
-        self.database_url = f"{driver}://{url_components[1]}"
+        return f"{driver}://{url_components[1]}"
 
     def _build_connection_kwargs(self):
         """Build connection kwargs by merging deprecated settings with db_connection_settings.
@@ -143,7 +191,7 @@ class DatabaseService(Service):
 
         return connection_kwargs
 
-    def _create_engine(self) -> AsyncEngine:
+    def _create_engine(self, database_url: str | None = None) -> AsyncEngine:
         # Get connection settings from config, with defaults if not specified
         # if the user specifies an empty dict, we allow it.
         kwargs = self._build_connection_kwargs()
@@ -159,15 +207,15 @@ class DatabaseService(Service):
                 kwargs.pop("poolclass", None)
 
         return create_async_engine(
-            self.database_url,
+            database_url or self.database_url,
             connect_args=self._get_connect_args(),
             **kwargs,
         )
 
     @retry(wait=wait_fixed(2), stop=stop_after_attempt(10))
-    def _create_engine_with_retry(self) -> AsyncEngine:
+    def _create_engine_with_retry(self, database_url: str | None = None) -> AsyncEngine:
         """Create the engine for the database with retry logic."""
-        return self._create_engine()
+        return self._create_engine(database_url)
 
     def _get_connect_args(self):
         settings = self.settings_service.settings
@@ -221,6 +269,36 @@ class DatabaseService(Service):
             # Provides efficient session creation and proper connection pooling
             async with self.async_session_maker() as session:
                 yield session
+            if session.info.get("wrote") and (user_id := request_user_id.get()) is not None:
+                self.record_write(user_id)
+
+    def record_write(self, user_id: UUID | str) -> None:
+        """Route the reads of `user_id` to the primary database until the replica lag window has passed."""
+        with self._recent_writers_lock:
+            self._recent_writers[str(user_id)] = True
+
+    def wrote_recently(self, user_id: UUID | str) -> bool:
+        """Whether `user_id` wrote within the replica lag window, so the replica may not have their writes yet."""
+        with self._recent_writers_lock:
+            return str(user_id) in self._recent_writers
+
+    @asynccontextmanager
+    async def read_session(self, user_id: UUID | str | None = None):
+        """Create a session for reads, on the read replica if one is set.
+
+        The session reads from the primary database when there is no replica, or when `user_id` wrote within the
+        replica lag window. Nothing is committed: use session_scope() for writes.
+        """
+        if (
+            self.replica_session_maker is None
+            or self.settings_service.settings.use_noop_database
+            or (user_id is not None and self.wrote_recently(user_id))
+        ):
+            async with self._with_session() as session:
+                yield session
+        else:
+            async with self.replica_session_maker() as session:
+                yield session
 
     async def assign_orphaned_flows_to_superuser(self) -> None:
         """Assign orphaned flows to the default superuser when auto login is enabled."""
@@ -336,6 +414,72 @@ class DatabaseService(Service):
         async with self.engine.begin() as conn:
             await conn.run_sync(self._check_schema_health)
 
+    def _alembic_config(self, buffer) -> Config:
+        alembic_cfg = Config(stdout=buffer)
+        alembic_cfg.set_main_option("script_location", str(self.script_location))
+        alembic_cfg.set_main_option("sqlalchemy.url", self.database_url.replace("%", "%%"))
+        return alembic_cfg
+
+    def _alembic_buffer(self):
+        return (
+            nullcontext(sys.stdout) if self.alembic_log_to_stdout else self.alembic_log_path.open("a", encoding="utf-8")  # type: ignore[union-attr]
+        )
+
+    def _head_revisions(self) -> set[str]:
+        if self._heads is None:
+            self._heads = set(ScriptDirectory(str(self.script_location)).get_heads())
+        return self._heads
+
+    async def _stored_revisions(self) -> set[str]:
+        async with self.engine.connect() as conn:
+            return set(await conn.run_sync(lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads()))
+
+    async def is_at_head_revision(self) -> bool:
+        """Return whether the revision stored in the database is the head revision of the migrations."""
+        return await self._stored_revisions() == self._head_revisions()
+
+    def _migration_leader_lock_key(self) -> int:
+        # Distinct from the transaction lock that alembic/env.py takes around each upgrade
+        namespace = self.settings_service.settings.migration_lock_namespace or "vetrai"
+        return int(hashlib.sha256(f"{namespace}:boot".encode()).hexdigest()[:16], 16) % (2**63 - 1)
+
+    def _upgrade_to_head(self) -> None:
+        with self._alembic_buffer() as buffer:
+            buffer.write(f"{datetime.now(tz=timezone.utc).astimezone().isoformat()}: Upgrading to head\n")
+            command.upgrade(self._alembic_config(buffer), "head")
+
+    async def _migrate_as_leader(self) -> None:
+        """Upgrade the database to the head revision from a single worker.
+
+        On PostgreSQL, the worker that takes the leader lock upgrades while the others wait for the head revision,
+        taking over if the leader exits first. Other databases are upgraded in place, as alembic/env.py serializes
+        SQLite upgrades with an exclusive transaction.
+        """
+        if self.engine.dialect.name != "postgresql":
+            await asyncio.to_thread(self._upgrade_to_head)
+            return
+
+        lock_key = self._migration_leader_lock_key()
+        deadline = time.monotonic() + self.settings_service.settings.migration_wait_timeout
+        while True:
+            async with self.engine.connect() as conn:
+                if (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": lock_key})).scalar():
+                    try:
+                        if not await self.is_at_head_revision():
+                            await logger.ainfo("Upgrading the database to the head revision")
+                            await asyncio.to_thread(self._upgrade_to_head)
+                    finally:
+                        await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": lock_key})
+                        await conn.commit()
+                    return
+            if await self.is_at_head_revision():
+                return
+            if time.monotonic() > deadline:
+                msg = "Timed out waiting for another worker to migrate the database to the head revision"
+                raise RuntimeError(msg)
+            await logger.adebug("Waiting for another worker to migrate the database")
+            await asyncio.sleep(MIGRATION_POLL_INTERVAL)
+
     @staticmethod
     def init_alembic(alembic_cfg) -> None:
         logger.info("Initializing alembic")
@@ -357,10 +501,7 @@ class DatabaseService(Service):
             nullcontext(sys.stdout) if self.alembic_log_to_stdout else self.alembic_log_path.open("w", encoding="utf-8")  # type: ignore[union-attr]
         )
         with buffer_context as buffer:
-            alembic_cfg = Config(stdout=buffer)
-            # alembic_cfg.attributes["connection"] = session
-            alembic_cfg.set_main_option("script_location", str(self.script_location))
-            alembic_cfg.set_main_option("sqlalchemy.url", self.database_url.replace("%", "%%"))
+            alembic_cfg = self._alembic_config(buffer)
 
             if should_initialize_alembic:
                 try:
@@ -403,8 +544,31 @@ class DatabaseService(Service):
             except Exception:  # noqa: BLE001
                 await logger.adebug("Alembic not initialized")
                 should_initialize_alembic = True
+
+        if not should_initialize_alembic and not fix and self.settings_service.settings.migration_fast_boot:
+            # Reflecting the whole schema to diff it against the models is only needed when migrations changed.
+            # `check_migrations` runs the full check on demand.
+            if await self.is_at_head_revision():
+                await logger.adebug("Database is at the head revision, skipping the migration check")
+                return
+            await self._migrate_as_leader()
+            return
         await asyncio.to_thread(self._run_migrations, should_initialize_alembic, fix)
 
+    def _check_migrations(self) -> None:
+        with self._alembic_buffer() as buffer:
+            buffer.write(f"{datetime.now(tz=timezone.utc).astimezone().isoformat()}: Checking migrations\n")
+            command.check(self._alembic_config(buffer))
+
+    async def check_migrations(self) -> None:
+        """Compare the database schema with the models, like startup does when fast boot is disabled.
+
+        Raises:
+            alembic.util.exc.AutogenerateDiffsDetected: If the schema and the models differ.
+            alembic.util.exc.CommandError: If the database is not at the head revision.
+        """
+        await asyncio.to_thread(self._check_migrations)
+
     @staticmethod
     def try_downgrade_upgrade_until_success(alembic_cfg, retries=5) -> None:
         # Try -1 then head, if it fails, try -2 then head, etc.
@@ -523,3 +687,5 @@ class DatabaseService(Service):
         except Exception:  # noqa: BLE001
             await logger.aexception("Error tearing down database")
         await self.engine.dispose()
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
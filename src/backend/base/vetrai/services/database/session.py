@@ -1,3 +1,16 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# The user the current request is served for, set by the authentication dependencies. The writes of primary
+# sessions are recorded for this user, so that their next reads go to the primary instead of the read replica.
+request_user_id: ContextVar[UUID | None] = ContextVar("request_user_id", default=None)
+
+
 class NoopSession:
     class NoopBind:
         class NoopConnect:
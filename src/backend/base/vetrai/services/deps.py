@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from vetrai.services.cache.service import AsyncBaseCacheService, CacheService
     from vetrai.services.chat.service import ChatService
     from vetrai.services.database.service import DatabaseService
+    from vetrai.services.result_cache.service import ResultCacheService
     from vetrai.services.session.service import SessionService
     from vetrai.services.state.service import StateService
     from vetrai.services.store.service import StoreService
@@ -198,6 +199,17 @@ def get_shared_component_cache_service() -> CacheService:
     return get_service(ServiceType.SHARED_COMPONENT_CACHE_SERVICE, SharedComponentCacheServiceFactory())
 
 
+def get_result_cache_service() -> ResultCacheService:
+    """Retrieves the persistent component result cache service from the service manager.
+
+    Returns:
+        The result cache service instance.
+    """
+    from vetrai.services.result_cache.factory import ResultCacheServiceFactory
+
+    return get_service(ServiceType.RESULT_CACHE_SERVICE, ResultCacheServiceFactory())
+
+
 def get_session_service() -> SessionService:
     """Retrieves the session service from the service manager.
 
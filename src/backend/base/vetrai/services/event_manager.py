@@ -244,5 +244,6 @@ def create_webhook_event_manager(flow_id: str, run_id: str | None = None) -> Eve
     manager.register_event("on_end_vertex", "end_vertex")
     manager.register_event("on_build_start", "build_start")
     manager.register_event("on_build_end", "build_end")
+    manager.register_event("on_result_cache", "result_cache")
 
     return manager
@@ -76,8 +76,8 @@ def import_all_services_into_a_dict():
         try:
             service_name = ServiceType(service_type).value.replace("_service", "")
 
-            # Special handling for mcp_composer which is now in lfx module
-            if service_name == "mcp_composer":
+            # Special handling for services that are now in the lfx module
+            if service_name in {"mcp_composer", "http_client"}:
                 module_name = f"lfx.services.{service_name}.service"
             else:
                 module_name = f"vetrai.services.{service_name}.service"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from vetrai.services.base import Service
@@ -11,7 +12,8 @@ from vetrai.services.database.models.jobs.crud import get_job_by_job_id, get_job
 from vetrai.services.database.models.jobs.model import Job, JobStatus
 from vetrai.services.deps import session_scope
 
-# if TYPE_CHECKING:
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class JobService(Service):
@@ -40,11 +42,13 @@ class JobService(Service):
         async with session_scope() as session:
             return await get_jobs_by_flow_id(session, flow_id, page=page, size=page_size)
 
-    async def get_job_by_job_id(self, job_id: UUID | str) -> Job | None:
+    async def get_job_by_job_id(self, job_id: UUID | str, session: AsyncSession | None = None) -> Job | None:
         """Get job for a specific job ID.
 
         Args:
             job_id: The job ID to filter jobs by
+            session: Session to read the job with, for instance a read replica session. If None, a new session
+                of the primary database is used.
 
         Returns:
             Job object for the specified job ID
@@ -52,8 +56,10 @@ class JobService(Service):
         if isinstance(job_id, str):
             job_id = UUID(job_id)
 
-        async with session_scope() as session:
+        if session is not None:
             return await get_job_by_job_id(session, job_id)
+        async with session_scope() as db:
+            return await get_job_by_job_id(db, job_id)
 
     async def create_job(self, job_id: UUID, flow_id: UUID) -> Job:
         """Create a new job record with QUEUED status.
@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.cache.serializer import CacheSerializer
+from vetrai.services.cache.service import RedisCache
+from vetrai.services.factory import ServiceFactory
+from vetrai.services.result_cache.service import ResultCacheService
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class ResultCacheServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(ResultCacheService)
+
+    @override
+    def create(self, settings_service: "SettingsService"):
+        settings = settings_service.settings
+        if settings.result_cache_type == "redis":
+            cache = RedisCache(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                expiration_time=settings.result_cache_expire,
+                serializer=CacheSerializer.from_settings(settings, default="dill"),
+            )
+        else:
+            cache = AsyncDiskCache(
+                cache_dir=Path(settings.config_dir) / "result_cache",
+                expiration_time=settings.result_cache_expire,
+                size_limit=settings.result_cache_size_limit,
+                persistent=True,
+                serializer=CacheSerializer.from_settings(settings),
+            )
+        return ResultCacheService(cache)
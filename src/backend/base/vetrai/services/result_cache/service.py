@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from lfx.services.cache.utils import CACHE_MISS
+
+from vetrai.services.base import Service
+
+if TYPE_CHECKING:
+    from vetrai.services.cache.base import AsyncBaseCacheService, ExternalAsyncBaseCacheService
+
+
+class ResultCacheService(Service):
+    """Persistent, content-addressed store for component results.
+
+    Unlike the chat cache, which is keyed by flow build, entries are keyed by component code and inputs
+    and outlive restarts, so any worker can reuse them.
+    """
+
+    name = "result_cache_service"
+
+    def __init__(self, cache: AsyncBaseCacheService | ExternalAsyncBaseCacheService) -> None:
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Any:
+        value = await self.cache.get(key)
+        if value is CACHE_MISS:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.cache.set(key, value)
+
+    def get_stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    async def teardown(self) -> None:
+        await self.cache.teardown()
@@ -7,6 +7,8 @@ class ServiceType(str, Enum):
     AUTH_SERVICE = "auth_service"
     CACHE_SERVICE = "cache_service"
     SHARED_COMPONENT_CACHE_SERVICE = "shared_component_cache_service"
+    RESULT_CACHE_SERVICE = "result_cache_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
     SETTINGS_SERVICE = "settings_service"
     DATABASE_SERVICE = "database_service"
     CHAT_SERVICE = "chat_service"
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 import httpx
 from lfx.log.logger import logger
+from lfx.services.deps import get_http_client_service
 
 if TYPE_CHECKING:
     from vetrai.services.store.schema import ListComponentResponse
@@ -43,8 +44,8 @@ async def update_components_with_user_data(
 # Get the latest released version of vetrai (https://pypi.org/project/vetrai/)
 async def get_lf_version_from_pypi():
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("https://pypi.org/pypi/vetrai/json")
+        client = get_http_client_service().get_async_client()
+        response = await client.get("https://pypi.org/pypi/vetrai/json")
         if response.status_code != httpx.codes.OK:
             return None
         return response.json()["info"]["version"]
@@ -140,6 +140,13 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="startup_step_duration_seconds",
+            description="Duration of each named application startup step",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"step": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
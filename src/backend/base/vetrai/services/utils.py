@@ -137,6 +137,16 @@ async def teardown_services() -> None:
     service_manager = get_service_manager()
     await service_manager.teardown()
 
+    from lfx.base.data.docling_pool import shutdown_docling_pool
+    from lfx.base.vectorstores.registry import clear_vector_store_registry
+    from lfx.custom.template_cache import clear_template_cache
+    from lfx.utils.executors import shutdown_executor_pools
+
+    shutdown_executor_pools(wait=False)
+    shutdown_docling_pool(wait=False)
+    clear_vector_store_registry()
+    clear_template_cache()
+
 
 def initialize_settings_service() -> None:
     """Initialize the settings manager."""
@@ -223,6 +233,7 @@ def register_all_service_factories() -> None:
     from lfx.services.manager import get_service_manager
 
     service_manager = get_service_manager()
+    from lfx.services.http_client import factory as http_client_factory
     from lfx.services.mcp_composer import factory as mcp_composer_factory
     from lfx.services.settings import factory as settings_factory
 
@@ -231,6 +242,7 @@ def register_all_service_factories() -> None:
     from vetrai.services.chat import factory as chat_factory
     from vetrai.services.database import factory as database_factory
     from vetrai.services.job_queue import factory as job_queue_factory
+    from vetrai.services.result_cache import factory as result_cache_factory
     from vetrai.services.session import factory as session_factory
     from vetrai.services.shared_component_cache import factory as shared_component_cache_factory
     from vetrai.services.state import factory as state_factory
@@ -258,8 +270,10 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(task_factory.TaskServiceFactory())
     service_manager.register_factory(store_factory.StoreServiceFactory())
     service_manager.register_factory(shared_component_cache_factory.SharedComponentCacheServiceFactory())
+    service_manager.register_factory(result_cache_factory.ResultCacheServiceFactory())
     service_manager.register_factory(auth_factory.AuthServiceFactory())
     service_manager.register_factory(mcp_composer_factory.MCPComposerServiceFactory())
+    service_manager.register_factory(http_client_factory.HTTPClientServiceFactory())
     service_manager.set_factory_registered()
 
 
@@ -1,10 +1,15 @@
 import asyncio
 import base64
+import contextlib
+import queue
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 from lfx.log import logger
-from scipy.signal import resample
+from scipy.signal import firwin, resample, upfirdn
 
 SAMPLE_RATE_24K = 24000
 VAD_SAMPLE_RATE_16K = 16000
@@ -43,6 +48,145 @@ def resample_24k_to_16k(frame_24k_bytes):
     return frame_16k.tobytes()
 
 
+class StreamingResampler:
+    """Polyphase FIR resampler for a stream of int16 PCM chunks.
+
+    The filter state is kept across calls, so chunks of any size can be resampled one after the other without
+    the edge artifacts and per-frame FFT of ``resample_24k_to_16k``. The filter matches
+    ``scipy.signal.resample_poly``; the output is delayed by the filter's half length.
+    """
+
+    def __init__(self, up: int = 2, down: int = 3) -> None:
+        self.up = up
+        self.down = down
+        max_rate = max(up, down)
+        half_len = 10 * max_rate
+        self._taps = firwin(2 * half_len + 1, 1 / max_rate, window=("kaiser", 5.0)) * up
+        # Input samples needed before the newest one to compute an output
+        self._context = -(-len(self._taps) // up) - 1
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts a new stream, for when the next chunk does not follow the previous one."""
+        # The history always starts at a multiple of `down`, so outputs of `upfirdn` over the history plus the
+        # new chunk line up with outputs of the whole stream
+        history_length = -(-self._context // self.down) * self.down
+        self._history = np.zeros(history_length, dtype=np.float64)
+        self._history_start = -history_length
+        self._next_output = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resamples the next chunk of the stream and returns the int16 samples that became available."""
+        stream = np.concatenate([self._history, samples])
+        stream_end = self._history_start + len(stream)
+        # Output m uses the input samples up to index (m * down) // up
+        last_output = (stream_end * self.up - 1) // self.down
+        first_local_output = self._next_output - self._history_start * self.up // self.down
+        resampled = upfirdn(self._taps, stream, self.up, self.down)
+        resampled = resampled[first_local_output : first_local_output + last_output + 1 - self._next_output]
+
+        self._next_output = last_output + 1
+        history_start = (stream_end - self._context) // self.down * self.down
+        self._history = stream[history_start - self._history_start :]
+        self._history_start = history_start
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16)
+
+
+class VadPipeline:
+    """Decodes, resamples and classifies streamed 24kHz client audio for barge-in detection.
+
+    ``process`` is blocking and meant to run in a worker thread on batches of queued chunks, see ``VadWorker``.
+    """
+
+    def __init__(self, vad) -> None:
+        self.vad = vad
+        self._resampler = StreamingResampler(up=2, down=3)
+        self._pcm_remainder = b""
+        self._frames_16k = bytearray()
+
+    def reset(self) -> None:
+        """Drops the state kept from previous chunks, for when chunks were dropped from the stream.
+
+        Resampling across the gap would mix audio from both sides of it into the filter history.
+        """
+        self._resampler.reset()
+        self._pcm_remainder = b""
+        self._frames_16k.clear()
+
+    def process(self, chunks: list[str]) -> bool:
+        """Processes base64-encoded 24kHz PCM chunks and returns whether any complete frame contained speech."""
+        pcm = self._pcm_remainder + b"".join(base64.b64decode(chunk) for chunk in chunks)
+        usable = len(pcm) - len(pcm) % BYTES_PER_SAMPLE
+        self._pcm_remainder = pcm[usable:]
+        self._frames_16k.extend(self._resampler.process(np.frombuffer(pcm[:usable], dtype=np.int16)).tobytes())
+
+        has_speech = False
+        frames = memoryview(self._frames_16k)
+        consumed = 0
+        while len(frames) - consumed >= BYTES_PER_16K_FRAME:
+            frame = bytes(frames[consumed : consumed + BYTES_PER_16K_FRAME])
+            consumed += BYTES_PER_16K_FRAME
+            has_speech = self.vad.is_speech(frame, VAD_SAMPLE_RATE_16K) or has_speech
+        frames.release()
+        del self._frames_16k[:consumed]
+        return has_speech
+
+
+class VadWorker:
+    """Worker thread processing the queued audio of every voice session in batches, off the event loop.
+
+    Jobs submitted while a batch is running are picked up together in the next batch, and their results are
+    handed back to each event loop with a single callback per batch.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, pipeline: VadPipeline, chunks: list[str]) -> asyncio.Future[bool]:
+        """Schedules ``pipeline.process(chunks)`` and returns a future for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="vetrai-voice-vad", daemon=True)
+                self._thread.start()
+        self._jobs.put((loop, future, pipeline, chunks))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            jobs = [self._jobs.get()]
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    jobs.append(self._jobs.get_nowait())
+            results: dict[asyncio.AbstractEventLoop, list] = defaultdict(list)
+            for loop, future, pipeline, chunks in jobs:
+                try:
+                    results[loop].append((future, pipeline.process(chunks), None))
+                except Exception as exc:  # noqa: BLE001
+                    results[loop].append((future, None, exc))
+            for loop, loop_results in results.items():
+                with contextlib.suppress(RuntimeError):  # The event loop was closed
+                    loop.call_soon_threadsafe(_set_vad_results, loop_results)
+
+
+def _set_vad_results(results: list) -> None:
+    for future, result, exc in results:
+        if future.done():
+            continue
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+
+@lru_cache(maxsize=1)
+def get_vad_worker() -> VadWorker:
+    return VadWorker()
+
+
 # def resample_24k_to_16k(frame_24k_bytes: bytes) -> bytes:
 #    """
 #    Convert one 20ms chunk (960 bytes @ 24kHz) to 20ms @ 16kHz (640 bytes).
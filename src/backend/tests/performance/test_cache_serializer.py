@@ -0,0 +1,105 @@
+"""Benchmark the cache serializers on the values the chat service caches during builds.
+
+Every `build_vertex` caches the whole graph of the flow, and frozen vertices cache their build outputs. The Redis
+caches encode them with dill by default and the disk caches with pickle, which cannot encode the component
+classes created from flow code, so graphs are only benchmarked with dill and the graph state codec.
+
+Run with: pytest src/backend/tests/performance/test_cache_serializer.py -s
+"""
+
+import json
+import time
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.models_and_agents.prompt import PromptComponent
+from lfx.components.processing.split_text import SplitTextComponent
+from lfx.graph.graph.base import Graph
+from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.cache.serializer import CacheSerializer
+
+ITERATIONS = 5
+# Settings each backend can be configured with; (backend, serializer, compression)
+CONFIGURATIONS = [
+    ("redis", "dill", None),
+    ("redis", "dill", "zstd"),
+    ("redis", "graph", None),
+    ("redis", "graph", "zstd"),
+    ("disk", "pickle", None),
+    ("disk", "pickle", "lz4"),
+    ("disk", "msgpack", "zstd"),
+    ("disk", "graph", "lz4"),
+]
+
+
+async def _cached_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    prompt = PromptComponent(_id="prompt")
+    prompt.set(template="Summarize the document for the user.\n\n{document}\n\nUser: {question}")
+    prompt.set(question=chat_input.message_response)
+    split = SplitTextComponent(_id="split", chunk_size=200, chunk_overlap=20)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=prompt.build_prompt)
+    payload = json.loads(json.dumps(Graph(start=chat_input, end=chat_output).dump()["data"]))
+    payload["nodes"].append(split.to_frontend_node())
+    graph = Graph.from_payload(payload, flow_id="flow", flow_name="Summarize", user_id="user")
+    graph.prepare()
+    graph.set_run_id("run")
+    await graph.build_vertex("chat_input", inputs_dict={"input_value": "What is this document about? " * 50})
+    return graph
+
+
+def _measure(codec: CacheSerializer, value) -> tuple[float, float, int]:
+    encoded = codec.dumps(value)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        codec.dumps(value)
+    encode = (time.perf_counter() - start) / ITERATIONS
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        codec.loads(encoded)
+    decode = (time.perf_counter() - start) / ITERATIONS
+    return encode, decode, len(encoded)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_cached_graph_serializers():
+    graph = await _cached_graph()
+    value = {"result": graph, "type": type(graph)}
+    timings = {}
+    print("\ncached graph (backend, serializer, compression: encode, decode, stored bytes)")  # noqa: T201
+    for backend, serializer, compression in CONFIGURATIONS:
+        if serializer not in {"dill", "graph"}:
+            continue
+        encode, decode, size = _measure(CacheSerializer(serializer, compression), value)
+        timings[serializer, compression] = encode, size
+        print(  # noqa: T201
+            f"  {backend}, {serializer}, {compression}: {encode * 1000:.2f} ms, {decode * 1000:.2f} ms, {size} bytes"
+        )
+
+    dill_encode, dill_size = timings["dill", None]
+    graph_encode, graph_size = timings["graph", "zstd"]
+    assert graph_encode < dill_encode / 10
+    assert graph_size < dill_size / 4
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("backend", "serializer", "compression"), CONFIGURATIONS)
+async def test_benchmark_cached_vertex_builds(tmp_path, backend, serializer, compression):
+    graph = await _cached_graph()
+    value = {"result": graph.get_vertex("chat_input").get_build_state(), "type": dict}
+    codec = CacheSerializer(serializer, compression)
+    encode, decode, size = _measure(codec, value)
+
+    cache = AsyncDiskCache(tmp_path, serializer=codec)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await cache.set("chat_input", value)
+        await cache.get("chat_input")
+    disk_round_trip = (time.perf_counter() - start) / ITERATIONS
+
+    print(  # noqa: T201
+        f"\nvertex build ({backend}, {serializer}, {compression}): encode {encode * 1e6:.0f} µs, "
+        f"decode {decode * 1e6:.0f} µs, {size} bytes, disk set+get {disk_round_trip * 1e6:.0f} µs"
+    )
+    assert (await cache.get("chat_input"))["result"]["built"]
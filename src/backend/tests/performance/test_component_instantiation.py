@@ -0,0 +1,55 @@
+"""Benchmark instantiating 10,000 components of the common types, as flows with many vertices and loops do.
+
+Every instance copies the input and output definitions of its class. ``copy_definition`` shares their immutable
+field values instead of deep copying them, and the class source and output return types are resolved once per
+class, so this measures what is left of the construction cost.
+
+Run with: pytest src/backend/tests/performance/test_component_instantiation.py -s
+"""
+
+import time
+from copy import deepcopy
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput, TextInputComponent
+from lfx.components.models_and_agents.prompt import PromptComponent
+from lfx.components.openai.openai_chat_model import OpenAIModelComponent
+from lfx.components.processing.parser import ParserComponent
+from lfx.components.processing.split_text import SplitTextComponent
+
+N_COMPONENTS = 10_000
+COMPONENT_CLASSES = [
+    ChatInput,
+    ChatOutput,
+    TextInputComponent,
+    PromptComponent,
+    ParserComponent,
+    SplitTextComponent,
+    OpenAIModelComponent,
+]
+
+
+@pytest.mark.benchmark
+def test_benchmark_component_instantiation():
+    """Instantiating a component should cost well under a millisecond."""
+    for component_class in COMPONENT_CLASSES:
+        component_class()
+
+    start = time.perf_counter()
+    for i in range(N_COMPONENTS):
+        COMPONENT_CLASSES[i % len(COMPONENT_CLASSES)]()
+    elapsed = time.perf_counter() - start
+
+    # What every instance used to pay: a deepcopy of each input and output definition
+    start = time.perf_counter()
+    for i in range(N_COMPONENTS):
+        component_class = COMPONENT_CLASSES[i % len(COMPONENT_CLASSES)]
+        deepcopy(component_class.inputs)
+        deepcopy(component_class.outputs)
+    deepcopy_elapsed = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\n{N_COMPONENTS} components: {elapsed:.2f} s ({elapsed / N_COMPONENTS * 1e6:.0f} µs each), "
+        f"deep copying their definitions alone: {deepcopy_elapsed:.2f} s"
+    )
+    assert elapsed < deepcopy_elapsed
@@ -0,0 +1,82 @@
+"""Benchmark scanning a directory of custom components with and without the component manifest.
+
+Run with: pytest src/backend/tests/performance/test_component_manifest.py -s
+"""
+
+import time
+
+import pytest
+from lfx.custom.directory_reader.manifest import ComponentManifest
+from lfx.custom.directory_reader.utils import abuild_custom_component_list_from_path
+
+N_COMPONENTS = 200
+
+COMPONENT_CODE = """
+from lfx.custom.custom_component.component import Component
+from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output
+from lfx.schema.data import Data
+from lfx.schema.message import Message
+
+
+class Custom{index}(Component):
+    display_name = "Custom {index}"
+    description = "Custom component number {index}."
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        IntInput(name="limit", display_name="Limit", value=10),
+        BoolInput(name="strict", display_name="Strict", value=False),
+        DropdownInput(name="mode", display_name="Mode", options=["fast", "accurate"], value="fast"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="message", method="build_message"),
+        Output(display_name="Data", name="data", method="build_data"),
+    ]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text[: self.limit])
+
+    def build_data(self) -> Data:
+        return Data(data={{"text": self.text, "mode": self.mode, "strict": self.strict}})
+"""
+
+
+@pytest.mark.benchmark
+async def test_benchmark_component_manifest_scan(tmp_path):
+    """A warm scan only stats files, so it should be much faster than parsing and building every component."""
+    components_path = tmp_path / "components"
+    for team in range(4):
+        category = components_path / f"team_{team}"
+        category.mkdir(parents=True)
+        for index in range(team, N_COMPONENTS, 4):
+            (category / f"custom_{index}.py").write_text(COMPONENT_CODE.format(index=index))
+
+    start = time.perf_counter()
+    uncached = await abuild_custom_component_list_from_path(str(components_path))
+    no_manifest = time.perf_counter() - start
+
+    manifest = ComponentManifest(tmp_path / "manifest.db", "benchmark")
+    start = time.perf_counter()
+    await abuild_custom_component_list_from_path(str(components_path), manifest=manifest)
+    cold = time.perf_counter() - start
+
+    # A new manifest instance on the same file behaves like another worker or a restarted server
+    start = time.perf_counter()
+    warm_result = await abuild_custom_component_list_from_path(
+        str(components_path), manifest=ComponentManifest(tmp_path / "manifest.db", "benchmark")
+    )
+    warm = time.perf_counter() - start
+
+    changed = components_path / "team_0" / "custom_0.py"
+    changed.write_text(COMPONENT_CODE.format(index=0).replace("Custom component", "Changed component"))
+    start = time.perf_counter()
+    await abuild_custom_component_list_from_path(str(components_path), manifest=manifest)
+    one_changed = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\nScan of {N_COMPONENTS} custom components: no manifest {no_manifest * 1000:.0f} ms, "
+        f"cold {cold * 1000:.0f} ms, warm {warm * 1000:.0f} ms, one file changed {one_changed * 1000:.0f} ms"
+    )
+    assert warm_result == uncached
+    assert sum(len(components) for components in warm_result.values()) == N_COMPONENTS
+    assert warm < no_manifest / 5
+    assert one_changed < no_manifest / 2
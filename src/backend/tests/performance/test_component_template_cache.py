@@ -0,0 +1,61 @@
+"""Benchmark replaying a session of editing a component in the UI, with and without the component template cache.
+
+While a user edits a component, the UI rebuilds its template on every field change and validates its code on every
+code change. Each request evaluated the code of the component again. Templates, code trees and validation results
+are now cached by code, so only requests carrying new code evaluate it.
+
+Run with: pytest src/backend/tests/performance/test_component_template_cache.py -s
+"""
+
+import inspect
+import time
+
+import pytest
+from lfx.components.models_and_agents.agent import AgentComponent
+from lfx.custom.custom_component.component import Component
+from lfx.custom.template_cache import TemplateCache
+from lfx.custom.utils import build_custom_component_template
+from vetrai.api.v1.base import Code
+from vetrai.api.v1.validate import post_validate_code
+
+CODE_EDITS = 5
+FIELD_CHANGES_PER_EDIT = 10
+
+
+async def _replay_session(code: str) -> int:
+    """Edit the code a few times, changing field values between edits, and return the number of requests."""
+    requests = 0
+    for edit in range(CODE_EDITS):
+        edited = f"{code}\n# edit {edit}\n"
+        await post_validate_code(Code(code=edited))
+        build_custom_component_template(Component(_code=edited), user_id="user")
+        requests += 2
+        for _ in range(FIELD_CHANGES_PER_EDIT):
+            build_custom_component_template(Component(_code=edited), user_id="user")
+            requests += 1
+    return requests
+
+
+@pytest.mark.benchmark
+async def test_benchmark_component_editing_session(monkeypatch):
+    code = inspect.getsource(inspect.getmodule(AgentComponent))
+    # Warm up the imports of the component code
+    build_custom_component_template(Component(_code=code), user_id="user")
+
+    monkeypatch.setattr("lfx.custom.template_cache._template_cache", TemplateCache(ttl=0))
+    start = time.perf_counter()
+    requests = await _replay_session(code)
+    uncached = time.perf_counter() - start
+
+    cache = TemplateCache()
+    monkeypatch.setattr("lfx.custom.template_cache._template_cache", cache)
+    start = time.perf_counter()
+    await _replay_session(code)
+    cached = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\nediting session of {requests} requests: uncached {uncached / requests * 1000:.1f} ms/request, "
+        f"cached {cached / requests * 1000:.1f} ms/request ({cache.hits} hits, {cache.misses} misses)"
+    )
+    assert cache.misses == 2 * CODE_EDITS
+    assert cached < uncached
@@ -0,0 +1,98 @@
+"""Benchmark Docling conversion throughput in the server process and in the Docling process pool.
+
+The Docling component used to convert the files of a build one after another in a thread of the server. The pool
+converts them in parallel in worker processes that keep their converters loaded. Both are warmed up first, so
+model loading is not measured.
+
+The corpus is the PDF files of the directory in ``DOCLING_BENCHMARK_CORPUS`` or, if it is not set, generated
+text PDFs.
+
+Run with: pytest src/backend/tests/performance/test_docling_pool.py -s
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("docling")
+
+from lfx.base.data.docling_pool import DoclingProcessPool
+from lfx.base.data.docling_utils import convert_document
+
+GENERATED_FILES = 16
+WORKERS = min(4, os.cpu_count() or 1)
+OPTIONS = {
+    "pipeline": "standard",
+    "ocr_engine": "None",
+    "do_picture_classification": False,
+    "pic_desc_config": None,
+    "pic_desc_prompt": "",
+}
+
+
+def _text_pdf(path: Path, lines: list[str]) -> None:
+    text = "\n".join(f"({line}) Tj 0 -16 Td" for line in lines)
+    stream = f"BT /F1 11 Tf 56 780 Td\n{text}\nET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R "
+            b"/Resources << /Font << /F1 5 0 R >> >> >>"
+        ),
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    content = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(content))
+
+
+def _corpus(tmp_path: Path) -> list[str]:
+    if directory := os.environ.get("DOCLING_BENCHMARK_CORPUS"):
+        return sorted(str(path) for path in Path(directory).glob("*.pdf"))
+    paths = []
+    for index in range(GENERATED_FILES):
+        path = tmp_path / f"report_{index}.pdf"
+        _text_pdf(
+            path, [f"Quarterly report {index}, section {line}: revenue grew in every region." for line in range(40)]
+        )
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.benchmark
+def test_benchmark_docling_pool_throughput(tmp_path):
+    corpus = _corpus(tmp_path)
+
+    convert_document(corpus[0], OPTIONS)
+    start = time.perf_counter()
+    in_process = [convert_document(path, OPTIONS) for path in corpus]
+    in_process_seconds = time.perf_counter() - start
+
+    pool = DoclingProcessPool(max_workers=WORKERS, task_timeout=None)
+    try:
+        for future in [pool.submit(convert_document, path, OPTIONS) for path in corpus[:WORKERS]]:
+            future.result()
+        start = time.perf_counter()
+        pooled = [future.result() for future in [pool.submit(convert_document, path, OPTIONS) for path in corpus]]
+        pooled_seconds = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    print(  # noqa: T201
+        f"\nDocling conversion of {len(corpus)} PDFs: in process {len(corpus) / in_process_seconds:.2f} files/s, "
+        f"pool of {WORKERS} workers {len(corpus) / pooled_seconds:.2f} files/s"
+    )
+    assert [result["file_path"] for result in pooled] == [result["file_path"] for result in in_process]
+    if WORKERS > 1:
+        assert pooled_seconds < in_process_seconds
@@ -0,0 +1,74 @@
+"""Benchmark how a flow of slow blocking components affects another flow and event emission.
+
+One flow runs many blocking calls, like components that wait on HTTP requests, while a second flow runs quick
+blocking calls and emits token events. With the loop's default executor, which is what `asyncio.to_thread` uses,
+the quick calls and the events queue behind the slow ones. With the executor pools the events have their own pool
+and the per-flow limit keeps the slow flow from taking every thread of the `io` pool.
+
+Run with: pytest src/backend/tests/performance/test_executor_pools.py -s
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lfx.utils.executors import EVENTS_POOL, IO_POOL, configure_executor_pools, get_executor_pool, run_in_pool
+
+SLOW_CALLS = 64
+SLOW_CALL_SECONDS = 0.2
+QUICK_CALLS = 20
+EVENTS = 50
+
+
+async def _to_thread(_pool: str, func, *args, flow_id: str | None = None):  # noqa: ARG001
+    return await asyncio.to_thread(func, *args)
+
+
+async def _timed(run, pool: str, seconds: float, flow_id: str) -> float:
+    start = time.perf_counter()
+    await run(pool, time.sleep, seconds, flow_id=flow_id)
+    return time.perf_counter() - start
+
+
+async def _mixed_workload(run) -> dict[str, float]:
+    slow = [asyncio.create_task(_timed(run, IO_POOL, SLOW_CALL_SECONDS, "slow flow")) for _ in range(SLOW_CALLS)]
+    await asyncio.sleep(0.01)
+    quick = [asyncio.create_task(_timed(run, IO_POOL, 0.001, "quick flow")) for _ in range(QUICK_CALLS)]
+    events = [asyncio.create_task(_timed(run, EVENTS_POOL, 0, "quick flow")) for _ in range(EVENTS)]
+    start = time.perf_counter()
+    quick_latencies = await asyncio.gather(*quick)
+    event_latencies = await asyncio.gather(*events)
+    quick_flow_seconds = time.perf_counter() - start
+    await asyncio.gather(*slow)
+    return {
+        "quick flow": quick_flow_seconds,
+        "slowest quick call": max(quick_latencies),
+        "slowest event": max(event_latencies),
+        "slow flow": time.perf_counter() - start,
+    }
+
+
+@pytest.mark.benchmark
+async def test_benchmark_executor_pool_isolation():
+    loop = asyncio.get_running_loop()
+    # The size asyncio gives the default executor
+    default_workers = min(32, (os.cpu_count() or 1) + 4)
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=default_workers))
+    shared = await _mixed_workload(_to_thread)
+
+    configure_executor_pools(sizes={IO_POOL: 16}, flow_limit=8)
+    try:
+        pooled = await _mixed_workload(run_in_pool)
+        io_stats = get_executor_pool(IO_POOL).stats()
+    finally:
+        configure_executor_pools()
+
+    print(f"\nmixed blocking workload, default executor with {default_workers} threads vs io pool of 16 threads")  # noqa: T201
+    for name, seconds in shared.items():
+        print(f"  {name}: {seconds * 1000:.0f} ms shared, {pooled[name] * 1000:.0f} ms with pools")  # noqa: T201
+    print(f"  io pool: {io_stats}")  # noqa: T201
+    assert pooled["slowest event"] < shared["slowest event"] / 10
+    assert pooled["quick flow"] < shared["quick flow"] / 5
+    assert io_stats.completed == SLOW_CALLS + QUICK_CALLS
@@ -0,0 +1,86 @@
+"""Benchmark graph edge lookups and run scheduling as flows grow.
+
+Run with: pytest src/backend/tests/performance/test_graph_scaling.py -s
+"""
+
+import time
+from dataclasses import dataclass
+
+import pytest
+from lfx.graph.graph.base import Graph
+
+
+@dataclass(eq=False)
+class _Vertex:
+    id: str
+
+
+@dataclass(frozen=True)
+class _Edge:
+    source_id: str
+    target_id: str
+
+
+def _layered_graph(n_vertices: int) -> Graph:
+    """Build a graph where every vertex feeds the next two, so each vertex has up to four edges."""
+    graph = Graph()
+    vertex_ids = [f"vertex-{i}" for i in range(n_vertices)]
+    graph.vertex_map = {vertex_id: _Vertex(vertex_id) for vertex_id in vertex_ids}
+    graph.edges = [
+        _Edge(vertex_ids[i], vertex_ids[j]) for i in range(n_vertices) for j in (i + 1, i + 2) if j < n_vertices
+    ]
+    return graph
+
+
+def _scan_vertex_edges(graph: Graph, vertex_id: str) -> list:
+    """The full-scan lookup used before edges were indexed, kept as a reference."""
+    return [edge for edge in graph.edges if vertex_id in {edge.source_id, edge.target_id}]
+
+
+def _schedule(graph: Graph) -> int:
+    """Complete every vertex in topological order, returning how many became runnable."""
+    predecessor_map, _ = graph.build_adjacency_maps(graph.edges)
+    run_manager = graph.run_manager
+    run_manager.build_run_map(predecessor_map, set(graph.vertex_map))
+    runnable = 0
+    for vertex_id in graph.vertex_map:
+        run_manager.remove_vertex_from_runnables(vertex_id)
+        for successor_id in run_manager.run_map.get(vertex_id, ()):
+            if run_manager.are_all_predecessors_fulfilled(successor_id, is_loop=False):
+                runnable += 1
+    return runnable
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_vertices", [100, 1_000, 5_000])
+def test_benchmark_graph_scaling(n_vertices):
+    """Indexed lookups and set-based scheduling should stay roughly linear in the number of vertices."""
+    graph = _layered_graph(n_vertices)
+    vertex_ids = list(graph.vertex_map)
+
+    start = time.perf_counter()
+    for vertex_id in vertex_ids:
+        graph.get_vertex_edges(vertex_id)
+        graph.get_vertices_with_target(vertex_id)
+        graph.get_vertex_neighbors(graph.vertex_map[vertex_id])
+    indexed = time.perf_counter() - start
+
+    # The full scan is quadratic, so only time a sample and extrapolate
+    sample = vertex_ids[:: max(1, n_vertices // 100)]
+    start = time.perf_counter()
+    for vertex_id in sample:
+        _scan_vertex_edges(graph, vertex_id)
+    scan = (time.perf_counter() - start) * len(vertex_ids) / len(sample)
+
+    start = time.perf_counter()
+    runnable = _schedule(graph)
+    scheduling = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\n{n_vertices} vertices / {len(graph.edges)} edges: indexed lookups {indexed * 1000:.1f} ms, "
+        f"edge scan (extrapolated) {scan * 1000:.1f} ms, scheduling {scheduling * 1000:.1f} ms"
+    )
+    assert all(len(graph.get_vertex_edges(vertex_id)) <= 4 for vertex_id in sample)
+    assert runnable == n_vertices - 1
+    if n_vertices >= 1_000:
+        assert indexed < scan
@@ -0,0 +1,98 @@
+"""Benchmark the memory held by execution snapshots during a 500-vertex run.
+
+Run with: pytest src/backend/tests/performance/test_graph_snapshots.py -s
+"""
+
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+
+import pytest
+from lfx.graph.graph.base import Graph
+
+N_VERTICES = 500
+
+
+@dataclass(eq=False)
+class _Vertex:
+    id: str
+
+
+@dataclass(frozen=True)
+class _Edge:
+    source_id: str
+    target_id: str
+
+
+def _layered_graph() -> Graph:
+    """Build a graph where every vertex feeds the next two."""
+    graph = Graph()
+    vertex_ids = [f"vertex-{i}" for i in range(N_VERTICES)]
+    graph.vertex_map = {vertex_id: _Vertex(vertex_id) for vertex_id in vertex_ids}
+    graph.edges = [
+        _Edge(vertex_ids[i], vertex_ids[j]) for i in range(N_VERTICES) for j in (i + 1, i + 2) if j < N_VERTICES
+    ]
+    graph.vertices_layers = [[vertex_id] for vertex_id in vertex_ids]
+    predecessor_map, _ = graph.build_adjacency_maps(graph.edges)
+    graph.run_manager.build_run_map(predecessor_map, set(vertex_ids))
+    graph._first_layer = vertex_ids[:1]
+    graph._run_queue = deque(graph._first_layer)
+    return graph
+
+
+def _run(graph: Graph, record) -> None:
+    """Complete every vertex in order, recording the run state after each step like ``Graph.astep``."""
+    record(graph, None)
+    for vertex_id in list(graph.vertex_map):
+        graph._run_queue.popleft()
+        graph.run_manager.remove_vertex_from_runnables(vertex_id)
+        graph.run_manager.ran_at_least_once.add(vertex_id)
+        graph._run_queue.extend(
+            successor_id
+            for successor_id in graph.run_manager.run_map.get(vertex_id, ())
+            if successor_id not in graph._run_queue
+            and graph.run_manager.are_all_predecessors_fulfilled(successor_id, is_loop=False)
+        )
+        record(graph, vertex_id)
+
+
+def _measure(record, max_snapshots: int = 0) -> tuple[int, float]:
+    graph = _layered_graph()
+    graph.enable_snapshots(max_snapshots)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    _run(graph, record)
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained, elapsed
+
+
+@pytest.mark.benchmark
+def test_benchmark_graph_snapshots_memory():
+    """Compare a deepcopy per step with disabled recording and bounded delta snapshots."""
+    # A deepcopy per step is slow under tracemalloc, so only copy every tenth step and extrapolate
+    full_copies = []
+    steps = iter(range(N_VERTICES + 1))
+    retained, elapsed = _measure(
+        lambda graph, _: full_copies.append(graph.get_snapshot()) if next(steps) % 10 == 0 else None
+    )
+    legacy = (retained * 10, elapsed * 10)
+    disabled = _measure(lambda graph, vertex_id: graph._record_snapshot(vertex_id))
+    deltas = _measure(lambda graph, vertex_id: graph._record_snapshot(vertex_id), max_snapshots=N_VERTICES + 1)
+    bounded = _measure(lambda graph, vertex_id: graph._record_snapshot(vertex_id), max_snapshots=50)
+
+    for name, (retained, elapsed) in {
+        "deepcopy per step (extrapolated)": legacy,
+        "disabled": disabled,
+        "deltas, all steps": deltas,
+        "deltas, last 50 steps": bounded,
+    }.items():
+        print(f"\n{N_VERTICES} vertices, {name}: {retained / 1024:.0f} KiB retained, {elapsed * 1000:.0f} ms")  # noqa: T201
+
+    assert len(full_copies) == N_VERTICES // 10 + 1
+    assert disabled[0] < legacy[0] / 100
+    assert deltas[0] < legacy[0] / 10
+    assert bounded[0] < deltas[0]
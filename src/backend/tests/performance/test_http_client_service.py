@@ -0,0 +1,116 @@
+"""Benchmark outbound requests of components with a client per call and with the shared HTTP client service.
+
+Components used to open a new client for every call, like `async with httpx.AsyncClient()` or `requests.get`,
+which builds a TLS context and opens a new connection each time. The service keeps clients, and their keep-alive
+connections, between calls. The requests go to a local HTTP server that counts the connections it accepts.
+
+Run with: pytest src/backend/tests/performance/test_http_client_service.py -s
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import requests
+from lfx.services.http_client.service import HTTPClientService
+
+REQUESTS = 200
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"models": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _measure(server, run) -> tuple[float, int]:
+    """Return the mean latency in milliseconds of the requests made by `run` and the connections they opened."""
+    server.connections = 0
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1000 / REQUESTS, server.connections
+
+
+def _report(label: str, per_call: tuple[float, int], shared: tuple[float, int]) -> None:
+    print(  # noqa: T201
+        f"\n{label}, {REQUESTS} requests: client per call {per_call[0]:.2f} ms/request, {per_call[1]} connections; "
+        f"shared client {shared[0]:.2f} ms/request, {shared[1]} connections"
+    )
+
+
+@pytest.mark.benchmark
+def test_benchmark_shared_async_client(server):
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/tags"
+    service = HTTPClientService()
+
+    async def per_call():
+        for _ in range(REQUESTS):
+            async with httpx.AsyncClient() as client:
+                (await client.get(url)).raise_for_status()
+
+    async def shared():
+        for _ in range(REQUESTS):
+            (await service.get_async_client().get(url)).raise_for_status()
+        await service.teardown()
+
+    per_call_result = _measure(server, lambda: asyncio.run(per_call()))
+    shared_result = _measure(server, lambda: asyncio.run(shared()))
+
+    _report("httpx.AsyncClient", per_call_result, shared_result)
+    assert per_call_result[1] == REQUESTS
+    assert shared_result[1] == 1
+    assert shared_result[0] < per_call_result[0]
+
+
+@pytest.mark.benchmark
+def test_benchmark_shared_sync_client(server):
+    url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+    client = HTTPClientService().get_client()
+
+    def per_call():
+        for _ in range(REQUESTS):
+            requests.get(url, timeout=10).raise_for_status()
+
+    def shared():
+        for _ in range(REQUESTS):
+            client.get(url, timeout=10).raise_for_status()
+        client.close()
+
+    per_call_result = _measure(server, per_call)
+    shared_result = _measure(server, shared)
+
+    _report("requests.get", per_call_result, shared_result)
+    assert per_call_result[1] == REQUESTS
+    assert shared_result[1] == 1
+    assert shared_result[0] < per_call_result[0]
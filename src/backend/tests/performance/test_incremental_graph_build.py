@@ -0,0 +1,80 @@
+"""Benchmark editing one component of a 60 node flow and running it again, with and without graph patching.
+
+Every playground run built the graph of the flow from scratch, instantiating every component from its code, even
+when the user only changed one field. The cached graph of the previous run is now patched instead: only the edited
+component is instantiated again, and the run state of the other vertices is reset.
+
+Run with: pytest src/backend/tests/performance/test_incremental_graph_build.py -s
+"""
+
+import copy
+import time
+
+import pytest
+from lfx.components.input_output import ChatInput, TextOutputComponent
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph.graph.base import Graph
+
+NODES = 60
+EDITS = 10
+
+
+def _chain_payload() -> dict:
+    """A chat input, then 58 Combine Text components that each append a word, then a text output."""
+    previous = ChatInput(_id="chat_input", input_value="start", should_store_message=False)
+    output = previous.message_response
+    for i in range(NODES - 2):
+        combine = CombineTextComponent(_id=f"combine-{i}")
+        combine.set(text1=output, text2=f"w{i}", delimiter=" ")
+        output = combine.combine_texts
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=output)
+    return copy.deepcopy(Graph(previous, text_output).dump()["data"])
+
+
+def _edit(payload: dict, value: str) -> dict:
+    payload = copy.deepcopy(payload)
+    node = next(node for node in payload["nodes"] if node["id"] == f"combine-{NODES // 2}")
+    node["data"]["node"]["template"]["text2"]["value"] = value
+    return payload
+
+
+async def _run(graph: Graph) -> str:
+    results = {result.vertex.id: result async for result in graph.async_start() if hasattr(result, "vertex")}
+    return results["text_output"].result_dict.results["text"].text
+
+
+@pytest.mark.benchmark
+async def test_benchmark_edit_then_run_a_60_node_flow():
+    payload = _chain_payload()
+    # Warm up component imports and code compilation, which the first build pays once per process
+    graph = Graph.from_payload(copy.deepcopy(payload), flow_id="flow", user_id="user")
+    await _run(graph)
+
+    full_build = full_total = 0.0
+    for i in range(EDITS):
+        edited = _edit(payload, f"full-{i}")
+        start = time.perf_counter()
+        rebuilt = Graph.from_payload(edited, flow_id="flow", user_id="user")
+        full_build += time.perf_counter() - start
+        expected = await _run(rebuilt)
+        full_total += time.perf_counter() - start
+
+    patch_build = patch_total = 0.0
+    for i in range(EDITS):
+        edited = _edit(payload, f"full-{i}")
+        start = time.perf_counter()
+        affected = graph.patch(edited)
+        patch_build += time.perf_counter() - start
+        text = await _run(graph)
+        patch_total += time.perf_counter() - start
+        assert affected is not None
+
+    print(  # noqa: T201
+        f"\nedit then run, {NODES} nodes: full build {full_build / EDITS * 1000:.1f} ms + run = "
+        f"{full_total / EDITS * 1000:.1f} ms, patch {patch_build / EDITS * 1000:.1f} ms + run = "
+        f"{patch_total / EDITS * 1000:.1f} ms"
+    )
+    assert text == expected
+    assert len(graph.vertices) == NODES
+    assert patch_build < full_build
@@ -0,0 +1,76 @@
+"""Benchmark BM25 scoring of a 100k chunk knowledge base with and without the persisted lexical index.
+
+``compute_bm25`` tokenizes the whole corpus on every query. The lexical index only reads the postings of the
+query terms, which the retrieval component does for keyword and hybrid search.
+
+Run with: pytest src/backend/tests/performance/test_knowledge_base_lexical_index.py -s
+"""
+
+import statistics
+import time
+
+import numpy as np
+import pytest
+from lfx.base.knowledge_bases.knowledge_base_utils import compute_bm25
+from lfx.base.knowledge_bases.lexical_index import LexicalIndex
+
+N_CHUNKS = 100_000
+N_TERMS = 30_000
+CHUNK_TOKENS = 60
+QUERIES = [
+    "term42 term1337 term7",
+    "term5 term12000",
+    "term250 term251 term252 term253",
+    "term3 term8000 term29000",
+    "term0 term1",
+]
+
+
+def _chunks() -> list[str]:
+    # Zipf-distributed vocabulary, like natural language text
+    rng = np.random.default_rng(0)
+    ranks = np.minimum(rng.zipf(1.1, size=(N_CHUNKS, CHUNK_TOKENS)) - 1, N_TERMS - 1)
+    vocabulary = np.array([f"term{i}" for i in range(N_TERMS)])
+    return [" ".join(row) for row in vocabulary[ranks]]
+
+
+@pytest.mark.benchmark
+def test_benchmark_lexical_index_scoring(tmp_path):
+    """Scoring a query against 100k indexed chunks should take well under 10 ms."""
+    chunks = _chunks()
+    ids = [f"chunk-{i}" for i in range(N_CHUNKS)]
+
+    index = LexicalIndex(tmp_path / "lexical_index.db")
+    start = time.perf_counter()
+    # Ingestion indexes one batch at a time
+    batch_size = 10_000
+    for offset in range(0, N_CHUNKS, batch_size):
+        index.add_documents(zip(ids[offset : offset + batch_size], chunks[offset : offset + batch_size], strict=True))
+    build = time.perf_counter() - start
+
+    # Warm up the page cache, then measure with a fresh instance like a retrieval component run
+    index.search(QUERIES[0], top_k=10)
+    timings = {}
+    for query in QUERIES:
+        runs = []
+        for _ in range(5):
+            start = time.perf_counter()
+            LexicalIndex(tmp_path / "lexical_index.db").search(query, top_k=10)
+            runs.append(time.perf_counter() - start)
+        timings[query] = statistics.median(runs)
+
+    query = QUERIES[0]
+    start = time.perf_counter()
+    full_scores = compute_bm25(chunks, query.split())
+    full_corpus = time.perf_counter() - start
+
+    hits = index.search(query, top_k=10)
+    expected = sorted(range(N_CHUNKS), key=lambda i: -full_scores[i])[:10]
+    print(  # noqa: T201
+        f"\n{N_CHUNKS} chunks: index built in {build:.1f} s, compute_bm25 {full_corpus * 1000:.0f} ms per query"
+    )
+    for query, timing in timings.items():
+        print(f"  indexed BM25 '{query}': {timing * 1000:.2f} ms")  # noqa: T201
+
+    assert [score for _, score in hits] == pytest.approx([full_scores[i] for i in expected])
+    assert max(timings.values()) < 0.010
@@ -0,0 +1,98 @@
+"""Benchmark graph engine throughput with INFO and DEBUG logging, written synchronously or by the log writer thread.
+
+With synchronous logging every enabled record is processed, rendered and written on the event loop, and each
+``adebug`` hops to the default executor. In asynchronous mode (``VETRAI_LOG_ASYNC``) the loop only enqueues.
+
+Run with: pytest src/backend/tests/performance/test_logging_throughput.py -s
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import structlog
+from lfx.components.input_output import ChatInput, TextInputComponent, TextOutputComponent
+from lfx.graph.graph.base import Graph
+from lfx.log.logger import configure, get_log_queue
+
+N_RUNS = 100
+CHAIN_LENGTH = 10
+
+
+def _graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    previous = TextInputComponent(_id="text_input")
+    previous.set(input_value=chat_input.message_response)
+    for i in range(CHAIN_LENGTH):
+        component = TextOutputComponent(_id=f"text_output_{i}")
+        component.set(input_value=previous.text_response)
+        previous = component
+    return Graph(chat_input, previous)
+
+
+async def _throughput() -> float:
+    start = time.perf_counter()
+    for _ in range(N_RUNS):
+        [result async for result in _graph().async_start()]
+    return N_RUNS / (time.perf_counter() - start)
+
+
+def _configure(output, level: str, *, async_logging: bool) -> None:
+    structlog.reset_defaults()
+    with patch.dict(os.environ, {"VETRAI_PRETTY_LOGS": "false"}):
+        configure(log_level=level, async_logging=async_logging, output_file=output, cache=False, queue_size=100_000)
+
+
+def _close_and_restore() -> None:
+    if log_queue := get_log_queue():
+        log_queue.close()
+    structlog.reset_defaults()
+    configure(log_level="CRITICAL", cache=False)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_engine_throughput(tmp_path):
+    """Asynchronous DEBUG logging should keep the engine close to its INFO throughput."""
+    results = {}
+    try:
+        for level in ("INFO", "DEBUG"):
+            for async_logging in (False, True):
+                with (tmp_path / f"{level}-{async_logging}.log").open("w") as output:
+                    _configure(output, level, async_logging=async_logging)
+                    results[level, async_logging] = await _throughput()
+                    if log_queue := get_log_queue():
+                        log_queue.close()
+    finally:
+        _close_and_restore()
+
+    for (level, async_logging), runs_per_second in results.items():
+        mode = "async" if async_logging else "sync"
+        print(f"\n{level} {mode}: {runs_per_second:.1f} runs/s of a {CHAIN_LENGTH + 2} vertex graph")  # noqa: T201
+
+    assert results["DEBUG", True] > 0.75 * results["INFO", False]
+
+
+@pytest.mark.benchmark
+async def test_benchmark_async_log_calls(tmp_path):
+    """``await logger.adebug(...)`` should not cost an executor round trip per record in asynchronous mode."""
+    n_records = 5_000
+    timings = {}
+    try:
+        for async_logging in (False, True):
+            with (tmp_path / f"{async_logging}.log").open("w") as output:
+                _configure(output, "DEBUG", async_logging=async_logging)
+                logger = structlog.get_logger()
+                start = time.perf_counter()
+                for i in range(n_records):
+                    await logger.adebug("Vertex %s built", i, flow_id="flow")
+                timings[async_logging] = (time.perf_counter() - start) / n_records
+                if log_queue := get_log_queue():
+                    log_queue.close()
+    finally:
+        _close_and_restore()
+
+    print(  # noqa: T201
+        f"\nawait adebug: sync {timings[False] * 1e6:.0f} µs, async {timings[True] * 1e6:.0f} µs per record"
+    )
+    assert timings[True] < timings[False] / 2
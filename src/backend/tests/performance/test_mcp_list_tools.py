@@ -0,0 +1,110 @@
+"""Benchmark MCP `list_tools` for a project of 500 flows, before and after the tool listing cache.
+
+Listing the tools of a project built the graph of every flow to generate its input schema, on every call. Input
+schemas are now cached by flow id and `updated_at`, and whole listings by the header columns of the project's flows.
+The session serves the flows from memory, so the timings measure building the listing rather than the database.
+
+Run with: pytest src/backend/tests/performance/test_mcp_list_tools.py -s
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
+from uuid import uuid4
+
+import pytest
+from vetrai.api.v1 import mcp_utils
+
+FLOWS = 500
+CALLS = 20
+STARTER_PROJECT = (
+    Path(__file__).parents[2] / "base" / "vetrai" / "initial_setup" / "starter_projects" / "Basic Prompting.json"
+)
+
+
+class _Header(NamedTuple):
+    id: object
+    name: str
+    description: str
+    action_name: str | None
+    action_description: str | None
+    user_id: object
+    updated_at: datetime
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+
+class _Session:
+    def __init__(self, headers, data):
+        self.headers = headers
+        self.data = data
+
+    async def exec(self, stmt):
+        if stmt.column_descriptions[0]["name"] == "Flow":
+            ids = set(stmt.whereclause.right.value)
+            return _Result(
+                SimpleNamespace(id=h.id, name=h.name, updated_at=h.updated_at, data=self.data)
+                for h in self.headers
+                if h.id in ids
+            )
+        return _Result(self.headers)
+
+
+class _SessionContext:
+    def __init__(self, session):
+        self._session = session
+
+    async def __aenter__(self):
+        return self._session
+
+    async def __aexit__(self, *args):
+        return False
+
+
+@pytest.mark.benchmark
+async def test_benchmark_list_tools_for_a_project_of_500_flows(monkeypatch):
+    data = json.loads(STARTER_PROJECT.read_text(encoding="utf-8"))["data"]
+    user_id, now = uuid4(), datetime.now(timezone.utc)
+    headers = [_Header(uuid4(), f"Flow {i}", f"Flow number {i}", None, None, user_id, now) for i in range(FLOWS)]
+    session = _Session(headers, data)
+    project_id = uuid4()
+    monkeypatch.setattr(mcp_utils, "session_scope", lambda: _SessionContext(session))
+
+    async def list_tools():
+        return await mcp_utils.handle_list_tools(project_id=project_id, mcp_enabled_only=True)
+
+    # Warm up component imports and code compilation, which the first flow build pays once per process
+    mcp_utils.json_schema_from_flow(SimpleNamespace(data=data))
+
+    mcp_utils.invalidate_mcp_tools_cache()
+    start = time.perf_counter()
+    tools = await list_tools()
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        assert await list_tools() == tools
+    cached = (time.perf_counter() - start) / CALLS
+
+    # Saving one flow rebuilds only its schema
+    session.headers = [headers[0]._replace(updated_at=datetime.now(timezone.utc)), *headers[1:]]
+    start = time.perf_counter()
+    await list_tools()
+    one_saved = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\nlist_tools, {FLOWS} flows: building every schema {uncached * 1000:.0f} ms, "
+        f"cached {cached * 1000:.2f} ms/call, after saving one flow {one_saved * 1000:.1f} ms"
+    )
+    assert len(tools) == FLOWS
+    assert cached < uncached
+    assert one_saved < uncached
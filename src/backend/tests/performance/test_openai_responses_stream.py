@@ -0,0 +1,65 @@
+"""Benchmark the CPU time per streamed token of the OpenAI Responses endpoint, for answers of 4,000 tokens.
+
+Token events were encoded to JSON bytes by the event manager, decoded again by the stream generator, wrapped in a
+new chunk model and encoded to JSON a second time, with debug log messages formatted for every token. Events are
+now passed in-process as they were sent, and text chunks are built around a chunk envelope encoded once per
+response. The reference below replays the previous per-token work for comparison.
+
+Run with: pytest src/backend/tests/performance/test_openai_responses_stream.py -s
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from lfx.events.event_manager import encode_event_json
+from vetrai.api.v1 import openai_responses
+from vetrai.schema import OpenAIResponsesRequest, OpenAIResponsesStreamChunk
+
+TOKENS = 4_000
+FLOW = SimpleNamespace(data={"nodes": [{"data": {"type": "ChatInput"}}, {"data": {"type": "ChatOutput"}}]})
+
+
+async def _answer(*, event_manager, client_consumed_queue, **_) -> None:
+    """Stream an answer of TOKENS tokens, as a model connected to a Chat Output does."""
+    for i in range(TOKENS):
+        event_manager.on_token(data={"chunk": f" token{i}", "id": "message-1"})
+    await event_manager.queue.put((None, None, time.time()))
+    del client_consumed_queue
+
+
+def _previous_token_chunk(event: bytes, request: OpenAIResponsesRequest) -> str:
+    """The per-token work of the stream generator before events were passed in-process."""
+    parsed = json.loads(event.decode("utf-8"))
+    token = parsed["data"]["chunk"]
+    # Formatted even when debug logging is off
+    _ = f"[OpenAIResponses][stream] sent chunk with content={token}"
+    chunk = OpenAIResponsesStreamChunk(id="response", created=0, model=request.model, delta={"content": token})
+    return f"data: {chunk.model_dump_json()}\n\n"
+
+
+@pytest.mark.benchmark
+async def test_benchmark_cpu_per_streamed_token(monkeypatch):
+    monkeypatch.setattr(openai_responses, "run_flow_generator", _answer)
+    request = OpenAIResponsesRequest(model="flow", input="Hi", stream=True)
+
+    start = time.process_time()
+    previous = [
+        _previous_token_chunk(encode_event_json("token", {"chunk": f" token{i}", "id": "message-1"}), request)
+        for i in range(TOKENS)
+    ]
+    previous_cpu = time.process_time() - start
+
+    start = time.process_time()
+    response = await openai_responses.run_flow_for_openai_responses(FLOW, request, SimpleNamespace(), stream=True)
+    chunks = [chunk async for chunk in response.body_iterator]
+    streamed_cpu = time.process_time() - start
+
+    print(  # noqa: T201
+        f"\nResponses stream, {TOKENS} tokens: previous per-token encode and decode "
+        f"{previous_cpu / TOKENS * 1e6:.1f} us/token, whole stream now {streamed_cpu / TOKENS * 1e6:.1f} us/token"
+    )
+    text = "".join(json.loads(chunk.removeprefix("data: "))["delta"].get("content", "") for chunk in chunks[1:-2])
+    assert text == "".join(json.loads(chunk.removeprefix("data: "))["delta"]["content"] for chunk in previous)
+    assert streamed_cpu < previous_cpu
@@ -0,0 +1,102 @@
+"""Benchmark the persistent result cache on a RAG ingestion flow.
+
+The flow parses documents, splits them into chunks and embeds the chunks. Parsing and embedding stand in
+for document conversion and embedding API calls with a fixed latency plus real CPU work.
+
+Run with: pytest src/backend/tests/performance/test_result_cache.py -s
+"""
+
+import asyncio
+import hashlib
+import time
+
+import pytest
+from lfx.components.processing.split_text import SplitTextComponent
+from lfx.custom.custom_component.component import Component
+from lfx.graph.graph.base import Graph
+from lfx.graph.vertex import result_cache
+from lfx.io import DataFrameInput, IntInput, Output
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.result_cache.service import ResultCacheService
+
+PARSE_LATENCY = 0.2
+EMBEDDING_LATENCY = 0.3
+
+
+class ParseDocumentsComponent(Component):
+    display_name = "Parse Documents"
+    cache_results = True
+    inputs = [IntInput(name="documents", display_name="Documents", value=20)]
+    outputs = [Output(display_name="Data", name="data", method="parse")]
+
+    async def parse(self) -> list[Data]:
+        await asyncio.sleep(PARSE_LATENCY)
+        return [
+            Data(text=" ".join(f"document {index} sentence {sentence}." for sentence in range(200)))
+            for index in range(self.documents)
+        ]
+
+
+class HashEmbeddingsComponent(Component):
+    display_name = "Hash Embeddings"
+    cache_results = True
+    inputs = [DataFrameInput(name="chunks", display_name="Chunks")]
+    outputs = [Output(display_name="Vectors", name="vectors", method="embed")]
+
+    async def embed(self) -> DataFrame:
+        await asyncio.sleep(EMBEDDING_LATENCY)
+        rows = []
+        for text in self.chunks["text"]:
+            digest = hashlib.sha256(text.encode()).digest()
+            rows.append({"text": text, "vector": [byte / 255 for byte in digest]})
+        return DataFrame(rows)
+
+
+async def _ingest() -> int:
+    parse = ParseDocumentsComponent(_id="parse")
+    split = SplitTextComponent(_id="split", chunk_size=500, chunk_overlap=50, separator=" ")
+    split.cache_results = True
+    split.set(data_inputs=parse.parse)
+    embed = HashEmbeddingsComponent(_id="embed")
+    embed.set(chunks=split.split_text)
+    graph = Graph(parse, embed)
+    results = [result async for result in graph.async_start()]
+    vertex = next(
+        result.vertex for result in results if getattr(result, "vertex", None) and result.vertex.id == "embed"
+    )
+    return len(vertex.built_object["vectors"])
+
+
+@pytest.mark.benchmark
+async def test_benchmark_result_cache_rag_ingestion(tmp_path, monkeypatch):
+    """Compare a cold ingestion with re-runs in the same worker and in a freshly started worker."""
+    service = ResultCacheService(AsyncDiskCache(tmp_path, persistent=True))
+    monkeypatch.setattr(result_cache, "get_result_cache_service", lambda: service)
+
+    start = time.perf_counter()
+    chunks = await _ingest()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert await _ingest() == chunks
+    warm = time.perf_counter() - start
+    await service.teardown()
+
+    # A new service on the same directory behaves like another worker or a restarted server
+    restarted = ResultCacheService(AsyncDiskCache(tmp_path, persistent=True))
+    monkeypatch.setattr(result_cache, "get_result_cache_service", lambda: restarted)
+    start = time.perf_counter()
+    assert await _ingest() == chunks
+    after_restart = time.perf_counter() - start
+    await restarted.teardown()
+
+    print(  # noqa: T201
+        f"\nRAG ingestion of {chunks} chunks: cold {cold * 1000:.0f} ms, warm {warm * 1000:.0f} ms, "
+        f"after restart {after_restart * 1000:.0f} ms"
+    )
+    assert service.get_stats() == {"hits": 3, "misses": 3}
+    assert restarted.get_stats() == {"hits": 3, "misses": 0}
+    assert warm < cold - PARSE_LATENCY
+    assert after_restart < cold - PARSE_LATENCY
@@ -0,0 +1,55 @@
+"""Micro-benchmarks of ``lfx.serialization.serialize`` for the values flowing through builds and events.
+
+Run with: pytest src/backend/tests/performance/test_serialization.py -s
+"""
+
+import timeit
+
+import pandas as pd
+import pytest
+from lfx.events.event_manager import encode_event_json, encode_event_orjson
+from lfx.schema.data import Data
+from lfx.schema.message import Message
+from lfx.serialization.serialization import serialize
+
+ITERATIONS = 200
+
+
+def _nested(depth: int = 3, width: int = 8) -> dict:
+    if depth == 0:
+        return {"text": "chunk of text " * 4, "score": 0.5, "index": 3, "flag": True, "missing": None}
+    return {f"key{i}": [_nested(depth - 1, width // 2) for _ in range(2)] for i in range(width)}
+
+
+VALUES = {
+    "Data": Data(data={"text": "hello " * 20, "score": 0.75, "metadata": {"source": "a.txt", "page": 3}}),
+    "Message": Message(text="hello " * 20, sender="User", sender_name="User", session_id="session"),
+    "DataFrame": pd.DataFrame({"text": [f"row {i}" for i in range(200)], "value": range(200)}),
+    "nested dict": _nested(),
+}
+
+
+def _per_call(function, *args) -> float:
+    return min(timeit.repeat(lambda: function(*args), number=ITERATIONS, repeat=3)) / ITERATIONS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", list(VALUES))
+def test_benchmark_serialize(name):
+    value = VALUES[name]
+    timing = _per_call(serialize, value)
+
+    print(f"\nserialize({name}): {timing * 1e6:.1f} µs")  # noqa: T201
+    assert serialize(value) == serialize(value)
+
+
+@pytest.mark.benchmark
+def test_benchmark_event_encoders():
+    payload = {"build_data": serialize(VALUES["nested dict"]), "message": serialize(VALUES["Message"])}
+    json_timing = _per_call(encode_event_json, "end_vertex", payload)
+    orjson_timing = _per_call(encode_event_orjson, "end_vertex", payload)
+
+    print(  # noqa: T201
+        f"\nevent encoding: json {json_timing * 1e6:.1f} µs, orjson {orjson_timing * 1e6:.1f} µs"
+    )
+    assert orjson_timing < json_timing
@@ -0,0 +1,49 @@
+"""Benchmark starter project provisioning on boot with the full starter set.
+
+Run with: pytest src/backend/tests/performance/test_starter_projects_boot.py -s
+"""
+
+import shutil
+import time
+
+import anyio
+import pytest
+from sqlmodel import select
+from vetrai.initial_setup.constants import STARTER_FOLDER_NAME
+from vetrai.initial_setup.setup import load_starter_projects, update_changed_starter_projects
+from vetrai.services.database.models.flow.model import Flow
+from vetrai.services.database.models.folder.model import Folder
+
+
+@pytest.mark.benchmark
+async def test_benchmark_starter_projects_boot(async_session, tmp_path):
+    """Compare a first boot, which provisions every starter project, with an unchanged re-boot."""
+    starter_projects = []
+    # Work on copies so that component updates never rewrite the packaged files
+    for project_path, project in await load_starter_projects():
+        copied = tmp_path / project_path.name
+        shutil.copy(project_path, copied)
+        starter_projects.append((anyio.Path(copied), project))
+    folder = Folder(name=STARTER_FOLDER_NAME, description="Starter projects")
+    async_session.add(folder)
+    await async_session.commit()
+
+    start = time.perf_counter()
+    await update_changed_starter_projects(async_session, folder.id, starter_projects, {})
+    await async_session.commit()
+    first_boot = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await update_changed_starter_projects(async_session, folder.id, starter_projects, {})
+    writes = len(async_session.new) + len(async_session.dirty) + len(async_session.deleted)
+    await async_session.commit()
+    unchanged_boot = time.perf_counter() - start
+
+    flows = (await async_session.exec(select(Flow.id).where(Flow.folder_id == folder.id))).all()
+    print(  # noqa: T201
+        f"\n{len(starter_projects)} starter projects: first boot {first_boot * 1000:.1f} ms, "
+        f"unchanged boot {unchanged_boot * 1000:.1f} ms"
+    )
+    assert len(flows) == len(starter_projects)
+    assert writes == 0
+    assert unchanged_boot < first_boot
@@ -0,0 +1,80 @@
+"""Benchmark the queries of a retrieval flow with a new Chroma client per run and with the vector store registry.
+
+The knowledge base components used to open the persistent Chroma store of a knowledge base, and build its
+embedder, on every run. With the registry, runs lease the client that an earlier run opened. Each query runs a
+similarity search against a local knowledge base with deterministic embeddings, so only opening the store differs.
+
+Run with: pytest src/backend/tests/performance/test_vector_store_registry.py -s
+"""
+
+import hashlib
+import time
+
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from lfx.base.vectorstores.registry import VectorStoreKey, VectorStoreRegistry, close_chroma
+
+CHUNKS = 500
+QUERIES = 50
+
+
+class _HashEmbeddings(Embeddings):
+    model = "hash-embeddings"
+
+    def _vector(self, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [byte / 255 for byte in digest[:32]]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._vector(text)
+
+
+@pytest.fixture
+def knowledge_base(tmp_path):
+    kb_path = tmp_path / "user" / "docs"
+    chroma = Chroma(persist_directory=str(kb_path), embedding_function=_HashEmbeddings(), collection_name="docs")
+    chroma.add_documents([Document(page_content=f"chunk {i} about topic {i % 17}") for i in range(CHUNKS)])
+    close_chroma(chroma)
+    return kb_path
+
+
+def _open(kb_path) -> Chroma:
+    return Chroma(persist_directory=str(kb_path), embedding_function=_HashEmbeddings(), collection_name="docs")
+
+
+@pytest.mark.benchmark
+def test_benchmark_retrieval_with_the_vector_store_registry(knowledge_base):
+    def per_run():
+        chroma = _open(knowledge_base)
+        try:
+            return chroma.similarity_search_with_score("topic 3", k=5)
+        finally:
+            close_chroma(chroma)
+
+    registry = VectorStoreRegistry()
+    key = VectorStoreKey("chroma", str(knowledge_base), "docs", "hash-embeddings")
+
+    def shared():
+        with registry.lease(key, lambda: _open(knowledge_base), close=close_chroma) as chroma:
+            return chroma.similarity_search_with_score("topic 3", k=5)
+
+    timings = {}
+    for label, run in (("new client per run", per_run), ("registry", shared)):
+        results = run()
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            assert run() == results
+        timings[label] = (time.perf_counter() - start) * 1000 / QUERIES
+    registry.clear()
+
+    print(  # noqa: T201
+        f"\nRetrieval over {CHUNKS} chunks, {QUERIES} queries: "
+        + ", ".join(f"{label} {ms:.2f} ms/query" for label, ms in timings.items())
+    )
+    assert registry.misses == 1
+    assert timings["registry"] < timings["new client per run"]
@@ -0,0 +1,158 @@
+"""Benchmark barge-in audio processing for concurrent voice mode sessions.
+
+Each synthetic session streams 20ms chunks of 24kHz audio in real time. The inline pipeline decodes, resamples
+(one FFT per frame) and runs VAD for every chunk on the event loop. The worker thread pipeline hands everything
+queued to a shared worker thread with a streaming polyphase resampler. By default it hands over chunks as soon as
+they arrive; waiting for batches of chunks (VETRAI_VOICE_MODE_VAD_BATCH_CHUNKS) lowers CPU but adds latency.
+
+Run with: pytest src/backend/tests/performance/test_voice_mode_audio.py -s
+"""
+
+import asyncio
+import base64
+import time
+from functools import partial
+
+import numpy as np
+import pytest
+from vetrai.api.v1.voice_mode import VAD_QUEUE_MAXSIZE, put_dropping_oldest
+from vetrai.utils.voice_utils import (
+    BYTES_PER_24K_FRAME,
+    BYTES_PER_SAMPLE,
+    FRAME_DURATION_MS,
+    SAMPLE_RATE_24K,
+    VAD_SAMPLE_RATE_16K,
+    VadPipeline,
+    get_vad_worker,
+    resample_24k_to_16k,
+)
+
+N_SESSIONS = 50
+N_FRAMES = 100
+FRAME_SECONDS = FRAME_DURATION_MS / 1000
+# An opt-in value of VETRAI_VOICE_MODE_VAD_BATCH_CHUNKS, which defaults to 1
+OPT_IN_BATCH_CHUNKS = 3
+
+
+class _EnergyVad:
+    """Stand-in for webrtcvad when it is not installed, with a comparable per-frame cost."""
+
+    def is_speech(self, frame: bytes, sample_rate: int) -> bool:
+        assert sample_rate == VAD_SAMPLE_RATE_16K
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples**2))) > 500
+
+
+def _get_vad():
+    try:
+        import webrtcvad
+    except ImportError:
+        return _EnergyVad()
+    return webrtcvad.Vad(mode=3)
+
+
+def _chunks() -> list[str]:
+    samples = BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE
+    t = np.arange(N_FRAMES * samples) / SAMPLE_RATE_24K
+    audio = (np.sin(2 * np.pi * 220 * t) * 8000 * (np.sin(2 * np.pi * t) > 0)).astype(np.int16).tobytes()
+    return [
+        base64.b64encode(audio[i : i + BYTES_PER_24K_FRAME]).decode() for i in range(0, len(audio), BYTES_PER_24K_FRAME)
+    ]
+
+
+async def _stream(queue: asyncio.Queue, chunks: list[str], put) -> None:
+    start = time.perf_counter()
+    for index, chunk in enumerate(chunks):
+        await asyncio.sleep(max(0, start + index * FRAME_SECONDS - time.perf_counter()))
+        put(queue, (time.perf_counter(), chunk))
+    put(queue, None)
+
+
+async def _inline_session(chunks: list[str], latencies: list[float]) -> None:
+    """The previous pipeline: every chunk is decoded, resampled and classified on the event loop."""
+    queue: asyncio.Queue = asyncio.Queue()
+    producer = asyncio.create_task(_stream(queue, chunks, asyncio.Queue.put_nowait))
+    vad = _get_vad()
+    buffer = bytearray()
+    while (item := await queue.get()) is not None:
+        received, chunk = item
+        buffer.extend(base64.b64decode(chunk))
+        while len(buffer) >= BYTES_PER_24K_FRAME:
+            frame_24k = bytes(buffer[:BYTES_PER_24K_FRAME])
+            del buffer[:BYTES_PER_24K_FRAME]
+            vad.is_speech(resample_24k_to_16k(frame_24k), VAD_SAMPLE_RATE_16K)
+        latencies.append(time.perf_counter() - received)
+    await producer
+
+
+async def _worker_thread_session(chunks: list[str], latencies: list[float], batch_chunks: int = 1) -> None:
+    """The current pipeline: queued chunks of all sessions are processed in batches in a worker thread."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=VAD_QUEUE_MAXSIZE)
+    producer = asyncio.create_task(_stream(queue, chunks, put_dropping_oldest))
+    pipeline = VadPipeline(_get_vad())
+    done = False
+    while not done:
+        batch = [await queue.get()]
+        while len(batch) < batch_chunks and batch[-1] is not None:
+            batch.append(await queue.get())
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        done = batch[-1] is None
+        items = [item for item in batch if item is not None]
+        await get_vad_worker().submit(pipeline, [chunk for _, chunk in items])
+        finished = time.perf_counter()
+        latencies.extend(finished - received for received, _ in items)
+    await producer
+
+
+async def _measure_loop_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    interval = 0.005
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _run(session) -> dict[str, float]:
+    chunks = _chunks()
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_loop_lag(stop, lags))
+    cpu_start = time.process_time()
+    await asyncio.gather(*(session(chunks, latencies) for _ in range(N_SESSIONS)))
+    cpu = time.process_time() - cpu_start
+    stop.set()
+    await lag_task
+    audio_seconds = N_FRAMES * FRAME_SECONDS
+    return {
+        "cpu_ms_per_session_second": cpu / N_SESSIONS / audio_seconds * 1000,
+        "p99_frame_latency_ms": float(np.percentile(latencies, 99)) * 1000,
+        "p99_loop_lag_ms": float(np.percentile(lags, 99)) * 1000,
+        "frames": len(latencies),
+    }
+
+
+@pytest.mark.benchmark
+async def test_benchmark_voice_mode_audio_pipeline():
+    """Report per-session CPU and p99 frame latency for 50 concurrent sessions."""
+    inline = await _run(_inline_session)
+    worker_thread = await _run(_worker_thread_session)
+    batched = await _run(partial(_worker_thread_session, batch_chunks=OPT_IN_BATCH_CHUNKS))
+
+    for name, result in {
+        "inline per frame": inline,
+        "worker thread": worker_thread,
+        f"worker thread, batches of {OPT_IN_BATCH_CHUNKS} chunks": batched,
+    }.items():
+        print(  # noqa: T201
+            f"\n{N_SESSIONS} sessions, {name}: {result['cpu_ms_per_session_second']:.1f} ms CPU per session-second, "
+            f"p99 frame latency {result['p99_frame_latency_ms']:.1f} ms, "
+            f"p99 event loop lag {result['p99_loop_lag_ms']:.1f} ms"
+        )
+
+    assert inline["frames"] == N_SESSIONS * N_FRAMES
+    assert worker_thread["frames"] <= N_SESSIONS * N_FRAMES
+    assert batched["frames"] <= N_SESSIONS * N_FRAMES
+    assert batched["cpu_ms_per_session_second"] < inline["cpu_ms_per_session_second"]
+    assert worker_thread["p99_frame_latency_ms"] < batched["p99_frame_latency_ms"]
@@ -1,6 +1,10 @@
-from unittest.mock import patch
+import asyncio
+import copy
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from vetrai.api.utils import get_suggestion_message, remove_api_keys
+from lfx.components.input_output import ChatInput, TextOutputComponent
+from lfx.graph.graph.base import Graph
+from vetrai.api.utils import get_suggestion_message, patch_cached_graph, remove_api_keys
 from vetrai.services.database.models.flow.utils import get_outdated_components
 from vetrai.utils.version import get_version_info
 
@@ -169,3 +173,62 @@ def test_remove_api_keys():
     empty_flow = {"data": {"nodes": []}}
     result = remove_api_keys(empty_flow)
     assert result == empty_flow
+
+
+def _cached_graph_chat_service(user_id: str):
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    payload = copy.deepcopy(Graph(chat_input, text_output).dump()["data"])
+    graph = Graph.from_payload(copy.deepcopy(payload), flow_id="flow", user_id=user_id)
+    chat_service = MagicMock()
+    chat_service.get_cache = AsyncMock(return_value={"result": graph, "type": "Graph"})
+    chat_service.clear_cache = AsyncMock()
+    return chat_service, graph, payload
+
+
+async def test_patch_cached_graph_reuses_the_graph_of_the_same_user():
+    chat_service, graph, payload = _cached_graph_chat_service("user")
+    run_id = graph._run_id
+
+    patched = await patch_cached_graph(
+        "flow", MagicMock(), chat_service, payload=payload, flow_name="Flow", user_id="user", session_id="session"
+    )
+
+    assert patched is graph
+    assert patched.flow_name == "Flow"
+    assert patched._run_id != run_id
+    assert patched.session_id == "session"
+
+
+async def test_patch_cached_graph_skips_graphs_of_other_users_and_running_graphs():
+    chat_service, graph, payload = _cached_graph_chat_service("user")
+    kwargs = {"payload": payload, "flow_name": "Flow", "session_id": "session"}
+
+    assert await patch_cached_graph("flow", MagicMock(), chat_service, user_id="other-user", **kwargs) is None
+
+    graph.run_manager.vertices_being_run.add("chat_input")
+    assert await patch_cached_graph("flow", MagicMock(), chat_service, user_id="user", **kwargs) is None
+
+
+async def test_patch_cached_graph_takes_the_graph_out_of_the_cache_for_one_build():
+    chat_service, graph, payload = _cached_graph_chat_service("user")
+
+    async def get_cache(*_args, **_kwargs):
+        await asyncio.sleep(0)
+        return {"result": graph, "type": "Graph"}
+
+    async def clear_cache(*_args, **_kwargs):
+        await asyncio.sleep(0)
+
+    chat_service.get_cache = AsyncMock(side_effect=get_cache)
+    chat_service.clear_cache = AsyncMock(side_effect=clear_cache)
+    kwargs = {"payload": payload, "flow_name": "Flow", "user_id": "user", "session_id": "session"}
+
+    patched = await asyncio.gather(
+        patch_cached_graph("flow", MagicMock(), chat_service, **kwargs),
+        patch_cached_graph("flow", MagicMock(), chat_service, **kwargs),
+    )
+
+    assert patched == [graph, None]
+    chat_service.clear_cache.assert_awaited_once_with("flow")
@@ -1,5 +1,6 @@
 import tempfile
 import uuid
+from unittest.mock import patch
 
 from fastapi import status
 from httpx import AsyncClient
@@ -428,6 +429,26 @@ async def test_update_flow_accepts_relative_path(client: AsyncClient, logged_in_
     assert update_response.status_code == status.HTTP_200_OK
 
 
+async def test_flow_sync_is_resynced_only_when_the_path_changes(client: AsyncClient, logged_in_headers):
+    """Saving a flow only asks the flow sync to reload watched paths when its fs_path changes."""
+    with patch("vetrai.api.v1.flows.request_flow_fs_resync") as resync:
+        basic_case = {"name": "test_flow", "data": {}, "fs_path": "synced_flow.json"}
+        create_response = await client.post("api/v1/flows/", json=basic_case, headers=logged_in_headers)
+        assert create_response.status_code == status.HTTP_201_CREATED
+        flow_id = create_response.json()["id"]
+        assert resync.call_count == 1
+
+        response = await client.patch(f"api/v1/flows/{flow_id}", json={"name": "renamed"}, headers=logged_in_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert resync.call_count == 1
+
+        response = await client.patch(
+            f"api/v1/flows/{flow_id}", json={"fs_path": "moved_flow.json"}, headers=logged_in_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert resync.call_count == 2
+
+
 async def test_create_flow_rejects_empty_path(client: AsyncClient, logged_in_headers):
     """Test that empty fs_path is handled correctly (should be allowed as None).
 
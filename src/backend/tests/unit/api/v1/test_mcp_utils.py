@@ -1,4 +1,6 @@
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 from vetrai.api.v1 import mcp_utils
@@ -80,3 +82,65 @@ async def test_handle_list_resources_includes_flow_and_user_files(monkeypatch):
     uris = {str(resource.uri) for resource in resources}
     assert f"http://localhost:4000/api/v1/files/download/{flow_id}/flow-doc.docx" in uris
     assert f"http://localhost:4000/api/v1/files/download/{user_id}/uploaded-summary.pdf" in uris
+
+
+class FlowHeader(NamedTuple):
+    id: str
+    name: str
+    description: str | None
+    action_name: str | None
+    action_description: str | None
+    user_id: str
+    updated_at: datetime
+
+
+class FakeFlowSession:
+    """Serves header rows for column queries and full flows for entity queries, counting the flows loaded."""
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.loaded = 0
+
+    async def exec(self, stmt):
+        if stmt.column_descriptions[0]["name"] == "Flow":
+            ids = set(stmt.whereclause.right.value)
+            flows = [
+                SimpleNamespace(id=header.id, name=header.name, updated_at=header.updated_at, data={})
+                for header in self.headers
+                if header.id in ids
+            ]
+            self.loaded += len(flows)
+            return FakeResult(flows)
+        return FakeResult(self.headers)
+
+
+@pytest.mark.asyncio
+async def test_handle_list_tools_caches_input_schemas_by_flow_version(monkeypatch):
+    now = datetime.now(timezone.utc)
+    headers = [
+        FlowHeader("flow-1", "First Flow", "Does things", None, None, "user-1", now),
+        FlowHeader("flow-2", "Second Flow", None, "second_action", "Second action", "user-1", now),
+    ]
+    session = FakeFlowSession(headers)
+    monkeypatch.setattr(mcp_utils, "session_scope", lambda: FakeSessionContext(session))
+    monkeypatch.setattr(mcp_utils, "json_schema_from_flow", lambda flow: {"type": "object", "title": flow.name})
+    mcp_utils.invalidate_mcp_tools_cache()
+
+    tools = await mcp_utils.handle_list_tools(project_id="project-1", mcp_enabled_only=True)
+    assert [tool.name for tool in tools] == ["first_flow", "second_action"]
+    assert session.loaded == 2
+
+    # Unchanged flows are listed from the cache
+    assert await mcp_utils.handle_list_tools(project_id="project-1", mcp_enabled_only=True) == tools
+    assert session.loaded == 2
+
+    # A saved flow has a new updated_at, so only its schema is rebuilt
+    session.headers = [headers[0]._replace(name="Renamed Flow", updated_at=now + timedelta(seconds=1)), headers[1]]
+    tools = await mcp_utils.handle_list_tools(project_id="project-1", mcp_enabled_only=True)
+    assert [tool.name for tool in tools] == ["renamed_flow", "second_action"]
+    assert tools[0].inputSchema["title"] == "Renamed Flow"
+    assert session.loaded == 3
+
+    mcp_utils.invalidate_mcp_tools_cache("flow-2")
+    await mcp_utils.handle_list_tools(project_id="project-1", mcp_enabled_only=True)
+    assert session.loaded == 4
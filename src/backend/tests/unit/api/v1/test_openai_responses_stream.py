@@ -0,0 +1,84 @@
+import json
+
+from vetrai.api.v1.openai_responses import ResponsesStream
+from vetrai.schema import OpenAIResponsesRequest
+
+
+def _stream(**request) -> ResponsesStream:
+    return ResponsesStream(OpenAIResponsesRequest(model="flow", input="Hi", **request), "response-1", 1700000000)
+
+
+def _payload(chunk: str) -> dict:
+    return json.loads(chunk.removeprefix("data: ").split("data: ")[-1])
+
+
+def _agent_message(message_id: str, steps: list[dict], **message) -> dict:
+    return {
+        "id": message_id,
+        "sender": "Machine",
+        "sender_name": "AI",
+        "text": "",
+        "properties": {"state": "partial"},
+        "content_blocks": [{"title": "Agent Steps", "contents": steps}],
+        **message,
+    }
+
+
+def test_token_chunks_match_the_chunk_schema():
+    stream = _stream()
+
+    chunk = stream.token_chunk({"chunk": 'Hé "quoted"', "id": "message-1"})
+
+    assert chunk.startswith("data: ")
+    assert chunk.endswith("\n\n")
+    assert _payload(chunk) == {
+        "id": "response-1",
+        "object": "response.chunk",
+        "created": 1700000000,
+        "model": "flow",
+        "delta": {"content": 'Hé "quoted"'},
+        "status": None,
+    }
+    assert stream.token_chunk({"chunk": "", "id": "message-1"}) is None
+
+
+def test_messages_streamed_by_tokens_are_not_sent_again():
+    stream = _stream()
+    stream.token_chunk({"chunk": "Hello", "id": "message-1"})
+
+    assert stream.message_chunks(_agent_message("message-1", [], text="Hello")) == []
+
+
+def test_message_text_is_sent_as_deltas():
+    stream = _stream()
+
+    first = stream.message_chunks(_agent_message("message-1", [], text="Hello"))
+    second = stream.message_chunks(_agent_message("message-1", [], text="Hello world"))
+    complete = stream.message_chunks(
+        _agent_message("message-1", [], text="Hello world!", properties={"state": "complete"})
+    )
+
+    assert [_payload(chunk)["delta"]["content"] for chunk in first + second] == ["Hello", " world"]
+    assert complete == []
+    assert stream.sent_len == len("Hello world")
+
+
+def test_tool_calls_are_emitted_once_when_they_finish():
+    stream = _stream()
+    started = {"type": "tool_use", "name": "search", "tool_input": {"query": "vetrai"}, "output": None}
+    finished = {**started, "output": "results"}
+
+    assert stream.message_chunks(_agent_message("message-1", [started])) == []
+    chunks = stream.message_chunks(_agent_message("message-1", [finished]))
+    # Chat Output sends the agent steps again in its own message
+    assert stream.message_chunks(_agent_message("message-2", [finished])) == []
+
+    events = [json.loads(chunk.split("data: ", 1)[1]) for chunk in chunks]
+    assert [event["type"] for event in events] == [
+        "response.output_item.added",
+        "response.function_call_arguments.delta",
+        "response.function_call_arguments.done",
+        "response.output_item.done",
+    ]
+    assert events[1]["delta"] == '{"query": "vetrai"}'
+    assert events[3]["item"]["call_id"] == "call_1"
@@ -0,0 +1,76 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from vetrai.api.v1.voice_mode import SendQueues, put_dropping_oldest
+
+
+def test_put_dropping_oldest_keeps_the_latest_items():
+    queue: asyncio.Queue[int] = asyncio.Queue(maxsize=2)
+
+    assert put_dropping_oldest(queue, 1) is False
+    assert put_dropping_oldest(queue, 2) is False
+    assert put_dropping_oldest(queue, 3) is True
+    assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+
+
+def _send_queues(maxsize: int) -> tuple[SendQueues, MagicMock]:
+    openai_ws = MagicMock()
+    openai_ws.send = AsyncMock()
+    client_ws = MagicMock()
+    client_ws.send_text = AsyncMock()
+    send_queues = SendQueues(openai_ws, client_ws, lambda *_: None, maxsize=maxsize)
+    # Hold the OpenAI writer so the queue fills up
+    send_queues.block.clear()
+    return send_queues, openai_ws
+
+
+async def test_send_queues_apply_backpressure_and_keep_control_messages():
+    send_queues, openai_ws = _send_queues(maxsize=1)
+    send_queues.openai_send({"type": "first"})
+    await asyncio.sleep(0)
+    send_queues.openai_send({"type": "queued"})
+
+    send_queues.openai_send({"type": "response.cancel"})
+    send_queues.openai_send({"type": "session.update"})
+    waiting = asyncio.create_task(send_queues.aopenai_send({"type": "waiting"}))
+    await asyncio.sleep(0)
+    assert send_queues.dropped_messages == 0
+    assert not waiting.done()
+
+    send_queues.block.set()
+    await waiting
+    await asyncio.sleep(0)
+    await send_queues.close()
+
+    sent = [call.args[0] for call in openai_ws.send.await_args_list]
+    assert sent == [
+        '{"type": "first"}',
+        '{"type": "queued"}',
+        '{"type": "response.cancel"}',
+        '{"type": "session.update"}',
+        '{"type": "waiting"}',
+    ]
+
+
+async def test_full_send_queues_drop_the_oldest_audio_frame():
+    send_queues, openai_ws = _send_queues(maxsize=2)
+    send_queues.openai_send({"type": "first"})
+    await asyncio.sleep(0)
+    send_queues.openai_send({"type": "input_audio_buffer.append", "audio": "old"})
+    send_queues.openai_send({"type": "response.create"})
+
+    send_queues.openai_send({"type": "input_audio_buffer.append", "audio": "new"})
+    send_queues.openai_send({"type": "input_audio_buffer.append", "audio": "newer"})
+    assert send_queues.dropped_messages == 2
+
+    send_queues.block.set()
+    await asyncio.sleep(0)
+    await send_queues.close()
+
+    sent = [json.loads(call.args[0]) for call in openai_ws.send.await_args_list]
+    assert sent == [
+        {"type": "first"},
+        {"type": "response.create"},
+        {"type": "input_audio_buffer.append", "audio": "newer"},
+    ]
@@ -0,0 +1,70 @@
+import pytest
+from lfx.base.knowledge_bases.knowledge_base_utils import compute_bm25, compute_tfidf
+from lfx.base.knowledge_bases.lexical_index import LexicalIndex, reciprocal_rank_fusion
+
+DOCUMENTS = [
+    "the cat sat on the mat",
+    "the dog ran in the park",
+    "cats and dogs are pets",
+    "birds fly in the sky",
+    "the cat chased the dog and the cat won",
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical_index.db")
+    index.add_documents((f"doc-{i}", text) for i, text in enumerate(DOCUMENTS))
+    return index
+
+
+def _expected(scores: list[float]) -> list[tuple[str, float]]:
+    return sorted(((f"doc-{i}", score) for i, score in enumerate(scores) if score > 0), key=lambda hit: -hit[1])
+
+
+@pytest.mark.parametrize(("scoring", "compute"), [("bm25", compute_bm25), ("tfidf", compute_tfidf)])
+def test_search_matches_full_corpus_scoring(index, scoring, compute):
+    hits = index.search("Cat dog", top_k=10, scoring=scoring)
+
+    expected = _expected(compute(DOCUMENTS, ["cat", "dog"]))
+    assert [doc_id for doc_id, _ in hits] == [doc_id for doc_id, _ in expected]
+    assert [score for _, score in hits] == pytest.approx([score for _, score in expected])
+
+
+def test_search_returns_top_k(index):
+    hits = index.search("the cat", top_k=2)
+
+    expected = _expected(compute_bm25(DOCUMENTS, ["the", "cat"]))[:2]
+    assert [doc_id for doc_id, _ in hits] == [doc_id for doc_id, _ in expected]
+
+
+def test_incremental_batches_score_like_a_single_batch(tmp_path, index):
+    incremental = LexicalIndex(tmp_path / "incremental.db")
+    incremental.add_documents((f"doc-{i}", text) for i, text in enumerate(DOCUMENTS[:2]))
+    # A new instance on the same file, as in a later ingestion run
+    added = LexicalIndex(tmp_path / "incremental.db").add_documents(
+        (f"doc-{i}", text) for i, text in enumerate(DOCUMENTS)
+    )
+
+    assert added == len(DOCUMENTS) - 2
+    assert incremental.document_count() == len(DOCUMENTS)
+    assert incremental.search("cat dog pets", top_k=10) == pytest.approx(index.search("cat dog pets", top_k=10))
+
+
+def test_search_without_matches(tmp_path, index):
+    assert index.search("unicorn", top_k=5) == []
+    assert index.search("   ", top_k=5) == []
+    assert LexicalIndex(tmp_path / "missing.db").search("cat", top_k=5) == []
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_search_rejects_unknown_scoring(index):
+    with pytest.raises(ValueError, match="Unknown lexical scoring"):
+        index.search("cat", top_k=5, scoring="cosine")
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]])
+
+    assert [doc_id for doc_id, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
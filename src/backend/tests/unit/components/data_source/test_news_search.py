@@ -1,7 +1,7 @@
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-import requests
 from lfx.components.data_source.news_search import NewsSearchComponent
 from lfx.schema import DataFrame
 
@@ -46,7 +46,7 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
         mock_response.content = mock_rss_content.encode("utf-8")
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             component = NewsSearchComponent(query="OpenAI")
             result = component.search_news()
             assert isinstance(result, DataFrame)
@@ -57,7 +57,7 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
             assert news_results_df.iloc[1]["title"] == "Test News 2"
 
     def test_news_search_error(self):
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+        with patch("httpx.Client.get", side_effect=httpx.RequestError("Network error")):
             component = NewsSearchComponent(query="OpenAI")
             result = component.search_news()
             assert isinstance(result, DataFrame)
@@ -79,7 +79,7 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
         mock_response.content = mock_rss_content.encode("utf-8")
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             component = NewsSearchComponent(query="OpenAI")
             result = component.search_news()
             assert isinstance(result, DataFrame)
@@ -1,7 +1,7 @@
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-import requests
 from lfx.components.data_source.rss import RSSReaderComponent
 from lfx.schema import DataFrame
 
@@ -48,12 +48,12 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         </rss>
         """
 
-        # Mock the requests.get response
+        # Mock the shared HTTP client response
         mock_response = Mock()
         mock_response.content = mock_rss_content.encode("utf-8")
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
             result = component.read_rss()
 
@@ -83,7 +83,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         mock_response.content = mock_rss_content.encode("utf-8")
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
             result = component.read_rss()
 
@@ -95,7 +95,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
 
     def test_rss_fetch_error(self):
         # Mock a failed request
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+        with patch("httpx.Client.get", side_effect=httpx.RequestError("Network error")):
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
             result = component.read_rss()
 
@@ -120,7 +120,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         mock_response.content = mock_rss_content.encode("utf-8")
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
             result = component.read_rss()
 
@@ -372,3 +372,30 @@ class TestKnowledgeRetrievalComponent(ComponentTestBaseWithClient):
         default_kwargs["include_embeddings"] = False
         component = component_class(**default_kwargs)
         assert component.include_embeddings is False
+
+    def test_hybrid_search_fuses_vector_and_keyword_rankings(self, component_class, default_kwargs, tmp_path):
+        """Test that hybrid search fetches keyword-only hits and ranks chunks found by both first."""
+        from langchain_core.documents import Document
+        from lfx.base.knowledge_bases.lexical_index import LexicalIndex
+
+        chunks = {
+            "a": "vector databases store embeddings",
+            "b": "bm25 ranks chunks by keyword overlap",
+            "c": "hybrid search combines keyword and vector scores",
+        }
+        chroma = MagicMock()
+        chroma._collection.count.return_value = len(chunks)
+        chroma._collection.get.return_value = {"ids": list(chunks), "documents": list(chunks.values())}
+        chroma.similarity_search_with_score.return_value = [
+            (Document(id="a", page_content=chunks["a"]), 0.1),
+            (Document(id="c", page_content=chunks["c"]), 0.2),
+        ]
+        chroma.get_by_ids.side_effect = lambda ids: [Document(id=i, page_content=chunks[i]) for i in ids]
+
+        component = component_class(**{**default_kwargs, "search_query": "keyword hybrid", "search_type": "Hybrid"})
+        results = component._hybrid_search(tmp_path, chroma)
+
+        assert [doc.id for doc, _ in results] == ["c", "a", "b"]
+        chroma.get_by_ids.assert_called_once_with(["b"])
+        # The chunks missing from the lexical index were indexed on first use
+        assert LexicalIndex(tmp_path / "lexical_index.db").document_count() == len(chunks)
@@ -1,10 +1,27 @@
 import asyncio
+import contextlib
+import dataclasses
+from types import SimpleNamespace
 from uuid import uuid4
 
+import anyio
+import orjson
 import pytest
-from vetrai.initial_setup.setup import get_or_create_default_folder, session_scope
+from sqlmodel import select
+from vetrai.initial_setup.constants import STARTER_FOLDER_NAME
+from vetrai.initial_setup.setup import (
+    get_fs_flow_paths,
+    get_or_create_default_folder,
+    get_starter_project_hash,
+    get_types_fingerprint,
+    session_scope,
+    sync_flow_from_file,
+    update_changed_starter_projects,
+)
+from vetrai.services.database.models.flow.model import Flow
 from vetrai.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
-from vetrai.services.database.models.folder.model import FolderRead
+from vetrai.services.database.models.folder.model import Folder, FolderRead
+from vetrai.services.database.models.starter_project.model import StarterProjectManifest
 
 
 @pytest.mark.usefixtures("client")
@@ -51,3 +68,207 @@ async def test_get_or_create_default_folder_concurrent_calls() -> None:
     results = await asyncio.gather(get_folder(), get_folder(), get_folder())
     folder_ids = {folder.id for folder in results}
     assert len(folder_ids) == 1, "Concurrent calls must return a single, consistent folder instance."
+
+
+def _starter_project(name: str, description: str = "A starter project") -> dict:
+    return {"name": name, "description": description, "data": {"nodes": [], "edges": []}}
+
+
+async def _starter_folder(session) -> Folder:
+    folder = Folder(name=STARTER_FOLDER_NAME, description="Starter projects")
+    session.add(folder)
+    await session.commit()
+    return folder
+
+
+async def _starter_flow_names(session, folder_id) -> list[str]:
+    return sorted((await session.exec(select(Flow.name).where(Flow.folder_id == folder_id))).all())
+
+
+async def test_update_changed_starter_projects_skips_unchanged(async_session, tmp_path):
+    folder = await _starter_folder(async_session)
+    projects = [
+        (anyio.Path(tmp_path / f"{name}.json"), _starter_project(name)) for name in ("Basic Prompting", "Agent")
+    ]
+
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    await async_session.commit()
+    assert await _starter_flow_names(async_session, folder.id) == ["Agent", "Basic Prompting"]
+    manifest = (await async_session.exec(select(StarterProjectManifest))).all()
+    assert {entry.name for entry in manifest} == {"Agent", "Basic Prompting"}
+
+    # A second boot with identical content must not touch the database
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    assert not async_session.new
+    assert not async_session.dirty
+    assert not async_session.deleted
+
+
+async def test_update_changed_starter_projects_only_reprovisions_changed(async_session, tmp_path):
+    folder = await _starter_folder(async_session)
+    projects = [
+        (anyio.Path(tmp_path / f"{name}.json"), _starter_project(name)) for name in ("Basic Prompting", "Agent")
+    ]
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    await async_session.commit()
+    flow_ids = dict((await async_session.exec(select(Flow.name, Flow.id))).all())
+
+    projects[0] = (projects[0][0], _starter_project("Basic Prompting", description="Changed"))
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    await async_session.commit()
+
+    new_flow_ids = dict((await async_session.exec(select(Flow.name, Flow.id))).all())
+    assert new_flow_ids["Agent"] == flow_ids["Agent"]
+    assert new_flow_ids["Basic Prompting"] != flow_ids["Basic Prompting"]
+
+
+async def test_update_changed_starter_projects_reprovisions_on_component_change(async_session, tmp_path):
+    folder = await _starter_folder(async_session)
+    projects = [(anyio.Path(tmp_path / "Agent.json"), _starter_project("Agent"))]
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    await async_session.commit()
+    flow_id = (await async_session.exec(select(Flow.id))).one()
+
+    await update_changed_starter_projects(async_session, folder.id, projects, {"inputs": {"ChatInput": {}}})
+    await async_session.commit()
+
+    assert (await async_session.exec(select(Flow.id))).one() != flow_id
+
+
+async def test_update_changed_starter_projects_removes_stale(async_session, tmp_path):
+    folder = await _starter_folder(async_session)
+    projects = [
+        (anyio.Path(tmp_path / f"{name}.json"), _starter_project(name)) for name in ("Basic Prompting", "Agent")
+    ]
+    await update_changed_starter_projects(async_session, folder.id, projects, {})
+    await async_session.commit()
+
+    await update_changed_starter_projects(async_session, folder.id, projects[:1], {})
+    await async_session.commit()
+
+    assert await _starter_flow_names(async_session, folder.id) == ["Basic Prompting"]
+    manifest = (await async_session.exec(select(StarterProjectManifest))).all()
+    assert [entry.name for entry in manifest] == ["Basic Prompting"]
+
+
+def test_starter_project_hash_depends_on_project_and_types():
+    project = _starter_project("Agent")
+    fingerprint = get_types_fingerprint({"inputs": {}})
+
+    assert get_starter_project_hash(project, fingerprint) == get_starter_project_hash(dict(project), fingerprint)
+    assert get_starter_project_hash(project, fingerprint) != get_starter_project_hash(
+        _starter_project("Agent", description="Changed"), fingerprint
+    )
+    assert get_starter_project_hash(project, fingerprint) != get_starter_project_hash(
+        project, get_types_fingerprint({"inputs": {"ChatInput": {}}})
+    )
+
+
+async def _fs_flow(session, fs_path: str) -> Flow:
+    flow = Flow(name="fs flow", description="original", data={}, fs_path=fs_path, user_id=uuid4())
+    session.add(flow)
+    await session.commit()
+    return flow
+
+
+async def test_get_fs_flow_paths_resolves_relative_paths(async_session, tmp_path):
+    relative = await _fs_flow(async_session, "flow.json")
+    absolute = await _fs_flow(async_session, str(tmp_path / "absolute.json"))
+    async_session.add(Flow(name="no fs path", data={}))
+    await async_session.commit()
+    storage_service = SimpleNamespace(data_dir=anyio.Path(tmp_path))
+
+    paths = await get_fs_flow_paths(async_session, storage_service)
+
+    assert set(paths) == {relative.id, absolute.id}
+    assert paths[relative.id] == anyio.Path(tmp_path) / "flows" / str(relative.user_id) / "flow.json"
+    assert paths[absolute.id] == anyio.Path(tmp_path / "absolute.json")
+
+
+async def test_sync_flow_from_file_updates_changed_fields(async_session, tmp_path):
+    path = anyio.Path(tmp_path / "flow.json")
+    flow = await _fs_flow(async_session, str(path))
+    await path.write_text(orjson.dumps({"name": "new name", "description": "original"}).decode())
+
+    state = await sync_flow_from_file(async_session, flow.id, path, None)
+
+    assert state is not None
+    assert flow.name == "new name"
+
+
+async def test_sync_flow_from_file_skips_unchanged_files(async_session, tmp_path):
+    path = anyio.Path(tmp_path / "flow.json")
+    flow = await _fs_flow(async_session, str(path))
+    await path.write_text(orjson.dumps({"name": "new name"}).decode())
+    state = await sync_flow_from_file(async_session, flow.id, path, None)
+    await async_session.commit()
+
+    # Same mtime and size: the file is not read again
+    flow.name = "edited in the database"
+    assert await sync_flow_from_file(async_session, flow.id, path, state) is state
+    assert flow.name == "edited in the database"
+
+    # Rewritten with identical content: the hash matches and the flow is left untouched
+    await path.write_text(orjson.dumps({"name": "new name"}).decode())
+    touched = dataclasses.replace(state, mtime=state.mtime - 1)
+    assert (await sync_flow_from_file(async_session, flow.id, path, touched)).digest == state.digest
+    assert flow.name == "edited in the database"
+
+
+async def test_sync_flow_from_file_does_not_write_identical_values(async_session, tmp_path):
+    path = anyio.Path(tmp_path / "flow.json")
+    flow = await _fs_flow(async_session, str(path))
+    await path.write_text(orjson.dumps({"name": flow.name, "description": flow.description}).decode())
+
+    await sync_flow_from_file(async_session, flow.id, path, None)
+
+    assert not async_session.dirty
+
+
+async def test_sync_flow_from_file_missing_file(async_session, tmp_path):
+    flow = await _fs_flow(async_session, str(tmp_path / "missing.json"))
+
+    assert await sync_flow_from_file(async_session, flow.id, anyio.Path(tmp_path / "missing.json"), None) is None
+
+
+async def test_watch_flows_from_fs_syncs_only_changed_flows(monkeypatch, tmp_path):
+    watchfiles = pytest.importorskip("watchfiles")
+    from vetrai.initial_setup import setup
+
+    flows_dir = anyio.Path(tmp_path) / "flows"
+    watched, other = flows_dir / "watched.json", flows_dir / "other.json"
+    watched_id, other_id = uuid4(), uuid4()
+    synced: list[list] = []
+
+    async def load_fs_flow_paths():
+        return {watched_id: (watched, None), other_id: (other, None)}
+
+    async def sync_flow_files(_flow_paths, _file_states, flow_ids):
+        synced.append(sorted(flow_ids, key=str))
+
+    settings = SimpleNamespace(fs_flows_watch_debounce=50)
+    monkeypatch.setattr(setup, "get_settings_service", lambda: SimpleNamespace(settings=settings))
+    monkeypatch.setattr(setup, "get_storage_service", lambda: SimpleNamespace(data_dir=anyio.Path(tmp_path)))
+    monkeypatch.setattr(setup, "_load_fs_flow_paths", load_fs_flow_paths)
+    monkeypatch.setattr(setup, "_sync_flow_files", sync_flow_files)
+
+    task = asyncio.create_task(setup._watch_flows_from_fs({}, watchfiles.awatch))
+    try:
+        # The initial pass covers every flow
+        for _ in range(50):
+            if synced:
+                break
+            await asyncio.sleep(0.05)
+        assert synced == [sorted([watched_id, other_id], key=str)]
+
+        await asyncio.sleep(0.2)
+        await watched.write_text("{}")
+        for _ in range(100):
+            if len(synced) > 1:
+                break
+            await asyncio.sleep(0.05)
+        assert synced[1:] == [[watched_id]]
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from vetrai.initial_setup.startup import (
+    StartupPhase,
+    StartupState,
+    StartupStep,
+    StartupStepError,
+    run_startup_steps,
+)
+
+
+def _step(name, log, *, depends_on=(), critical=True, delay=0.0, result=None, error=None):
+    async def func(_results):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        log.append(("end", name))
+        return result
+
+    return StartupStep(name, func, depends_on=depends_on, critical=critical)
+
+
+async def test_steps_run_after_their_dependencies():
+    log: list[tuple[str, str]] = []
+    state = StartupState()
+    steps = [
+        _step("c", log, depends_on=("a", "b")),
+        _step("a", log, delay=0.01),
+        _step("b", log),
+    ]
+
+    await run_startup_steps(steps, state=state)
+
+    assert log.index(("start", "c")) > log.index(("end", "a"))
+    assert log.index(("start", "c")) > log.index(("end", "b"))
+    assert set(state.durations) == {"a", "b", "c"}
+
+
+async def test_independent_steps_run_concurrently():
+    log: list[tuple[str, str]] = []
+    steps = [_step(name, log, delay=0.05) for name in ("a", "b", "c")]
+
+    await run_startup_steps(steps, state=StartupState())
+
+    # Every step starts before any of them finishes
+    assert [event for event, _ in log[:3]] == ["start", "start", "start"]
+
+
+async def test_results_are_passed_to_dependents():
+    seen = {}
+
+    async def consumer(results):
+        seen["value"] = results["producer"]
+
+    steps = [
+        _step("producer", [], result={"types": 1}),
+        StartupStep("consumer", consumer, depends_on=("producer",)),
+    ]
+
+    results = await run_startup_steps(steps, state=StartupState())
+
+    assert seen["value"] == {"types": 1}
+    assert results["producer"] == {"types": 1}
+
+
+async def test_critical_failure_raises():
+    state = StartupState()
+    steps = [_step("a", [], error=ValueError("boom"))]
+
+    with pytest.raises(StartupStepError, match="boom"):
+        await run_startup_steps(steps, state=state)
+    assert "a" in state.failed
+
+
+async def test_non_critical_failure_skips_dependents():
+    log: list[tuple[str, str]] = []
+    state = StartupState()
+    steps = [
+        _step("a", log, critical=False, error=ValueError("boom")),
+        _step("b", log, depends_on=("a",), critical=False),
+        _step("c", log),
+    ]
+
+    await run_startup_steps(steps, state=state)
+
+    assert ("start", "b") not in log
+    assert ("end", "c") in log
+    assert state.failed.keys() == {"a"}
+    assert state.skipped == {"b"}
+
+
+async def test_critical_step_skipped_by_failed_dependency_raises():
+    steps = [
+        _step("a", [], critical=False, error=ValueError("boom")),
+        _step("b", [], depends_on=("a",)),
+    ]
+
+    with pytest.raises(StartupStepError, match="skipped"):
+        await run_startup_steps(steps, state=StartupState())
+
+
+async def test_dependencies_can_name_completed_steps():
+    log: list[tuple[str, str]] = []
+
+    results = await run_startup_steps(
+        [_step("warmup", log, depends_on=("services",))],
+        state=StartupState(),
+        results={"services": None},
+    )
+
+    assert ("end", "warmup") in log
+    assert "warmup" in results
+
+
+@pytest.mark.parametrize(
+    ("steps", "match"),
+    [
+        ([StartupStep("a", None, depends_on=("missing",))], "unknown"),
+        ([StartupStep("a", None), StartupStep("a", None)], "Duplicate"),
+        ([StartupStep("a", None, depends_on=("b",)), StartupStep("b", None, depends_on=("a",))], "cycle"),
+    ],
+)
+async def test_invalid_step_graphs_are_rejected(steps, match):
+    with pytest.raises(ValueError, match=match):
+        await run_startup_steps(steps, state=StartupState())
+
+
+def test_state_reports_phase():
+    state = StartupState()
+    state.durations["services"] = 0.5
+    state.phase = StartupPhase.SERVING
+
+    assert state.to_dict() == {"status": "serving", "steps": {"services": 0.5}, "failed": [], "skipped": []}
+
+    state.reset()
+    assert state.phase == StartupPhase.STARTING
+    assert state.durations == {}
@@ -0,0 +1,130 @@
+import json
+import pickle
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.models_and_agents.prompt import PromptComponent
+from lfx.graph.graph.base import Graph
+from lfx.schema.message import Message
+from lfx.services.cache.utils import CACHE_MISS
+from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.cache.serializer import CacheSerializer
+
+
+@dataclass
+class SerializedPoint:
+    x: int
+    y: int
+
+
+PLAIN_VALUE = {"text": "hello " * 10_000, "scores": [0.5, 1.5], "count": 3, "nested": {"ok": True, "none": None}}
+
+
+def _flow_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    prompt = PromptComponent(_id="prompt")
+    prompt.set(template="Answer like a pirate.\n\nUser: {user_input}", user_input=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=prompt.build_prompt)
+    payload = json.loads(json.dumps(Graph(start=chat_input, end=chat_output).dump()["data"]))
+    graph = Graph.from_payload(payload, flow_id="flow", flow_name="Pirate", user_id="user")
+    graph.prepare()
+    graph.set_run_id("run")
+    return graph
+
+
+@pytest.mark.parametrize("serializer", ["pickle", "dill", "msgpack"])
+@pytest.mark.parametrize("compression", [None, "zstd", "lz4"])
+def test_values_round_trip(serializer, compression):
+    codec = CacheSerializer(serializer, compression)
+
+    assert codec.loads(codec.dumps(PLAIN_VALUE)) == PLAIN_VALUE
+    assert codec.loads(codec.dumps("short")) == "short"
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+def test_only_values_above_the_threshold_are_compressed(compression):
+    small = {"text": "hello " * 100}
+    uncompressed = CacheSerializer("pickle")
+    compressed = CacheSerializer("pickle", compression, compression_threshold=1024)
+
+    assert len(compressed.dumps(small)) == len(uncompressed.dumps(small))
+    assert len(compressed.dumps(PLAIN_VALUE)) < len(uncompressed.dumps(PLAIN_VALUE)) / 10
+    # Any serializer can read values written with other settings, and plain pickles
+    assert uncompressed.loads(compressed.dumps(PLAIN_VALUE)) == PLAIN_VALUE
+    assert compressed.loads(pickle.dumps(PLAIN_VALUE)) == PLAIN_VALUE
+
+
+def test_msgpack_pickles_values_it_cannot_encode():
+    codec = CacheSerializer("msgpack")
+    value = {"message": Message(text="hi"), "ids": {"a", "b"}}
+
+    decoded = codec.loads(codec.dumps(value))
+
+    assert decoded["message"].text == "hi"
+    assert decoded["ids"] == {"a", "b"}
+    assert len(codec.dumps(PLAIN_VALUE)) < len(CacheSerializer("pickle").dumps(PLAIN_VALUE))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        SerializedPoint(1, 2),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        (1, "two", 3.0),
+        {"nested": [(1, 2)], "id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    ],
+    ids=["dataclass", "uuid", "datetime", "tuple", "nested"],
+)
+def test_msgpack_round_trips_values_that_are_not_json_types(value):
+    codec = CacheSerializer("msgpack")
+
+    decoded = codec.loads(codec.dumps(value))
+
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unknown cache value format"):
+        CacheSerializer().loads(b"\xc1V\x09\x00payload")
+
+
+async def test_graph_serializer_stores_the_run_state():
+    graph = _flow_graph()
+    await graph.build_vertex("chat_input", inputs_dict={"input_value": "ahoy"})
+    codec = CacheSerializer("graph", "zstd")
+
+    encoded = codec.dumps({"result": graph, "type": type(graph)})
+    cached = codec.loads(encoded)["result"]
+
+    assert len(encoded) < len(CacheSerializer("dill").dumps({"result": graph, "type": type(graph)})) / 4
+    assert cached is not graph
+    assert [vertex.id for vertex in cached.vertices] == [vertex.id for vertex in graph.vertices]
+    assert cached.run_id == "run"
+    assert cached.flow_name == "Pirate"
+    assert list(cached._run_queue) == list(graph._run_queue)
+    assert cached.run_manager.to_dict() == graph.run_manager.to_dict()
+    restored_input = cached.get_vertex("chat_input")
+    assert restored_input.built
+    assert restored_input.built_object["message"].text == "ahoy"
+    assert restored_input.result.results == graph.get_vertex("chat_input").result.results
+    assert not cached.get_vertex("prompt").built
+
+    # The rebuilt graph can continue the run
+    result = await cached.build_vertex("prompt")
+    assert "ahoy" in result.vertex.built_object["prompt"].text
+
+
+async def test_disk_cache_uses_its_serializer(tmp_path):
+    cache = AsyncDiskCache(tmp_path, serializer=CacheSerializer("msgpack", "zstd", compression_threshold=0))
+
+    await cache.set("key", PLAIN_VALUE)
+
+    assert await cache.get("key") == PLAIN_VALUE
+    assert len(cache.cache.get("key")["value"]) < len(pickle.dumps(PLAIN_VALUE)) / 10
+    assert await cache.get("missing") is CACHE_MISS
@@ -0,0 +1,88 @@
+"""Tests for the fast boot migration check, against a temporary SQLite database."""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from alembic import command
+from lfx.services.settings.base import Settings
+from vetrai.services.database.service import DatabaseService
+
+
+@pytest.fixture
+async def database_service(tmp_path, monkeypatch):
+    # Settings are read from the environment
+    monkeypatch.setenv("VETRAI_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'vetrai.db'}")
+    monkeypatch.setenv("VETRAI_ALEMBIC_LOG_FILE", str(tmp_path / "alembic.log"))
+    settings_service = MagicMock()
+    settings_service.settings = Settings()
+    service = DatabaseService(settings_service)
+    await service.create_db_and_tables()
+    engine = service.engine
+    with patch("vetrai.services.database.service.session_scope", service._with_session):
+        yield service
+    await engine.dispose()
+
+
+async def _stamp(service: DatabaseService, revision: str) -> None:
+    # alembic/env.py runs its own event loop
+    await asyncio.to_thread(command.stamp, service._alembic_config(sys.stdout), revision)
+
+
+async def test_fast_boot_skips_the_check_at_the_head_revision(database_service):
+    await _stamp(database_service, "head")
+
+    with (
+        patch.object(database_service, "_run_migrations") as full_check,
+        patch.object(database_service, "_upgrade_to_head") as upgrade,
+    ):
+        await database_service.run_migrations()
+
+    assert await database_service.is_at_head_revision()
+    full_check.assert_not_called()
+    upgrade.assert_not_called()
+
+
+async def test_fast_boot_upgrades_behind_the_head_revision(database_service):
+    # Create the version table, as on a database that alembic initialized, then move it behind the head
+    await _stamp(database_service, "head")
+    await _stamp(database_service, "base")
+
+    with (
+        patch.object(database_service, "_run_migrations") as full_check,
+        patch.object(database_service, "_upgrade_to_head") as upgrade,
+    ):
+        await database_service.run_migrations()
+
+    upgrade.assert_called_once()
+    full_check.assert_not_called()
+
+
+async def test_full_check_runs_when_fast_boot_is_disabled(database_service):
+    await _stamp(database_service, "head")
+    database_service.settings_service.settings.migration_fast_boot = False
+
+    with patch.object(database_service, "_run_migrations") as full_check:
+        await database_service.run_migrations()
+
+    full_check.assert_called_once_with(False, False)  # noqa: FBT003
+
+
+async def test_waiting_workers_return_once_the_leader_reaches_the_head_revision(database_service):
+    database_service.settings_service.settings.migration_wait_timeout = 5
+    database_service.engine = MagicMock(dialect=MagicMock())
+    database_service.engine.dialect.name = "postgresql"
+    connection = AsyncMock()
+    connection.execute.return_value = MagicMock(scalar=MagicMock(return_value=False))
+    database_service.engine.connect.return_value.__aenter__.return_value = connection
+
+    with (
+        patch.object(database_service, "is_at_head_revision", AsyncMock(side_effect=[False, True])),
+        patch.object(database_service, "_upgrade_to_head") as upgrade,
+        patch("vetrai.services.database.service.MIGRATION_POLL_INTERVAL", 0),
+    ):
+        await database_service._migrate_as_leader()
+
+    upgrade.assert_not_called()
+    assert database_service.engine.connect.call_count == 2
@@ -0,0 +1,95 @@
+"""Tests for read replica routing, with the primary and the replica in two temporary SQLite databases."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from lfx.services.settings.base import Settings
+from sqlmodel import SQLModel, select
+from vetrai.services.database.models.user.model import User
+from vetrai.services.database.service import DatabaseService
+from vetrai.services.database.session import request_user_id
+
+
+def _database_service(tmp_path, monkeypatch, **settings) -> DatabaseService:
+    # Settings are read from the environment
+    monkeypatch.setenv("VETRAI_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setenv("VETRAI_ALEMBIC_LOG_FILE", str(tmp_path / "alembic.log"))
+    for name, value in settings.items():
+        monkeypatch.setenv(f"VETRAI_{name.upper()}", str(value))
+    settings_service = MagicMock()
+    settings_service.settings = Settings()
+    return DatabaseService(settings_service)
+
+
+@pytest.fixture
+async def database_service(tmp_path, monkeypatch):
+    service = _database_service(
+        tmp_path,
+        monkeypatch,
+        database_replica_url=f"sqlite:///{tmp_path / 'replica.db'}",
+        database_replica_lag_window=0.2,
+    )
+    await service.create_db_and_tables()
+    async with service.replica_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield service
+    await service.engine.dispose()
+    await service.replica_engine.dispose()
+
+
+async def _write_user(service: DatabaseService, username: str) -> None:
+    async with service._with_session() as session:
+        session.add(User(username=username, password="password"))  # noqa: S106
+        await session.commit()
+
+
+async def _usernames(service: DatabaseService, user_id) -> set[str]:
+    async with service.read_session(user_id) as session:
+        return set((await session.exec(select(User.username))).all())
+
+
+async def test_reads_go_to_the_replica(database_service):
+    await _write_user(database_service, "written-by-a-job")
+
+    assert database_service.replica_url.startswith("sqlite+aiosqlite://")
+    assert await _usernames(database_service, "reader") == set()
+
+
+async def test_users_read_their_writes_from_the_primary_within_the_lag_window(database_service):
+    token = request_user_id.set("writer")
+    try:
+        await _write_user(database_service, "alice")
+    finally:
+        request_user_id.reset(token)
+
+    assert await _usernames(database_service, "writer") == {"alice"}
+    assert await _usernames(database_service, "other-user") == set()
+
+    await asyncio.sleep(0.3)
+
+    assert await _usernames(database_service, "writer") == set()
+
+
+async def test_sessions_that_only_read_do_not_route_to_the_primary(database_service):
+    token = request_user_id.set("reader")
+    try:
+        async with database_service._with_session() as session:
+            await session.exec(select(User))
+            await session.commit()
+    finally:
+        request_user_id.reset(token)
+
+    assert not database_service.wrote_recently("reader")
+
+
+async def test_reads_go_to_the_primary_without_a_replica(tmp_path, monkeypatch):
+    service = _database_service(tmp_path, monkeypatch)
+    await service.create_db_and_tables()
+    try:
+        await _write_user(service, "alice")
+
+        assert service.replica_engine is None
+        assert await _usernames(service, "reader") == {"alice"}
+    finally:
+        await service.engine.dispose()
@@ -0,0 +1,28 @@
+from lfx.schema.message import Message
+from lfx.services.cache.utils import CACHE_MISS
+from vetrai.services.cache.disk import AsyncDiskCache
+from vetrai.services.result_cache.service import ResultCacheService
+
+
+async def test_disk_results_survive_restarts(tmp_path):
+    first_worker = ResultCacheService(AsyncDiskCache(tmp_path, persistent=True))
+    await first_worker.set("key", {"results": {"parsed": Message(text="DOC")}})
+    await first_worker.teardown()
+
+    second_worker = ResultCacheService(AsyncDiskCache(tmp_path, persistent=True))
+    cached = await second_worker.get("key")
+
+    assert cached["results"]["parsed"].text == "DOC"
+    assert await second_worker.get("missing") is CACHE_MISS
+    assert second_worker.get_stats() == {"hits": 1, "misses": 1}
+
+
+async def test_disk_cache_is_size_bounded(tmp_path):
+    service = ResultCacheService(AsyncDiskCache(tmp_path, size_limit=1024 * 1024, persistent=True))
+
+    for index in range(50):
+        await service.set(f"key-{index}", "x" * 64 * 1024)
+
+    assert service.cache.cache.volume() < 2 * 1024 * 1024
+    assert await service.get("key-0") is CACHE_MISS
+    assert await service.get("key-49") != CACHE_MISS
@@ -23,11 +23,13 @@ import structlog
 from lfx.log.logger import (
     LOG_LEVEL_MAP,
     VALID_LOG_LEVELS,
+    CallsiteForLevels,
     InterceptHandler,
     SizedLogBuffer,
     add_serialized,
     buffer_writer,
     configure,
+    get_log_queue,
     log_buffer,
     remove_exception_in_production,
     setup_gunicorn_logger,
@@ -746,6 +748,130 @@ class TestSizedLogBufferIntegration:
         assert timestamps[0] > 0  # Should be a valid epoch timestamp
 
 
+class _BlockingOutput:
+    """File-like output whose writes wait until released, to fill the log queue."""
+
+    def __init__(self):
+        import threading
+
+        self.released = threading.Event()
+        self.lines: list[str] = []
+
+    def write(self, text: str) -> None:
+        self.released.wait(timeout=10)
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class TestAsyncLogging:
+    """Test suite for the queue-backed asynchronous logging mode."""
+
+    def teardown_method(self):
+        if (log_queue := get_log_queue()) is not None:
+            log_queue.close()
+        structlog.reset_defaults()
+        structlog.configure()
+
+    def _records(self, output) -> list[dict]:
+        get_log_queue().close()
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_records_are_written_by_the_writer_thread(self):
+        import io
+
+        output = io.StringIO()
+        with patch.dict(os.environ, {"VETRAI_PRETTY_LOGS": "false"}):
+            configure(log_level="INFO", async_logging=True, output_file=output, cache=False)
+        logger = structlog.get_logger()
+
+        logger.debug("not formatted %s", "at info level")
+        logger.info("first %s", "record")
+        logger.warning("second", key="value")
+
+        records = self._records(output)
+        assert [record["event"] for record in records] == ["first record", "second"]
+        assert records[1]["key"] == "value"
+        assert records[1]["level"] == "warning"
+        assert "timestamp" in records[0]
+
+    async def test_async_methods_log_without_the_executor(self):
+        import asyncio
+        import io
+
+        output = io.StringIO()
+        with patch.dict(os.environ, {"VETRAI_PRETTY_LOGS": "false"}):
+            configure(log_level="DEBUG", async_logging=True, output_file=output, cache=False)
+        logger = structlog.get_logger()
+
+        with patch.object(asyncio.get_running_loop(), "run_in_executor") as run_in_executor:
+            await logger.adebug("from %s", "a coroutine")
+            try:
+                1 / 0  # noqa: B018
+            except ZeroDivisionError:
+                await logger.aexception("failed")
+
+        run_in_executor.assert_not_called()
+        records = self._records(output)
+        assert [record["event"] for record in records][-2:] == ["from a coroutine", "failed"]
+
+    def test_overflow_is_counted_instead_of_blocking(self):
+        output = _BlockingOutput()
+        with patch.dict(os.environ, {"VETRAI_PRETTY_LOGS": "false"}):
+            configure(log_level="INFO", async_logging=True, output_file=output, cache=False, queue_size=2)
+        logger = structlog.get_logger()
+
+        for i in range(20):
+            logger.info("record %d", i)
+
+        log_queue = get_log_queue()
+        assert log_queue.dropped > 0
+        output.released.set()
+        log_queue.close()
+        assert f"Dropped {log_queue.dropped} log records" in "".join(output.lines).splitlines()[-1]
+
+    def test_callsite_is_added_only_for_opted_in_levels(self):
+        import io
+
+        output = io.StringIO()
+        with patch.dict(os.environ, {"VETRAI_PRETTY_LOGS": "false"}):
+            configure(log_level="INFO", async_logging=True, output_file=output, cache=False, callsite_levels="warning")
+        logger = structlog.get_logger()
+
+        logger.info("without callsite")
+        logger.warning("with callsite")
+
+        info, warning = self._records(output)
+        assert "func_name" not in info
+        assert warning["func_name"] == "test_callsite_is_added_only_for_opted_in_levels"
+        assert warning["filename"] == "test_logger.py"
+
+    def test_reconfiguring_the_same_level_applies_the_other_options(self):
+        configure(log_level="INFO", cache=False)
+        assert get_log_queue() is None
+
+        configure(log_level="INFO", async_logging=True, queue_size=2, cache=False)
+        first_queue = get_log_queue()
+        assert first_queue is not None
+        assert first_queue._queue.maxsize == 2
+
+        configure(log_level="INFO", async_logging=True, queue_size=2, cache=False)
+        assert get_log_queue() is first_queue
+
+        configure(log_level="INFO", async_logging=True, queue_size=4, cache=False)
+        assert get_log_queue()._queue.maxsize == 4
+
+        configure(log_level="INFO", async_logging=True, queue_size=4, callsite_levels="warning", cache=False)
+        assert any(
+            isinstance(processor, CallsiteForLevels) and processor.levels == {"WARNING"}
+            for processor in structlog.get_config()["processors"]
+        )
+
+        configure(log_level="INFO", async_logging=False, callsite_levels="warning", cache=False)
+        assert get_log_queue() is None
+
+
 class TestSpecificBugFixes:
     """Test suite for specific bugs that were discovered and fixed."""
 
@@ -10,6 +10,8 @@ from vetrai.utils.voice_utils import (
     FRAME_DURATION_MS,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
+    VadPipeline,
     _write_bytes_to_file,
     resample_24k_to_16k,
     write_audio_to_file,
@@ -172,6 +174,87 @@ class TestResample24kTo16k:
         assert target_samples == 320  # int(480 * 2 / 3)
 
 
+class TestStreamingResampler:
+    """Test cases for the stateful polyphase resampler."""
+
+    def test_matches_resample_poly_for_any_chunking(self):
+        """Streaming arbitrary chunk sizes gives the same samples as resampling the whole signal at once."""
+        from scipy.signal import resample_poly
+
+        rng = np.random.default_rng(0)
+        t = np.arange(SAMPLE_RATE_24K) / SAMPLE_RATE_24K
+        samples = (np.sin(2 * np.pi * 440 * t) * 10000 + rng.normal(0, 500, len(t))).astype(np.int16)
+
+        resampler = StreamingResampler(up=2, down=3)
+        chunks = []
+        start = 0
+        for size in rng.integers(0, 900, 200):
+            chunks.append(resampler.process(samples[start : start + size]))
+            start += size
+        chunks.append(resampler.process(samples[start:]))
+        streamed = np.concatenate(chunks)
+
+        expected = np.rint(resample_poly(samples.astype(np.float64), 2, 3)).astype(np.int16)
+        assert len(streamed) == len(expected) == VAD_SAMPLE_RATE_16K
+        # The stream is delayed by the filter half length (30 taps at 48kHz, 10 samples at 16kHz)
+        assert np.max(np.abs(streamed[10:].astype(int) - expected[:-10])) <= 1
+
+    def test_full_frames_produce_full_frames(self):
+        """Each 20ms frame at 24kHz yields exactly one 20ms frame at 16kHz."""
+        resampler = StreamingResampler(up=2, down=3)
+        frame = np.zeros(BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE, dtype=np.int16)
+
+        for _ in range(5):
+            assert len(resampler.process(frame).tobytes()) == BYTES_PER_16K_FRAME
+
+    def test_reset_starts_a_new_stream(self):
+        """After a reset, the output only depends on the chunks processed since."""
+        rng = np.random.default_rng(0)
+        before, after = rng.integers(-10000, 10000, (2, 1000)).astype(np.int16)
+        resampler = StreamingResampler(up=2, down=3)
+        resampler.process(before[:999])
+
+        resampler.reset()
+
+        np.testing.assert_array_equal(resampler.process(after), StreamingResampler(up=2, down=3).process(after))
+
+
+class TestVadPipeline:
+    """Test cases for batched VAD processing."""
+
+    def test_batches_are_split_into_vad_frames(self):
+        """Chunks of any size, including odd byte counts, are regrouped into complete 16kHz frames."""
+        vad = MagicMock()
+        vad.is_speech.side_effect = lambda frame, rate: len(frame) == BYTES_PER_16K_FRAME and rate == 16000
+        pipeline = VadPipeline(vad)
+        audio = np.ones(5 * BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE, dtype=np.int16).tobytes()
+
+        assert pipeline.process([base64.b64encode(audio[:1001]).decode()]) is True
+        assert pipeline.process([base64.b64encode(audio[1001:]).decode()]) is True
+        assert vad.is_speech.call_count == 5
+
+    def test_reset_drops_audio_before_a_gap(self):
+        """Partial samples and frames left over from chunks before a gap are not joined with later chunks."""
+        vad = MagicMock()
+        pipeline = VadPipeline(vad)
+        audio = np.ones(BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE, dtype=np.int16).tobytes()
+        # Most of a 20ms frame and an odd byte are left over before the gap
+        pipeline.process([base64.b64encode(audio[:801]).decode()])
+
+        pipeline.reset()
+        pipeline.process([base64.b64encode(audio[:200]).decode()])
+
+        vad.is_speech.assert_not_called()
+
+    def test_no_speech_without_complete_frame(self):
+        """No VAD call is made before a full 20ms frame is available."""
+        vad = MagicMock()
+        pipeline = VadPipeline(vad)
+
+        assert pipeline.process([base64.b64encode(b"\x00" * 100).decode()]) is False
+        vad.is_speech.assert_not_called()
+
+
 class TestWriteAudioToFile:
     """Test cases for write_audio_to_file function."""
 
@@ -1,5 +1,4 @@
 # Add helper functions for each event type
-import asyncio
 from collections.abc import AsyncIterator
 from time import perf_counter
 from typing import Any, Protocol
@@ -12,6 +11,7 @@ from lfx.schema.content_block import ContentBlock
 from lfx.schema.content_types import TextContent, ToolContent
 from lfx.schema.log import OnTokenFunctionType, SendMessageFunctionType
 from lfx.schema.message import Message
+from lfx.utils.executors import EVENTS_POOL, run_in_pool
 
 
 class ExceptionWithMessageError(Exception):
@@ -316,7 +316,8 @@ async def handle_on_chain_stream(
         # Note: we should expect the callback, but we keep it optional for backwards compatibility
         # as of v1.6.5
         if output_text and output_text.strip() and send_token_callback and message_id:
-            await asyncio.to_thread(
+            await run_in_pool(
+                EVENTS_POOL,
                 send_token_callback,
                 data={
                     "chunk": output_text,
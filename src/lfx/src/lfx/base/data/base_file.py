@@ -1,11 +1,13 @@
 import ast
+import importlib.util
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from functools import cache
 from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from zipfile import ZipFile, is_zipfile
 
 import orjson
@@ -21,8 +23,29 @@ from lfx.services.deps import get_settings_service
 from lfx.utils.async_helpers import run_until_complete
 from lfx.utils.helpers import build_content_type_from_extension
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
+
+@cache
+def _has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def read_table(source: str | BytesIO, ext: str, *, arrow: bool = False) -> pd.DataFrame | None:
+    """Reads a CSV, Excel or Parquet file into a pandas DataFrame, or returns None for other extensions.
+
+    With `arrow` and pyarrow installed, CSV files are parsed by pyarrow and all columns are Arrow-backed, so
+    filtering, slicing and passing the table between components doesn't convert the values to Python objects.
+    Otherwise the default pandas engine and dtypes are used.
+    """
+    arrow_options: dict[str, Any] = {"dtype_backend": "pyarrow"} if arrow and _has_pyarrow() else {}
+    if ext == ".csv":
+        if arrow_options:
+            return pd.read_csv(source, engine="pyarrow", **arrow_options)
+        return pd.read_csv(source)
+    if ext == ".xlsx":
+        return pd.read_excel(source, **arrow_options)
+    if ext == ".parquet":
+        return pd.read_parquet(source, **arrow_options)
+    return None
 
 
 class BaseFileComponent(Component, ABC):
@@ -353,7 +376,7 @@ class BaseFileComponent(Component, ABC):
 
         return Message(text="\n".join(paths) if paths else "")
 
-    def load_files_structured_helper(self, file_path: str) -> list[dict] | None:
+    def load_files_structured_helper(self, file_path: str) -> pd.DataFrame | None:
         if not file_path:
             return None
 
@@ -364,37 +387,15 @@ class BaseFileComponent(Component, ABC):
 
         # For S3 storage, download file bytes first
         if settings.storage_type == "s3":
+            if ext not in {".csv", ".xlsx", ".parquet"}:
+                return None
             # Download file content from S3
             content = run_until_complete(read_file_bytes(file_path))
-
-            # Map file extensions to pandas read functions that support BytesIO
-            if ext == ".csv":
-                result = pd.read_csv(BytesIO(content))
-            elif ext == ".xlsx":
-                result = pd.read_excel(BytesIO(content))
-            elif ext == ".parquet":
-                result = pd.read_parquet(BytesIO(content))
-            else:
-                return None
-
-            return result.to_dict("records")
+            return read_table(BytesIO(content), ext, arrow=settings.arrow_backed_tables)
 
         # Local storage - read directly from filesystem
-        file_readers: dict[str, Callable[[str], pd.DataFrame]] = {
-            ".csv": pd.read_csv,
-            ".xlsx": pd.read_excel,
-            ".parquet": pd.read_parquet,
-            # TODO: sqlite and json support?
-        }
-
-        # Get the appropriate reader function or None
-        reader = file_readers.get(ext)
-
-        if reader:
-            result = reader(file_path)  # MyPy now knows reader is callable
-            return result.to_dict("records")
-
-        return None
+        # TODO: sqlite and json support?
+        return read_table(file_path, ext, arrow=settings.arrow_backed_tables)
 
     def load_files_structured(self) -> DataFrame:
         """Load files and return as DataFrame with structured content.
@@ -411,15 +412,17 @@ class BaseFileComponent(Component, ABC):
 
         # If file_path is provided and is a CSV, read it directly
         if file_path and str(file_path).lower().endswith((".csv", ".xlsx", ".parquet")):
-            rows = self.load_files_structured_helper(file_path)
+            # The columns are passed on as they were read, without converting the rows to dictionaries
+            table = self.load_files_structured_helper(file_path)
+            result = DataFrame(table) if table is not None else DataFrame()
         else:
             # Convert Data objects to a list of dictionaries
             # TODO: Parse according to docling standards
-            rows = [data_list[0].data]
+            result = DataFrame([data_list[0].data])
 
-        self.status = DataFrame(rows)
+        self.status = result
 
-        return DataFrame(rows)
+        return result
 
     def parse_string_to_dict(self, s: str) -> dict:
         # Try JSON first (handles true/false/null)
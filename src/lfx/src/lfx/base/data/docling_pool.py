@@ -0,0 +1,310 @@
+"""A pool of long-lived worker processes that convert documents with Docling.
+
+Docling conversion is CPU-bound, so running it in a thread of the server holds the GIL against the event loop and
+every other flow. The pool runs it in separate processes instead. Workers outlive the builds that use them, so the
+`DocumentConverter` of each pipeline configuration, and its models, stay loaded between runs (see
+`lfx.base.data.docling_utils.get_converter`).
+
+Files are dispatched to the first idle worker, so the files of a build are converted in parallel. A conversion
+that takes longer than the task timeout, or that is cancelled while it runs, kills its worker. Workers whose
+resident memory grows past a limit are restarted after their current file.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
+
+_POLL_INTERVAL = 0.1
+
+
+def _resident_memory() -> int:
+    """Return the resident memory of the current process in bytes, or 0 when it cannot be measured."""
+    try:
+        return int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Peak instead of current memory, in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _worker_main(connection: Connection) -> None:
+    """Run conversion tasks received on `connection` until the pool closes it."""
+    # Interrupts are handled by the server, which stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            task = connection.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        convert, file_path, options = task
+        try:
+            result: Any = ("ok", convert(file_path, options))
+        except Exception as exc:  # noqa: BLE001
+            result = ("error", exc)
+        try:
+            connection.send((*result, _resident_memory()))
+        except Exception as exc:  # noqa: BLE001
+            # The result could not be pickled
+            connection.send(("error", RuntimeError(f"Could not send the result for {file_path}: {exc}"), 0))
+
+
+class _Worker:
+    """A worker process and the connection the pool sends it tasks on."""
+
+    def __init__(self, context: BaseContext, index: int) -> None:
+        self.context = context
+        self.index = index
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.connection: Connection | None = None
+
+    def start(self) -> None:
+        parent_connection, child_connection = self.context.Pipe()
+        self.process = self.context.Process(
+            target=_worker_main, args=(child_connection,), name=f"docling-worker-{self.index}", daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.connection = parent_connection
+
+    def run(
+        self,
+        convert: Callable[[str, dict], Any],
+        file_path: str,
+        options: dict,
+        *,
+        timeout: float | None,
+        cancelled: threading.Event,
+    ) -> tuple[Any, int]:
+        """Convert a file and return the result with the resident memory of the worker afterwards.
+
+        Raises:
+            TimeoutError: If the conversion takes longer than `timeout` seconds. The worker is killed.
+            CancelledError: If `cancelled` is set while the file is converted. The worker is killed.
+            RuntimeError: If the worker exits while it converts the file.
+        """
+        if self.process is None or not self.process.is_alive():
+            self.start()
+        self.connection.send((convert, file_path, options))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.connection.poll(_POLL_INTERVAL):
+            if cancelled.is_set():
+                self.kill()
+                raise CancelledError
+            if deadline is not None and time.monotonic() > deadline:
+                self.kill()
+                msg = f"Docling conversion of {file_path} timed out after {timeout} seconds"
+                raise TimeoutError(msg)
+            if not self.process.is_alive():
+                exit_code = self.process.exitcode
+                self.kill()
+                msg = f"Docling worker exited with code {exit_code} while converting {file_path}"
+                raise RuntimeError(msg)
+        try:
+            status, value, resident_memory = self.connection.recv()
+        except EOFError:
+            self.kill()
+            msg = f"Docling worker exited while converting {file_path}"
+            raise RuntimeError(msg) from None
+        if status == "error":
+            raise value
+        return value, resident_memory
+
+    def stop(self, timeout: float = 5) -> None:
+        """Ask the worker to exit after its current task, killing it if it does not within `timeout` seconds."""
+        if self.process is None:
+            return
+        with suppress(OSError, ValueError):
+            self.connection.send(None)
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join()
+            self.process = None
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class ConversionFuture(Future):
+    """The future of a conversion. Cancelling it while the file is converted kills the worker converting it."""
+
+    def __init__(self, convert: Callable[[str, dict], Any], file_path: str, options: dict) -> None:
+        super().__init__()
+        self.convert = convert
+        self.file_path = file_path
+        self.options = options
+        self.stop_requested = threading.Event()
+
+    def cancel(self) -> bool:
+        if super().cancel():
+            return True
+        if not self.done():
+            # The future raises CancelledError once the worker is stopped
+            self.stop_requested.set()
+        return False
+
+
+class DoclingProcessPool:
+    """Converts documents in a fixed number of long-lived worker processes.
+
+    Workers are started when they receive their first file. Every worker has a dispatcher thread in the server
+    process that sends it files and waits for the results, which does not hold the GIL.
+
+    Args:
+        max_workers: The number of worker processes.
+        task_timeout: Seconds after which the conversion of a file is stopped, or None for no limit.
+        max_worker_memory: Resident memory in bytes from which a worker is restarted after its current file, or None
+            to never restart workers.
+        mp_context: The multiprocessing start method. Workers are spawned by default, since forking a server with
+            running threads is not safe.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        task_timeout: float | None = 300,
+        max_worker_memory: int | None = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        if max_workers < 1:
+            msg = f"The Docling pool needs at least one worker, got {max_workers}"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.max_worker_memory = max_worker_memory
+        self._context = multiprocessing.get_context(mp_context)
+        self._tasks: queue.SimpleQueue[ConversionFuture | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._dispatchers: list[threading.Thread] = []
+        self.recycled_workers = 0
+
+    def submit(self, convert: Callable[[str, dict], Any], file_path: str, options: dict) -> ConversionFuture:
+        """Schedule `convert(file_path, options)` in a worker process.
+
+        `convert` and `options` must be picklable; functions are pickled by reference.
+        """
+        future = ConversionFuture(convert, file_path, options)
+        with self._lock:
+            if self._shutdown:
+                msg = "The Docling pool is shut down"
+                raise RuntimeError(msg)
+            if len(self._dispatchers) < self.max_workers:
+                dispatcher = threading.Thread(
+                    target=self._dispatch,
+                    args=(_Worker(self._context, len(self._dispatchers)),),
+                    name=f"docling-dispatcher-{len(self._dispatchers)}",
+                    daemon=True,
+                )
+                dispatcher.start()
+                self._dispatchers.append(dispatcher)
+        self._tasks.put(future)
+        return future
+
+    def _dispatch(self, worker: _Worker) -> None:
+        try:
+            while (future := self._tasks.get()) is not None:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result, resident_memory = worker.run(
+                        future.convert,
+                        future.file_path,
+                        future.options,
+                        timeout=self.task_timeout,
+                        cancelled=future.stop_requested,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    future.set_exception(exc)
+                    continue
+                recycle = self.max_worker_memory is not None and resident_memory > self.max_worker_memory
+                if recycle:
+                    self.recycled_workers += 1
+                future.set_result(result)
+                if recycle:
+                    logger.debug(
+                        f"Restarting Docling worker {worker.index}, which uses {resident_memory // 2**20} MB of memory"
+                    )
+                    worker.stop()
+        finally:
+            worker.stop()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers once they finish their current file. Files that did not start are cancelled."""
+        with self._lock:
+            self._shutdown = True
+            dispatchers = list(self._dispatchers)
+        while True:
+            try:
+                future = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None:
+                future.cancel()
+        for _ in dispatchers:
+            self._tasks.put(None)
+        if wait:
+            for dispatcher in dispatchers:
+                dispatcher.join()
+
+
+_pool: DoclingProcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_docling_pool() -> DoclingProcessPool:
+    """Return the Docling process pool of the server, created from the settings on first use."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            from lfx.services.deps import get_settings_service
+
+            settings_service = get_settings_service()
+            if settings_service is None:
+                _pool = DoclingProcessPool()
+            else:
+                settings = settings_service.settings
+                max_memory = settings.docling_worker_max_memory
+                _pool = DoclingProcessPool(
+                    max_workers=settings.docling_workers,
+                    task_timeout=settings.docling_task_timeout or None,
+                    max_worker_memory=max_memory * 2**20 if max_memory else None,
+                )
+        return _pool
+
+
+def shutdown_docling_pool(*, wait: bool = True) -> None:
+    """Stop the workers of the Docling process pool, if it was created."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,347 @@
+"""Content-addressed cache of embedding vectors.
+
+Re-ingesting a file, re-running a flow or ingesting the same documents into two knowledge bases embeds the same
+texts again. ``CachedEmbeddings`` wraps any LangChain ``Embeddings`` and keys every vector by the model identity
+and the hash of the normalized text, so only texts that were never embedded by that model reach the provider,
+in a single batch.
+
+Vectors are stored in a SQLite database in the user cache directory, shared by every worker on the host and
+bounded in size; the oldest vectors are evicted first. When ``embedding_cache_redis`` is set, vectors are also
+shared through Redis across hosts. Any storage error is treated as a cache miss.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.embeddings import Embeddings
+
+from lfx.base.embeddings.embeddings_class import EmbeddingsWithModels
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+EMBEDDING_CACHE_FILENAME = "embedding_cache.db"
+REDIS_KEY_PREFIX = "lfx:embedding:"
+_BUSY_TIMEOUT_SECONDS = 30
+# Stay below SQLite's default limit of bound parameters per statement
+_MAX_PARAMETERS = 500
+# Eviction frees a little more than needed, so it does not run on every write once the cache is full
+_EVICTION_TARGET = 0.9
+# Attributes that identify the model and options an embeddings instance produces vectors with
+_IDENTITY_ATTRIBUTES = ("model", "model_name", "model_id", "deployment")
+_OPTION_ATTRIBUTES = (
+    "dimensions",
+    "base_url",
+    "openai_api_base",
+    "azure_endpoint",
+    "endpoint",
+    "task_type",
+    "input_type",
+    "truncate",
+    "encode_kwargs",
+    "model_kwargs",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    key INTEGER PRIMARY KEY CHECK (key = 0),
+    total_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (key, total_bytes) VALUES (0, 0);
+"""
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def embedding_model_id(embeddings: Embeddings) -> str | None:
+    """Returns a stable identity for the vectors an embeddings instance produces, or None if it has none."""
+    identity = [f"{type(embeddings).__module__}.{type(embeddings).__qualname__}"]
+    for attribute in _IDENTITY_ATTRIBUTES + _OPTION_ATTRIBUTES:
+        value = getattr(embeddings, attribute, None)
+        if value is not None and value not in ({}, []):
+            identity.append(f"{attribute}={value!r}")
+    if not any(getattr(embeddings, attribute, None) for attribute in _IDENTITY_ATTRIBUTES):
+        # Without a model name, two differently configured instances could not be told apart
+        return None
+    return "|".join(identity)
+
+
+def _encode(vector: list[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _decode(payload: bytes) -> list[float]:
+    vector = array("d")
+    vector.frombytes(payload)
+    return vector.tolist()
+
+
+def _batches(items: list[str], size: int = _MAX_PARAMETERS) -> Iterator[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class EmbeddingCacheStats:
+    """Hit and miss counters, updated from the event loop and from worker threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def as_dict(self) -> dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
+
+
+_STATS = EmbeddingCacheStats()
+
+
+def get_embedding_cache_stats() -> dict[str, float]:
+    """Returns the embedding cache hits, misses and hit rate of this process."""
+    return _STATS.as_dict()
+
+
+class EmbeddingCache:
+    def __init__(self, path: str | Path, size_limit: int, redis_client: Any | None = None) -> None:
+        self.path = Path(path)
+        self.size_limit = size_limit
+        self.redis_client = redis_client
+        self._initialized = False
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        # A short-lived connection per batch keeps the cache safe to use from threads and forked workers
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return closing(connection)
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        vectors = self._get_local(keys)
+        missing = [key for key in keys if key not in vectors]
+        if missing and self.redis_client is not None:
+            remote = self._get_remote(missing)
+            if remote:
+                self._put_local(remote)
+                vectors.update(remote)
+        return vectors
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+        self._put_local(vectors)
+        if self.redis_client is not None:
+            self._put_remote(vectors)
+
+    def _get_local(self, keys: list[str]) -> dict[str, list[float]]:
+        vectors: dict[str, list[float]] = {}
+        try:
+            with self._connect() as connection:
+                for batch in _batches(keys):
+                    placeholders = ", ".join("?" * len(batch))
+                    rows = connection.execute(
+                        f"SELECT key, vector FROM vectors WHERE key IN ({placeholders})",  # noqa: S608
+                        batch,
+                    )
+                    vectors.update((key, _decode(payload)) for key, payload in rows)
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug(f"Could not read the embedding cache at {self.path}: {exc}")
+            return {}
+        return vectors
+
+    def _put_local(self, vectors: dict[str, list[float]]) -> None:
+        try:
+            with self._connect() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    added_bytes = 0
+                    for key, vector in vectors.items():
+                        payload = _encode(vector)
+                        cursor = connection.execute(
+                            "INSERT OR IGNORE INTO vectors (key, vector) VALUES (?, ?)", (key, payload)
+                        )
+                        added_bytes += len(payload) * cursor.rowcount
+                    connection.execute("UPDATE stats SET total_bytes = total_bytes + ?", (added_bytes,))
+                    self._evict(connection)
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                connection.execute("COMMIT")
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug(f"Could not update the embedding cache at {self.path}: {exc}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total_bytes,) = connection.execute("SELECT total_bytes FROM stats").fetchone()
+        if total_bytes <= self.size_limit:
+            return
+        to_free = total_bytes - int(self.size_limit * _EVICTION_TARGET)
+        freed = 0
+        last_rowid = None
+        # Rowids grow with insertion, so the oldest vectors come first
+        for rowid, size in connection.execute("SELECT rowid, length(vector) FROM vectors ORDER BY rowid"):
+            freed += size
+            last_rowid = rowid
+            if freed >= to_free:
+                break
+        connection.execute("DELETE FROM vectors WHERE rowid <= ?", (last_rowid,))
+        connection.execute("UPDATE stats SET total_bytes = total_bytes - ?", (freed,))
+
+    def _get_remote(self, keys: list[str]) -> dict[str, list[float]]:
+        try:
+            payloads = self.redis_client.mget([REDIS_KEY_PREFIX + key for key in keys])
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Could not read the embedding cache from Redis: {exc}")
+            return {}
+        return {key: _decode(payload) for key, payload in zip(keys, payloads, strict=True) if payload is not None}
+
+    def _put_remote(self, vectors: dict[str, list[float]]) -> None:
+        # Redis evicts vectors according to its maxmemory policy
+        try:
+            self.redis_client.mset({REDIS_KEY_PREFIX + key: _encode(vector) for key, vector in vectors.items()})
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Could not update the embedding cache in Redis: {exc}")
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings that only send texts the model has not embedded before to the wrapped embeddings."""
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model_id: str) -> None:
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model_id = model_id
+        self.stats = EmbeddingCacheStats()
+
+    def _key(self, text: str, kind: str) -> str:
+        # Some models embed queries and documents differently
+        content = f"{self.model_id}\0{kind}\0{normalize_text(text)}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _lookup(self, texts: list[str], kind: str) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        keys = [self._key(text, kind) for text in texts]
+        vectors = self.cache.get_many(list(dict.fromkeys(keys)))
+        # Duplicate texts are embedded once
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in vectors}
+        hits = sum(key in vectors for key in keys)
+        self.stats.record(hits, len(keys) - hits)
+        _STATS.record(hits, len(keys) - hits)
+        return keys, vectors, missing
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = self._lookup(texts, "document")
+        if missing:
+            embedded = dict(zip(missing, self.embeddings.embed_documents(list(missing.values())), strict=True))
+            self.cache.put_many(embedded)
+            vectors.update(embedded)
+        return [vectors[key] for key in keys]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = await asyncio.to_thread(self._lookup, texts, "document")
+        if missing:
+            embedded = dict(zip(missing, await self.embeddings.aembed_documents(list(missing.values())), strict=True))
+            await asyncio.to_thread(self.cache.put_many, embedded)
+            vectors.update(embedded)
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        (key,), vectors, missing = self._lookup([text], "query")
+        if missing:
+            vectors[key] = self.embeddings.embed_query(text)
+            self.cache.put_many({key: vectors[key]})
+        return vectors[key]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        (key,), vectors, missing = await asyncio.to_thread(self._lookup, [text], "query")
+        if missing:
+            vectors[key] = await self.embeddings.aembed_query(text)
+            await asyncio.to_thread(self.cache.put_many, {key: vectors[key]})
+        return vectors[key]
+
+    def __getattr__(self, name: str):
+        """Delegate attribute access, such as the model name, to the wrapped embeddings."""
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def __repr__(self) -> str:
+        return f"CachedEmbeddings(embeddings={self.embeddings!r})"
+
+
+@lru_cache(maxsize=1)
+def _get_redis_client(url: str):
+    import redis
+
+    return redis.Redis.from_url(url)
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Returns the embedding cache shared by all workers on this host, or None when it is disabled."""
+    from platformdirs import user_cache_dir
+
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None or not settings_service.settings.embedding_cache:
+        return None
+    settings = settings_service.settings
+    redis_client = None
+    if settings.embedding_cache_redis:
+        url = settings.redis_url or f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
+        try:
+            redis_client = _get_redis_client(url)
+        except ImportError:
+            logger.warning("The redis package is not installed, so the embedding cache is not shared through Redis.")
+    return EmbeddingCache(
+        Path(user_cache_dir("lfx", "vetrai")) / EMBEDDING_CACHE_FILENAME,
+        size_limit=settings.embedding_cache_size_limit,
+        redis_client=redis_client,
+    )
+
+
+def with_embedding_cache(embeddings: Any) -> Any:
+    """Wraps embeddings in ``CachedEmbeddings`` when the embedding cache is enabled.
+
+    Values that are not embeddings, or whose model cannot be identified, are returned unchanged.
+    """
+    if isinstance(embeddings, list):
+        return [with_embedding_cache(item) for item in embeddings]
+    if isinstance(embeddings, EmbeddingsWithModels):
+        return EmbeddingsWithModels(
+            embeddings=with_embedding_cache(embeddings.embeddings),
+            available_models={name: with_embedding_cache(model) for name, model in embeddings.available_models.items()},
+        )
+    if not isinstance(embeddings, Embeddings) or isinstance(embeddings, CachedEmbeddings):
+        return embeddings
+    model_id = embedding_model_id(embeddings)
+    if model_id is None:
+        return embeddings
+    cache = get_embedding_cache()
+    if cache is None:
+        return embeddings
+    return CachedEmbeddings(embeddings, cache, model_id)
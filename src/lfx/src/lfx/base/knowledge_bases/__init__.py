@@ -1,3 +1,11 @@
 from .knowledge_base_utils import compute_bm25, compute_tfidf, get_knowledge_bases
+from .lexical_index import LEXICAL_INDEX_FILENAME, LexicalIndex, reciprocal_rank_fusion
 
-__all__ = ["compute_bm25", "compute_tfidf", "get_knowledge_bases"]
+__all__ = [
+    "LEXICAL_INDEX_FILENAME",
+    "LexicalIndex",
+    "compute_bm25",
+    "compute_tfidf",
+    "get_knowledge_bases",
+    "reciprocal_rank_fusion",
+]
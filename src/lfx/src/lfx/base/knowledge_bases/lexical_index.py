@@ -0,0 +1,207 @@
+"""Persisted inverted index for lexical (BM25 / TF-IDF) scoring of knowledge base chunks.
+
+``compute_bm25`` and ``compute_tfidf`` tokenize the whole corpus on every call. The index stores, per term, the
+postings ``(document, term frequency, document length)`` and keeps the document count and total length, so a
+query only reads the postings of its own terms. Scores are identical to ``compute_bm25`` and ``compute_tfidf``.
+
+The index is a SQLite database stored beside the Chroma collection of the knowledge base. Every ingestion batch
+appends one posting segment per term, so documents are indexed incrementally and never rewritten.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from array import array
+from collections import Counter, defaultdict
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+LEXICAL_INDEX_FILENAME = "lexical_index.db"
+RRF_K = 60
+_BUSY_TIMEOUT_SECONDS = 30
+# Each posting is (document, term frequency, document length), stored as three columns per segment
+_POSTING_DTYPE = np.dtype("<i4")
+_POSTING_FIELDS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    key INTEGER PRIMARY KEY CHECK (key = 0),
+    documents INTEGER NOT NULL,
+    total_length INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (key, documents, total_length) VALUES (0, 0, 0);
+CREATE TABLE IF NOT EXISTS documents (
+    doc INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    entries BLOB NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into terms the same way ``compute_bm25`` and ``compute_tfidf`` do."""
+    return text.lower().split()
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[str]], k: int = RRF_K) -> list[tuple[str, float]]:
+    """Fuses several rankings of document ids into one, best first.
+
+    Reciprocal rank fusion only uses ranks, so vector distances and lexical scores need no normalization.
+    """
+    scores: dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] += 1 / (k + rank + 1)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return closing(connection)
+
+    def document_count(self) -> int:
+        if not self.path.exists():
+            return 0
+        with self._connect() as connection:
+            (documents,) = connection.execute("SELECT documents FROM stats").fetchone()
+        return documents
+
+    def document_ids(self) -> set[str]:
+        if not self.path.exists():
+            return set()
+        with self._connect() as connection:
+            return {doc_id for (doc_id,) in connection.execute("SELECT id FROM documents")}
+
+    def add_documents(self, documents: Iterable[tuple[str, str]]) -> int:
+        """Indexes ``(id, text)`` pairs and returns how many were added. Ids already in the index are skipped."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                added = self._add_documents(connection, documents)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return added
+
+    @staticmethod
+    def _add_documents(connection: sqlite3.Connection, documents: Iterable[tuple[str, str]]) -> int:
+        (next_doc,) = connection.execute("SELECT COALESCE(MAX(doc) + 1, 0) FROM documents").fetchone()
+        segment = next_doc
+        postings: dict[str, array] = defaultdict(lambda: array("i"))
+        added = 0
+        total_length = 0
+        for doc_id, text in documents:
+            tokens = tokenize(text)
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO documents (doc, id, length) VALUES (?, ?, ?)", (next_doc, doc_id, len(tokens))
+            )
+            if cursor.rowcount == 0:
+                continue
+            for term, frequency in Counter(tokens).items():
+                postings[term].extend((next_doc, frequency, len(tokens)))
+            next_doc += 1
+            added += 1
+            total_length += len(tokens)
+        if not added:
+            return 0
+        connection.executemany(
+            "INSERT INTO postings (term, segment, entries) VALUES (?, ?, ?)",
+            (
+                # Stored column by column, so each field is a contiguous array when scoring
+                (term, segment, np.asarray(entries, dtype=_POSTING_DTYPE).reshape(-1, _POSTING_FIELDS).T.tobytes())
+                for term, entries in postings.items()
+            ),
+        )
+        connection.execute(
+            "UPDATE stats SET documents = documents + ?, total_length = total_length + ?", (added, total_length)
+        )
+        return added
+
+    def search(
+        self, query: str, top_k: int, *, scoring: str = "bm25", k1: float = 1.2, b: float = 0.75
+    ) -> list[tuple[str, float]]:
+        """Returns the ``(id, score)`` pairs of the best matching documents, best first.
+
+        ``scoring`` is ``"bm25"`` or ``"tfidf"``. Documents that contain none of the query terms are not returned.
+        """
+        if scoring not in {"bm25", "tfidf"}:
+            msg = f"Unknown lexical scoring '{scoring}'. Use 'bm25' or 'tfidf'."
+            raise ValueError(msg)
+        query_terms = Counter(tokenize(query))
+        if not query_terms or top_k <= 0 or not self.path.exists():
+            return []
+
+        with self._connect() as connection:
+            # A single read transaction sees the stats and the postings of the same ingestion runs
+            connection.execute("BEGIN")
+            n_docs, total_length = connection.execute("SELECT documents, total_length FROM stats").fetchone()
+            placeholders = ", ".join("?" * len(query_terms))
+            rows = connection.execute(
+                f"SELECT term, entries FROM postings WHERE term IN ({placeholders})",  # noqa: S608
+                tuple(query_terms),
+            ).fetchall()
+            if not rows or total_length == 0:
+                connection.execute("COMMIT")
+                return []
+
+            segments: dict[str, list[np.ndarray]] = defaultdict(list)
+            for term, entries in rows:
+                segments[term].append(np.frombuffer(entries, dtype=_POSTING_DTYPE).reshape(_POSTING_FIELDS, -1))
+            # Documents are numbered from 0 in ingestion order, so scores are accumulated in a dense array
+            scores = np.zeros(n_docs)
+            for term, term_segments in segments.items():
+                document_frequency = sum(segment.shape[1] for segment in term_segments)
+                weight = np.log(n_docs / document_frequency) * query_terms[term]
+                for docs, tf, doc_length in term_segments:
+                    scores[docs] += _term_scores(tf, doc_length, weight, scoring, k1, b, total_length / n_docs)
+
+            candidates = np.flatnonzero(scores)
+            if len(candidates) > top_k:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            doc_list = ", ".join("?" * len(candidates))
+            ids = dict(
+                connection.execute(
+                    f"SELECT doc, id FROM documents WHERE doc IN ({doc_list})",  # noqa: S608
+                    tuple(int(doc) for doc in candidates),
+                )
+            )
+            connection.execute("COMMIT")
+        return [(ids[int(doc)], float(scores[doc])) for doc in candidates]
+
+
+def _term_scores(
+    tf: np.ndarray, doc_length: np.ndarray, weight: float, scoring: str, k1: float, b: float, avg_doc_length: float
+) -> np.ndarray:
+    """Scores of one query term in the documents of a posting segment, with the formulas of ``compute_bm25``."""
+    if scoring == "tfidf":
+        return tf * weight / doc_length
+    # idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_length / avg_doc_length)), with fewer temporary arrays
+    denominator = doc_length * (k1 * b / avg_doc_length)
+    denominator += k1 * (1 - b)
+    denominator += tf
+    return tf * (weight * (k1 + 1)) / denominator
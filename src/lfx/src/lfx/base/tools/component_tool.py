@@ -12,6 +12,7 @@ from lfx.base.tools.constants import TOOL_OUTPUT_NAME
 from lfx.schema.data import Data
 from lfx.schema.message import Message
 from lfx.serialization.serialization import serialize
+from lfx.utils.executors import EVENTS_POOL, run_in_pool
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -110,11 +111,11 @@ def _build_output_async_function(
     async def output_function(*args, **kwargs):
         try:
             if event_manager:
-                await asyncio.to_thread(event_manager.on_build_start, data={"id": component.get_id()})
+                await run_in_pool(EVENTS_POOL, event_manager.on_build_start, data={"id": component.get_id()})
             component.set(*args, **kwargs)
             result = await output_method()
             if event_manager:
-                await asyncio.to_thread(event_manager.on_build_end, data={"id": component.get_id()})
+                await run_in_pool(EVENTS_POOL, event_manager.on_build_end, data={"id": component.get_id()})
         except Exception as e:
             raise ToolException(e) from e
         if isinstance(result, Message):
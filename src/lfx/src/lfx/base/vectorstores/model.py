@@ -2,6 +2,7 @@ from abc import abstractmethod
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from lfx.base.embeddings.cache import with_embedding_cache
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import Text, VectorStore
 from lfx.helpers.data import docs_to_data
@@ -89,6 +90,16 @@ class LCVectorStoreComponent(Component):
         Output(display_name="DataFrame", name="dataframe", method="as_dataframe"),
     ]
 
+    def _pre_run_setup(self) -> None:
+        super()._pre_run_setup()
+        # Vector stores only embed texts the embedding model has not embedded before
+        if self._attributes.get("embedding") is not None:
+            self._attributes["embedding"] = with_embedding_cache(self._attributes["embedding"])
+
+    def reset_run_state(self) -> None:
+        super().reset_run_state()
+        self._cached_vector_store = None
+
     def _validate_outputs(self) -> None:
         # At least these three outputs must be defined
         required_output_methods = [
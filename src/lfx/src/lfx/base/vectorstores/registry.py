@@ -0,0 +1,293 @@
+"""Vector store clients shared by the runs of a process.
+
+Opening a vector store is not free: a Chroma client reopens its persistent SQLite and HNSW store, and the
+knowledge base components also build the embeddings client of the knowledge base. Chat flows that retrieve on
+every message paid that cost on every run. The registry keeps the clients open between runs instead.
+
+Clients are keyed by the backend, where the data lives (a persist directory or connection parameters), the
+collection and the identity of the embeddings, so runs that would have built an identical client share one.
+Components take a client with `VectorStoreRegistry.lease`, which counts the runs using it. Clients that no run
+uses are closed once they have been idle for longer than the idle timeout, or when more than `max_idle` clients
+are idle. `invalidate` closes the clients of a location, for instance when a knowledge base is deleted; clients
+still in use are closed when their last run releases them.
+
+The client must not be used after its lease ends, since the registry may close it then. Components that hand their
+vector store to downstream components, like the Local DB component, build their own instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pydantic import SecretStr
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from langchain_core.embeddings import Embeddings
+
+VectorStoreT = TypeVar("VectorStoreT")
+
+# Backends whose key location is a directory on this machine, rather than connection parameters
+LOCAL_BACKENDS = frozenset({"chroma"})
+
+# Attributes of embeddings instances whose values decide which account embeds the texts
+_CREDENTIAL_MARKERS = ("key", "token", "secret", "password")
+
+
+@dataclass(frozen=True)
+class VectorStoreKey:
+    """Identifies the clients that runs can share."""
+
+    backend: str
+    """The kind of store, for instance "chroma" for a persistent Chroma store on this machine."""
+    location: str
+    """The persist directory of local stores, or the connection parameters of remote ones."""
+    collection: str
+    embedding: str | None = None
+    """The identity of the embeddings the client embeds texts with, or None if it does not embed texts."""
+
+
+@dataclass
+class _Entry(Generic[VectorStoreT]):
+    store: VectorStoreT
+    close: Callable[[VectorStoreT], None] | None
+    references: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    invalidated: bool = False
+
+
+def close_chroma(store: Any) -> None:
+    """Close the client of a LangChain Chroma vector store, releasing its SQLite and HNSW files."""
+    client = getattr(store, "_client", None)
+    if client is not None and hasattr(client, "close"):
+        client.close()
+
+
+def hash_identity(*parts: Any) -> str:
+    """Return a digest of `parts`, for embedding identities that include credentials."""
+    values = (part.get_secret_value() if isinstance(part, SecretStr) else part for part in parts)
+    return hashlib.sha256("\0".join(map(str, values)).encode("utf-8")).hexdigest()
+
+
+def embeddings_identity(embeddings: Embeddings | None) -> str | None:
+    """Return the identity of an embeddings instance, including its credentials, or None if it has none.
+
+    Instances built with the same model, options and credentials embed texts identically, so a client built with
+    one of them can serve runs that built the other.
+    """
+    from lfx.base.embeddings.cache import CachedEmbeddings, embedding_model_id
+
+    if embeddings is None:
+        return None
+    wrapped = embeddings.embeddings if isinstance(embeddings, CachedEmbeddings) else embeddings
+    model_id = embedding_model_id(wrapped)
+    if model_id is None:
+        return None
+    credentials = []
+    for name, value in sorted(vars(wrapped).items()):
+        if isinstance(value, SecretStr):
+            credentials.append((name, value.get_secret_value()))
+        elif isinstance(value, str) and any(marker in name.lower() for marker in _CREDENTIAL_MARKERS):
+            credentials.append((name, value))
+    return hash_identity(model_id, type(embeddings).__name__, credentials)
+
+
+class VectorStoreRegistry:
+    """Keeps vector store clients open between runs, with reference counting and idle eviction.
+
+    Args:
+        idle_timeout: Seconds after which a client that no run uses is closed. 0 disables the registry, so every
+            lease builds a new client, as components did before.
+        max_idle: Maximum number of idle clients. The least recently used ones are closed first.
+    """
+
+    def __init__(self, idle_timeout: float = 600, max_idle: int = 32) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_idle = max_idle
+        self._entries: dict[VectorStoreKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[VectorStoreKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def lease(
+        self,
+        key: VectorStoreKey | None,
+        factory: Callable[[], VectorStoreT],
+        close: Callable[[VectorStoreT], None] | None = None,
+    ) -> Iterator[VectorStoreT]:
+        """Yield the client of `key`, building it with `factory` if no open client has that key.
+
+        A key of None means the client cannot be shared, for instance because the identity of its embeddings is
+        unknown: it is built for this lease only, and left to the garbage collector like the clients of components
+        that do not use the registry. `close` releases the resources of a client when it is evicted.
+        """
+        if key is None or self.idle_timeout <= 0:
+            yield factory()
+            return
+
+        entry = self._acquire(key, factory, close)
+        try:
+            yield entry.store
+        finally:
+            self._release(entry)
+
+    def _acquire(self, key: VectorStoreKey, factory: Callable[[], Any], close: Callable | None) -> _Entry:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Runs that need the same missing client wait for one of them to build it
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.references += 1
+                    self.hits += 1
+                    return entry
+            try:
+                store = factory()
+            except BaseException:
+                with self._lock:
+                    if key not in self._entries:
+                        self._key_locks.pop(key, None)
+                raise
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = _Entry(store, close, references=1)
+                    self.misses += 1
+                    store = None
+                else:
+                    # The key lock was dropped with an evicted entry while this run waited on it
+                    entry.references += 1
+                    self.hits += 1
+        if store is not None:
+            self._close(store, close)
+        self.evict_idle()
+        return entry
+
+    def _remove(self, key: VectorStoreKey) -> _Entry:
+        """Remove the entry of `key` and its lock. Must be called with `_lock` held."""
+        self._key_locks.pop(key, None)
+        return self._entries.pop(key)
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.references -= 1
+            entry.last_used = time.monotonic()
+            close_now = entry.invalidated and entry.references == 0
+        if close_now:
+            self._close(entry.store, entry.close)
+        self.evict_idle()
+
+    def evict_idle(self) -> int:
+        """Close the idle clients that expired, and the least recently used ones above `max_idle`.
+
+        Returns the number of clients closed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = sorted(
+                ((key, entry) for key, entry in self._entries.items() if entry.references == 0),
+                key=lambda item: item[1].last_used,
+            )
+            expired = [item for item in idle if now - item[1].last_used > self.idle_timeout]
+            surplus = len(idle) - len(expired) - self.max_idle
+            if surplus > 0:
+                expired += idle[len(expired) : len(expired) + surplus]
+            for key, _ in expired:
+                self._remove(key)
+        for _, entry in expired:
+            self._close(entry.store, entry.close)
+        return len(expired)
+
+    def invalidate(self, location: str | Path) -> int:
+        """Close the clients of `location` and of the locations below it, which runs can no longer share.
+
+        Clients in use are closed when their last run releases them. Returns the number of clients invalidated.
+        """
+        prefix = Path(location).resolve()
+        with self._lock:
+            matches = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if key.backend in LOCAL_BACKENDS
+                and ((path := Path(key.location).resolve()) == prefix or prefix in path.parents)
+            ]
+            for key, entry in matches:
+                self._remove(key)
+                entry.invalidated = True
+            unused = [entry for _, entry in matches if entry.references == 0]
+        for entry in unused:
+            self._close(entry.store, entry.close)
+        return len(matches)
+
+    def clear(self) -> None:
+        """Close every client. Clients in use are closed when their last run releases them."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+            self._key_locks.clear()
+            for entry in entries:
+                entry.invalidated = True
+            unused = [entry for entry in entries if entry.references == 0]
+        for entry in unused:
+            self._close(entry.store, entry.close)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _close(store: Any, close: Callable | None) -> None:
+        if close is None:
+            return
+        try:
+            close(store)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Error closing a vector store client", exc_info=exc)
+
+
+_registry: VectorStoreRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_vector_store_registry() -> VectorStoreRegistry:
+    """Return the vector store registry of the process, configured from the settings on first use."""
+    global _registry  # noqa: PLW0603
+    with _registry_lock:
+        if _registry is None:
+            from lfx.services.deps import get_settings_service
+
+            settings_service = get_settings_service()
+            if settings_service is None:
+                _registry = VectorStoreRegistry()
+            else:
+                settings = settings_service.settings
+                _registry = VectorStoreRegistry(
+                    idle_timeout=settings.vector_store_idle_timeout, max_idle=settings.vector_store_max_clients
+                )
+        return _registry
+
+
+def invalidate_vector_stores(location: str | Path) -> int:
+    """Close the open vector store clients of `location`, for instance before deleting a knowledge base."""
+    with _registry_lock:
+        registry = _registry
+    return 0 if registry is None else registry.invalidate(location)
+
+
+def clear_vector_store_registry() -> None:
+    """Close every open vector store client of the process."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.clear()
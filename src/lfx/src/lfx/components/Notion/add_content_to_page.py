@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from langchain.tools import StructuredTool
 from markdown import markdown
@@ -12,6 +12,7 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import MultilineInput, SecretStrInput, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 MIN_ROWS_IN_TABLE = 3
 
@@ -74,11 +75,11 @@ class AddContentToPage(LCToolComponent):
                 "children": blocks,
             }
 
-            response = requests.patch(url, headers=headers, json=data, timeout=10)
+            response = get_http_client_service().get_client().patch(url, headers=headers, json=data, timeout=10)
             response.raise_for_status()
 
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_message = f"Error: Failed to add content to Notion page. {e}"
             if hasattr(e, "response") and e.response is not None:
                 error_message += f" Status code: {e.response.status_code}, Response: {e.response.text}"
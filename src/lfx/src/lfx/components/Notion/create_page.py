@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.field_typing import Tool
 from lfx.inputs.inputs import MultilineInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionPageCreator(LCToolComponent):
@@ -81,10 +82,11 @@ class NotionPageCreator(LCToolComponent):
         }
 
         try:
-            response = requests.post("https://api.notion.com/v1/pages", headers=headers, json=data, timeout=10)
+            client = get_http_client_service().get_client()
+            response = client.post("https://api.notion.com/v1/pages", headers=headers, json=data, timeout=10)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_message = f"Failed to create Notion page. Error: {e}"
             if hasattr(e, "response") and e.response is not None:
                 error_message += f" Status code: {e.response.status_code}, Response: {e.response.text}"
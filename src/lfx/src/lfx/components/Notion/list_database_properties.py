@@ -1,4 +1,4 @@
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -7,6 +7,7 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import SecretStrInput, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionDatabaseProperties(LCToolComponent):
@@ -55,11 +56,11 @@ class NotionDatabaseProperties(LCToolComponent):
             "Notion-Version": "2022-06-28",  # Use the latest supported version
         }
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_client_service().get_client().get(url, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
             return data.get("properties", {})
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Error fetching Notion database properties: {e}"
         except ValueError as e:
             return f"Error parsing Notion API response: {e}"
@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -10,6 +10,7 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import MultilineInput, SecretStrInput, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionListPages(LCToolComponent):
@@ -109,11 +110,11 @@ class NotionListPages(LCToolComponent):
                 return f"Invalid JSON format for query: {e}"
 
         try:
-            response = requests.post(url, headers=headers, json=query_payload, timeout=10)
+            response = get_http_client_service().get_client().post(url, headers=headers, json=query_payload, timeout=10)
             response.raise_for_status()
             results = response.json()
             return results["results"]
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Error querying Notion database: {e}"
         except KeyError:
             return "Unexpected response format from Notion API"
@@ -1,4 +1,3 @@
-import requests
 from langchain.tools import StructuredTool
 from pydantic import BaseModel
 
@@ -6,6 +5,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.field_typing import Tool
 from lfx.inputs.inputs import SecretStrInput
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionUserList(LCToolComponent):
@@ -58,7 +58,7 @@ class NotionUserList(LCToolComponent):
             "Notion-Version": "2022-06-28",
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client_service().get_client().get(url, headers=headers, timeout=10)
         response.raise_for_status()
 
         data = response.json()
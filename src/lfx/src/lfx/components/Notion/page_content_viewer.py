@@ -1,4 +1,4 @@
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -7,6 +7,7 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import SecretStrInput, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionPageContent(LCToolComponent):
@@ -55,11 +56,11 @@ class NotionPageContent(LCToolComponent):
             "Notion-Version": "2022-06-28",
         }
         try:
-            blocks_response = requests.get(blocks_url, headers=headers, timeout=10)
+            blocks_response = get_http_client_service().get_client().get(blocks_url, headers=headers, timeout=10)
             blocks_response.raise_for_status()
             blocks_data = blocks_response.json()
             return self.parse_blocks(blocks_data.get("results", []))
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_message = f"Error: Failed to retrieve Notion page content. {e}"
             if hasattr(e, "response") and e.response is not None:
                 error_message += f" Status code: {e.response.status_code}, Response: {e.response.text}"
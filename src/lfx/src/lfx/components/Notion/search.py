@@ -1,6 +1,5 @@
 from typing import Any
 
-import requests
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -8,6 +7,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.field_typing import Tool
 from lfx.inputs.inputs import DropdownInput, SecretStrInput, StrInput
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionSearch(LCToolComponent):
@@ -104,7 +104,7 @@ class NotionSearch(LCToolComponent):
             "sort": {"direction": sort_direction, "timestamp": "last_edited_time"},
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response = get_http_client_service().get_client().post(url, headers=headers, json=data, timeout=10)
         response.raise_for_status()
 
         results = response.json()
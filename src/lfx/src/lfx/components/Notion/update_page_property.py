@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -10,6 +10,7 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import MultilineInput, SecretStrInput, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class NotionPageUpdate(LCToolComponent):
@@ -87,19 +88,19 @@ class NotionPageUpdate(LCToolComponent):
 
         try:
             logger.info(f"Sending request to Notion API: URL: {url}, Data: {json.dumps(data)}")
-            response = requests.patch(url, headers=headers, json=data, timeout=10)
+            response = get_http_client_service().get_client().patch(url, headers=headers, json=data, timeout=10)
             response.raise_for_status()
             updated_page = response.json()
 
             logger.info(f"Successfully updated Notion page. Response: {json.dumps(updated_page)}")
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             error_message = f"HTTP Error occurred: {e}"
             if e.response is not None:
                 error_message += f"\nStatus code: {e.response.status_code}"
                 error_message += f"\nResponse body: {e.response.text}"
             logger.exception(error_message)
             return error_message
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_message = f"An error occurred while making the request: {e}"
             logger.exception(error_message)
             return error_message
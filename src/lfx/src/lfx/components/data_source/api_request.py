@@ -26,6 +26,7 @@ from lfx.io import (
 )
 from lfx.schema.data import Data
 from lfx.schema.dotdict import dotdict
+from lfx.services.deps import get_http_client_service
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
 from lfx.utils.ssrf_protection import SSRFProtectionError, validate_url_for_ssrf
 
@@ -471,18 +472,17 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
-            result = await self.make_request(
-                client,
-                method,
-                url,
-                headers,
-                body,
-                timeout,
-                follow_redirects=follow_redirects,
-                save_to_file=save_to_file,
-                include_httpx_metadata=include_httpx_metadata,
-            )
+        result = await self.make_request(
+            get_http_client_service().get_async_client(),
+            method,
+            url,
+            headers,
+            body,
+            timeout,
+            follow_redirects=follow_redirects,
+            save_to_file=save_to_file,
+            include_httpx_metadata=include_httpx_metadata,
+        )
         self.status = result
         return result
 
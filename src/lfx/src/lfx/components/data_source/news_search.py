@@ -1,12 +1,13 @@
 from urllib.parse import quote_plus
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output
 from lfx.schema import DataFrame
+from lfx.services.deps import get_http_client_service
 
 
 class NewsSearchComponent(Component):
@@ -127,12 +128,13 @@ class NewsSearchComponent(Component):
                 )
             )
 
+        client = get_http_client_service().get_client()
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            response = client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed to fetch news: {e}"
             self.log(self.status)
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
@@ -8,13 +8,14 @@ import re
 from typing import Any
 from urllib.parse import parse_qs, quote_plus, unquote, urlparse
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output, TabInput
 from lfx.schema import DataFrame
+from lfx.services.deps import get_http_client_service
 from lfx.utils.request_utils import get_user_agent
 
 
@@ -162,10 +163,11 @@ class WebSearchComponent(Component):
         params = {"q": query, "kl": "us-en"}
         url = "https://html.duckduckgo.com/html/"
 
+        client = get_http_client_service().get_client()
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=self.timeout)
+            response = client.get(url, params=params, headers=headers, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed request: {e!s}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "snippet": str(e), "content": ""}]))
 
@@ -189,10 +191,10 @@ class WebSearchComponent(Component):
 
                 try:
                     final_url = self.ensure_url(decoded_link)
-                    page = requests.get(final_url, headers=headers, timeout=self.timeout)
+                    page = client.get(final_url, headers=headers, timeout=self.timeout, follow_redirects=True)
                     page.raise_for_status()
                     content = BeautifulSoup(page.text, "lxml").get_text(separator=" ", strip=True)
-                except requests.RequestException as e:
+                except httpx.HTTPError as e:
                     final_url = decoded_link
                     content = f"(Failed to fetch: {e!s}"
 
@@ -242,12 +244,13 @@ class WebSearchComponent(Component):
                 )
             )
 
+        client = get_http_client_service().get_client()
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            response = client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed to fetch news: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
@@ -277,8 +280,9 @@ class WebSearchComponent(Component):
                 pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": "No RSS URL provided"}])
             )
 
+        client = get_http_client_service().get_client()
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            response = client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             if not response.content.strip():
                 msg = "Empty response received"
@@ -293,7 +297,7 @@ class WebSearchComponent(Component):
 
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.status = f"Failed to fetch RSS: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
@@ -1,11 +1,14 @@
-import queue
-import threading
-import time
+import asyncio
+import concurrent.futures
+import importlib.util
 
 from lfx.base.data import BaseFileComponent
-from lfx.base.data.docling_utils import _serialize_pydantic_model, docling_worker
+from lfx.base.data.docling_pool import get_docling_pool
+from lfx.base.data.docling_utils import _serialize_pydantic_model, convert_document
 from lfx.inputs import BoolInput, DropdownInput, HandleInput, StrInput
 from lfx.schema import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.utils.async_helpers import run_until_complete
 
 
 class DoclingInlineComponent(BaseFileComponent):
@@ -92,67 +95,55 @@ class DoclingInlineComponent(BaseFileComponent):
         *BaseFileComponent.get_base_outputs(),
     ]
 
-    def _wait_for_result_with_thread_monitoring(
-        self, result_queue: queue.Queue, thread: threading.Thread, timeout: int = 300
-    ):
-        """Wait for result from queue while monitoring thread health.
+    _conversion_loop: asyncio.AbstractEventLoop | None = None
+    _conversion: concurrent.futures.Future | None = None
 
-        Handles cases where thread crashes without sending result.
-        """
-        start_time = time.time()
+    async def load_files(self) -> DataFrame:
+        """Load files and return as DataFrame, awaiting their conversions on the event loop.
 
-        while time.time() - start_time < timeout:
-            # Check if thread is still alive
-            if not thread.is_alive():
-                # Thread finished, try to get any result it might have sent
-                try:
-                    result = result_queue.get_nowait()
-                except queue.Empty:
-                    # Thread finished without sending result
-                    msg = "Worker thread crashed unexpectedly without producing result."
-                    raise RuntimeError(msg) from None
-                else:
-                    self.log("Thread completed and result retrieved")
-                    return result
-
-            # Poll the queue instead of blocking
-            try:
-                result = result_queue.get(timeout=1)
-            except queue.Empty:
-                # No result yet, continue monitoring
-                continue
-            else:
-                self.log("Result received from worker thread")
-                return result
-
-        # Overall timeout reached
-        msg = f"Thread timed out after {timeout} seconds"
-        raise TimeoutError(msg)
-
-    def _stop_thread_gracefully(self, thread: threading.Thread, timeout: int = 10):
-        """Wait for thread to complete gracefully.
-
-        Note: Python threads cannot be forcefully killed, so we just wait.
-        The thread should respond to shutdown signals via the queue.
+        Cancelling the build cancels the conversions, which stops the worker processes converting the files.
         """
-        if not thread.is_alive():
-            return
-
-        self.log("Waiting for thread to complete gracefully")
-        thread.join(timeout=timeout)
+        self._conversion_loop = asyncio.get_running_loop()
+        try:
+            return await self._run_blocking(super().load_files)
+        except asyncio.CancelledError:
+            if self._conversion is not None:
+                self._conversion.cancel()
+            raise
+        finally:
+            self._conversion_loop = None
 
-        if thread.is_alive():
-            self.log("Warning: Thread still alive after timeout")
+    async def _convert_files(self, file_paths: list, options: dict) -> list[dict | None]:
+        # Files are converted in parallel by worker processes that keep their converters loaded between builds
+        pool = get_docling_pool()
+        futures = [pool.submit(convert_document, str(file_path), options) for file_path in file_paths]
+        result: list[dict | None] = []
+        try:
+            for future in futures:
+                try:
+                    result.append(await asyncio.wrap_future(future))
+                except TimeoutError as e:
+                    self.log(str(e))
+                    result.append(None)
+        except asyncio.CancelledError:
+            self.log("Docling conversion cancelled")
+            raise
+        except Exception as e:
+            self.log(f"Error during processing: {e}")
+            raise
+        finally:
+            # Stop the conversions that are still running if processing was interrupted
+            for future in futures:
+                future.cancel()
+        return result
 
     def process_files(self, file_list: list[BaseFileComponent.BaseFile]) -> list[BaseFileComponent.BaseFile]:
-        try:
-            from docling.document_converter import DocumentConverter  # noqa: F401
-        except ImportError as e:
+        if importlib.util.find_spec("docling") is None:
             msg = (
                 "Docling is an optional dependency. Install with `uv pip install 'vetrai[docling]'` or refer to the "
                 "documentation on how to install optional dependencies."
             )
-            raise ImportError(msg) from e
+            raise ImportError(msg)
 
         file_paths = [file.path for file in file_list if file.path]
 
@@ -164,46 +155,33 @@ class DoclingInlineComponent(BaseFileComponent):
         if self.pic_desc_llm is not None:
             pic_desc_config = _serialize_pydantic_model(self.pic_desc_llm)
 
-        # Use threading instead of multiprocessing for memory sharing
-        # This enables the global DocumentConverter cache to work across runs
-        result_queue: queue.Queue = queue.Queue()
-        thread = threading.Thread(
-            target=docling_worker,
-            kwargs={
-                "file_paths": file_paths,
-                "queue": result_queue,
-                "pipeline": self.pipeline,
-                "ocr_engine": self.ocr_engine,
-                "do_picture_classification": self.do_picture_classification,
-                "pic_desc_config": pic_desc_config,
-                "pic_desc_prompt": self.pic_desc_prompt,
-            },
-            daemon=False,  # Allow thread to complete even if main thread exits
-        )
-
-        result = None
-        thread.start()
-
-        try:
-            result = self._wait_for_result_with_thread_monitoring(result_queue, thread, timeout=300)
-        except KeyboardInterrupt:
-            self.log("Docling thread cancelled by user")
-            result = []
-        except Exception as e:
-            self.log(f"Error during processing: {e}")
-            raise
-        finally:
-            # Wait for thread to complete gracefully
-            self._stop_thread_gracefully(thread)
+        options = {
+            "pipeline": self.pipeline,
+            "ocr_engine": self.ocr_engine,
+            "do_picture_classification": self.do_picture_classification,
+            "pic_desc_config": pic_desc_config,
+            "pic_desc_prompt": self.pic_desc_prompt,
+        }
+        loop = self._conversion_loop
+        if loop is None:
+            result = run_until_complete(self._convert_files(file_paths, options))
+        else:
+            # Called from `load_files` in a worker thread: the conversions are awaited on its event loop
+            self._conversion = asyncio.run_coroutine_threadsafe(self._convert_files(file_paths, options), loop)
+            try:
+                result = self._conversion.result()
+            finally:
+                self._conversion = None
 
         # Enhanced error checking with dependency-specific handling
-        if isinstance(result, dict) and "error" in result:
-            error_msg = result["error"]
+        error = next((r for r in result if r and "error" in r), None)
+        if error is not None:
+            error_msg = error["error"]
 
             # Handle dependency errors specifically
-            if result.get("error_type") == "dependency_error":
-                dependency_name = result.get("dependency_name", "Unknown dependency")
-                install_command = result.get("install_command", "Please check documentation")
+            if error.get("error_type") == "dependency_error":
+                dependency_name = error.get("dependency_name", "Unknown dependency")
+                install_command = error.get("install_command", "Please check documentation")
 
                 # Create a user-friendly error message
                 user_message = (
@@ -214,15 +192,10 @@ class DoclingInlineComponent(BaseFileComponent):
                 raise ImportError(user_message)
 
             # Handle other specific errors
-            if error_msg.startswith("Docling is not installed"):
+            if error_msg.startswith(("Docling is not installed", "Docling is an optional dependency")):
                 raise ImportError(error_msg)
 
-            # Handle graceful shutdown
-            if "Worker interrupted by SIGINT" in error_msg or "shutdown" in result:
-                self.log("Docling process cancelled by user")
-                result = []
-            else:
-                raise RuntimeError(error_msg)
+            raise RuntimeError(error_msg)
 
         processed_data = [Data(data={"doc": r["document"], "file_path": r["file_path"]}) if r else None for r in result]
         return self.rollup_data(file_list, processed_data)
@@ -5,11 +5,12 @@ import contextlib
 import hashlib
 import json
 import re
+import sqlite3
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import pandas as pd
 from cryptography.fernet import InvalidToken
@@ -17,8 +18,11 @@ from langchain_chroma import Chroma
 from vetrai.services.auth.utils import decrypt_api_key, encrypt_api_key
 from vetrai.services.database.models.user.crud import get_user_by_id
 
+from lfx.base.embeddings.cache import CachedEmbeddings, with_embedding_cache
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.lexical_index import LEXICAL_INDEX_FILENAME, LexicalIndex
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
+from lfx.base.vectorstores.registry import VectorStoreKey, close_chroma, get_vector_store_registry, hash_identity
 from lfx.components.processing.converter import convert_to_dataframe
 from lfx.custom import Component
 from lfx.io import (
@@ -32,6 +36,7 @@ from lfx.io import (
     TableInput,
 )
 from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
 from lfx.schema.table import EditMode
 from lfx.services.deps import (
     get_settings_service,
@@ -40,9 +45,6 @@ from lfx.services.deps import (
 )
 from lfx.utils.validate_cloud import raise_error_if_astra_cloud_disable_component
 
-if TYPE_CHECKING:
-    from lfx.schema.dataframe import DataFrame
-
 HUGGINGFACE_MODEL_NAMES = [
     "sentence-transformers/all-MiniLM-L6-v2",
     "sentence-transformers/all-mpnet-base-v2",
@@ -387,47 +389,75 @@ class KnowledgeIngestionComponent(Component):
                 raise ValueError(msg)
             vector_store_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create embeddings model
-            embedding_function = self._build_embeddings(embedding_model, api_key)
-
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
-            # Create vector store
-            chroma = Chroma(
-                persist_directory=str(vector_store_dir),
-                embedding_function=embedding_function,
-                collection_name=self.knowledge_base,
+            # Open the vector store, reusing the client and embedder that an earlier run opened on the knowledge
+            # base. The embedder reuses the vectors of chunks embedded before.
+            key = VectorStoreKey(
+                "chroma",
+                str(vector_store_dir),
+                self.knowledge_base,
+                hash_identity(self._get_embedding_provider(embedding_model), embedding_model, self.chunk_size, api_key),
             )
-
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
-
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            with get_vector_store_registry().lease(
+                key,
+                lambda: Chroma(
+                    persist_directory=str(vector_store_dir),
+                    embedding_function=with_embedding_cache(self._build_embeddings(embedding_model, api_key)),
+                    collection_name=self.knowledge_base,
+                ),
+                close=close_chroma,
+            ) as chroma:
+                # Convert DataFrame to Data objects (following Local DB pattern)
+                data_objects = await self._convert_df_to_data_objects(df_source, config_list, chroma=chroma)
+
+                # Convert Data objects to LangChain Documents
+                documents = []
+                for data_obj in data_objects:
+                    doc = data_obj.to_lc_document()
+                    documents.append(doc)
+
+                # Add documents to vector store
+                if documents:
+                    embedding_function = chroma.embeddings
+                    if isinstance(embedding_function, CachedEmbeddings):
+                        hits, misses = embedding_function.stats.hits, embedding_function.stats.misses
+                    ids = chroma.add_documents(documents)
+                    self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+                    if isinstance(embedding_function, CachedEmbeddings):
+                        stats = embedding_function.stats
+                        self.log(
+                            f"Reused {stats.hits - hits} cached embeddings, embedded {stats.misses - misses} chunks"
+                        )
+                    self._update_lexical_index(vector_store_dir, ids, documents)
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
+    def _update_lexical_index(self, kb_path: Path, ids: list[str], documents: list) -> None:
+        """Index the new chunks for keyword and hybrid search, keyed by their Chroma ids."""
+        try:
+            LexicalIndex(kb_path / LEXICAL_INDEX_FILENAME).add_documents(
+                zip(ids, (doc.page_content for doc in documents), strict=True)
+            )
+        except sqlite3.Error as e:
+            # Retrieval indexes missing chunks on its next keyword search
+            self.log(f"Error updating lexical index: {e}")
+
     async def _convert_df_to_data_objects(
-        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], chroma: Chroma | None = None
     ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
+        """Convert DataFrame to Data objects for vector store.
 
-        # Set up vector store directory
-        kb_path = await self._kb_path()
+        `chroma` is the open vector store of the knowledge base, if the caller has one.
+        """
+        data_objects: list[Data] = []
 
         # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
+        if chroma is None:
+            kb_path = await self._kb_path()
+            chroma = Chroma(
+                persist_directory=str(kb_path),
+                collection_name=self.knowledge_base,
+            )
 
         # Get all documents and their metadata
         all_docs = chroma.get()
@@ -449,8 +479,10 @@ class KnowledgeIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
+        # Convert each row to a Data object, reading the values column by column
+        if not isinstance(df_source, DataFrame):
+            df_source = DataFrame(df_source)
+        for row in df_source.iter_records():
             # Build content text from identifier columns using list comprehension
             identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
 
@@ -4,11 +4,15 @@ from typing import Any
 
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 from vetrai.services.auth.utils import decrypt_api_key
 from vetrai.services.database.models.user.crud import get_user_by_id
 from pydantic import SecretStr
 
+from lfx.base.embeddings.cache import with_embedding_cache
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.lexical_index import LEXICAL_INDEX_FILENAME, LexicalIndex, reciprocal_rank_fusion
+from lfx.base.vectorstores.registry import VectorStoreKey, close_chroma, get_vector_store_registry, hash_identity
 from lfx.custom import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
@@ -22,6 +26,9 @@ _KNOWLEDGE_BASES_ROOT_PATH: Path | None = None
 # Error message to raise if we're in Astra cloud environment and the component is not supported.
 astra_error_msg = "Knowledge retrieval is not supported in Astra cloud environment."
 
+# Each ranking contributes this many candidates per requested result to hybrid search
+HYBRID_CANDIDATES_PER_RESULT = 4
+
 
 def _get_knowledge_bases_root_path() -> Path:
     """Lazy load the knowledge bases root path from settings."""
@@ -73,6 +80,17 @@ class KnowledgeRetrievalComponent(Component):
             advanced=True,
             required=False,
         ),
+        DropdownInput(
+            name="search_type",
+            display_name="Search Type",
+            info=(
+                "Similarity ranks results by embedding distance, Keyword by BM25 over the knowledge base text, "
+                "and Hybrid fuses both rankings."
+            ),
+            options=["Similarity", "Keyword", "Hybrid"],
+            value="Similarity",
+            advanced=True,
+        ),
         BoolInput(
             name="include_metadata",
             display_name="Include Metadata",
@@ -186,49 +204,68 @@ class KnowledgeRetrievalComponent(Component):
         msg = f"Embedding provider '{provider}' is not supported for retrieval."
         raise NotImplementedError(msg)
 
-    async def retrieve_data(self) -> DataFrame:
-        """Retrieve data from the selected knowledge base by reading the Chroma collection.
-
-        Returns:
-            A DataFrame containing the data rows from the knowledge base.
-        """
-        # Check if we're in Astra cloud environment and raise an error if we are.
-        raise_error_if_astra_cloud_disable_component(astra_error_msg)
-        # Get the current user
-        async with session_scope() as db:
-            if not self.user_id:
-                msg = "User ID is required for fetching Knowledge Base data."
-                raise ValueError(msg)
-            current_user = await get_user_by_id(db, self.user_id)
-            if not current_user:
-                msg = f"User with ID {self.user_id} not found."
-                raise ValueError(msg)
-            kb_user = current_user.username
-        kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
-
-        metadata = self._get_kb_metadata(kb_path)
-        if not metadata:
-            msg = f"Metadata not found for knowledge base: {self.knowledge_base}. Ensure it has been indexed."
-            raise ValueError(msg)
-
-        # Build the embedder for the knowledge base
-        embedding_function = self._build_embeddings(metadata)
-
-        # Load vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            embedding_function=embedding_function,
-            collection_name=self.knowledge_base,
+    def _embedding_identity(self, metadata: dict) -> str:
+        """Return the identity of the embedder that `_build_embeddings` builds from metadata."""
+        runtime_api_key = self.api_key.get_secret_value() if isinstance(self.api_key, SecretStr) else self.api_key
+        return hash_identity(
+            metadata.get("embedding_provider"),
+            metadata.get("embedding_model"),
+            metadata.get("chunk_size"),
+            runtime_api_key or metadata.get("api_key"),
         )
 
-        # If a search query is provided, perform a similarity search
-        if self.search_query:
+    def _get_lexical_index(self, kb_path: Path, chroma: Chroma) -> LexicalIndex:
+        """Return the lexical index of the knowledge base, indexing any chunks it is missing."""
+        index = LexicalIndex(kb_path / LEXICAL_INDEX_FILENAME)
+        collection = chroma._collection  # noqa: SLF001
+        if index.document_count() < collection.count():
+            # Knowledge bases ingested before the index existed, or whose index update failed
+            indexed = index.document_ids()
+            stored = collection.get(include=["documents"])
+            added = index.add_documents(
+                (doc_id, text or "")
+                for doc_id, text in zip(stored["ids"], stored["documents"], strict=True)
+                if doc_id not in indexed
+            )
+            logger.info(f"Added {added} chunks to the lexical index of {self.knowledge_base}")
+        return index
+
+    def _keyword_search(self, kb_path: Path, chroma: Chroma) -> list[tuple[Document, float]]:
+        hits = self._get_lexical_index(kb_path, chroma).search(self.search_query, self.top_k)
+        docs_by_id = {doc.id: doc for doc in chroma.get_by_ids([doc_id for doc_id, _ in hits])}
+        return [(docs_by_id[doc_id], score) for doc_id, score in hits if doc_id in docs_by_id]
+
+    def _hybrid_search(self, kb_path: Path, chroma: Chroma) -> list[tuple[Document, float]]:
+        candidates = self.top_k * HYBRID_CANDIDATES_PER_RESULT
+        vector_hits = chroma.similarity_search_with_score(query=self.search_query, k=candidates)
+        lexical_hits = self._get_lexical_index(kb_path, chroma).search(self.search_query, candidates)
+        fused = reciprocal_rank_fusion(
+            [[doc.id for doc, _ in vector_hits], [doc_id for doc_id, _ in lexical_hits]],
+        )[: self.top_k]
+
+        docs_by_id = {doc.id: doc for doc, _ in vector_hits}
+        missing = [doc_id for doc_id, _ in fused if doc_id not in docs_by_id]
+        if missing:
+            docs_by_id.update((doc.id, doc) for doc in chroma.get_by_ids(missing))
+        return [(docs_by_id[doc_id], score) for doc_id, score in fused if doc_id in docs_by_id]
+
+    def _search(self, kb_path: Path, chroma: Chroma) -> tuple[list[tuple[Document, float]], dict[str, Any]]:
+        """Return the chunks that match the search query with their scores, and the embeddings to include."""
+        # If a search query is provided, rank the results by relevance (higher scores are better)
+        if self.search_query and self.search_type == "Keyword":
+            logger.info(f"Performing keyword search with query: {self.search_query}")
+            results = self._keyword_search(kb_path, chroma)
+        elif self.search_query and self.search_type == "Hybrid":
+            logger.info(f"Performing hybrid search with query: {self.search_query}")
+            results = self._hybrid_search(kb_path, chroma)
+        elif self.search_query:
             # Use the search query to perform a similarity search
             logger.info(f"Performing similarity search with query: {self.search_query}")
             results = chroma.similarity_search_with_score(
                 query=self.search_query or "",
                 k=self.top_k,
             )
+            results = [(doc, -1 * distance) for doc, distance in results]
         else:
             results = chroma.similarity_search(
                 query=self.search_query or "",
@@ -254,6 +291,46 @@ class KnowledgeRetrievalComponent(Component):
                     if metadata and "_id" in metadata:
                         id_to_embedding[metadata["_id"]] = embeddings_result["embeddings"][i]
 
+        return results, id_to_embedding
+
+    async def retrieve_data(self) -> DataFrame:
+        """Retrieve data from the selected knowledge base by reading the Chroma collection.
+
+        Returns:
+            A DataFrame containing the data rows from the knowledge base.
+        """
+        # Check if we're in Astra cloud environment and raise an error if we are.
+        raise_error_if_astra_cloud_disable_component(astra_error_msg)
+        # Get the current user
+        async with session_scope() as db:
+            if not self.user_id:
+                msg = "User ID is required for fetching Knowledge Base data."
+                raise ValueError(msg)
+            current_user = await get_user_by_id(db, self.user_id)
+            if not current_user:
+                msg = f"User with ID {self.user_id} not found."
+                raise ValueError(msg)
+            kb_user = current_user.username
+        kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
+
+        metadata = self._get_kb_metadata(kb_path)
+        if not metadata:
+            msg = f"Metadata not found for knowledge base: {self.knowledge_base}. Ensure it has been indexed."
+            raise ValueError(msg)
+
+        # Load the vector store, reusing the client and embedder that an earlier run opened on the knowledge base
+        key = VectorStoreKey("chroma", str(kb_path), self.knowledge_base, self._embedding_identity(metadata))
+        with get_vector_store_registry().lease(
+            key,
+            lambda: Chroma(
+                persist_directory=str(kb_path),
+                embedding_function=with_embedding_cache(self._build_embeddings(metadata)),
+                collection_name=self.knowledge_base,
+            ),
+            close=close_chroma,
+        ) as chroma:
+            results, id_to_embedding = self._search(kb_path, chroma)
+
         # Build output data based on include_metadata setting
         data_list = []
         for doc in results:
@@ -261,7 +338,7 @@ class KnowledgeRetrievalComponent(Component):
                 "content": doc[0].page_content,
             }
             if self.search_query:
-                kwargs["_score"] = -1 * doc[1]
+                kwargs["_score"] = doc[1]
             if self.include_metadata:
                 # Include all metadata, embeddings, and content
                 kwargs.update(doc[0].metadata)
@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.field_typing import Tool
 from lfx.inputs.inputs import SecretStrInput, StrInput
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class HomeAssistantControl(LCToolComponent):
@@ -132,11 +133,11 @@ class HomeAssistantControl(LCToolComponent):
             }
             payload = {"entity_id": entity_id}
 
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = get_http_client_service().get_client().post(url, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
 
             return response.json()  # HA response JSON on success
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Error: Failed to call service. {e}"
         except Exception as e:  # noqa: BLE001
             return f"An unexpected error occurred: {e}"
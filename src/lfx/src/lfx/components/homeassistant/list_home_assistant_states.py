@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-import requests
+import httpx
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.field_typing import Tool
 from lfx.inputs.inputs import SecretStrInput, StrInput
 from lfx.schema.data import Data
+from lfx.services.deps import get_http_client_service
 
 
 class ListHomeAssistantStates(LCToolComponent):
@@ -103,14 +104,14 @@ class ListHomeAssistantStates(LCToolComponent):
                 "Content-Type": "application/json",
             }
             url = f"{base_url}/api/states"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_client_service().get_client().get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
             all_states = response.json()
             if filter_domain:
                 return [st for st in all_states if st.get("entity_id", "").startswith(f"{filter_domain}.")]
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Error: Failed to fetch states. {e}"
         except (ValueError, TypeError) as e:
             return f"Error processing response: {e}"
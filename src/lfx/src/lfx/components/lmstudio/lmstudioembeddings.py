@@ -1,12 +1,11 @@
 from typing import Any
 from urllib.parse import urljoin
 
-import httpx
-
 from lfx.base.embeddings.model import LCEmbeddingsModel
 from lfx.field_typing import Embeddings
 from lfx.inputs.inputs import DropdownInput, SecretStrInput
 from lfx.io import FloatInput, MessageTextInput
+from lfx.services.deps import get_http_client_service
 
 
 class LMStudioEmbeddingsComponent(LCEmbeddingsModel):
@@ -31,12 +30,12 @@ class LMStudioEmbeddingsComponent(LCEmbeddingsModel):
     async def get_model(base_url_value: str) -> list[str]:
         try:
             url = urljoin(base_url_value, "/v1/models")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client_service().get_async_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
 
-                return [model["id"] for model in data.get("data", [])]
+            return [model["id"] for model in data.get("data", [])]
         except Exception as e:
             msg = "Could not retrieve models. Please, make sure the LM Studio server is running."
             raise ValueError(msg) from e
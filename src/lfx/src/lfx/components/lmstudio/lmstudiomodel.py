@@ -8,6 +8,7 @@ from lfx.base.models.model import LCModelComponent
 from lfx.field_typing import LanguageModel
 from lfx.field_typing.range_spec import RangeSpec
 from lfx.inputs.inputs import DictInput, DropdownInput, FloatInput, IntInput, SecretStrInput, StrInput
+from lfx.services.deps import get_http_client_service
 
 
 class LMStudioModelComponent(LCModelComponent):
@@ -24,9 +25,9 @@ class LMStudioModelComponent(LCModelComponent):
             if base_url_load_from_db:
                 base_url_value = await self.get_variables(base_url_value, field_name)
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(urljoin(base_url_value, "/v1/models"), timeout=2.0)
-                    response.raise_for_status()
+                client = get_http_client_service().get_async_client()
+                response = await client.get(urljoin(base_url_value, "/v1/models"), timeout=2.0)
+                response.raise_for_status()
             except httpx.HTTPError:
                 msg = "Could not access the default LM Studio URL. Please, specify the 'Base URL' field."
                 self.log(msg)
@@ -39,12 +40,12 @@ class LMStudioModelComponent(LCModelComponent):
     async def get_model(base_url_value: str) -> list[str]:
         try:
             url = urljoin(base_url_value, "/v1/models")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client_service().get_async_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
 
-                return [model["id"] for model in data.get("data", [])]
+            return [model["id"] for model in data.get("data", [])]
         except Exception as e:
             msg = "Could not retrieve models. Please, make sure the LM Studio server is running."
             raise ValueError(msg) from e
@@ -9,6 +9,7 @@ from lfx.base.models.model import LCModelComponent
 from lfx.field_typing import Embeddings
 from lfx.io import DropdownInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
+from lfx.services.deps import get_http_client_service
 from lfx.utils.util import transform_localhost_url
 
 HTTP_STATUS_OK = 200
@@ -133,34 +134,34 @@ class OllamaEmbeddingsComponent(LCModelComponent):
             # Ollama REST API to return model capabilities
             show_url = urljoin(base_url, "api/show")
 
-            async with httpx.AsyncClient() as client:
-                headers = self.headers
-                # Fetch available models
-                tags_response = await client.get(url=tags_url, headers=headers)
-                tags_response.raise_for_status()
-                models = tags_response.json()
-                if asyncio.iscoroutine(models):
-                    models = await models
-                await logger.adebug(f"Available models: {models}")
-
-                # Filter models that are embedding models
-                model_ids = []
-                for model in models[self.JSON_MODELS_KEY]:
-                    model_name = model[self.JSON_NAME_KEY]
-                    await logger.adebug(f"Checking model: {model_name}")
-
-                    payload = {"model": model_name}
-                    show_response = await client.post(url=show_url, json=payload, headers=headers)
-                    show_response.raise_for_status()
-                    json_data = show_response.json()
-                    if asyncio.iscoroutine(json_data):
-                        json_data = await json_data
-
-                    capabilities = json_data.get(self.JSON_CAPABILITIES_KEY, [])
-                    await logger.adebug(f"Model: {model_name}, Capabilities: {capabilities}")
-
-                    if self.EMBEDDING_CAPABILITY in capabilities:
-                        model_ids.append(model_name)
+            client = get_http_client_service().get_async_client()
+            headers = self.headers
+            # Fetch available models
+            tags_response = await client.get(url=tags_url, headers=headers)
+            tags_response.raise_for_status()
+            models = tags_response.json()
+            if asyncio.iscoroutine(models):
+                models = await models
+            await logger.adebug(f"Available models: {models}")
+
+            # Filter models that are embedding models
+            model_ids = []
+            for model in models[self.JSON_MODELS_KEY]:
+                model_name = model[self.JSON_NAME_KEY]
+                await logger.adebug(f"Checking model: {model_name}")
+
+                payload = {"model": model_name}
+                show_response = await client.post(url=show_url, json=payload, headers=headers)
+                show_response.raise_for_status()
+                json_data = show_response.json()
+                if asyncio.iscoroutine(json_data):
+                    json_data = await json_data
+
+                capabilities = json_data.get(self.JSON_CAPABILITIES_KEY, [])
+                await logger.adebug(f"Model: {model_name}, Capabilities: {capabilities}")
+
+                if self.EMBEDDING_CAPABILITY in capabilities:
+                    model_ids.append(model_name)
 
         except (httpx.RequestError, ValueError) as e:
             msg = "Could not get model names from Ollama."
@@ -170,16 +171,14 @@ class OllamaEmbeddingsComponent(LCModelComponent):
 
     async def is_valid_ollama_url(self, url: str) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                url = transform_localhost_url(url)
-                if not url:
-                    return False
-                # Strip /v1 suffix if present, as Ollama API endpoints are at root level
-                url = url.rstrip("/").removesuffix("/v1")
-                if not url.endswith("/"):
-                    url = url + "/"
-                return (
-                    await client.get(url=urljoin(url, "api/tags"), headers=self.headers)
-                ).status_code == HTTP_STATUS_OK
+            url = transform_localhost_url(url)
+            if not url:
+                return False
+            # Strip /v1 suffix if present, as Ollama API endpoints are at root level
+            url = url.rstrip("/").removesuffix("/v1")
+            if not url.endswith("/"):
+                url = url + "/"
+            client = get_http_client_service().get_async_client()
+            return (await client.get(url=urljoin(url, "api/tags"), headers=self.headers)).status_code == HTTP_STATUS_OK
         except httpx.RequestError:
             return False
@@ -13,6 +13,7 @@ class DataFrameOperationsComponent(Component):
     documentation: str = "https://docs.vetrai.org/dataframe-operations"
     icon = "table"
     name = "DataFrameOperations"
+    cache_results = True
 
     OPERATION_CHOICES = [
         "Add Column",
@@ -26,6 +27,10 @@ class DataFrameOperationsComponent(Component):
         "Tail",
         "Drop Duplicates",
     ]
+    # Operations that return a new table without changing their input
+    COPY_FREE_OPERATIONS = frozenset(
+        {"Drop Column", "Drop Duplicates", "Filter", "Rename Column", "Select Columns", "Sort"}
+    )
 
     inputs = [
         DataFrameInput(
@@ -205,8 +210,6 @@ class DataFrameOperationsComponent(Component):
         return build_config
 
     def perform_operation(self) -> DataFrame:
-        df_copy = self.df.copy()
-
         # Handle SortableListInput format for operation
         operation_input = getattr(self, "operation", [])
         if isinstance(operation_input, list) and len(operation_input) > 0:
@@ -214,6 +217,9 @@ class DataFrameOperationsComponent(Component):
         else:
             op = ""
 
+        # The other operations change the table in place or return a view of it, so they work on a copy
+        df_copy = self.df if op in self.COPY_FREE_OPERATIONS else self.df.copy()
+
         # If no operation selected, return original DataFrame
         if not op:
             return df_copy
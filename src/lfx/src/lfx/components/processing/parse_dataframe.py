@@ -1,5 +1,6 @@
 from lfx.custom.custom_component.component import Component
 from lfx.io import DataFrameInput, MultilineInput, Output, StrInput
+from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
 
 
@@ -56,12 +57,10 @@ class ParseDataFrameComponent(Component):
         """
         dataframe, template, sep = self._clean_args()
 
-        lines = []
-        # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
-            text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
-            lines.append(text_line)
+        # Format each row, e.g. template="{text}" and a row {"text": "Hello"}
+        if not isinstance(dataframe, DataFrame):
+            dataframe = DataFrame(dataframe)
+        lines = dataframe.format_rows(template)
 
         # Join all lines with the provided separator
         result_string = sep.join(lines)
@@ -12,6 +12,7 @@ class ParserComponent(Component):
     description = "Extracts text using a template."
     documentation: str = "https://docs.vetrai.org/parser"
     icon = "braces"
+    cache_results = True
 
     inputs = [
         HandleInput(
@@ -118,9 +119,7 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            lines = df.format_rows(self.pattern)
         elif data is not None:
             # Use format_map with a dict that returns default_value for missing keys
             class DefaultDict(dict):
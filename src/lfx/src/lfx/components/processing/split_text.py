@@ -14,6 +14,8 @@ class SplitTextComponent(Component):
     documentation: str = "https://docs.vetrai.org/split-text"
     icon = "scissors-line-dashed"
     name = "SplitText"
+    executor_pool = "cpu"
+    cache_results = True
 
     inputs = [
         HandleInput(
@@ -69,9 +71,6 @@ class SplitTextComponent(Component):
         Output(display_name="Chunks", name="dataframe", method="split_text"),
     ]
 
-    def _docs_to_data(self, docs) -> list[Data]:
-        return [Data(text=doc.page_content, data=doc.metadata) for doc in docs]
-
     def _fix_separator(self, separator: str) -> str:
         """Fix common separator issues and convert to proper format."""
         if separator == "/n":
@@ -138,4 +137,10 @@ class SplitTextComponent(Component):
             raise TypeError(msg) from e
 
     def split_text(self) -> DataFrame:
-        return DataFrame(self._docs_to_data(self.split_text_base()))
+        # The chunks go straight into the columns, like Data(text=..., data=metadata) rows but without the objects
+        rows = []
+        for doc in self.split_text_base():
+            row = dict(doc.metadata)
+            row.setdefault("text", doc.page_content)
+            rows.append(row)
+        return DataFrame(rows)
@@ -6,7 +6,7 @@ from itertools import starmap
 from pathlib import Path
 from typing import Any
 
-from cachetools import TTLCache, keys
+from cachetools import keys
 from fastapi import HTTPException
 
 from lfx.custom.eval import eval_custom_component_code
@@ -61,7 +61,6 @@ class CodeParser:
 
     def __init__(self, code: str | type) -> None:
         """Initializes the parser with the provided code."""
-        self.cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
         if isinstance(code, type):
             if not inspect.isclass(code):
                 msg = "The provided code must be a class."
@@ -129,7 +128,6 @@ class CodeParser:
             arg_dict["type"] = ast.unparse(arg.annotation)
         return arg_dict
 
-    # @cachedmethod(operator.attrgetter("cache"))
     def construct_eval_env(self, return_type_str: str, imports) -> dict:
         """Constructs an evaluation environment.
 
@@ -1,15 +1,14 @@
 import copy
-import operator
 import re
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from cachetools import TTLCache, cachedmethod
 from fastapi import HTTPException
 
 from lfx.custom import validate
 from lfx.custom.attributes import ATTR_FUNC_MAPPING
 from lfx.custom.code_parser.code_parser import CodeParser
 from lfx.custom.eval import eval_custom_component_code
+from lfx.custom.template_cache import get_template_cache
 from lfx.log.logger import logger
 
 if TYPE_CHECKING:
@@ -35,8 +34,6 @@ class BaseComponent:
         self._user_id: str | UUID | None = None
         self._template_config: dict = {}
 
-        self.cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
-
         for key, value in data.items():
             if key == "user_id":
                 self._user_id = value
@@ -62,10 +59,9 @@ class BaseComponent:
         """Get the function entrypoint name."""
         return self._function_entrypoint_name
 
-    @cachedmethod(cache=operator.attrgetter("cache"))
     def get_code_tree(self, code: str):
-        parser = CodeParser(code)
-        return parser.parse_code()
+        # Parsing executes the code, so the trees are shared by every instance built from the same code
+        return get_template_cache().get_or_build("code_tree", code, CodeParser(code).parse_code)
 
     def get_function(self):
         if not self._code:
@@ -6,7 +6,7 @@ import inspect
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 from uuid import UUID
 
 import nanoid
@@ -40,9 +40,11 @@ from lfx.serialization.serialization import serialize
 from lfx.template.field.base import UNDEFINED, Input, Output
 from lfx.template.frontend_node.custom_components import ComponentFrontendNode
 from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import EVENTS_POOL, IO_POOL, get_component_pool_name, run_in_pool
 from lfx.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
+from .prototype import copy_definition, get_component_prototype
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -113,6 +115,12 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     selected_output: str | None = None
+    cache_results: bool = False
+    """Whether results may be reused across runs when the code and resolved inputs are unchanged.
+    Only enable it for components whose outputs depend on nothing but their inputs."""
+    executor_pool: str = IO_POOL
+    """The executor pool that runs the synchronous output methods of the component (see `lfx.utils.executors`).
+    Use 'cpu' for components that compute rather than wait on I/O."""
     code_class_base_inheritance: ClassVar[str] = "Component"
 
     def __init__(self, **kwargs) -> None:
@@ -352,6 +360,11 @@ class Component(CustomComponent):
             for output in self._outputs_map.values():
                 output.value = UNDEFINED
 
+    def reset_run_state(self) -> None:
+        super().reset_run_state()
+        self._current_output = ""
+        self.reset_all_output_values()
+
     def _build_state_model(self):
         if self._state_model:
             return self._state_model
@@ -398,13 +411,7 @@ class Component(CustomComponent):
         if self._code:
             return
         try:
-            module = inspect.getmodule(self.__class__)
-            if module is None:
-                msg = "Could not find module for class"
-                raise ValueError(msg)
-
-            class_code = inspect.getsource(module)
-            self._code = class_code
+            self._code = get_component_prototype(type(self)).get_source(type(self))
         except (OSError, TypeError) as e:
             msg = f"Could not find source code for {self.__class__.__name__}"
             raise ValueError(msg) from e
@@ -530,9 +537,9 @@ class Component(CustomComponent):
             if output.name is None:
                 msg = "Output name cannot be None."
                 raise ValueError(msg)
-            # Deepcopy is required to avoid modifying the original component;
+            # A copy is required to avoid modifying the original component;
             # allows each instance of each component to modify its own output
-            self._outputs_map[output.name] = deepcopy(output)
+            self._outputs_map[output.name] = copy_definition(output)
 
     def map_inputs(self, inputs: list[InputTypes]) -> None:
         """Maps the given inputs to the component.
@@ -551,7 +558,7 @@ class Component(CustomComponent):
                 msg = self.build_component_error_message("Input name cannot be None")
                 raise ValueError(msg)
             try:
-                self._inputs[input_.name] = deepcopy(input_)
+                self._inputs[input_.name] = copy_definition(input_)
             except TypeError:
                 self._inputs[input_.name] = input_
 
@@ -905,7 +912,7 @@ class Component(CustomComponent):
             if asyncio.iscoroutinefunction(_input.value):
                 self._inputs[key].value = await _input.value()
             elif callable(_input.value):
-                self._inputs[key].value = await asyncio.to_thread(_input.value)
+                self._inputs[key].value = await self._run_blocking(_input.value)
 
         self.set_attributes({})
 
@@ -986,7 +993,9 @@ class Component(CustomComponent):
 
     def _get_method_return_type(self, method_name: str) -> list[str]:
         method = getattr(self, method_name)
-        return_type = get_type_hints(method).get("return")
+        return get_component_prototype(type(self)).get_return_types(method, self._format_return_types)
+
+    def _format_return_types(self, return_type: Any) -> list[str]:
         if return_type is None:
             return []
         extracted_return_types = self._extract_return_type(return_type)
@@ -1206,7 +1215,9 @@ class Component(CustomComponent):
 
         # First process outputs in the order defined by self.outputs
         for output in self.outputs:
-            output_obj = self._outputs_map.get(output.name, deepcopy(output))
+            output_obj = self._outputs_map.get(output.name)
+            if output_obj is None:
+                output_obj = copy_definition(output)
             if self._should_process_output(output_obj):
                 result.append(output_obj)
                 processed_names.add(output_obj.name)
@@ -1235,7 +1246,7 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            result = await method() if inspect.iscoroutinefunction(method) else await self._run_blocking(method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1252,6 +1263,12 @@ class Component(CustomComponent):
 
         return result
 
+    async def _run_blocking(self, func, /, *args, pool: str | None = None, **kwargs):
+        """Runs a blocking call in the executor pool of the component, or in `pool`, on behalf of its flow."""
+        flow_id = self._vertex.graph.flow_id if self._vertex is not None else None
+        pool = pool or get_component_pool_name(type(self))
+        return await run_in_pool(pool, func, *args, flow_id=flow_id, **kwargs)
+
     async def resolve_output(self, output_name: str) -> Any:
         """Resolves and returns the value for a specified output by name.
 
@@ -1312,6 +1329,13 @@ class Component(CustomComponent):
         self._logs = []
         self._current_output = ""
 
+    def restore_results(self, results: dict[str, Any], artifacts: dict[str, Any]) -> None:
+        """Restores results and artifacts of an earlier build instead of running the output methods."""
+        for name, value in results.items():
+            if name in self._outputs_map:
+                self._outputs_map[name].value = value
+        self._finalize_results(results, artifacts)
+
     def _finalize_results(self, results, artifacts):
         self._artifacts = artifacts
         self._results = results
@@ -1754,7 +1778,7 @@ class Component(CustomComponent):
                     case _:
                         self._event_manager.on_message(data=data_dict)
 
-            await asyncio.to_thread(_send_event)
+            await self._run_blocking(_send_event, pool=EVENTS_POOL)
 
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
         return bool(
@@ -1828,8 +1852,9 @@ class Component(CustomComponent):
                 msg_copy = message.model_copy()
                 msg_copy.text = complete_message
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
+            await self._run_blocking(
                 self._event_manager.on_token,
+                pool=EVENTS_POOL,
                 data={
                     "chunk": chunk,
                     "id": str(message_id),
@@ -129,6 +129,17 @@ class CustomComponent(BaseComponent):
     def set_artifacts(self, artifacts: dict):
         self._artifacts = artifacts
 
+    def reset_run_state(self) -> None:
+        """Resets what a run left on the component, so that a graph can run the same instance again.
+
+        `Graph.patch` calls it on the components it keeps. Subclasses that keep state between the output methods
+        of a run clear it here.
+        """
+        self._results = {}
+        self._artifacts = {}
+        self._logs = []
+        self._output_logs = {}
+
     @property
     def trace_name(self) -> str:
         if hasattr(self, "_id") and self._id is None:
@@ -0,0 +1,109 @@
+"""Per-class prototypes that make constructing components cheap.
+
+The input and output definitions declared on a component class are the prototypes of the ones every instance
+owns. Building a component changes its definitions (values, ``load_from_db``, output types and values), so
+instances cannot share them, but a full ``deepcopy`` of every definition dominated construction time.
+``copy_definition`` makes a shallow copy instead: immutable field values are shared with the prototype and an
+assignment only replaces the value in the instance's own copy. Lists, dicts and nested models can be changed in
+place, so those are still copied.
+
+Everything that is the same for every instance of a class, the source code of its module and the return types
+of its output methods, is computed once and kept in the class's ``ComponentPrototype``.
+"""
+
+from __future__ import annotations
+
+import inspect
+from copy import deepcopy
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar, get_type_hints
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DefinitionT = TypeVar("DefinitionT", bound=BaseModel)
+
+_IMMUTABLE_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes, type})
+
+
+def _is_immutable(value: Any) -> bool:
+    return type(value) in _IMMUTABLE_TYPES or isinstance(value, Enum)
+
+
+def _copy_value(value: Any) -> Any:
+    # Flat containers, like options and input types, do not need the machinery of deepcopy
+    if type(value) is list and all(_is_immutable(item) for item in value):
+        return value.copy()
+    if type(value) is dict and all(_is_immutable(item) for item in value.values()):
+        return value.copy()
+    return deepcopy(value)
+
+
+def copy_definition(definition: DefinitionT) -> DefinitionT:
+    """Returns a copy of an input or output definition that an instance can change, like ``deepcopy`` does."""
+    copy = definition.model_copy()
+    fields = copy.__dict__
+    for name, value in fields.items():
+        if type(value) not in _IMMUTABLE_TYPES and not isinstance(value, Enum):
+            fields[name] = _copy_value(value)
+    if copy.__pydantic_extra__:
+        object.__setattr__(copy, "__pydantic_extra__", deepcopy(copy.__pydantic_extra__))
+    if copy.__pydantic_private__:
+        object.__setattr__(copy, "__pydantic_private__", deepcopy(copy.__pydantic_private__))
+    return copy
+
+
+class ComponentPrototype:
+    """State shared by all instances of a component class."""
+
+    def __init__(self) -> None:
+        self._source: str | None = None
+        # Keyed by function, so methods replaced or added on an instance are not mixed up with the class ones
+        self._return_types: WeakKeyDictionary[Callable, list[str]] = WeakKeyDictionary()
+
+    def get_source(self, component_class: type) -> str:
+        """Returns the source code of the module that defines the class, read only once.
+
+        Raises:
+            ValueError: If the module of the class is not found.
+            OSError, TypeError: If the source code of the module is not available.
+        """
+        if self._source is None:
+            module = inspect.getmodule(component_class)
+            if module is None:
+                msg = "Could not find module for class"
+                raise ValueError(msg)
+            self._source = inspect.getsource(module)
+        return self._source
+
+    def get_return_types(self, method: Callable, extract_return_types: Callable[[Any], list[str]]) -> list[str]:
+        """Returns the formatted return types of an output method, resolving its type hints only once."""
+        function = getattr(method, "__func__", method)
+        try:
+            return list(self._return_types[function])
+        except KeyError:
+            pass
+        except TypeError:
+            # Not weak referenceable, so it is not cached
+            return extract_return_types(get_type_hints(method).get("return"))
+        return_types = extract_return_types(get_type_hints(method).get("return"))
+        self._return_types[function] = return_types
+        return list(return_types)
+
+
+_PROTOTYPES: WeakKeyDictionary[type, ComponentPrototype] = WeakKeyDictionary()
+
+
+def get_component_prototype(component_class: type) -> ComponentPrototype:
+    """Returns the prototype of a component class, creating it the first time.
+
+    Classes built from code at runtime are only weakly referenced, so their prototypes go away with them.
+    """
+    try:
+        return _PROTOTYPES[component_class]
+    except KeyError:
+        prototype = _PROTOTYPES[component_class] = ComponentPrototype()
+        return prototype
@@ -1,14 +1,24 @@
+from __future__ import annotations
+
 import ast
 import asyncio
+import dataclasses
 import zlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import anyio
 from aiofile import async_open
 
 from lfx.custom.custom_component.component import Component
+from lfx.custom.directory_reader.manifest import FileEntry, hash_content, hash_directory
 from lfx.log.logger import logger
 
+if TYPE_CHECKING:
+    from os import stat_result
+
+    from lfx.custom.directory_reader.manifest import ComponentManifest
+
 MAX_DEPTH = 2
 
 
@@ -43,10 +53,17 @@ class DirectoryReader:
     # the custom components from this directory.
     base_path = ""
 
-    def __init__(self, directory_path, *, compress_code_field=False) -> None:
-        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code."""
+    def __init__(self, directory_path, *, compress_code_field=False, manifest: ComponentManifest | None = None) -> None:
+        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code.
+
+        When a manifest is given, the async menu build and template building reuse the results stored for
+        unchanged files.
+        """
         self.directory_path = directory_path
         self.compress_code_field = compress_code_field
+        self.manifest = manifest
+        # Hashes of the scanned directories, by path, computed by the async menu build for the template cache
+        self._directory_hashes: dict[str, str] = {}
 
     def get_safe_path(self):
         """Check if the path is valid and return it, or None if it's not."""
@@ -64,13 +81,32 @@ class DirectoryReader:
     def filter_loaded_components(self, data: dict, *, with_errors: bool) -> dict:
         from lfx.custom.utils import build_component
 
+        use_manifest = self.manifest is not None and not with_errors
+        cached_templates = {}
+        built_templates = {}
+        if use_manifest:
+            cached_templates = self.manifest.get_templates(
+                (component["code"], self._directory_hashes[menu["path"]])
+                for menu in data["menu"]
+                if menu["path"] in self._directory_hashes
+                for component in menu["components"]
+                if not component["error"]
+            )
+
         items = []
         for menu in data["menu"]:
             components = []
             for component in menu["components"]:
                 try:
                     if component["error"] if with_errors else not component["error"]:
-                        component_tuple = (*build_component(component), component)
+                        directory_hash = self._directory_hashes.get(menu["path"])
+                        key = (component["code"], directory_hash)
+                        built = cached_templates.get(key)
+                        if built is None:
+                            built = build_component(component)
+                            if use_manifest and directory_hash is not None:
+                                built_templates[key] = built
+                        component_tuple = (*built, component)
                         components.append(component_tuple)
                 except Exception as exc:  # noqa: BLE001
                     logger.debug(
@@ -79,6 +115,8 @@ class DirectoryReader:
                     )
                     continue
             items.append({"name": menu["name"], "path": menu["path"], "components": components})
+        if built_templates:
+            self.manifest.put_templates(built_templates)
         filtered = [menu for menu in items if menu["components"]]
         logger.debug(f"Filtered components {'with errors' if with_errors else ''}: {len(filtered)}")
         return {"menu": filtered}
@@ -305,45 +343,27 @@ class DirectoryReader:
         response = {"menu": []}
         await logger.adebug("-------------------- Async Building component menu list --------------------")
 
-        tasks = [self.process_file_async(file_path) for file_path in file_paths]
-        results = await asyncio.gather(*tasks)
+        if self.manifest is None:
+            component_infos = await asyncio.gather(
+                *(self._abuild_component_info(file_path) for file_path in file_paths)
+            )
+            results = [(component_info, None) for component_info in component_infos]
+        else:
+            results = await self._aget_component_infos_from_manifest(file_paths)
 
-        for file_path, (validation_result, result_content) in zip(file_paths, results, strict=True):
+        updated_entries = [entry for _, entry in results if entry is not None]
+        if updated_entries:
+            await logger.adebug(f"Updating {len(updated_entries)} changed file(s) in the component manifest")
+            await asyncio.to_thread(self.manifest.put_files, updated_entries)
+
+        for file_path, (component_info, _) in zip(file_paths, results, strict=True):
             file_path_ = Path(file_path)
             menu_name = file_path_.parent.name
-            filename = file_path_.name
-
-            if not validation_result:
-                await logger.aerror(f"Error while processing file {file_path}")
-
             menu_result = self.find_menu(response, menu_name) or {
                 "name": menu_name,
                 "path": str(file_path_.parent),
                 "components": [],
             }
-            component_name = filename.split(".")[0]
-
-            if "_" in component_name:
-                component_name_camelcase = " ".join(word.title() for word in component_name.split("_"))
-            else:
-                component_name_camelcase = component_name
-
-            if validation_result:
-                try:
-                    output_types = await asyncio.to_thread(self.get_output_types_from_code, result_content)
-                except Exception:  # noqa: BLE001
-                    await logger.aexception("Error while getting output types from code")
-                    output_types = [component_name_camelcase]
-            else:
-                output_types = [component_name_camelcase]
-
-            component_info = {
-                "name": component_name_camelcase,
-                "output_types": output_types,
-                "file": filename,
-                "code": result_content if validation_result else "",
-                "error": "" if validation_result else result_content,
-            }
             menu_result["components"].append(component_info)
 
             if menu_result not in response["menu"]:
@@ -352,6 +372,89 @@ class DirectoryReader:
         await logger.adebug("-------------------- Component menu list built --------------------")
         return response
 
+    async def _aget_component_infos_from_manifest(self, file_paths) -> list[tuple[dict, FileEntry | None]]:
+        """Returns the menu entry of every file and, for the files whose manifest entry must be updated, the new entry.
+
+        An entry is reused only if neither the file nor the other scanned files of its directory changed.
+        """
+        manifest_entries = await asyncio.to_thread(self.manifest.get_files)
+        states = await asyncio.gather(
+            *(self._afile_state(file_path, manifest_entries.get(file_path)) for file_path in file_paths)
+        )
+
+        file_hashes: dict[str, dict[str, str]] = {}
+        for file_path, state in zip(file_paths, states, strict=True):
+            if state is not None:
+                file_path_ = Path(file_path)
+                file_hashes.setdefault(str(file_path_.parent), {})[file_path_.name] = state[1]
+        self._directory_hashes = {directory: hash_directory(hashes) for directory, hashes in file_hashes.items()}
+
+        return await asyncio.gather(
+            *(
+                self._aget_component_info(file_path, manifest_entries.get(file_path), state)
+                for file_path, state in zip(file_paths, states, strict=True)
+            )
+        )
+
+    @staticmethod
+    async def _afile_state(file_path, entry: FileEntry | None) -> tuple[stat_result, str] | None:
+        """Returns the stat and content hash of a file, reading it only if it changed since its entry was stored."""
+        try:
+            stat = await anyio.Path(file_path).stat()
+            if entry is not None and entry.matches(stat):
+                return stat, entry.sha256
+            async with async_open(str(file_path), "rb") as file:
+                return stat, hash_content(await file.read())
+        except OSError:
+            return None
+
+    async def _aget_component_info(
+        self, file_path, entry: FileEntry | None, state: tuple[stat_result, str] | None
+    ) -> tuple[dict, FileEntry | None]:
+        if state is None:
+            return await self._abuild_component_info(file_path), None
+        stat, content_hash = state
+        directory_hash = self._directory_hashes[str(Path(file_path).parent)]
+        if entry is not None and entry.sha256 == content_hash and entry.directory_sha256 == directory_hash:
+            if entry.matches(stat):
+                return entry.component, None
+            # Touched or checked out again without changes
+            return entry.component, dataclasses.replace(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        component_info = await self._abuild_component_info(file_path)
+        return component_info, FileEntry(
+            str(file_path), stat.st_mtime_ns, stat.st_size, content_hash, directory_hash, component_info
+        )
+
+    async def _abuild_component_info(self, file_path) -> dict:
+        validation_result, result_content = await self.process_file_async(file_path)
+        if not validation_result:
+            await logger.aerror(f"Error while processing file {file_path}")
+
+        filename = Path(file_path).name
+        component_name = filename.split(".")[0]
+
+        if "_" in component_name:
+            component_name_camelcase = " ".join(word.title() for word in component_name.split("_"))
+        else:
+            component_name_camelcase = component_name
+
+        if validation_result:
+            try:
+                output_types = await asyncio.to_thread(self.get_output_types_from_code, result_content)
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error while getting output types from code")
+                output_types = [component_name_camelcase]
+        else:
+            output_types = [component_name_camelcase]
+
+        return {
+            "name": component_name_camelcase,
+            "output_types": output_types,
+            "file": filename,
+            "code": result_content if validation_result else "",
+            "error": "" if validation_result else result_content,
+        }
+
     @staticmethod
     def get_output_types_from_code(code: str) -> list:
         """Get the output types from the code."""
@@ -0,0 +1,216 @@
+"""Disk-backed manifest of scanned custom component files.
+
+Scanning ``components_path`` parses every file several times and builds each template by executing the
+component code. The manifest stores the menu entry of every file, keyed by path, mtime, size and content hash,
+and every built template, keyed by the hash of its code. Component files can import the other modules of their
+directory, so both are also keyed by a hash of the contents of the Python files scanned in that directory. Only
+files that changed since the last scan, or whose directory has a changed file, are processed again. Files that are
+not scanned, like ``__init__.py`` files and subpackages, are not part of the key.
+
+The manifest is a SQLite database in WAL mode, so every worker on the host reads and updates the same
+manifest. Entries are tied to the installed lfx version because templates depend on the base component
+classes. Any database error is treated as a cache miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import stat_result
+
+# Renamed whenever the schema changes, since tables are only created when missing
+MANIFEST_FILENAME = "component_manifest_v2.db"
+_BUSY_TIMEOUT_SECONDS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    directory_sha256 TEXT NOT NULL,
+    version TEXT NOT NULL,
+    component BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS templates (
+    code_sha256 TEXT NOT NULL,
+    version TEXT NOT NULL,
+    name TEXT NOT NULL,
+    template BLOB NOT NULL,
+    PRIMARY KEY (code_sha256, version)
+);
+"""
+_INSERT_FILE = (
+    "INSERT OR REPLACE INTO files (path, mtime_ns, size, sha256, directory_sha256, version, component) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_TEMPLATE = "INSERT OR REPLACE INTO templates (code_sha256, version, name, template) VALUES (?, ?, ?, ?)"
+
+
+def hash_content(content: bytes | str) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_directory(file_hashes: dict[str, str]) -> str:
+    """Returns the hash of a component directory from the content hashes of its files, by file name."""
+    return hash_content("".join(f"{name}\0{file_hashes[name]}\n" for name in sorted(file_hashes)))
+
+
+def _template_key(code: str, directory_sha256: str) -> str:
+    return hash_content(f"{directory_sha256}\0{code}")
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """The menu entry built for a component file, with the file and directory state it was built from."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    directory_sha256: str
+    component: dict[str, Any]
+
+    def matches(self, stat: stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+class ComponentManifest:
+    def __init__(self, path: str | Path, version: str) -> None:
+        self.path = Path(path)
+        self.version = version
+        self._initialized = False
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        # A short-lived connection per batch keeps the manifest safe to use from threads and forked workers
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return closing(connection)
+
+    def _transaction(self, statements: Iterator[tuple[str, tuple]]) -> None:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, parameters in statements:
+                    connection.execute(sql, parameters)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def get_files(self) -> dict[str, FileEntry]:
+        """Returns the stored menu entries built by the installed lfx version, by path."""
+        try:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    "SELECT path, mtime_ns, size, sha256, directory_sha256, component FROM files WHERE version = ?",
+                    (self.version,),
+                ).fetchall()
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug(f"Could not read the component manifest at {self.path}: {exc}")
+            return {}
+        return {
+            path: FileEntry(path, mtime_ns, size, sha256, directory_sha256, orjson.loads(component))
+            for path, mtime_ns, size, sha256, directory_sha256, component in rows
+        }
+
+    def put_files(self, entries: Iterable[FileEntry]) -> None:
+        def statements():
+            for entry in entries:
+                yield (
+                    _INSERT_FILE,
+                    (
+                        entry.path,
+                        entry.mtime_ns,
+                        entry.size,
+                        entry.sha256,
+                        entry.directory_sha256,
+                        self.version,
+                        orjson.dumps(entry.component),
+                    ),
+                )
+
+        try:
+            self._transaction(statements())
+        except (sqlite3.Error, OSError, TypeError) as exc:
+            logger.debug(f"Could not update the component manifest at {self.path}: {exc}")
+
+    def get_templates(self, codes: Iterable[tuple[str, str]]) -> dict[tuple[str, str], tuple[str, dict]]:
+        """Returns the stored ``(component_name, template)`` pairs for the given component codes.
+
+        Codes are given and returned as ``(code, directory_sha256)`` pairs, with the `hash_directory` of the
+        directory of the component file.
+        """
+        hashes = {_template_key(code, directory_sha256): (code, directory_sha256) for code, directory_sha256 in codes}
+        if not hashes:
+            return {}
+        try:
+            with self._connect() as connection:
+                connection.execute("CREATE TEMP TABLE wanted (code_sha256 TEXT PRIMARY KEY)")
+                connection.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((key,) for key in hashes))
+                rows = connection.execute(
+                    "SELECT templates.code_sha256, name, template FROM templates "
+                    "JOIN wanted USING (code_sha256) WHERE version = ?",
+                    (self.version,),
+                ).fetchall()
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug(f"Could not read the component manifest at {self.path}: {exc}")
+            return {}
+        return {hashes[code_sha256]: (name, orjson.loads(template)) for code_sha256, name, template in rows}
+
+    def put_templates(self, templates: dict[tuple[str, str], tuple[str, dict]]) -> None:
+        """Stores built templates by ``(code, directory_sha256)``, skipping those that are not JSON-serializable."""
+
+        def statements():
+            # Templates built by other lfx versions can no longer be served
+            yield "DELETE FROM templates WHERE version != ?", (self.version,)
+            for (code, directory_sha256), (name, template) in templates.items():
+                try:
+                    payload = orjson.dumps(template)
+                except TypeError:
+                    continue
+                yield (
+                    _INSERT_TEMPLATE,
+                    (_template_key(code, directory_sha256), self.version, name, payload),
+                )
+
+        try:
+            self._transaction(statements())
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug(f"Could not update the component manifest at {self.path}: {exc}")
+
+
+def get_component_manifest() -> ComponentManifest | None:
+    """Returns the manifest shared by all workers on this host, or None when it is disabled."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    from platformdirs import user_cache_dir
+
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None or not settings_service.settings.components_manifest:
+        return None
+    try:
+        lfx_version = version("lfx")
+    except PackageNotFoundError:
+        return None
+    return ComponentManifest(Path(user_cache_dir("lfx", "vetrai")) / MANIFEST_FILENAME, lfx_version)
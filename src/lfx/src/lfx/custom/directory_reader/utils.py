@@ -1,6 +1,7 @@
 import asyncio
 
 from lfx.custom.directory_reader.directory_reader import DirectoryReader
+from lfx.custom.directory_reader.manifest import ComponentManifest
 from lfx.log.logger import logger
 from lfx.template.frontend_node.custom_components import CustomComponentFrontendNode
 
@@ -82,10 +83,13 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+async def abuild_custom_component_list_from_path(path: str, manifest: ComponentManifest | None = None):
+    """Build a list of custom components for the langchain from a given path.
+
+    Files that did not change since they were recorded in the manifest are not parsed or built again.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
-    reader = DirectoryReader(path, compress_code_field=False)
+    reader = DirectoryReader(path, compress_code_field=False, manifest=manifest)
 
     valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
 
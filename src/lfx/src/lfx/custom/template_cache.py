@@ -0,0 +1,120 @@
+"""Templates, code trees and validation results of component code, shared by the requests of a process.
+
+Editing a component in the UI sends a request on every change: `/custom_component` and `/custom_component/update`
+build the frontend template of the component, which evaluates its code several times, and `/validate/code` imports
+and executes it again. Most of these requests carry code that was already built a moment before, for instance when
+only a field value changed.
+
+The cache keeps what was built from a piece of code, keyed by a hash of the code, so changed code is always built
+again. Templates are also keyed by the user, since building them instantiates the component for that user. Entries
+expire after `ttl` seconds, which bounds how stale they can be when something outside the code changes, like the
+installed packages. Concurrent requests for the same missing entry wait for one of them to build it.
+
+Cached values are shared, so callers must copy the ones they mutate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+
+def code_hash(code: str) -> str:
+    """Return the key of a piece of component code."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class TemplateCache:
+    """A TTL and LRU bounded cache of values built from component code, with coalescing of concurrent builds.
+
+    Args:
+        ttl: Seconds after which an entry is built again. 0 disables the cache, so every call builds its value.
+        maxsize: Maximum number of entries. The least recently used ones are evicted first.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self._entries: TTLCache = TTLCache(maxsize=max(maxsize, 1), ttl=max(ttl, 0))
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, kind: str, code: str, build: Callable[[], T], *key: Hashable) -> T:
+        """Return the `kind` value of `code`, building it with `build` if it is not cached.
+
+        `key` holds whatever else the value depends on, like the user it was built for. Exceptions raised by
+        `build` are not cached.
+        """
+        if self.ttl <= 0:
+            return build()
+
+        cache_key = (kind, code_hash(code), *key)
+        with self._lock:
+            value = self._entries.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+        # Requests that need the same missing value wait for one of them to build it
+        with key_lock:
+            with self._lock:
+                value = self._entries.get(cache_key, _MISSING)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+            try:
+                value = build()
+                with self._lock:
+                    self._entries[cache_key] = value
+                    self.misses += 1
+            finally:
+                with self._lock:
+                    self._key_locks.pop(cache_key, None)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_template_cache: TemplateCache | None = None
+_template_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """Return the template cache of the process, configured from the settings on first use."""
+    global _template_cache  # noqa: PLW0603
+    with _template_cache_lock:
+        if _template_cache is None:
+            from lfx.services.deps import get_settings_service
+
+            settings_service = get_settings_service()
+            if settings_service is None:
+                _template_cache = TemplateCache()
+            else:
+                settings = settings_service.settings
+                _template_cache = TemplateCache(
+                    ttl=settings.component_template_cache_ttl, maxsize=settings.component_template_cache_size
+                )
+        return _template_cache
+
+
+def clear_template_cache() -> None:
+    """Drop every cached template, code tree and validation result of the process."""
+    global _template_cache  # noqa: PLW0603
+    with _template_cache_lock:
+        _template_cache = None
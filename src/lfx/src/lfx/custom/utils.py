@@ -4,6 +4,7 @@ from __future__ import annotations
 import ast
 import asyncio
 import contextlib
+import copy
 import hashlib
 import inspect
 import re
@@ -18,6 +19,7 @@ from lfx.custom import validate
 from lfx.custom.custom_component.component import Component
 from lfx.custom.custom_component.custom_component import CustomComponent
 from lfx.custom.dependency_analyzer import analyze_component_dependencies
+from lfx.custom.directory_reader.manifest import get_component_manifest
 from lfx.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
     build_custom_component_list_from_path,
@@ -25,6 +27,7 @@ from lfx.custom.directory_reader.utils import (
 )
 from lfx.custom.eval import eval_custom_component_code
 from lfx.custom.schema import MissingDefault
+from lfx.custom.template_cache import get_template_cache
 from lfx.field_typing.range_spec import RangeSpec
 from lfx.helpers.custom import format_type
 from lfx.log.logger import logger
@@ -549,10 +552,40 @@ def build_custom_component_template(
     base classes, and output types, reorders fields, and returns the resulting template dictionary
     along with the component instance.
 
+    Templates of components built from code are cached by code and user, so only the first request for a piece of
+    code evaluates it.
+
     Raises:
         HTTPException: If the component is missing required attributes or if any error occurs during
                       template construction.
     """
+    code = custom_component._code
+    if type(custom_component).__name__ not in _COMPONENT_TYPE_NAMES or not isinstance(code, str):
+        return _build_custom_component_template(custom_component, user_id=user_id, module_name=module_name)
+
+    built: list[tuple[dict[str, Any], CustomComponent | Component]] = []
+
+    def build() -> tuple[dict[str, Any], type[Component] | None]:
+        template, instance = _build_custom_component_template(
+            custom_component, user_id=user_id, module_name=module_name
+        )
+        built.append((template, instance))
+        # Components built from inputs can be instantiated again from their class, others are built again
+        return copy.deepcopy(template), type(instance) if isinstance(instance, Component) else None
+
+    template, component_class = get_template_cache().get_or_build("template", code, build, str(user_id), module_name)
+    if built:
+        return built[0]
+    if component_class is None:
+        return _build_custom_component_template(custom_component, user_id=user_id, module_name=module_name)
+    return copy.deepcopy(template), component_class(_user_id=user_id, _code=code)
+
+
+def _build_custom_component_template(
+    custom_component: CustomComponent,
+    user_id: str | UUID | None = None,
+    module_name: str | None = None,
+) -> tuple[dict[str, Any], CustomComponent | Component]:
     try:
         has_template_config = hasattr(custom_component, "template_config")
     except Exception as exc:
@@ -670,6 +703,7 @@ async def abuild_custom_components(components_paths: list[str]):
         return {}
 
     await logger.adebug(f"Building custom components from {components_paths}")
+    manifest = get_component_manifest()
     custom_components_from_file: dict = {}
     processed_paths = set()
     for path in components_paths:
@@ -677,7 +711,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, manifest=manifest)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             await logger.adebug(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
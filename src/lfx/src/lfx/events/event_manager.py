@@ -5,8 +5,9 @@ import json
 import time
 import uuid
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
 
@@ -25,10 +26,60 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+class Event(NamedTuple):
+    """An event passed to a consumer in the same process, with its data as the producer sent it."""
+
+    type: str
+    data: Any
+
+
+def encode_event_json(event_type: str, data: LoggableType) -> bytes:
+    json_data = {"event": event_type, "data": jsonable_encoder(data)}
+    return (json.dumps(json_data) + "\n\n").encode("utf-8")
+
+
+def encode_event_orjson(event_type: str, data: LoggableType) -> bytes:
+    """Encodes an event with orjson, only converting the values orjson cannot encode natively."""
+    try:
+        return (
+            orjson.dumps(
+                {"event": event_type, "data": data},
+                default=jsonable_encoder,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+            + b"\n\n"
+        )
+    except TypeError:
+        # Payloads orjson rejects, such as integers beyond 64 bits
+        return encode_event_json(event_type, data)
+
+
+def encode_event_structured(event_type: str, data: LoggableType) -> Event:
+    """Passes the event without encoding it, for consumers that read the queue in the same process.
+
+    The data is not copied, so consumers must not mutate it.
+    """
+    return Event(event_type, data)
+
+
+_ENCODERS = {"json": encode_event_json, "orjson": encode_event_orjson, "structured": encode_event_structured}
+
+
+def _get_event_encoder() -> str:
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return "json"
+    return settings_service.settings.event_encoder
+
+
 class EventManager:
-    def __init__(self, queue):
+    def __init__(self, queue, *, encoder: str | None = None):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        encoder = encoder or _get_event_encoder()
+        self._encode = _ENCODERS.get(encoder, encode_event_json)
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -71,13 +122,11 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
+        str_data = self._encode(event_type, data)
         if self.queue:
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+                self.queue.put_nowait((event_id, str_data, time.time()))
             except Exception:  # noqa: BLE001
                 logger.debug("Queue not available for event")
 
@@ -99,11 +148,12 @@ def create_default_event_manager(queue=None):
     manager.register_event("on_end_vertex", "end_vertex")
     manager.register_event("on_build_start", "build_start")
     manager.register_event("on_build_end", "build_end")
+    manager.register_event("on_result_cache", "result_cache")
     return manager
 
 
-def create_stream_tokens_event_manager(queue=None):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue=None, *, encoder: str | None = None):
+    manager = EventManager(queue, encoder=encoder)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
@@ -111,4 +161,5 @@ def create_stream_tokens_event_manager(queue=None):
     manager.register_event("on_error", "error")
     manager.register_event("on_build_start", "build_start")
     manager.register_event("on_build_end", "build_end")
+    manager.register_event("on_result_cache", "result_cache")
     return manager
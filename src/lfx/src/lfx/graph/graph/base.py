@@ -21,8 +21,10 @@ from lfx.events.observability.lifecycle_events import observable
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.diff import diff_graph_data
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from lfx.graph.graph.snapshots import SnapshotRecorder
 from lfx.graph.graph.state_model import create_state_model_from_graph
 from lfx.graph.graph.utils import (
     find_all_cycle_edges,
@@ -41,7 +43,7 @@ from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from lfx.services.cache.utils import CacheMiss
-from lfx.services.deps import get_chat_service, get_tracing_service
+from lfx.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -108,7 +110,9 @@ class Graph:
         # Conditional routing system (separate from ACTIVE/INACTIVE cycle management)
         self.conditionally_excluded_vertices: set = set()  # Vertices excluded by conditional routing
         self.conditional_exclusion_sources: dict[str, set[str]] = {}  # Maps source vertex -> excluded vertices
-        self.edges: list[CycleEdge] = []
+        self._edges_by_source: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_target: dict[str, list[CycleEdge]] = defaultdict(list)
+        self.edges = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -127,8 +131,10 @@ class Graph:
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
-        self._call_order: list[str] = []
-        self._snapshots: list[dict[str, Any]] = []
+        # Execution snapshots and their call order are only recorded when enabled, see `enable_snapshots`
+        self._call_order: deque[str] = deque(maxlen=0)
+        self._snapshots: SnapshotRecorder | None = None
+        self._snapshot_limit: int | None = None
         self._end_trace_tasks: set[asyncio.Task] = set()
         self._is_subgraph = False
 
@@ -896,7 +902,7 @@ class Graph:
                 event_manager=event_manager,
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
-            await logger.adebug(f"Run outputs: {run_output_object}")
+            await logger.adebug("Run outputs: %s", run_output_object)
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
@@ -1046,10 +1052,35 @@ class Graph:
             # After the first level, exclude all descendants
             self._exclude_branch_conditionally(child_id, visited, excluded, output_name=None, skip_first=False)
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        """The edges of the graph.
+
+        Assigning a new list rebuilds the source and target indexes used for edge lookups,
+        so the list must not be mutated in place. Use ``_append_edge`` to add a single edge.
+        """
+        return self._edge_list
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._edge_list = edges
+        self._edges_by_source = defaultdict(list)
+        self._edges_by_target = defaultdict(list)
+        for edge in edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        self._edges_by_source[edge.source_id].append(edge)
+        self._edges_by_target[edge.target_id].append(edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        self._edge_list.append(edge)
+        self._index_edge(edge)
+
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
+        for edge in self._edges_by_source.get(source_id, []):
+            if edge.target_id == target_id:
                 return edge
         return None
 
@@ -1138,11 +1169,81 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._call_order = deque(maxlen=0)
+        self._snapshots = None
+        self._snapshot_limit = None
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
+    def get_run_state(self) -> dict[str, Any] | None:
+        """Returns the state of the current run without the objects the graph is built from.
+
+        Unlike `__getstate__`, the vertices, edges and components are not included: `from_run_state` builds them
+        again from the flow data and restores the run progress and the outputs of the built vertices onto them.
+        Returns None for graphs that were not created from flow data, which cannot be rebuilt this way.
+        """
+        if getattr(self, "_start", None) is not None or not self.raw_graph_data["nodes"]:
+            return None
+        return {
+            "flow_id": self.flow_id,
+            "flow_name": self.flow_name,
+            "description": self.description,
+            "user_id": self.user_id,
+            "raw_graph_data": self.raw_graph_data,
+            "run_id": self._run_id,
+            "prepared": self._prepared,
+            "run_manager": self.run_manager.to_dict(),
+            "inactivated_vertices": self.inactivated_vertices,
+            "inactive_vertex_ids": [vertex.id for vertex in self.vertices if not vertex.is_active()],
+            "activated_vertices": self.activated_vertices,
+            "vertices_layers": self.vertices_layers,
+            "vertices_to_run": self.vertices_to_run,
+            "stop_vertex": self.stop_vertex,
+            "run_queue": list(self._run_queue),
+            "first_layer": self._first_layer,
+            "sorted_vertices_layers": self._sorted_vertices_layers,
+            "vertex_builds": {vertex.id: vertex.get_build_state() for vertex in self.vertices if vertex.built},
+        }
+
+    @classmethod
+    def from_run_state(cls, state: dict[str, Any]) -> Graph:
+        """Creates a graph from the flow data in a `get_run_state` state and restores its run onto it."""
+        graph = cls.from_payload(
+            state["raw_graph_data"],
+            flow_id=state["flow_id"],
+            flow_name=state["flow_name"],
+            user_id=state["user_id"],
+        )
+        graph.description = state["description"]
+        graph.set_run_id(state["run_id"])
+        graph._prepared = state["prepared"]  # noqa: SLF001
+        run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+        run_manager.cycle_vertices = graph.run_manager.cycle_vertices
+        graph.run_manager = run_manager
+        graph.inactivated_vertices = state["inactivated_vertices"]
+        graph.activated_vertices = state["activated_vertices"]
+        graph.vertices_layers = state["vertices_layers"]
+        graph.vertices_to_run = state["vertices_to_run"]
+        graph.stop_vertex = state["stop_vertex"]
+        graph._run_queue = deque(state["run_queue"])  # noqa: SLF001
+        graph._first_layer = state["first_layer"]  # noqa: SLF001
+        graph._sorted_vertices_layers = state["sorted_vertices_layers"]  # noqa: SLF001
+        for vertex_id in state["inactive_vertex_ids"]:
+            graph.vertex_map[vertex_id].state = VertexStates.INACTIVE
+        for vertex_id, build_state in state["vertex_builds"].items():
+            vertex = graph.vertex_map[vertex_id]
+            try:
+                vertex.restore_build_state(build_state)
+            except Exception:  # noqa: BLE001
+                # The vertex is built again when it is needed
+                logger.debug("Error restoring the build of vertex %s", vertex_id, exc_info=True)
+                vertex.built = False
+        return graph
+
     @classmethod
     def from_payload(
         cls,
@@ -1287,6 +1388,107 @@ class Graph:
             vertex.set_top_level(self.top_level_vertices)
         self.reset_all_edges_of_vertex(vertex)
 
+    def patch(self, payload: dict, context: dict | None = None) -> set[str] | None:
+        """Updates the graph to a new version of its flow, rebuilding only what changed.
+
+        Vertices that were added or whose data changed are created again. Their components, and those of the
+        vertices whose inputs were rewired and of all their descendants, are instantiated again; the other vertices
+        keep their component instances, reset with `reset_run_state`. Edges are rebuilt from the payload, and the
+        run state of the graph and of every vertex is reset, so the graph runs like a graph built with
+        `from_payload`.
+
+        Args:
+            payload: The new version of the flow.
+            context: Optional context dictionary for request-specific data.
+
+        Returns:
+            The ids of the vertices created again, of the vertices whose inputs were rewired and of their
+            descendants, or None if the graph cannot be patched, for instance because the flow has cycles or
+            Listen/Notify components. The caller should then build a new graph from the payload.
+        """
+        if "data" in payload:
+            payload = payload["data"]
+        graph_data = process_flow({"nodes": payload["nodes"], "edges": payload["edges"]})
+        new_nodes = [node for node in graph_data["nodes"] if node.get("type") != NodeTypeEnum.NoteNode]
+        new_edges = graph_data["edges"]
+        edge_tuples = [(e["data"]["sourceHandle"]["id"], e["data"]["targetHandle"]["id"]) for e in new_edges]
+        if (
+            self._is_subgraph
+            or self.cycle_vertices
+            or find_cycle_vertices(edge_tuples)
+            or any(node["id"].split("-", maxsplit=1)[0] in {"Listen", "Notify"} for node in new_nodes)
+        ):
+            return None
+
+        diff = diff_graph_data(self._vertices, self._edges, new_nodes, new_edges)
+        kept = {
+            vertex.id: vertex
+            for vertex in self.vertices
+            if vertex.id not in diff.removed_nodes and vertex.id not in diff.changed_nodes
+        }
+
+        self.raw_graph_data = {"nodes": payload["nodes"], "edges": payload["edges"]}
+        self._graph_data = graph_data
+        self._vertices = graph_data["nodes"]
+        self._edges = new_edges
+        self._cycle_vertices = None
+        self._cycles = None
+        self._is_cyclic = None
+        self.top_level_vertices = [node["id"] for node in payload["nodes"] if node.get("id")]
+
+        self.vertices = []
+        self.vertex_map = {}
+        for node in new_nodes:
+            self._add_vertex(kept.get(node["id"]) or self._create_vertex(node))
+        self.edges = self._build_edges()
+        self.build_graph_maps()
+        self._is_input_vertices = []
+        self._is_output_vertices = []
+        self._is_state_vertices = None
+        self.has_session_id_vertices = []
+        self.define_vertices_lists()
+
+        for vertex in self.vertices:
+            vertex.set_top_level(self.top_level_vertices)
+            vertex.reset_build_state()
+
+        affected = set(diff.added_nodes | diff.changed_nodes) | (diff.rewired_nodes & self.vertex_map.keys())
+        for vertex_id in list(affected):
+            affected.update(successor.id for successor in self.get_all_successors(self.vertex_map[vertex_id]))
+        for vertex in self.vertices:
+            if vertex.id in affected:
+                vertex.custom_component = None
+                vertex.instantiate_component(self.user_id)
+            elif vertex.custom_component is not None:
+                # State a component kept during the previous run, like a built vector store, must not leak into
+                # the next one
+                vertex.custom_component.reset_run_state()
+
+        self._reset_run_state(context)
+        self.increment_update_count()
+        return affected
+
+    def _reset_run_state(self, context: dict | None = None) -> None:
+        """Resets the state that a run leaves on the graph and on the components of its vertices."""
+        self._prepared = False
+        self._start_time = datetime.now(timezone.utc)
+        self._state_model = None
+        self._context = dotdict(context or {})
+        self.inactivated_vertices = set()
+        self.activated_vertices = []
+        self.vertices_layers = []
+        self.vertices_to_run = set()
+        self.stop_vertex = None
+        self.inactive_vertices = set()
+        self.conditionally_excluded_vertices = set()
+        self.conditional_exclusion_sources = {}
+        self.run_manager = RunnableVerticesManager()
+        self._sorted_vertices_layers = []
+        self._run_queue = deque()
+        self._first_layer = []
+        self._call_order.clear()
+        self._reset_all_output_values()
+
     def reset_all_edges_of_vertex(self, vertex: Vertex) -> None:
         """Resets all the edges of a vertex."""
         for edge in vertex.edges:
@@ -1310,8 +1512,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._edges_by_source.get(edge.source_id, [])
+            ):
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1488,10 +1694,43 @@ class Graph:
             }
         )
 
+    def enable_snapshots(self, max_snapshots: int) -> None:
+        """Records the execution state after every step, keeping at most ``max_snapshots`` of them.
+
+        Overrides the `graph_snapshots_limit` setting for this graph. Pass 0 to disable recording.
+        """
+        self._snapshot_limit = max(max_snapshots, 0)
+        self._snapshots = SnapshotRecorder(self._snapshot_limit) if self._snapshot_limit else None
+        self._call_order = deque(self._call_order, maxlen=self._snapshot_limit)
+
+    def get_snapshots(self) -> list[dict[str, Any]]:
+        """Returns the recorded execution snapshots, oldest first, in the layout of `get_snapshot`."""
+        return self._snapshots.snapshots() if self._snapshots is not None else []
+
+    def _snapshot_state(self) -> dict[str, Any]:
+        run_manager = self.run_manager
+        return {
+            "run_map": {key: frozenset(value) for key, value in run_manager.run_map.items()},
+            "run_predecessors": {key: frozenset(value) for key, value in run_manager.run_predecessors.items()},
+            "vertices_to_run": frozenset(run_manager.vertices_to_run),
+            "vertices_being_run": frozenset(run_manager.vertices_being_run),
+            "ran_at_least_once": frozenset(run_manager.ran_at_least_once),
+            "run_queue": tuple(self._run_queue),
+            "vertices_layers": tuple(tuple(layer) for layer in self.vertices_layers),
+            "first_layer": tuple(self._first_layer),
+            "inactive_vertices": frozenset(self.inactive_vertices),
+            "activated_vertices": tuple(self.activated_vertices),
+        }
+
     def _record_snapshot(self, vertex_id: str | None = None) -> None:
-        self._snapshots.append(self.get_snapshot())
+        if self._snapshot_limit is None:
+            settings_service = get_settings_service()
+            limit = settings_service.settings.graph_snapshots_limit if settings_service else 0
+            self.enable_snapshots(limit)
         if vertex_id:
             self._call_order.append(vertex_id)
+        if self._snapshots is not None:
+            self._snapshots.record(self._snapshot_state(), vertex_id)
 
     def step(
         self,
@@ -1565,14 +1804,8 @@ class Graph:
                     try:
                         cached_vertex_dict = cached_result["result"]
                         # Now set update the vertex with the cached vertex
-                        vertex.built = cached_vertex_dict["built"]
-                        vertex.artifacts = cached_vertex_dict["artifacts"]
-                        vertex.built_object = cached_vertex_dict["built_object"]
-                        vertex.built_result = cached_vertex_dict["built_result"]
-                        vertex.full_data = cached_vertex_dict["full_data"]
-                        vertex.results = cached_vertex_dict["results"]
                         try:
-                            vertex.finalize_build()
+                            vertex.restore_build_state(cached_vertex_dict)
 
                             if vertex.result is not None:
                                 vertex.result.used_frozen_result = True
@@ -1593,16 +1826,7 @@ class Graph:
                     event_manager=event_manager,
                 )
                 if set_cache is not None:
-                    vertex_dict = {
-                        "built": vertex.built,
-                        "results": vertex.results,
-                        "artifacts": vertex.artifacts,
-                        "built_object": vertex.built_object,
-                        "built_result": vertex.built_result,
-                        "full_data": vertex.full_data,
-                    }
-
-                    await set_cache(key=vertex.id, data=vertex_dict)
+                    await set_cache(key=vertex.id, data=vertex.get_build_state())
 
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
@@ -1632,22 +1856,26 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        edges: list[CycleEdge] = []
+        if is_source is not False:
+            edges.extend(self._edges_by_source.get(vertex_id, []))
+        if is_target is not False:
+            # Self-loops are already included as outgoing edges
+            edges.extend(
+                edge
+                for edge in self._edges_by_target.get(vertex_id, [])
+                if is_source is False or edge.source_id != vertex_id
+            )
+        return edges
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, []):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
     async def process(
@@ -1700,7 +1928,7 @@ class Graph:
                 tasks.append(task)
                 vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
 
-            await logger.adebug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
+            await logger.adebug("Running layer %s with %s tasks, %s", layer_index, len(tasks), current_batch)
             try:
                 next_runnable_vertices = await self._execute_tasks(
                     tasks, lock=lock, has_webhook_component=has_webhook_component
@@ -1861,7 +2089,7 @@ class Graph:
             # This could usually happen with input vertices like ChatInput
             self.run_manager.remove_vertex_from_runnables(v.id)
 
-            await logger.adebug(f"Vertex {v.id}, result: {v.built_result}, object: {v.built_object}")
+            await logger.adebug("Vertex %s, result: %s, object: %s", v.id, v.built_result, v.built_object)
 
         for v in vertices:
             next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=v, cache=False)
@@ -2009,21 +2237,14 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
-            if edge.source_id == vertex.id:
-                neighbor = self.get_vertex(edge.target_id)
-                if neighbor is None:
-                    continue
-                if neighbor not in neighbors:
-                    neighbors[neighbor] = 0
-                neighbors[neighbor] += 1
-            elif edge.target_id == vertex.id:
-                neighbor = self.get_vertex(edge.source_id)
-                if neighbor is None:
-                    continue
-                if neighbor not in neighbors:
-                    neighbors[neighbor] = 0
-                neighbors[neighbor] += 1
+        for edge in self.get_vertex_edges(vertex.id):
+            neighbor_id = edge.target_id if edge.source_id == vertex.id else edge.source_id
+            neighbor = self.get_vertex(neighbor_id)
+            if neighbor is None:
+                continue
+            if neighbor not in neighbors:
+                neighbors[neighbor] = 0
+            neighbors[neighbor] += 1
         return neighbors
 
     @property
@@ -0,0 +1,74 @@
+"""Structural differences between two versions of a flow.
+
+`Graph.patch` uses them to update a built graph to the version of a flow the user just edited, instead of building
+a new graph and instantiating every component again.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from lfx.graph.vertex.schema import NodeTypeEnum
+
+if TYPE_CHECKING:
+    from lfx.graph.edge.schema import EdgeData
+    from lfx.graph.vertex.schema import NodeData
+
+# Keys of a node that only describe how the node is drawn, and have no effect on the graph
+_LAYOUT_KEYS = frozenset({"position", "positionAbsolute", "selected", "dragging", "measured", "width", "height"})
+
+EdgeKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class GraphDiff:
+    """The nodes and edges that differ between two versions of a flow."""
+
+    added_nodes: frozenset[str]
+    removed_nodes: frozenset[str]
+    changed_nodes: frozenset[str]
+    """Nodes of both versions whose data differs."""
+    added_edges: frozenset[EdgeKey]
+    removed_edges: frozenset[EdgeKey]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes or self.removed_nodes or self.changed_nodes or self.added_edges or self.removed_edges
+        )
+
+    @property
+    def rewired_nodes(self) -> set[str]:
+        """The nodes that gained or lost an incoming edge."""
+        return {target for _, target, _ in self.added_edges | self.removed_edges}
+
+
+def node_state(node: NodeData) -> dict:
+    """Return the keys of `node` that the graph is built from, without the layout of the node."""
+    return {key: value for key, value in node.items() if key not in _LAYOUT_KEYS}
+
+
+def edge_key(edge: EdgeData) -> EdgeKey:
+    """Return what identifies an edge: its source, its target and the handles it connects."""
+    return edge["source"], edge["target"], json.dumps(edge.get("data"), sort_keys=True, default=str)
+
+
+def diff_graph_data(
+    old_nodes: list[NodeData], old_edges: list[EdgeData], new_nodes: list[NodeData], new_edges: list[EdgeData]
+) -> GraphDiff:
+    """Compare two versions of the processed nodes and edges of a flow. Note nodes are ignored."""
+    old = {node["id"]: node for node in old_nodes if node.get("type") != NodeTypeEnum.NoteNode}
+    new = {node["id"]: node for node in new_nodes if node.get("type") != NodeTypeEnum.NoteNode}
+    old_edge_keys = {edge_key(edge) for edge in old_edges}
+    new_edge_keys = {edge_key(edge) for edge in new_edges}
+    return GraphDiff(
+        added_nodes=frozenset(new.keys() - old.keys()),
+        removed_nodes=frozenset(old.keys() - new.keys()),
+        changed_nodes=frozenset(
+            node_id for node_id in new.keys() & old.keys() if node_state(new[node_id]) != node_state(old[node_id])
+        ),
+        added_edges=frozenset(new_edge_keys - old_edge_keys),
+        removed_edges=frozenset(old_edge_keys - new_edge_keys),
+    )
@@ -1,10 +1,20 @@
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+
+def _to_sets(mapping: Mapping[str, Iterable[str]]) -> defaultdict[str, set[str]]:
+    """Copies an adjacency mapping into sets, accepting the list-based layout of older cached states."""
+    result: defaultdict[str, set[str]] = defaultdict(set)
+    for key, values in mapping.items():
+        result[key] = set(values)
+    return result
 
 
 class RunnableVerticesManager:
     def __init__(self) -> None:
-        self.run_map: dict[str, list[str]] = defaultdict(list)  # Tracks successors of each vertex
-        self.run_predecessors: dict[str, list[str]] = defaultdict(list)  # Tracks predecessors for each vertex
+        self.run_map: dict[str, set[str]] = defaultdict(set)  # Tracks successors of each vertex
+        # Tracks the pending predecessors of each vertex; its size is the vertex's remaining in-degree
+        self.run_predecessors: dict[str, set[str]] = defaultdict(set)
         self.vertices_to_run: set[str] = set()  # Set of vertices that are ready to run
         self.vertices_being_run: set[str] = set()  # Set of vertices that are currently running
         self.cycle_vertices: set[str] = set()  # Set of vertices that are in a cycle
@@ -22,8 +32,8 @@ class RunnableVerticesManager:
     @classmethod
     def from_dict(cls, data: dict) -> "RunnableVerticesManager":
         instance = cls()
-        instance.run_map = data["run_map"]
-        instance.run_predecessors = data["run_predecessors"]
+        instance.run_map = _to_sets(data["run_map"])
+        instance.run_predecessors = _to_sets(data["run_predecessors"])
         instance.vertices_to_run = data["vertices_to_run"]
         instance.vertices_being_run = data["vertices_being_run"]
         instance.ran_at_least_once = data.get("ran_at_least_once", set())
@@ -39,8 +49,8 @@ class RunnableVerticesManager:
         }
 
     def __setstate__(self, state: dict) -> None:
-        self.run_map = state["run_map"]
-        self.run_predecessors = state["run_predecessors"]
+        self.run_map = _to_sets(state["run_map"])
+        self.run_predecessors = _to_sets(state["run_predecessors"])
         self.vertices_to_run = state["vertices_to_run"]
         self.vertices_being_run = state["vertices_being_run"]
         self.ran_at_least_once = state["ran_at_least_once"]
@@ -49,7 +59,7 @@ class RunnableVerticesManager:
         return all(not value for value in self.run_predecessors.values())
 
     def update_run_state(self, run_predecessors: dict, vertices_to_run: set) -> None:
-        self.run_predecessors.update(run_predecessors)
+        self.run_predecessors.update(_to_sets(run_predecessors))
         self.vertices_to_run.update(vertices_to_run)
         self.build_run_map(self.run_predecessors, self.vertices_to_run)
 
@@ -79,14 +89,13 @@ class RunnableVerticesManager:
             bool: True if all predecessor conditions are met, False otherwise
         """
         # Get pending predecessors, return True if none exist
-        pending = self.run_predecessors.get(vertex_id, [])
-        if not pending:
+        pending_set = self.run_predecessors.get(vertex_id)
+        if not pending_set:
             return True
 
         # For cycle vertices, check if any pending predecessors are also in cycle
         # Using set intersection is faster than iteration
         if vertex_id in self.cycle_vertices:
-            pending_set = set(pending)
             running_predecessors = pending_set & self.vertices_being_run
 
             # If this vertex has already run at least once, be strict: wait until NOTHING is pending or running
@@ -100,19 +109,20 @@ class RunnableVerticesManager:
         return False
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
-        """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
-        for predecessor in predecessors:
-            if vertex_id in self.run_predecessors[predecessor]:
-                self.run_predecessors[predecessor].remove(vertex_id)
+        """Removes a vertex from the pending predecessors of its successors."""
+        for successor in self.run_map.get(vertex_id, ()):
+            pending = self.run_predecessors.get(successor)
+            if pending:
+                pending.discard(vertex_id)
 
     def build_run_map(self, predecessor_map, vertices_to_run) -> None:
         """Builds a map of vertices and their runnable successors."""
-        self.run_map = defaultdict(list)
+        self.run_map = defaultdict(set)
         for vertex_id, predecessors in predecessor_map.items():
             for predecessor in predecessors:
-                self.run_map[predecessor].append(vertex_id)
-        self.run_predecessors = predecessor_map.copy()
+                self.run_map[predecessor].add(vertex_id)
+        # Copy into fresh sets so the graph's predecessor map is not mutated as vertices complete
+        self.run_predecessors = _to_sets(predecessor_map)
         self.vertices_to_run = vertices_to_run
 
     def update_vertex_run_state(self, vertex_id: str, *, is_runnable: bool) -> None:
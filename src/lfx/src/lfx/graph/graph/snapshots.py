@@ -0,0 +1,109 @@
+"""Bounded, delta-based recording of graph execution state for debugging and replay.
+
+Recording is off by default. When enabled, the first snapshot is stored in full and every later step only
+stores the fields that changed since the previous step. Snapshots are kept in a ring buffer: once the limit
+is reached, the oldest delta is folded into the base snapshot so memory stays bounded by the limit.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Fields holding a vertex id -> vertex ids mapping, diffed per vertex instead of as a whole
+_MAPPING_FIELDS = ("run_map", "run_predecessors")
+_RUN_MANAGER_FIELDS = ("run_map", "run_predecessors", "vertices_to_run", "vertices_being_run", "ran_at_least_once")
+
+# Captured states hold immutable values (tuples, frozensets) so unchanged fields are shared between snapshots
+_State = dict[str, Any]
+_Delta = dict[str, Any]
+
+
+def _diff(previous: _State, current: _State) -> _Delta:
+    delta: _Delta = {}
+    for field, value in current.items():
+        old = previous[field]
+        if field in _MAPPING_FIELDS:
+            changed = {key: item for key, item in value.items() if old.get(key) != item}
+            removed = [key for key in old if key not in value]
+            if changed or removed:
+                delta[field] = (changed, removed)
+        elif old != value:
+            delta[field] = value
+    return delta
+
+
+def _apply(state: _State, delta: _Delta) -> _State:
+    result = dict(state)
+    for field, value in delta.items():
+        if field in _MAPPING_FIELDS:
+            changed, removed = value
+            mapping = {**state[field], **changed}
+            for key in removed:
+                mapping.pop(key, None)
+            result[field] = mapping
+        else:
+            result[field] = value
+    return result
+
+
+def _to_snapshot(state: _State) -> dict[str, Any]:
+    """Expands a captured state into the layout returned by ``Graph.get_snapshot``."""
+    return {
+        "run_manager": {
+            field: (
+                {key: set(value) for key, value in state[field].items()}
+                if field in _MAPPING_FIELDS
+                else set(state[field])
+            )
+            for field in _RUN_MANAGER_FIELDS
+        },
+        "run_queue": deque(state["run_queue"]),
+        "vertices_layers": [list(layer) for layer in state["vertices_layers"]],
+        "first_layer": list(state["first_layer"]),
+        "inactive_vertices": set(state["inactive_vertices"]),
+        "activated_vertices": list(state["activated_vertices"]),
+    }
+
+
+class SnapshotRecorder:
+    """Ring buffer of execution snapshots stored as a base state plus per-step deltas."""
+
+    def __init__(self, max_snapshots: int) -> None:
+        if max_snapshots < 1:
+            msg = "max_snapshots must be at least 1"
+            raise ValueError(msg)
+        self.max_snapshots = max_snapshots
+        self._base: _State | None = None
+        self._base_vertex_id: str | None = None
+        self._deltas: deque[tuple[str | None, _Delta]] = deque()
+        self._last: _State | None = None
+
+    def __len__(self) -> int:
+        return 0 if self._base is None else len(self._deltas) + 1
+
+    def record(self, state: _State, vertex_id: str | None = None) -> None:
+        """Records the state reached after building ``vertex_id`` (or after preparing the graph)."""
+        if self._last is None:
+            self._base, self._base_vertex_id = state, vertex_id
+        else:
+            self._deltas.append((vertex_id, _diff(self._last, state)))
+            if len(self) > self.max_snapshots:
+                self._base_vertex_id, oldest = self._deltas.popleft()
+                self._base = _apply(self._base, oldest)
+        self._last = state
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        """Returns the retained snapshots, oldest first, each tagged with the vertex that produced it."""
+        if self._base is None:
+            return []
+        state = self._base
+        snapshots = [{"vertex_id": self._base_vertex_id, **_to_snapshot(state)}]
+        for vertex_id, delta in self._deltas:
+            state = _apply(state, delta)
+            snapshots.append({"vertex_id": vertex_id, **_to_snapshot(state)})
+        return snapshots
+
+    def clear(self) -> None:
+        self._base = self._base_vertex_id = self._last = None
+        self._deltas.clear()
@@ -237,6 +237,36 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def get_build_state(self) -> dict[str, Any]:
+        """Returns what a build produced, so it can be cached and restored with `restore_build_state`."""
+        return {
+            "built": self.built,
+            "results": self.results,
+            "artifacts": self.artifacts,
+            "built_object": self.built_object,
+            "built_result": self.built_result,
+            "full_data": self.full_data,
+            "outputs_logs": self.outputs_logs,
+            "logs": self.logs,
+        }
+
+    def restore_build_state(self, state: dict[str, Any]) -> None:
+        """Restores the outputs of a previous build and finalizes the result from them.
+
+        Raises:
+            KeyError: If the state is missing one of the build outputs.
+        """
+        self.built = state["built"]
+        self.artifacts = state["artifacts"]
+        self.built_object = state["built_object"]
+        self.built_result = state["built_result"]
+        self.full_data = state["full_data"]
+        self.results = state["results"]
+        # Older cached states do not have the logs
+        self.outputs_logs = state.get("outputs_logs", self.outputs_logs)
+        self.logs = state.get("logs", self.logs)
+        self.finalize_build()
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -705,6 +735,26 @@ class Vertex:
         self.steps_ran = []
         self.build_params()
 
+    def reset_build_state(self) -> None:
+        """Resets what building the vertex in a run set, keeping its component instance.
+
+        The parameters are built again from the data and the edges of the vertex, so the vertex can be reused by a
+        graph whose edges changed.
+        """
+        self.updated_raw_params = False
+        self._incoming_edges = None
+        self._outgoing_edges = None
+        self._successors_ids = None
+        self.state = VertexStates.ACTIVE
+        self.result = None
+        self.results = {}
+        self.outputs_logs = {}
+        self.logs = {}
+        self.artifacts_raw = {}
+        self.artifacts_type = {}
+        self.use_result = False
+        self._reset()
+
     def _is_chat_input(self) -> bool:
         return False
 
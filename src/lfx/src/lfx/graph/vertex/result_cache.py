@@ -0,0 +1,150 @@
+"""Content-addressed result cache for component vertices.
+
+Components opt in with ``Component.cache_results``. Their results are stored in the result cache service
+under a key derived from the component code, the resolved input values, which already contain the results of
+upstream vertices, and the user of the run. A later build by the same user, with the same code and inputs, reuses
+the stored results instead of running the component, in any flow, run or worker.
+
+Components can read context outside their inputs, like the user they run for, so the cache is never used
+implicitly, for instance for frozen vertices. ``VETRAI_RESULT_CACHE_ENABLED=false`` disables it everywhere.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from pydantic import BaseModel, SecretStr
+
+from lfx.log.logger import logger
+from lfx.schema.data import Data
+from lfx.schema.message import Message
+from lfx.services.cache.utils import CacheMiss
+from lfx.services.deps import get_result_cache_service, get_settings_service
+
+if TYPE_CHECKING:
+    from lfx.custom.custom_component.component import Component
+    from lfx.graph.vertex.base import Vertex
+
+RESULT_CACHE_KEY_PREFIX = "vertex_result:"
+
+
+class UncacheableValueError(TypeError):
+    """Raised when an input value has no stable fingerprint, so its results must not be cached."""
+
+
+def _fingerprint(value: Any, *, nested: bool = False) -> Any:
+    """Reduces a value to a JSON-serializable structure that only depends on its content."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, SecretStr):
+        # Only the digest of the fingerprint is stored, so secrets never leave the process
+        return value.get_secret_value()
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, Mapping):
+        return {str(key): _fingerprint(item, nested=nested) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_fingerprint(item, nested=nested) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((_fingerprint(item, nested=nested) for item in value), key=json.dumps)
+    if isinstance(value, Message):
+        if not isinstance(value.text, str | None):
+            msg = "Streaming messages cannot be fingerprinted"
+            raise UncacheableValueError(msg)
+        # Timestamps, ids and sessions change on every run without changing the content
+        return {
+            "text": value.text,
+            "sender": value.sender,
+            "sender_name": value.sender_name,
+            "files": _fingerprint(value.files, nested=True),
+        }
+    if isinstance(value, Data):
+        return {"data": _fingerprint(value.data, nested=nested), "text_key": value.text_key}
+    if isinstance(value, pd.DataFrame):
+        return value.to_json(orient="split", date_format="iso", default_handler=str)
+    if isinstance(value, BaseModel):
+        # Clients and other runtime objects held by models are derived from their configuration
+        return {type(value).__qualname__: _fingerprint(dict(value), nested=True)}
+    if nested:
+        return f"<{type(value).__module__}.{type(value).__qualname__}>"
+    msg = f"Values of type {type(value).__name__} cannot be fingerprinted"
+    raise UncacheableValueError(msg)
+
+
+def build_result_cache_key(component: Component, vertex: Vertex, params: dict[str, Any]) -> str:
+    """Returns the cache key for running ``component`` with the resolved ``params``.
+
+    Raises:
+        UncacheableValueError: If a parameter has no stable fingerprint.
+    """
+    code = getattr(component, "_code", None) or type(component).__qualname__
+    graph = getattr(vertex, "graph", None)
+    payload = {
+        "code": hashlib.sha256(code.encode()).hexdigest(),
+        # Results are never shared across users, whose data they are made of
+        "user_id": str(getattr(component, "_user_id", None) or getattr(graph, "user_id", None)),
+        "params": _fingerprint(params),
+        # Only connected outputs are computed, so the connections are part of the key
+        "outputs": sorted(name for name in vertex.edges_source_names if name),
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{RESULT_CACHE_KEY_PREFIX}{digest}"
+
+
+def should_cache_results(component: Any, vertex: Vertex) -> bool:
+    """Whether the results of a vertex build may be served from the result cache."""
+    if not getattr(component, "cache_results", False) or vertex.is_loop or vertex.display_name == "Loop":
+        return False
+    settings_service = get_settings_service()
+    return settings_service is None or settings_service.settings.result_cache_enabled
+
+
+def _send_result_cache_event(component: Component, vertex: Vertex, status: str, key: str) -> None:
+    event_manager = component.get_event_manager()
+    if event_manager is not None:
+        event_manager.on_result_cache(data={"id": vertex.id, "status": status, "key": key})
+
+
+async def build_component_with_result_cache(params: dict, custom_component: Component, vertex: Vertex):
+    """Builds a component, reusing results stored for the same code and inputs when possible.
+
+    Returns the same ``(component, results, artifacts)`` tuple as ``build_component``.
+    """
+    from lfx.interface.initialize.loading import build_component
+
+    result_cache = get_result_cache_service()
+    if result_cache is None:
+        return await build_component(params=params, custom_component=custom_component)
+
+    try:
+        key = build_result_cache_key(custom_component, vertex, params)
+    except UncacheableValueError as exc:
+        await logger.adebug(f"Not caching results of {vertex.display_name}: {exc}")
+        return await build_component(params=params, custom_component=custom_component)
+
+    try:
+        cached = await result_cache.get(key)
+    except Exception:  # noqa: BLE001
+        await logger.aexception(f"Error reading the result cache for {vertex.display_name}")
+        cached = CacheMiss()
+
+    if not isinstance(cached, CacheMiss):
+        custom_component.set_attributes(params)
+        results, artifacts = cached["results"], cached["artifacts"]
+        custom_component.status = cached.get("status")
+        custom_component.restore_results(results, artifacts)
+        _send_result_cache_event(custom_component, vertex, "hit", key)
+        return custom_component, results, artifacts
+
+    _send_result_cache_event(custom_component, vertex, "miss", key)
+    custom_component, results, artifacts = await build_component(params=params, custom_component=custom_component)
+    try:
+        await result_cache.set(key, {"results": results, "artifacts": artifacts, "status": custom_component.status})
+    except Exception:  # noqa: BLE001
+        # Results holding clients, streams or other unpicklable objects are simply not cached
+        await logger.adebug(f"Could not store the results of {vertex.display_name} in the result cache", exc_info=True)
+    return custom_component, results, artifacts
@@ -206,6 +206,10 @@ class InterfaceVertex(ComponentVertex):
         self.steps = [self._build, self._run]
         self.is_interface_component = True
 
+    def reset_build_state(self) -> None:
+        super().reset_build_state()
+        self.added_message = None
+
     def build_stream_url(self) -> str:
         return f"/api/v1/build/{self.graph.flow_id}/{self.id}/stream"
 
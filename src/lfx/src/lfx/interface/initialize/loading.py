@@ -73,6 +73,12 @@ async def get_instance_results(
         if base_type == "custom_components":
             return await build_custom_component(params=custom_params, custom_component=custom_component)
         if base_type == "component":
+            from lfx.graph.vertex.result_cache import build_component_with_result_cache, should_cache_results
+
+            if should_cache_results(custom_component, vertex):
+                return await build_component_with_result_cache(
+                    params=custom_params, custom_component=custom_component, vertex=vertex
+                )
             return await build_component(params=custom_params, custom_component=custom_component)
         msg = f"Base type {base_type} not found."
         raise ValueError(msg)
@@ -1,15 +1,18 @@
 """Logging configuration for Vetrai using structlog."""
 
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from threading import Lock, Semaphore
-from typing import Any, TypedDict
+from threading import Lock, Semaphore, Thread
+from typing import Any, NamedTuple, NoReturn, TypedDict
 
 import orjson
 import structlog
@@ -29,6 +32,9 @@ LOG_LEVEL_MAP = {
     "CRITICAL": logging.CRITICAL,
 }
 
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+_LOG_METHODS = ("debug", "info", "warning", "warn", "error", "exception", "critical", "fatal", "msg", "log")
+
 
 class SizedLogBuffer:
     """A buffer for storing log messages for the log retrieval API."""
@@ -192,6 +198,166 @@ def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -
     return event_dict
 
 
+class LogQueue:
+    """Renders and writes log records on a background thread.
+
+    The calling thread only runs the processors that need its context (context variables, level, timestamp and
+    callsite) and enqueues the event. Serialization, the log buffer, rendering and output happen on the writer
+    thread. When the queue is full, records are dropped and counted instead of blocking the caller, and the writer
+    reports how many were dropped.
+    """
+
+    def __init__(self, processors: list[Callable], output_logger: Any, maxsize: int = DEFAULT_LOG_QUEUE_SIZE) -> None:
+        self._processors = processors
+        self._output_logger = output_logger
+        self._queue: queue.Queue[tuple[str, dict[str, Any]] | None] = queue.Queue(maxsize=maxsize)
+        self._lock = Lock()
+        self._dropped = 0
+        self._reported = 0
+        self._timestamper = structlog.processors.TimeStamper(fmt="iso")
+        self._thread = Thread(target=self._run, name="vetrai-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the queue was full."""
+        return self._dropped
+
+    def enqueue(self, _logger: Any, method_name: str, event_dict: dict[str, Any]) -> NoReturn:
+        """Last processor on the calling thread: hands the event to the writer thread."""
+        if event_dict.get("exc_info") is True:
+            # The writer thread has no exception being handled, so resolve it here
+            event_dict["exc_info"] = sys.exc_info()
+        try:
+            self._queue.put_nowait((method_name, event_dict))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+        raise structlog.DropEvent
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Writes the records already queued and stops the writer thread."""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            self._write(*item)
+            if self._dropped > self._reported and self._queue.empty():
+                dropped = self._dropped - self._reported
+                self._reported += dropped
+                event_dict = {"event": f"Dropped {dropped} log records because the log queue was full"}
+                self._write("warning", self._timestamper(None, "warning", {**event_dict, "level": "warning"}))
+
+    def _write(self, method_name: str, event_dict: dict[str, Any]) -> None:
+        try:
+            result: Any = event_dict
+            for processor in self._processors:
+                result = processor(self._output_logger, method_name, result)
+            if isinstance(result, str | bytes):
+                getattr(self._output_logger, method_name)(result)
+            elif isinstance(result, tuple):
+                args, kwargs = result
+                getattr(self._output_logger, method_name)(*args, **kwargs)
+            else:
+                getattr(self._output_logger, method_name)(**result)
+        except structlog.DropEvent:
+            pass
+        except Exception as exc:  # noqa: BLE001
+            # There is no logger left to report to
+            print(f"Failed to write log record: {exc!r}", file=sys.stderr)  # noqa: T201
+
+
+_log_queue: LogQueue | None = None
+
+
+def get_log_queue() -> LogQueue | None:
+    """Returns the queue of the asynchronous logging mode, or None when logging is synchronous."""
+    return _log_queue
+
+
+def _close_log_queue() -> None:
+    global _log_queue  # noqa: PLW0603
+    if _log_queue is not None:
+        _log_queue.close()
+        _log_queue = None
+
+
+atexit.register(_close_log_queue)
+
+
+def _make_queued_bound_logger(min_level: int) -> type:
+    """Filtering bound logger whose async methods log directly instead of through the default executor.
+
+    Enqueueing is cheap, so the thread hop structlog makes for ``adebug`` and friends would cost more than it saves.
+    Levels below ``min_level`` stay no-ops, so their arguments are never formatted.
+    """
+    base = structlog.make_filtering_bound_logger(min_level)
+
+    def make_async_method(name: str) -> Callable:
+        async def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+            return getattr(self, name)(*args, **kwargs)
+
+        method.__name__ = f"a{name}"
+        return method
+
+    namespace = {f"a{name}": make_async_method(name) for name in _LOG_METHODS}
+    return type(f"Queued{base.__name__}", (base,), namespace)
+
+
+class CallsiteForLevels:
+    """Adds the callsite (file, function and line) to the records of the given levels only.
+
+    Walking the stack is one of the most expensive steps of the pipeline, so it is opt-in per level.
+    """
+
+    def __init__(self, levels: set[str]) -> None:
+        self.levels = levels
+        self._adder = structlog.processors.CallsiteParameterAdder(
+            parameters=[
+                structlog.processors.CallsiteParameter.FILENAME,
+                structlog.processors.CallsiteParameter.FUNC_NAME,
+                structlog.processors.CallsiteParameter.LINENO,
+            ],
+            additional_ignores=[__name__],
+        )
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+        if event_dict.get("level", method_name).upper() in self.levels:
+            return self._adder(logger, method_name, event_dict)
+        return event_dict
+
+
+def _parse_callsite_levels(callsite_levels: str | None) -> set[str]:
+    if callsite_levels is None:
+        callsite_levels = os.getenv("VETRAI_LOG_CALLSITE_LEVELS")
+    if callsite_levels is None:
+        # Callsite information has always been added to every record when VETRAI_DEV is set
+        return set(VALID_LOG_LEVELS) if DEV else set()
+    levels = {level.strip().upper() for level in callsite_levels.split(",")}
+    if "ALL" in levels:
+        return set(VALID_LOG_LEVELS)
+    return levels & set(VALID_LOG_LEVELS)
+
+
+class _LoggingOptions(NamedTuple):
+    """The options a wrapper class was configured with, compared by `configure` to skip reconfiguring."""
+
+    min_level: int | None
+    async_logging: bool
+    queue_size: int | None
+    callsite_levels: set[str]
+
+    @classmethod
+    def of(cls, wrapper_class: Any) -> "_LoggingOptions | None":
+        return getattr(wrapper_class, "logging_options", None)
+
+
 class LogConfig(TypedDict):
     """Configuration for logging."""
 
@@ -212,12 +378,16 @@ def configure(
     log_rotation: str | None = None,
     cache: bool | None = None,
     output_file=None,
+    async_logging: bool | None = None,
+    callsite_levels: str | None = None,
+    queue_size: int | None = None,
 ) -> None:
-    """Configure the logger."""
-    # Early-exit only if structlog is configured AND current min level matches the requested one.
-    cfg = structlog.get_config() if structlog.is_configured() else {}
-    wrapper_class = cfg.get("wrapper_class")
-    current_min_level = getattr(wrapper_class, "min_level", None)
+    """Configure the logger.
+
+    ``async_logging`` (``VETRAI_LOG_ASYNC``) renders and writes records on a background thread fed by a queue of
+    ``queue_size`` records (``VETRAI_LOG_QUEUE_SIZE``). ``callsite_levels`` (``VETRAI_LOG_CALLSITE_LEVELS``) is a
+    comma-separated list of the levels whose records get the file, function and line of the caller.
+    """
     if os.getenv("VETRAI_LOG_LEVEL", "").upper() in VALID_LOG_LEVELS and log_level is None:
         log_level = os.getenv("VETRAI_LOG_LEVEL")
 
@@ -226,7 +396,21 @@ def configure(
         log_level_str = log_level
 
     requested_min_level = LOG_LEVEL_MAP.get(log_level_str.upper(), logging.ERROR)
-    if current_min_level == requested_min_level:
+
+    if async_logging is None:
+        async_logging = os.getenv("VETRAI_LOG_ASYNC", "false").lower() == "true"
+
+    if queue_size is None:
+        env_queue_size = os.getenv("VETRAI_LOG_QUEUE_SIZE", "")
+        queue_size = int(env_queue_size) if env_queue_size.isdigit() else DEFAULT_LOG_QUEUE_SIZE
+
+    levels = _parse_callsite_levels(callsite_levels)
+
+    # Early-exit only if structlog is configured with the requested min level, logging mode and callsite levels
+    cfg = structlog.get_config() if structlog.is_configured() else {}
+    current = _LoggingOptions.of(cfg.get("wrapper_class"))
+    requested = _LoggingOptions(requested_min_level, async_logging, queue_size if async_logging else None, levels)
+    if current == requested:
         return
 
     if log_level is None:
@@ -250,17 +434,11 @@ def configure(
         structlog.processors.TimeStamper(fmt="iso"),
     ]
 
-    # Add callsite information only when VETRAI_DEV is set
-    if DEV:
-        processors.append(
-            structlog.processors.CallsiteParameterAdder(
-                parameters=[
-                    structlog.processors.CallsiteParameter.FILENAME,
-                    structlog.processors.CallsiteParameter.FUNC_NAME,
-                    structlog.processors.CallsiteParameter.LINENO,
-                ]
-            )
-        )
+    # Add callsite information only for the opted-in levels (every level when VETRAI_DEV is set)
+    if levels:
+        processors.append(CallsiteForLevels(levels))
+    # Everything from here on can run on the writer thread in asynchronous mode
+    caller_processors_count = len(processors)
 
     processors.extend(
         [
@@ -276,7 +454,7 @@ def configure(
     elif log_env.lower() == "container_csv":
         # Include callsite fields in key order when DEV is enabled
         key_order = ["timestamp", "level", "event"]
-        if DEV:
+        if levels:
             key_order += ["filename", "func_name", "lineno"]
 
         processors.append(structlog.processors.KeyValueRenderer(key_order=key_order, drop_missing=True))
@@ -296,20 +474,35 @@ def configure(
     numeric_level = LOG_LEVEL_MAP.get(log_level.upper(), logging.ERROR)
 
     # Create wrapper class and attach the min level for later comparison
-    wrapper_class = structlog.make_filtering_bound_logger(numeric_level)
+    wrapper_class = (
+        _make_queued_bound_logger(numeric_level)
+        if async_logging
+        else structlog.make_filtering_bound_logger(numeric_level)
+    )
     wrapper_class.min_level = numeric_level
+    wrapper_class.logging_options = _LoggingOptions(
+        numeric_level, async_logging, queue_size if async_logging else None, levels
+    )
 
     # Configure structlog
     # Default to stdout for backward compatibility, unless output_file is specified
     log_output_file = output_file if output_file is not None else sys.stdout
+    logger_factory = (
+        structlog.PrintLoggerFactory(file=log_output_file) if not log_file else structlog.stdlib.LoggerFactory()
+    )
+
+    global _log_queue  # noqa: PLW0603
+    _close_log_queue()
+    if async_logging:
+        output_logger = logger_factory("vetrai") if log_file else logger_factory()
+        _log_queue = LogQueue(processors[caller_processors_count:], output_logger, maxsize=queue_size)
+        processors = [*processors[:caller_processors_count], _log_queue.enqueue]
 
     structlog.configure(
         processors=processors,
         wrapper_class=wrapper_class,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=log_output_file)
-        if not log_file
-        else structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=cache if cache is not None else True,
     )
 
@@ -1,6 +1,7 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import partial
 from typing import Any, cast
 from uuid import UUID
 
@@ -34,6 +35,9 @@ class _UnserializableSentinel:
 
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
+# Exact types returned as they are, without a dispatch table lookup
+_PASSTHROUGH_TYPES = frozenset({type(None), bool, int, float})
+
 
 def _serialize_str(obj: str, max_length: int | None, _) -> str:
     """Truncates a string to the specified maximum length, appending an ellipsis if truncation occurs.
@@ -101,7 +105,7 @@ def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items:
 
 def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
     """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
+    return {k: v if type(v) in _PASSTHROUGH_TYPES else serialize(v, max_length, max_items) for k, v in obj.items()}
 
 
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
@@ -110,14 +114,7 @@ def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items:
         truncated = list(obj)[:max_items]
         truncated.append(f"... [truncated {len(obj) - max_items} items]")
         obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
-
-
-def _serialize_primitive(obj: Any, *_) -> Any:
-    """Handle primitive types without conversion."""
-    if obj is None or isinstance(obj, int | float | bool | complex):
-        return obj
-    return UNSERIALIZABLE_SENTINEL
+    return [item if type(item) in _PASSTHROUGH_TYPES else serialize(item, max_length, max_items) for item in obj]
 
 
 def _serialize_instance(obj: Any, *_) -> str:
@@ -151,11 +148,6 @@ def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | N
     return {index: _truncate_value(value, max_length, max_items) for index, value in obj.items()}
 
 
-def _is_numpy_type(obj: Any) -> bool:
-    """Check if an object is a numpy type by checking its type's module name."""
-    return hasattr(type(obj), "__module__") and type(obj).__module__ == np.__name__
-
-
 def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None) -> Any:
     """Serialize numpy types."""
     try:
@@ -181,68 +173,87 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
+def _serialize_passthrough(obj: Any, *_) -> Any:
+    """Return JSON-compatible scalars unchanged."""
+    return obj
+
+
+def _serialize_type(obj: type, *_) -> Any:
+    """Handle classes, enum members accessed through classes, type variables and generic aliases."""
+    if hasattr(obj, "_name_"):  # Enum case
+        return f"{obj.__class__.__name__}.{obj._name_}"
+    if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
+        return repr(obj)
+    if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias/generic case
+        return repr(obj)
+    # Handle numpy numeric types (int, float, bool, complex)
+    if hasattr(obj, "dtype"):
+        if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
+            return obj.item()
+        if np.issubdtype(obj.dtype, np.bool_):
+            return bool(obj)
+        if np.issubdtype(obj.dtype, np.complexfloating):
+            return complex(cast("complex", obj))
+        if np.issubdtype(obj.dtype, np.str_):
+            return str(obj)
+        if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
+            return obj.tobytes().decode("utf-8", errors="ignore")
+        if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
+            return serialize(obj.item())
+    return UNSERIALIZABLE_SENTINEL
+
+
+Serializer = Callable[[Any, int | None, int | None], Any]
+
+# Serializers by base type, in priority order: the first base an object is an instance of wins
+_SERIALIZERS: tuple[tuple[type | tuple[type, ...], Serializer], ...] = (
+    ((int, float, bool, complex), _serialize_passthrough),
+    (str, _serialize_str),
+    (bytes, _serialize_bytes),
+    (datetime, _serialize_datetime),
+    (Decimal, _serialize_decimal),
+    (UUID, _serialize_uuid),
+    (Document, _serialize_document),
+    ((AsyncIterator, Generator, Iterator), _serialize_iterator),
+    (BaseModel, _serialize_pydantic),
+    (BaseModelV1, _serialize_pydantic_v1),
+    (dict, _serialize_dict),
+    (pd.DataFrame, _serialize_dataframe),
+    (pd.Series, _serialize_series),
+    ((list, tuple), _serialize_list_tuple),
+)
+
+# Serializer of every concrete class seen so far, so each class is only resolved once
+_DISPATCH_TABLE: dict[type, Serializer] = {}
+
+
+def _resolve_serializer(is_instance: Callable[[Any], bool], cls: type, *, is_class: bool) -> Serializer:
+    for bases, serializer in _SERIALIZERS:
+        if is_instance(bases):
+            return serializer
+    if cls.__module__ == np.__name__:
+        return _serialize_numpy_type
+    if is_class:
+        return _serialize_type
+    return _serialize_instance
+
+
+def _get_serializer(obj: Any) -> Serializer:
+    cls = type(obj)
+    serializer = _DISPATCH_TABLE.get(cls)
+    if serializer is not None:
+        return serializer
+    if obj.__class__ is not cls:
+        # Proxies and mocks can report another class, which isinstance honors, so they are not cached
+        return _resolve_serializer(partial(isinstance, obj), cls, is_class=isinstance(obj, type))
+    serializer = _resolve_serializer(partial(issubclass, cls), cls, is_class=issubclass(cls, type))
+    _DISPATCH_TABLE[cls] = serializer
+    return serializer
+
+
 def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
     """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
-    if obj is None:
-        return obj
-    primitive = _serialize_primitive(obj, max_length, max_items)
-    if primitive is not UNSERIALIZABLE_SENTINEL:
-        return primitive
-
-    match obj:
-        case str():
-            return _serialize_str(obj, max_length, max_items)
-        case bytes():
-            return _serialize_bytes(obj, max_length, max_items)
-        case datetime():
-            return _serialize_datetime(obj, max_length, max_items)
-        case Decimal():
-            return _serialize_decimal(obj, max_length, max_items)
-        case UUID():
-            return _serialize_uuid(obj, max_length, max_items)
-        case Document():
-            return _serialize_document(obj, max_length, max_items)
-        case AsyncIterator() | Generator() | Iterator():
-            return _serialize_iterator(obj, max_length, max_items)
-        case BaseModel():
-            return _serialize_pydantic(obj, max_length, max_items)
-        case BaseModelV1():
-            return _serialize_pydantic_v1(obj, max_length, max_items)
-        case dict():
-            return _serialize_dict(obj, max_length, max_items)
-        case pd.DataFrame():
-            return _serialize_dataframe(obj, max_length, max_items)
-        case pd.Series():
-            return _serialize_series(obj, max_length, max_items)
-        case list() | tuple():
-            return _serialize_list_tuple(obj, max_length, max_items)
-        case object() if _is_numpy_type(obj):
-            return _serialize_numpy_type(obj, max_length, max_items)
-        case object() if not isinstance(obj, type):  # Match any instance that's not a class
-            return _serialize_instance(obj, max_length, max_items)
-        case object() if hasattr(obj, "_name_"):  # Enum case
-            return f"{obj.__class__.__name__}.{obj._name_}"
-        case object() if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
-            return repr(obj)
-        case object() if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias/generic case
-            return repr(obj)
-        case _:
-            # Handle numpy numeric types (int, float, bool, complex)
-            if hasattr(obj, "dtype"):
-                if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
-                    return obj.item()
-                if np.issubdtype(obj.dtype, np.bool_):
-                    return bool(obj)
-                if np.issubdtype(obj.dtype, np.complexfloating):
-                    return complex(cast("complex", obj))
-                if np.issubdtype(obj.dtype, np.str_):
-                    return str(obj)
-                if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
-                    return obj.tobytes().decode("utf-8", errors="ignore")
-                if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
-                    return serialize(obj.item())
-            return UNSERIALIZABLE_SENTINEL
+    return _get_serializer(obj)(obj, max_length, max_items)
 
 
 def serialize(
@@ -254,7 +265,7 @@ def serialize(
 ) -> Any:
     """Unified serialization with optional truncation support.
 
-    Coordinates specialized serializers through a dispatcher pattern.
+    Coordinates specialized serializers through a dispatch table, resolved once per concrete class.
     Maintains recursive processing for nested structures.
 
     Args:
@@ -263,8 +274,12 @@ def serialize(
         max_items: Maximum items in list-like structures, None for no truncation
         to_str: If True, return a string representation of the object if serialization fails
     """
-    if obj is None:
-        return None
+    # Fast path for JSON scalars and strings within the length limit, the bulk of nested values
+    cls = type(obj)
+    if cls in _PASSTHROUGH_TYPES:
+        return obj
+    if cls is str and (max_length is None or len(obj) <= max_length):
+        return obj
     try:
         # First try type-specific serialization
         result = _serialize_dispatcher(obj, max_length, max_items)
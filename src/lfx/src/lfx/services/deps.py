@@ -16,10 +16,12 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from lfx.services.http_client.service import HTTPClientService
     from lfx.services.interfaces import (
         CacheServiceProtocol,
         ChatServiceProtocol,
         DatabaseServiceProtocol,
+        ResultCacheServiceProtocol,
         SettingsServiceProtocol,
         StorageServiceProtocol,
         TracingServiceProtocol,
@@ -104,6 +106,20 @@ def get_shared_component_cache_service() -> CacheServiceProtocol | None:
     return get_service(ServiceType.SHARED_COMPONENT_CACHE_SERVICE, SharedComponentCacheServiceFactory())
 
 
+def get_result_cache_service() -> ResultCacheServiceProtocol | None:
+    """Retrieves the result cache service instance, if one is registered."""
+    from lfx.services.schema import ServiceType
+
+    return get_service(ServiceType.RESULT_CACHE_SERVICE)
+
+
+def get_http_client_service() -> HTTPClientService:
+    """Retrieves the shared HTTP client service instance."""
+    from lfx.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
+
+
 def get_chat_service() -> ChatServiceProtocol | None:
     """Retrieves the chat service instance."""
     from lfx.services.schema import ServiceType
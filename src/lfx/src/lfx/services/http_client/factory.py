@@ -0,0 +1,30 @@
+"""Factory for creating the shared HTTP client service."""
+
+from typing import TYPE_CHECKING
+
+from lfx.services.factory import ServiceFactory
+from lfx.services.http_client.service import HTTPClientService
+from lfx.services.schema import ServiceType
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class HTTPClientServiceFactory(ServiceFactory):
+    """Factory for creating HTTPClientService instances from the settings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.service_class = HTTPClientService
+        self.dependencies = [ServiceType.SETTINGS_SERVICE]
+
+    def create(self, settings_service: "SettingsService") -> HTTPClientService:
+        """Create an HTTPClientService with the connection limits of the settings."""
+        settings = settings_service.settings
+        return HTTPClientService(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+            max_connections_per_host=settings.http_client_max_connections_per_host or None,
+            http2=settings.http_client_http2,
+        )
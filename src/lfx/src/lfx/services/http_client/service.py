@@ -0,0 +1,270 @@
+"""Shared HTTP client service implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+import httpx
+from httpx._utils import get_environment_proxies
+
+from lfx.log.logger import logger
+from lfx.services.base import Service
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+
+class _ClientKey(NamedTuple):
+    base_url: str
+    verify: ssl.SSLContext | str | bool
+    cert: str | tuple[str, ...] | None
+    proxy: str | None
+
+
+class _RejectResponseCookies(DefaultCookiePolicy):
+    """Keeps cookies set by responses out of shared clients, where they would leak between unrelated requests."""
+
+    def set_ok(self, cookie, request) -> bool:  # noqa: ARG002
+        return False
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release, release = None, self._release
+                release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release, release = None, self._release
+                release()
+
+
+class _HostLimitedTransport(httpx.BaseTransport):
+    """Allows at most `max_per_host` requests in flight to the same host, until their responses are closed."""
+
+    def __init__(self, transport: httpx.BaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                request.url.netloc.decode(), threading.BoundedSemaphore(self._max_per_host)
+            )
+        semaphore.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of `_HostLimitedTransport`, for clients used by a single event loop."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.get(host := request.url.netloc.decode())
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HTTPClientService(Service):
+    """Provides long-lived httpx clients that components share, so their requests reuse open connections.
+
+    There is one client per base URL and TLS and proxy settings. Clients without an explicit proxy use the proxies
+    of the environment, read when they are created. Asynchronous clients are also kept per event
+    loop, since their connections belong to the loop that opened them. Clients never store cookies set by
+    responses, and they have no default headers or authentication. Pass these, and the timeout, with each request.
+
+    Args:
+        max_connections: Maximum number of open connections of each client.
+        max_keepalive_connections: Maximum number of idle connections that each client keeps open.
+        keepalive_expiry: Seconds after which idle connections are closed.
+        max_connections_per_host: Maximum number of requests in flight to the same host per client, or None.
+        http2: Whether clients negotiate HTTP/2 with servers that support it.
+    """
+
+    name = "http_client_service"
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_connections_per_host: int | None = None,
+        *,
+        http2: bool = False,
+    ) -> None:
+        super().__init__()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2
+        self._clients: dict[_ClientKey, httpx.Client] = {}
+        self._async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, httpx.AsyncClient]] = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        base_url: str = "",
+        *,
+        verify: ssl.SSLContext | str | bool = True,
+        cert: str | tuple[str, ...] | None = None,
+        proxy: str | None = None,
+    ) -> httpx.Client:
+        """Return the shared synchronous client for the given base URL and TLS and proxy settings.
+
+        The client is closed by the service; do not use it as a context manager.
+        """
+        key = _ClientKey(base_url, verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = self._clients[key] = httpx.Client(
+                    base_url=base_url,
+                    transport=self._transport(key, key.proxy),
+                    mounts=self._environment_proxy_mounts(key, self._transport),
+                )
+                client.cookies.jar.set_policy(_RejectResponseCookies())
+            return client
+
+    def get_async_client(
+        self,
+        base_url: str = "",
+        *,
+        verify: ssl.SSLContext | str | bool = True,
+        cert: str | tuple[str, ...] | None = None,
+        proxy: str | None = None,
+    ) -> httpx.AsyncClient:
+        """Return the shared asynchronous client of the running event loop for the given settings.
+
+        The client is closed by the service; do not use it as a context manager.
+        """
+        key = _ClientKey(base_url, verify, cert, proxy)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = clients[key] = httpx.AsyncClient(
+                    base_url=base_url,
+                    transport=self._async_transport(key, key.proxy),
+                    mounts=self._environment_proxy_mounts(key, self._async_transport),
+                )
+                client.cookies.jar.set_policy(_RejectResponseCookies())
+            return client
+
+    def _transport(self, key: _ClientKey, proxy: str | None) -> httpx.BaseTransport:
+        transport: httpx.BaseTransport = httpx.HTTPTransport(**self._transport_options(key, proxy))
+        if self.max_connections_per_host:
+            transport = _HostLimitedTransport(transport, self.max_connections_per_host)
+        return transport
+
+    def _async_transport(self, key: _ClientKey, proxy: str | None) -> httpx.AsyncBaseTransport:
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(**self._transport_options(key, proxy))
+        if self.max_connections_per_host:
+            transport = _AsyncHostLimitedTransport(transport, self.max_connections_per_host)
+        return transport
+
+    @staticmethod
+    def _environment_proxy_mounts(key: _ClientKey, make_transport: Callable[[_ClientKey, str | None], Any]) -> dict:
+        """Route requests through the proxies of HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY.
+
+        httpx ignores these variables for clients given a transport, so the service mounts them itself, like httpx
+        does for its default transport. An explicit `proxy` takes precedence over them.
+        """
+        if key.proxy is not None:
+            return {}
+        # A None mount sends matching requests, like the hosts of NO_PROXY, through the client transport
+        return {
+            pattern: None if proxy is None else make_transport(key, proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def _transport_options(self, key: _ClientKey, proxy: str | None) -> dict[str, Any]:
+        return {
+            "verify": key.verify,
+            "cert": key.cert,
+            "proxy": proxy,
+            "http2": self.http2,
+            "limits": self.limits,
+        }
+
+    async def teardown(self) -> None:
+        """Close the clients. Asynchronous clients of other event loops are dropped without closing them."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            async_clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+            self._async_clients = WeakKeyDictionary()
+        for client in clients:
+            client.close()
+        for async_client in async_clients.values():
+            try:
+                await async_client.aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Error closing a shared HTTP client", exc_info=exc)
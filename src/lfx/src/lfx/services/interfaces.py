@@ -98,6 +98,20 @@ class CacheServiceProtocol(Protocol):
         ...
 
 
+class ResultCacheServiceProtocol(Protocol):
+    """Protocol for the persistent, content-addressed component result cache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Get cached results, or a CacheMiss."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Store results."""
+        ...
+
+
 class ChatServiceProtocol(Protocol):
     """Protocol for chat service."""
 
@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     SHARED_COMPONENT_CACHE_SERVICE = "shared_component_cache_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
     TRANSACTION_SERVICE = "transaction_service"
+    RESULT_CACHE_SERVICE = "result_cache_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
@@ -76,6 +76,12 @@ class Settings(BaseSettings):
     The driver shall be an async one like `sqlite+aiosqlite` (`sqlite` and `postgresql`
     will be automatically converted to the async drivers `sqlite+aiosqlite` and
     `postgresql+psycopg` respectively)."""
+    database_replica_url: str | None = None
+    """Optional URL of a read replica of the database. Read-only endpoints, like the flow list, the monitor
+    endpoints and workflow status polling, read from it through a pool of their own."""
+    database_replica_lag_window: float = 5.0
+    """The number of seconds after a write during which the reads of the same user go to the primary database
+    instead of the replica, so that users read their own writes while the replica catches up."""
     database_connection_retry: bool = False
     """If True, Vetrai will retry to connect to the database if it fails."""
     pool_size: int = 20
@@ -91,6 +97,13 @@ class Settings(BaseSettings):
     """Optional namespace identifier for PostgreSQL advisory lock during migrations.
     If not provided, a hash of the database URL will be used. Useful when multiple Vetrai
     instances share the same database and need coordinated migration locking."""
+    migration_fast_boot: bool = True
+    """If True, startup compares the revision stored in the database with the head revision of the migrations
+    and skips the autogenerate schema check when they match. One worker migrates while the others wait for the
+    head revision. Run `vetrai migration --check` for the full check."""
+    migration_wait_timeout: int = 300
+    """The number of seconds a worker waits for the worker that is migrating the database to reach the head
+    revision."""
 
     mcp_server_timeout: int = 20
     """The number of seconds to wait before giving up on a lock to released or establishing a connection to the
@@ -151,6 +164,36 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_serializer: Literal["pickle", "dill", "msgpack", "graph"] | None = None
+    """How the disk and Redis caches encode values. 'pickle' uses pickle protocol 5, 'dill' also handles classes
+    created at runtime, 'msgpack' is compact for plain data and 'graph' stores cached graphs as the state of their
+    run and rebuilds them from the flow data. If not set, the disk caches use 'pickle' and the Redis caches 'dill'."""
+    cache_compression: Literal["zstd", "lz4"] | None = None
+    """Compression applied to encoded cache values of at least `cache_compression_threshold` bytes."""
+    cache_compression_threshold: int = 16 * 1024
+    """Size in bytes from which encoded cache values are compressed."""
+    result_cache_enabled: bool = True
+    """If False, components with `cache_results` always run instead of reusing results stored in the result cache."""
+    result_cache_type: Literal["disk", "redis"] = "disk"
+    """Backend of the persistent result cache used by components with `cache_results`.
+    'disk' stores results under the config directory, 'redis' uses the Redis connection settings."""
+    result_cache_expire: int = 7 * 24 * 3600
+    """How long cached component results are kept, in seconds."""
+    result_cache_size_limit: int = 1024**3
+    """Maximum size of the disk result cache in bytes. The least recently stored results are evicted first.
+    The Redis result cache is bounded by the Redis `maxmemory` policy instead."""
+    embedding_cache: bool = True
+    """If True, embedding vectors are cached by model and text in the user cache directory, so embedding,
+    vector store and knowledge base components only embed texts that were never embedded by the same model."""
+    embedding_cache_size_limit: int = 1024**3
+    """Maximum size of the embedding cache in bytes. The least recently stored vectors are evicted first."""
+    embedding_cache_redis: bool = False
+    """If True, cached embedding vectors are also shared through Redis, using the Redis connection settings."""
+    vector_store_idle_timeout: int = 600
+    """Seconds after which an open vector store client that no run uses is closed. 0 disables the reuse of vector
+    store clients across runs."""
+    vector_store_max_clients: int = 32
+    """Maximum number of idle vector store clients kept open between runs."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -211,6 +254,35 @@ class Settings(BaseSettings):
     """List of environment variables to get from the environment and store in the database."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
+    executor_pool_sizes: dict[str, int] = {}
+    """Number of threads of the executor pools that run blocking component work, by pool name. Overrides the
+    defaults of the 'io' (32), 'cpu' (number of CPUs) and 'events' (4) pools and can define more pools."""
+    executor_pool_flow_limit: int | None = None
+    """Number of threads of each executor pool that a single flow can occupy at a time. If not set, one flow can
+    occupy a whole pool."""
+    component_executor_pools: dict[str, str] = {}
+    """Executor pool that runs the synchronous methods of a component, by component class name. Overrides the pool
+    the component declares."""
+    docling_workers: int = 2
+    """Number of worker processes that convert documents for the Docling component. Workers keep their models
+    loaded between builds."""
+    docling_task_timeout: int = 300
+    """Seconds after which the Docling conversion of a file is stopped and its worker restarted. 0 disables it."""
+    docling_worker_max_memory: int = 4096
+    """Resident memory in MB from which a Docling worker is restarted after its current file. 0 disables it."""
+    arrow_backed_tables: bool = False
+    """If True and pyarrow is installed, CSV, Excel and Parquet files loaded by file components are read into
+    Arrow-backed columns, with CSV files parsed by pyarrow. The inferred column types differ from pandas' defaults."""
+    http_client_max_connections: int = 100
+    """Maximum number of open connections of each shared HTTP client used by components."""
+    http_client_max_keepalive_connections: int = 20
+    """Maximum number of idle connections that each shared HTTP client keeps open."""
+    http_client_keepalive_expiry: float = 30.0
+    """Seconds after which idle connections of the shared HTTP clients are closed."""
+    http_client_max_connections_per_host: int = 0
+    """Maximum number of requests in flight to the same host per shared HTTP client. 0 disables the limit."""
+    http_client_http2: bool = False
+    """Whether the shared HTTP clients negotiate HTTP/2 with servers that support it."""
     frontend_timeout: int = 0
     """Timeout for the frontend API calls in seconds."""
     user_agent: str = "vetrai"
@@ -278,10 +350,23 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 50
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    graph_snapshots_limit: int = 0
+    """Number of execution snapshots to keep per graph run for debugging and replay. Set to 0 to disable
+    recording. Each snapshot after the first only stores the run state that changed in that step."""
+    incremental_graph_builds: bool = True
+    """If True, Playground builds update the graph of the previous build of the flow to the edited version,
+    instantiating only the components that were added or changed, instead of building a new graph."""
     webhook_polling_interval: int = 0
     """The polling interval for the webhook in ms. Set to 0 to disable (SSE provides real-time updates)."""
     fs_flows_polling_interval: int = 10000
-    """The polling interval in milliseconds for synchronizing flows from the file system."""
+    """The polling interval in milliseconds for synchronizing flows from the file system.
+
+    Only used when filesystem notifications are disabled or unavailable."""
+    fs_flows_watch: bool = True
+    """Whether to synchronize flows from the file system using filesystem notifications (requires `watchfiles`).
+    Falls back to polling every `fs_flows_polling_interval` milliseconds when disabled or unavailable."""
+    fs_flows_watch_debounce: int = 500
+    """Time in milliseconds to group bursts of file writes into a single flow synchronization."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -326,6 +411,20 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    event_encoder: Literal["json", "orjson"] = "json"
+    """How to encode build event payloads. 'orjson' is faster and encodes NaN and infinite floats as null."""
+    voice_mode_vad_batch_chunks: int = Field(default=1, ge=1)
+    """Number of 20ms client audio chunks voice mode waits for before running barge-in detection on them. Batching
+    lowers the CPU cost per session but delays barge-in by up to 20ms per additional chunk."""
+    components_manifest: bool = True
+    """If set to True, the results of scanning `components_path` are stored in a manifest in the user cache
+    directory, shared by all workers, so only custom component files that changed, or that share a directory with a
+    changed file, are parsed and built again."""
+    component_template_cache_ttl: float = 300
+    """Seconds for which the templates, code trees and validation results built from component code are reused by
+    requests with the same code, like the requests sent while editing a component. 0 disables the cache."""
+    component_template_cache_size: int = 256
+    """Maximum number of templates, code trees and validation results kept by the component template cache."""
     lazy_load_components: bool = False
     """If set to True, Vetrai will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
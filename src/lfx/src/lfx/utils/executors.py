@@ -0,0 +1,261 @@
+"""Named thread pools for the blocking work of components.
+
+Synchronous output methods, event emission and other blocking calls run in one of a few named pools instead of the
+event loop's default executor, so a handful of slow components cannot hold every thread that the rest of the
+process needs:
+
+    io: blocking I/O such as HTTP calls, database drivers and file access. The default pool of components.
+    cpu: CPU-bound work such as parsing and splitting documents.
+    events: emission of build events and streamed tokens.
+
+Pool sizes come from the `executor_pool_sizes` setting, which can also define more pools. With
+`executor_pool_flow_limit` set, a single flow can only occupy that many threads of a pool at a time and further
+calls from the flow wait for one of its own calls to finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+IO_POOL = "io"
+CPU_POOL = "cpu"
+EVENTS_POOL = "events"
+
+DEFAULT_POOL_SIZES = {IO_POOL: 32, CPU_POOL: os.cpu_count() or 1, EVENTS_POOL: 4}
+
+
+@dataclass(frozen=True)
+class ExecutorPoolStats:
+    """A snapshot of the activity of an executor pool."""
+
+    name: str
+    max_workers: int
+    running: int
+    """Calls running in a worker thread."""
+    queued: int
+    """Calls waiting for a free worker thread."""
+    waiting_for_flow: int
+    """Calls waiting because their flow already occupies `flow_limit` threads of the pool."""
+    max_queued: int
+    """The highest number of calls that waited for a worker thread at the same time."""
+    completed: int
+
+
+class ExecutorPool:
+    """A bounded thread pool that runs blocking calls for coroutines and tracks how many of them wait.
+
+    Args:
+        name: The name of the pool, used for its thread names and its stats.
+        max_workers: The number of worker threads.
+        flow_limit: The number of threads a single flow can occupy at a time, or None for no limit.
+    """
+
+    def __init__(self, name: str, max_workers: int, flow_limit: int | None = None) -> None:
+        if max_workers < 1:
+            msg = f"Executor pool '{name}' needs at least one worker, got {max_workers}"
+            raise ValueError(msg)
+        self.name = name
+        self.max_workers = max_workers
+        self.flow_limit = flow_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"vetrai-{name}")
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._waiting_for_flow = 0
+        # (flow id, event loop) -> [semaphore, calls holding or waiting for it]
+        self._flow_slots: dict[tuple[str, asyncio.AbstractEventLoop], list[Any]] = {}
+
+    async def run(self, func: Callable[..., T], /, *args: Any, flow_id: str | None = None, **kwargs: Any) -> T:
+        """Runs `func(*args, **kwargs)` in the pool with the current context and returns its result.
+
+        Calls from the same `flow_id` count towards the pool's `flow_limit`.
+        """
+        if self.flow_limit is None or flow_id is None:
+            return await self._submit(func, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        key = (str(flow_id), loop)
+        slot = self._flow_slots.get(key)
+        if slot is None:
+            slot = self._flow_slots[key] = [asyncio.Semaphore(self.flow_limit), 0]
+        slot[1] += 1
+        semaphore: asyncio.Semaphore = slot[0]
+        try:
+            if semaphore.locked():
+                self._waiting_for_flow += 1
+                try:
+                    await semaphore.acquire()
+                finally:
+                    self._waiting_for_flow -= 1
+            else:
+                await semaphore.acquire()
+            try:
+                return await self._submit(func, args, kwargs)
+            finally:
+                semaphore.release()
+        finally:
+            slot[1] -= 1
+            if not slot[1]:
+                del self._flow_slots[key]
+
+    async def _submit(self, func: Callable[..., T], args: tuple, kwargs: dict[str, Any]) -> T:
+        call = functools.partial(self._call, contextvars.copy_context(), func, args, kwargs)
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Calls cancelled before a worker picked them up never leave the queue on their own
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def _call(self, context: contextvars.Context, func: Callable[..., T], args: tuple, kwargs: dict[str, Any]) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return context.run(func, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def stats(self) -> ExecutorPoolStats:
+        """Returns the current activity of the pool."""
+        with self._lock:
+            return ExecutorPoolStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                running=self._running,
+                queued=self._queued,
+                waiting_for_flow=self._waiting_for_flow,
+                max_queued=self._max_queued,
+                completed=self._completed,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stops the worker threads once the calls already submitted finish."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+@dataclass
+class _PoolConfig:
+    sizes: dict[str, int]
+    flow_limit: int | None
+    component_pools: dict[str, str]
+
+
+_pools: dict[str, ExecutorPool] = {}
+_pools_lock = threading.Lock()
+_config: _PoolConfig | None = None
+
+
+def _load_config() -> _PoolConfig:
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return _PoolConfig(sizes=dict(DEFAULT_POOL_SIZES), flow_limit=None, component_pools={})
+    settings = settings_service.settings
+    return _PoolConfig(
+        sizes={**DEFAULT_POOL_SIZES, **settings.executor_pool_sizes},
+        flow_limit=settings.executor_pool_flow_limit,
+        component_pools=dict(settings.component_executor_pools),
+    )
+
+
+def _get_config() -> _PoolConfig:
+    global _config  # noqa: PLW0603
+    if _config is None:
+        _config = _load_config()
+    return _config
+
+
+def configure_executor_pools(
+    sizes: dict[str, int] | None = None,
+    flow_limit: int | None = None,
+    component_pools: dict[str, str] | None = None,
+) -> None:
+    """Replaces the pool configuration read from the settings.
+
+    Pools that already exist are shut down without waiting for their calls, and are created again with the new
+    configuration the next time they are used.
+    """
+    global _config  # noqa: PLW0603
+    shutdown_executor_pools(wait=False)
+    _config = _PoolConfig(
+        sizes={**DEFAULT_POOL_SIZES, **(sizes or {})},
+        flow_limit=flow_limit,
+        component_pools=dict(component_pools or {}),
+    )
+
+
+def get_executor_pool(name: str) -> ExecutorPool:
+    """Returns the pool with the given name, creating it on first use.
+
+    Raises:
+        ValueError: If no pool with that name is configured.
+    """
+    pool = _pools.get(name)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        if name not in _pools:
+            config = _get_config()
+            if name not in config.sizes:
+                msg = f"Unknown executor pool '{name}'. Configured pools: {', '.join(sorted(config.sizes))}"
+                raise ValueError(msg)
+            _pools[name] = ExecutorPool(name, config.sizes[name], config.flow_limit)
+        return _pools[name]
+
+
+def get_component_pool_name(component_class: type) -> str:
+    """Returns the pool that runs the synchronous methods of a component class.
+
+    The `component_executor_pools` setting, keyed by class name, takes precedence over the pool the class declares
+    in its `executor_pool` attribute.
+    """
+    configured = _get_config().component_pools.get(component_class.__name__)
+    return configured or getattr(component_class, "executor_pool", IO_POOL)
+
+
+async def run_in_pool(name: str, func: Callable[..., T], /, *args: Any, flow_id: str | None = None, **kwargs: Any) -> T:
+    """Runs `func(*args, **kwargs)` in the named pool. See `ExecutorPool.run`."""
+    return await get_executor_pool(name).run(func, *args, flow_id=flow_id, **kwargs)
+
+
+def executor_pool_stats() -> list[ExecutorPoolStats]:
+    """Returns the activity of the pools created so far."""
+    return [pool.stats() for pool in list(_pools.values())]
+
+
+def shutdown_executor_pools(*, wait: bool = True) -> None:
+    """Shuts down every pool. Pools used afterwards are created again."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
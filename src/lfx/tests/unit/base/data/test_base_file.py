@@ -1,12 +1,16 @@
-"""Tests for BaseFileComponent.load_files_message method."""
+"""Tests for BaseFileComponent.load_files_message method and reading structured files."""
 
 import json
 import tempfile
 from pathlib import Path
 
-from lfx.base.data.base_file import BaseFileComponent
+import pandas as pd
+import pytest
+from lfx.base.data import base_file
+from lfx.base.data.base_file import BaseFileComponent, read_table
 from lfx.schema.data import Data
 from lfx.schema.message import Message
+from lfx.services.deps import get_settings_service
 
 
 class TestFileComponent(BaseFileComponent):
@@ -249,3 +253,54 @@ class TestLoadFilesMessage:
         assert "Field extraction" in result_text
         # JSON content should be present in some form
         assert "parsed" in result_text or "Dict content" in result_text
+
+
+class TestReadTable:
+    """Tests for the column types of tables read from structured files."""
+
+    CSV = "id,score,name,joined\n1,0.5,Ada,2024-01-02\n2,,Grace,2024-03-04\n"
+
+    def test_default_engine_and_dtypes_are_used(self, tmp_path):
+        path = tmp_path / "table.csv"
+        path.write_text(self.CSV, encoding="utf-8")
+
+        df = read_table(str(path), ".csv")
+
+        assert df.dtypes.astype(str).to_dict() == {
+            "id": "int64",
+            "score": "float64",
+            "name": "object",
+            "joined": "object",
+        }
+        assert pd.isna(df["score"][1])
+
+    def test_arrow_falls_back_to_the_default_dtypes_without_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(base_file, "_has_pyarrow", lambda: False)
+        path = tmp_path / "table.csv"
+        path.write_text(self.CSV, encoding="utf-8")
+
+        df = read_table(str(path), ".csv", arrow=True)
+
+        assert df.dtypes.astype(str).to_dict()["id"] == "int64"
+
+    def test_arrow_backed_columns_are_opt_in(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "table.csv"
+        path.write_text(self.CSV, encoding="utf-8")
+
+        df = read_table(str(path), ".csv", arrow=True)
+
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+    def test_structured_files_follow_the_arrow_backed_tables_setting(self, tmp_path, monkeypatch):
+        path = tmp_path / "table.csv"
+        path.write_text(self.CSV, encoding="utf-8")
+        calls = []
+        monkeypatch.setattr(base_file, "read_table", lambda *_, **kwargs: calls.append(kwargs))
+        settings = get_settings_service().settings
+
+        TestFileComponent().load_files_structured_helper(str(path))
+        monkeypatch.setattr(settings, "arrow_backed_tables", True)
+        TestFileComponent().load_files_structured_helper(str(path))
+
+        assert calls == [{"arrow": False}, {"arrow": True}]
@@ -0,0 +1,107 @@
+"""Tests for the Docling process pool, with conversion functions that do not need Docling."""
+
+import os
+import sys
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+from lfx.base.data.docling_pool import DoclingProcessPool
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The tests fork their workers")
+
+
+def _worker_pid(file_path: str, options: dict) -> tuple[int, str]:
+    time.sleep(options.get("seconds", 0))
+    return os.getpid(), file_path
+
+
+def _fail(file_path: str, options: dict):  # noqa: ARG001
+    msg = f"cannot convert {file_path}"
+    raise ValueError(msg)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def _make_pool(**kwargs) -> DoclingProcessPool:
+        pool = DoclingProcessPool(mp_context="fork", **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield _make_pool
+    for pool in pools:
+        pool.shutdown(wait=False)
+
+
+def test_files_are_converted_in_parallel_by_warm_workers(make_pool):
+    pool = make_pool(max_workers=2)
+
+    start = time.perf_counter()
+    first = [pool.submit(_worker_pid, f"{i}.pdf", {"seconds": 0.5}).result() for i in range(1)]
+    futures = [pool.submit(_worker_pid, f"{i}.pdf", {"seconds": 0.5}) for i in range(4)]
+    results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    assert [file_path for _, file_path in results] == ["0.pdf", "1.pdf", "2.pdf", "3.pdf"]
+    assert len({pid for pid, _ in results}) == 2
+    assert first[0][0] in {pid for pid, _ in results}
+    assert elapsed < 2.5
+
+
+def test_conversion_errors_are_raised_by_the_future(make_pool):
+    pool = make_pool(max_workers=1)
+
+    with pytest.raises(ValueError, match=r"cannot convert broken\.pdf"):
+        pool.submit(_fail, "broken.pdf", {}).result()
+    assert pool.submit(_worker_pid, "ok.pdf", {}).result()[1] == "ok.pdf"
+
+
+def test_timed_out_conversions_kill_their_worker(make_pool):
+    pool = make_pool(max_workers=1, task_timeout=0.5)
+    pid, _ = pool.submit(_worker_pid, "warm.pdf", {}).result()
+
+    with pytest.raises(TimeoutError, match=r"slow\.pdf timed out"):
+        pool.submit(_worker_pid, "slow.pdf", {"seconds": 30}).result(timeout=10)
+
+    new_pid, _ = pool.submit(_worker_pid, "next.pdf", {}).result()
+    assert new_pid != pid
+
+
+def test_cancelling_stops_running_and_queued_conversions(make_pool):
+    pool = make_pool(max_workers=1)
+    running = pool.submit(_worker_pid, "running.pdf", {"seconds": 30})
+    queued = pool.submit(_worker_pid, "queued.pdf", {})
+    while not running.running():
+        time.sleep(0.01)
+
+    assert queued.cancel()
+    assert not running.cancel()
+    with pytest.raises(CancelledError):
+        running.result(timeout=5)
+    assert pool.submit(_worker_pid, "next.pdf", {}).result(timeout=10)[1] == "next.pdf"
+
+
+def test_workers_above_the_memory_limit_are_restarted(make_pool):
+    pool = make_pool(max_workers=1, max_worker_memory=1)
+
+    pids = [pool.submit(_worker_pid, f"{i}.pdf", {}).result()[0] for i in range(3)]
+
+    assert len(set(pids)) == 3
+    assert pool.recycled_workers == 3
+
+
+def test_shutdown_cancels_pending_conversions(make_pool):
+    pool = make_pool(max_workers=1)
+    running = pool.submit(_worker_pid, "running.pdf", {"seconds": 0.5})
+    pending = pool.submit(_worker_pid, "pending.pdf", {})
+    while not running.running():
+        time.sleep(0.01)
+
+    pool.shutdown()
+
+    assert running.result()[1] == "running.pdf"
+    assert pending.cancelled()
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.submit(_worker_pid, "late.pdf", {})
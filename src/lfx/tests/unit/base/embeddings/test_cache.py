@@ -0,0 +1,150 @@
+import hashlib
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.base.embeddings import cache as cache_module
+from lfx.base.embeddings.cache import CachedEmbeddings, EmbeddingCache, embedding_model_id, with_embedding_cache
+from lfx.base.embeddings.embeddings_class import EmbeddingsWithModels
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that record every text sent to the model."""
+
+    def __init__(self, model: str = "fake-model", size: int = 8) -> None:
+        self.model = model
+        self.size = size
+        self.calls: list[list[str]] = []
+
+    def _vector(self, text: str) -> list[float]:
+        digest = hashlib.sha256(f"{self.model}:{text}".encode()).digest()
+        return [byte / 255 for byte in digest[: self.size]]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append([text])
+        return [-value for value in self._vector(text)]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def mset(self, mapping):
+        self.values.update(mapping)
+
+
+@pytest.fixture
+def embedding_cache(tmp_path):
+    return EmbeddingCache(tmp_path / "embedding_cache.db", size_limit=1024**2)
+
+
+def _cached(model: FakeEmbeddings, cache: EmbeddingCache) -> CachedEmbeddings:
+    return CachedEmbeddings(model, cache, embedding_model_id(model))
+
+
+def test_only_cache_misses_are_embedded_in_one_batch(embedding_cache):
+    model = FakeEmbeddings()
+    embeddings = _cached(model, embedding_cache)
+
+    first = embeddings.embed_documents(["alpha", "beta"])
+    second = embeddings.embed_documents(["beta", "gamma", "gamma", " alpha "])
+
+    assert model.calls == [["alpha", "beta"], ["gamma"]]
+    assert first == FakeEmbeddings().embed_documents(["alpha", "beta"])
+    assert second == [first[1], *FakeEmbeddings().embed_documents(["gamma", "gamma"]), first[0]]
+    assert embeddings.stats.as_dict() == {"hits": 2, "misses": 4, "hit_rate": pytest.approx(1 / 3)}
+
+
+def test_vectors_are_shared_across_instances_but_not_models_or_query_kinds(embedding_cache):
+    _cached(FakeEmbeddings(), embedding_cache).embed_documents(["alpha"])
+
+    model = FakeEmbeddings()
+    other_model = FakeEmbeddings(model="other-model")
+    _cached(model, embedding_cache).embed_documents(["alpha"])
+    _cached(other_model, embedding_cache).embed_documents(["alpha"])
+    query = _cached(model, embedding_cache).embed_query("alpha")
+
+    assert model.calls == [["alpha"]]
+    assert other_model.calls == [["alpha"]]
+    assert query == FakeEmbeddings().embed_query("alpha")
+
+
+async def test_async_embeddings_use_the_cache(embedding_cache):
+    model = FakeEmbeddings()
+    embeddings = _cached(model, embedding_cache)
+
+    vectors = await embeddings.aembed_documents(["alpha", "beta"])
+    assert await embeddings.aembed_documents(["beta", "alpha"]) == vectors[::-1]
+    assert await embeddings.aembed_query("alpha") == await embeddings.aembed_query("alpha")
+
+    assert model.calls == [["alpha", "beta"], ["alpha"]]
+
+
+def test_oldest_vectors_are_evicted_beyond_the_size_limit(tmp_path):
+    vector_bytes = 8 * 8
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db", size_limit=10 * vector_bytes)
+    model = FakeEmbeddings()
+    embeddings = _cached(model, cache)
+
+    embeddings.embed_documents([f"text {i}" for i in range(12)])
+    model.calls.clear()
+    embeddings.embed_documents([f"text {i}" for i in range(12)])
+
+    assert model.calls == [[f"text {i}" for i in range(3)]]
+
+
+def test_redis_tier_shares_vectors_between_hosts(tmp_path):
+    redis = FakeRedis()
+    model = FakeEmbeddings()
+    _cached(model, EmbeddingCache(tmp_path / "host_a.db", 1024**2, redis_client=redis)).embed_documents(["alpha"])
+    vectors = _cached(model, EmbeddingCache(tmp_path / "host_b.db", 1024**2, redis_client=redis)).embed_documents(
+        ["alpha"]
+    )
+
+    assert model.calls == [["alpha"]]
+    assert vectors == FakeEmbeddings().embed_documents(["alpha"])
+    # The vector was copied to the local cache of the second host
+    local_model = FakeEmbeddings()
+    _cached(local_model, EmbeddingCache(tmp_path / "host_b.db", 1024**2)).embed_documents(["alpha"])
+    assert local_model.calls == []
+
+
+def test_unreadable_cache_falls_back_to_the_model(tmp_path):
+    (tmp_path / "embedding_cache.db").write_text("not a database")
+    model = FakeEmbeddings()
+
+    vectors = _cached(model, EmbeddingCache(tmp_path / "embedding_cache.db", 1024**2)).embed_documents(["alpha"])
+
+    assert vectors == FakeEmbeddings().embed_documents(["alpha"])
+
+
+def test_with_embedding_cache_only_wraps_identifiable_embeddings(monkeypatch, embedding_cache):
+    monkeypatch.setattr(cache_module, "get_embedding_cache", lambda: embedding_cache)
+    model = FakeEmbeddings()
+    anonymous = FakeEmbeddings()
+    anonymous.model = None
+
+    wrapped = with_embedding_cache(model)
+    assert isinstance(wrapped, CachedEmbeddings)
+    assert wrapped.model == "fake-model"
+    assert with_embedding_cache(wrapped) is wrapped
+    assert with_embedding_cache(anonymous) is anonymous
+    assert with_embedding_cache("not embeddings") == "not embeddings"
+
+    with_models = with_embedding_cache(EmbeddingsWithModels(model, available_models={"fake-model": model}))
+    assert isinstance(with_models, EmbeddingsWithModels)
+    assert isinstance(with_models.embeddings, CachedEmbeddings)
+    assert isinstance(with_models.available_models["fake-model"], CachedEmbeddings)
+
+
+def test_with_embedding_cache_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(cache_module, "get_embedding_cache", lambda: None)
+    model = FakeEmbeddings()
+
+    assert with_embedding_cache(model) is model
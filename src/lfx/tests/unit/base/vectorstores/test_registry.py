@@ -0,0 +1,186 @@
+import threading
+import time
+
+from langchain_core.embeddings import Embeddings
+from lfx.base.vectorstores.registry import VectorStoreKey, VectorStoreRegistry, embeddings_identity
+from pydantic import SecretStr
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+class FakeEmbeddings(Embeddings):
+    def __init__(self, model: str | None = "fake-model", api_key: str | SecretStr | None = None) -> None:
+        self.model = model
+        self.api_key = api_key
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:  # noqa: ARG002
+        return [0.0]
+
+
+def _close(store: FakeStore) -> None:
+    store.closed = True
+
+
+def _key(location: str = "/kb/user/docs", collection: str = "docs") -> VectorStoreKey:
+    return VectorStoreKey("chroma", location, collection, "embedding")
+
+
+def test_runs_share_the_client_of_a_key():
+    registry = VectorStoreRegistry()
+
+    with registry.lease(_key(), FakeStore, _close) as first:
+        pass
+    with registry.lease(_key(), FakeStore, _close) as second:
+        pass
+    with registry.lease(_key(collection="other"), FakeStore, _close) as other:
+        pass
+
+    assert first is second
+    assert other is not first
+    assert (registry.hits, registry.misses) == (1, 2)
+    assert not first.closed
+
+
+def test_unshareable_clients_are_built_per_lease():
+    registry = VectorStoreRegistry()
+
+    with registry.lease(None, FakeStore, _close) as first:
+        pass
+    with registry.lease(None, FakeStore, _close) as second:
+        pass
+
+    assert first is not second
+    assert len(registry) == 0
+    assert not first.closed
+
+
+def test_an_idle_timeout_of_zero_disables_reuse():
+    registry = VectorStoreRegistry(idle_timeout=0)
+
+    with registry.lease(_key(), FakeStore, _close) as first:
+        pass
+    with registry.lease(_key(), FakeStore, _close) as second:
+        pass
+
+    assert first is not second
+
+
+def test_idle_clients_expire():
+    registry = VectorStoreRegistry(idle_timeout=0.05)
+    with registry.lease(_key(), FakeStore, _close) as store:
+        pass
+
+    time.sleep(0.1)
+
+    assert registry.evict_idle() == 1
+    assert store.closed
+    assert len(registry) == 0
+
+
+def test_clients_in_use_are_not_evicted():
+    registry = VectorStoreRegistry(idle_timeout=0.05, max_idle=0)
+
+    with registry.lease(_key(), FakeStore, _close) as store:
+        time.sleep(0.1)
+        registry.evict_idle()
+        assert not store.closed
+
+    assert store.closed
+
+
+def test_least_recently_used_idle_clients_are_closed_above_max_idle():
+    registry = VectorStoreRegistry(max_idle=2)
+    stores = []
+    for collection in ("a", "b", "c"):
+        with registry.lease(_key(collection=collection), FakeStore, _close) as store:
+            stores.append(store)
+
+    assert [store.closed for store in stores] == [True, False, False]
+    assert len(registry) == 2
+
+
+def test_invalidate_closes_the_clients_of_a_knowledge_base(tmp_path):
+    registry = VectorStoreRegistry()
+    kb_path = tmp_path / "user" / "docs"
+    with registry.lease(_key(str(kb_path)), FakeStore, _close) as deleted:
+        pass
+    with registry.lease(_key(str(tmp_path / "user" / "docs-2")), FakeStore, _close) as kept:
+        pass
+
+    assert registry.invalidate(kb_path) == 1
+
+    assert deleted.closed
+    assert not kept.closed
+    with registry.lease(_key(str(kb_path)), FakeStore, _close) as reopened:
+        assert reopened is not deleted
+
+
+def test_clients_invalidated_while_in_use_are_closed_on_release(tmp_path):
+    registry = VectorStoreRegistry()
+
+    with registry.lease(_key(str(tmp_path)), FakeStore, _close) as store:
+        registry.invalidate(tmp_path.parent)
+        assert not store.closed
+
+    assert store.closed
+    assert len(registry) == 0
+
+
+def test_concurrent_runs_build_a_missing_client_once():
+    registry = VectorStoreRegistry()
+    built = []
+
+    def factory():
+        time.sleep(0.05)
+        built.append(FakeStore())
+        return built[-1]
+
+    def run():
+        with registry.lease(_key(), factory, _close):
+            pass
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert registry.hits == 3
+
+
+def test_embeddings_identity_includes_the_credentials():
+    first = embeddings_identity(FakeEmbeddings(api_key=SecretStr("key-1")))
+
+    assert first == embeddings_identity(FakeEmbeddings(api_key=SecretStr("key-1")))
+    assert first != embeddings_identity(FakeEmbeddings(api_key=SecretStr("key-2")))
+    assert first != embeddings_identity(FakeEmbeddings(model="other-model", api_key=SecretStr("key-1")))
+    assert embeddings_identity(FakeEmbeddings(model=None)) is None
+    assert embeddings_identity(None) is None
+
+
+def test_key_locks_are_dropped_with_their_entries(tmp_path):
+    registry = VectorStoreRegistry(max_idle=1)
+    for collection in ("a", "b", "c"):
+        with registry.lease(_key(str(tmp_path), collection), FakeStore, _close):
+            pass
+    registry.invalidate(tmp_path)
+
+    assert len(registry) == 0
+    assert registry._key_locks == {}
+
+
+def test_invalidate_skips_remote_stores(tmp_path):
+    registry = VectorStoreRegistry()
+    key = VectorStoreKey("chroma-http", str(tmp_path), "docs", "embedding")
+    with registry.lease(key, FakeStore, _close) as store:
+        pass
+
+    assert registry.invalidate(tmp_path) == 0
+    assert not store.closed
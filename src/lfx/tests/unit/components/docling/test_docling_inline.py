@@ -0,0 +1,54 @@
+"""Tests for the Docling component, with a stand-in for the Docling process pool."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("docling_core", reason="docling_core not installed")
+
+from lfx.base.data.docling_pool import ConversionFuture
+from lfx.components.docling import docling_inline
+from lfx.components.docling.docling_inline import DoclingInlineComponent
+
+
+class _Pool:
+    """Records the conversions submitted to it and never runs them."""
+
+    def __init__(self):
+        self.futures: list[ConversionFuture] = []
+
+    def submit(self, convert, file_path, options):
+        future = ConversionFuture(convert, file_path, options)
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = _Pool()
+    monkeypatch.setattr(docling_inline, "get_docling_pool", lambda: pool)
+    return pool
+
+
+async def test_conversions_are_awaited_and_timeouts_are_skipped(pool):
+    component = DoclingInlineComponent()
+    conversion = asyncio.create_task(component._convert_files(["a.pdf", "b.pdf"], {}))
+    await asyncio.sleep(0)
+
+    pool.futures[0].set_result({"document": "a", "file_path": "a.pdf"})
+    pool.futures[1].set_exception(TimeoutError("b.pdf timed out"))
+
+    assert await conversion == [{"document": "a", "file_path": "a.pdf"}, None]
+
+
+async def test_cancelling_the_build_cancels_the_conversions(pool):
+    component = DoclingInlineComponent()
+    conversion = asyncio.create_task(component._convert_files(["a.pdf", "b.pdf"], {}))
+    await asyncio.sleep(0)
+
+    conversion.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await conversion
+
+    assert len(pool.futures) == 2
+    assert all(future.cancelled() for future in pool.futures)
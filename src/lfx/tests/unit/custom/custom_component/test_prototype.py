@@ -0,0 +1,55 @@
+from copy import deepcopy
+
+from lfx.components.input_output.chat import ChatInput
+from lfx.components.models_and_agents.prompt import PromptComponent
+from lfx.custom.custom_component.component import Component
+from lfx.custom.custom_component.prototype import copy_definition, get_component_prototype
+from lfx.io import DropdownInput, Output
+from lfx.schema.message import Message
+
+
+class DropdownComponent(Component):
+    inputs = [DropdownInput(name="mode", options=["fast", "accurate"], value="fast")]
+    outputs = [Output(name="result", display_name="Result", method="build_result")]
+
+    def build_result(self) -> Message:
+        return Message(text=self.mode)
+
+
+def test_copy_definition_is_equivalent_to_deepcopy():
+    for definition in [*ChatInput.inputs, *ChatInput.outputs, *PromptComponent.inputs]:
+        copy = copy_definition(definition)
+
+        assert copy is not definition
+        assert copy == deepcopy(definition)
+        for name, value in definition.__dict__.items():
+            if isinstance(value, list | dict):
+                assert copy.__dict__[name] is not value
+
+
+def test_instances_do_not_change_the_class_definitions():
+    first = DropdownComponent()
+    second = DropdownComponent()
+
+    first.set(mode="accurate")
+    first._inputs["mode"].options.append("cheap")
+    first._outputs_map["result"].value = "done"
+
+    assert second.mode == "fast"
+    assert second._inputs["mode"].options == ["fast", "accurate"]
+    assert DropdownComponent.inputs[0].options == ["fast", "accurate"]
+    assert DropdownComponent.outputs[0].types == []
+    assert first._outputs_map["result"].types == ["Message"]
+
+
+def test_class_source_and_return_types_are_resolved_once():
+    prototype = get_component_prototype(ChatInput)
+    first = ChatInput()
+    second = ChatInput()
+
+    assert get_component_prototype(ChatInput) is prototype
+    assert first._code is second._code
+    assert prototype.get_source(ChatInput) is first._code
+    assert first._outputs_map["message"].types == second._outputs_map["message"].types == ["Message"]
+    # Callers get their own list
+    assert first._outputs_map["message"].types is not second._outputs_map["message"].types
@@ -0,0 +1,127 @@
+import os
+
+import pytest
+from lfx.custom.directory_reader.directory_reader import DirectoryReader
+from lfx.custom.directory_reader.manifest import ComponentManifest
+from lfx.custom.directory_reader.utils import abuild_custom_component_list_from_path
+
+COMPONENT_CODE = """
+from lfx.custom.custom_component.component import Component
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{name}"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text)
+"""
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    category = tmp_path / "components" / "custom"
+    category.mkdir(parents=True)
+    for name in ("First", "Second"):
+        (category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name))
+    return tmp_path / "components"
+
+
+@pytest.fixture
+def processed(monkeypatch):
+    calls = []
+    process_file_async = DirectoryReader.process_file_async
+
+    async def counting_process_file_async(self, file_path):
+        calls.append(os.path.basename(file_path))  # noqa: PTH119
+        return await process_file_async(self, file_path)
+
+    monkeypatch.setattr(DirectoryReader, "process_file_async", counting_process_file_async)
+    return calls
+
+
+@pytest.fixture
+def built(monkeypatch):
+    from lfx.custom import utils
+
+    calls = []
+    build_component = utils.build_component
+
+    def counting_build_component(component):
+        calls.append(component["name"])
+        return build_component(component)
+
+    monkeypatch.setattr(utils, "build_component", counting_build_component)
+    return calls
+
+
+async def _scan(components_path, manifest):
+    return await abuild_custom_component_list_from_path(str(components_path), manifest=manifest)
+
+
+async def test_unchanged_files_are_served_from_the_manifest(tmp_path, components_path, processed, built):
+    manifest = ComponentManifest(tmp_path / "manifest.db", "1.0")
+    cold = await _scan(components_path, manifest)
+    # Another worker opening the same manifest
+    warm = await _scan(components_path, ComponentManifest(tmp_path / "manifest.db", "1.0"))
+
+    assert warm == cold
+    assert set(warm["custom"]) == {"First", "Second"}
+    assert sorted(processed) == ["first.py", "second.py"]
+    assert sorted(built) == ["first", "second"]
+
+
+async def test_only_changed_files_are_processed_again(tmp_path, components_path, processed, built):
+    other = components_path / "other"
+    other.mkdir()
+    (other / "third.py").write_text(COMPONENT_CODE.format(name="Third"))
+    manifest = ComponentManifest(tmp_path / "manifest.db", "1.0")
+    await _scan(components_path, manifest)
+    processed.clear()
+    built.clear()
+
+    (other / "third.py").write_text(COMPONENT_CODE.format(name="Renamed"))
+    first = components_path / "custom" / "first.py"
+    os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 10**9))
+    result = await _scan(components_path, manifest)
+
+    assert set(result["custom"]) == {"First", "Second"}
+    assert set(result["other"]) == {"Renamed"}
+    assert processed == ["third.py"]
+    assert built == ["third"]
+
+
+async def test_files_are_processed_again_when_a_module_of_their_directory_changes(
+    tmp_path, components_path, processed, built
+):
+    helpers = components_path / "custom" / "helpers.py"
+    helpers.write_text("PREFIX = 'a'\n")
+    manifest = ComponentManifest(tmp_path / "manifest.db", "1.0")
+    await _scan(components_path, manifest)
+    processed.clear()
+    built.clear()
+
+    helpers.write_text("PREFIX = 'changed'\n")
+    result = await _scan(components_path, manifest)
+
+    assert set(result["custom"]) == {"First", "Second"}
+    assert sorted(processed) == ["first.py", "helpers.py", "second.py"]
+    assert sorted(built) == ["first", "helpers", "second"]
+
+
+async def test_manifest_is_scoped_to_the_lfx_version(tmp_path, components_path, processed):
+    await _scan(components_path, ComponentManifest(tmp_path / "manifest.db", "1.0"))
+    await _scan(components_path, ComponentManifest(tmp_path / "manifest.db", "2.0"))
+
+    assert len(processed) == 4
+
+
+async def test_unreadable_manifest_falls_back_to_a_full_scan(tmp_path, components_path, processed):
+    (tmp_path / "manifest.db").write_text("not a database")
+    result = await _scan(components_path, ComponentManifest(tmp_path / "manifest.db", "1.0"))
+
+    assert set(result["custom"]) == {"First", "Second"}
+    assert len(processed) == 2
@@ -0,0 +1,104 @@
+"""Tests for the cache of templates built from component code."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from lfx.custom.custom_component.component import Component
+from lfx.custom.template_cache import TemplateCache, clear_template_cache, get_template_cache
+from lfx.custom.utils import build_custom_component_template
+
+COMPONENT_CODE = """
+from lfx.custom.custom_component.component import Component
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class EchoComponent(Component):
+    display_name = "Echo"
+    inputs = [MessageTextInput(name="text", display_name="Text", value="{value}")]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+"""
+
+
+@pytest.fixture(autouse=True)
+def template_cache():
+    clear_template_cache()
+    yield get_template_cache()
+    clear_template_cache()
+
+
+def _code(value: str = "hello") -> str:
+    return COMPONENT_CODE.replace("{value}", value)
+
+
+def test_templates_are_built_once_per_code_and_user(template_cache):
+    template, instance = build_custom_component_template(Component(_code=_code()), user_id="user")
+    template["template"]["text"]["value"] = "mutated by the request"
+
+    cached_template, cached_instance = build_custom_component_template(Component(_code=_code()), user_id="user")
+
+    assert (template_cache.hits, template_cache.misses) == (1, 1)
+    assert cached_template["template"]["text"]["value"] == "hello"
+    assert type(cached_instance) is type(instance)
+    assert cached_instance is not instance
+    assert cached_instance._user_id == "user"
+
+
+def test_templates_are_built_again_for_changed_code_and_other_users(template_cache):
+    build_custom_component_template(Component(_code=_code()), user_id="user")
+
+    changed, _ = build_custom_component_template(Component(_code=_code("changed")), user_id="user")
+    build_custom_component_template(Component(_code=_code()), user_id="other-user")
+
+    assert template_cache.misses == 3
+    assert changed["template"]["text"]["value"] == "changed"
+
+
+def test_concurrent_builds_of_the_same_value_are_coalesced():
+    cache = TemplateCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.05)
+        return "template"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_build("template", "code", build))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["template"] * 4
+    assert len(calls) == 1
+
+
+def test_failed_builds_are_not_cached():
+    cache = TemplateCache()
+
+    def fail():
+        msg = "invalid code"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="invalid code"):
+        cache.get_or_build("template", "code", fail)
+
+    assert cache.get_or_build("template", "code", lambda: "template") == "template"
+
+
+def test_a_ttl_of_zero_disables_the_cache():
+    cache = TemplateCache(ttl=0)
+
+    with patch.object(cache, "_entries") as entries:
+        assert cache.get_or_build("template", "code", lambda: "first") == "first"
+        assert cache.get_or_build("template", "code", lambda: "second") == "second"
+
+    entries.get.assert_not_called()
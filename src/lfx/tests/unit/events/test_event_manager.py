@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from lfx.events.event_manager import (
+    Event,
     EventManager,
     create_default_event_manager,
     create_stream_tokens_event_manager,
@@ -211,6 +212,54 @@ class TestEventManager:
 
         assert parsed_data["data"] == complex_data
 
+    def test_orjson_encoder_matches_json_encoder(self):
+        """Test that the orjson event encoder produces the same payloads as the default encoder."""
+        from datetime import datetime, timezone
+        from uuid import uuid4
+
+        from lfx.schema.data import Data
+
+        queue = MagicMock()
+        data = {
+            "text": "héllo",
+            "when": datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+            "id": uuid4(),
+            "data": Data(data={"text": "chunk", "score": 0.5}),
+            "scores": (0.25, 0.5),
+            1: "integer key",
+        }
+
+        payloads = []
+        for encoder in ("json", "orjson"):
+            EventManager(queue, encoder=encoder).send_event(event_type="end_vertex", data=data)
+            _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+            assert data_bytes.endswith(b"\n\n")
+            payloads.append(json.loads(data_bytes))
+
+        assert payloads[1] == payloads[0]
+
+    def test_orjson_encoder_falls_back_for_unsupported_values(self):
+        """Test that values orjson cannot encode are encoded by the default encoder."""
+        queue = MagicMock()
+        manager = EventManager(queue, encoder="orjson")
+
+        manager.send_event(event_type="token", data={"big": 2**70})
+
+        _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        assert json.loads(data_bytes)["data"] == {"big": 2**70}
+
+    def test_structured_encoder_passes_events_without_encoding(self):
+        """Test that consumers in the same process receive the event type and the data as they were sent."""
+        queue = MagicMock()
+        manager = EventManager(queue, encoder="structured")
+        data = {"chunk": "Hello", "id": "message-1"}
+
+        manager.send_event(event_type="token", data=data)
+
+        _, event, _ = queue.put_nowait.call_args[0][0]
+        assert event == Event("token", data)
+        assert event.data is data
+
 
 class TestEventManagerFactories:
     """Test cases for EventManager factory functions."""
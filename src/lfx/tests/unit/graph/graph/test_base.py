@@ -362,3 +362,51 @@ def test_graph_raw_event_metrics_no_optional_fields():
 
     # Assert only timestamp is present (no optional fields)
     assert len(metrics) == 1
+
+
+def test_edge_indexes_follow_vertex_removal():
+    """Edge lookups use source and target indexes that must follow graph mutations."""
+    node_a = ChatInput(_id="node_a")
+    node_b = TextOutputComponent(_id="node_b")
+    node_c = ChatOutput(_id="node_c")
+    node_b.set(input_value=node_a.message_response)
+    node_c.set(input_value=node_b.text_response)
+    graph = Graph(node_a, node_c)
+
+    assert [edge.target_id for edge in graph.get_vertex_edges("node_b", is_target=False)] == ["node_c"]
+    assert [vertex.id for vertex in graph.get_vertices_with_target("node_b")] == ["node_a"]
+    assert graph.get_edge("node_a", "node_b") is not None
+    assert {vertex.id: count for vertex, count in graph.get_vertex_neighbors(graph.get_vertex("node_b")).items()} == {
+        "node_a": 1,
+        "node_c": 1,
+    }
+
+    graph.remove_vertex("node_c")
+
+    assert graph.get_vertex_edges("node_b", is_target=False) == []
+    assert graph.get_edge("node_b", "node_c") is None
+    assert len(graph.get_vertex_edges("node_b")) == len(graph.edges) == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_opt_in_and_bounded():
+    """Snapshots are off by default and, when enabled, replay the last steps from compact deltas."""
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(should_store_message=False, sender_name=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+    assert graph.get_snapshots() == []
+
+    graph.enable_snapshots(2)
+    expected = []
+    for _ in range(3):
+        await graph.astep()
+        expected.append(graph.get_snapshot())
+
+    snapshots = graph.get_snapshots()
+    assert [snapshot.pop("vertex_id") for snapshot in snapshots] == ["text_output", "chat_output"]
+    assert snapshots == expected[-2:]
+    assert list(graph._call_order) == ["text_output", "chat_output"]
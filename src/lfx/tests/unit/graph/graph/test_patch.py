@@ -0,0 +1,157 @@
+import copy
+
+import pytest
+from lfx.components.input_output import ChatInput, TextOutputComponent
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.custom.validate import create_class
+from lfx.graph import Graph
+from lfx.graph.graph.diff import diff_graph_data
+
+VECTOR_STORE_CODE = """
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class MemoryVectorStoreComponent(LCVectorStoreComponent):
+    display_name = "Memory Vector Store"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Stored", name="stored", method="stored_texts")]
+
+    @check_cached_vector_store
+    def build_vector_store(self) -> InMemoryVectorStore:
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+        vector_store.add_documents([Document(page_content=self.text)])
+        return vector_store
+
+    def stored_texts(self) -> Message:
+        vector_store = self.build_vector_store()
+        return Message(text=",".join(document["text"] for document in vector_store.store.values()))
+"""
+
+
+def _flow_payload() -> dict:
+    chat_input = ChatInput(_id="chat_input", input_value="hello", should_store_message=False)
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=chat_input.message_response, text2="world", delimiter=" ")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=combine.combine_texts)
+    graph = Graph(chat_input, text_output)
+    return copy.deepcopy(graph.dump()["data"])
+
+
+def _build(payload: dict) -> Graph:
+    return Graph.from_payload(copy.deepcopy(payload), flow_id="flow", user_id="user")
+
+
+def _node(payload: dict, node_id: str) -> dict:
+    return next(node for node in payload["nodes"] if node["id"] == node_id)
+
+
+def _components(graph: Graph) -> dict:
+    return {vertex.id: vertex.custom_component for vertex in graph.vertices}
+
+
+def test_diff_ignores_layout_changes():
+    old = _flow_payload()
+    new = copy.deepcopy(old)
+    _node(new, "combine")["position"] = {"x": 100, "y": 200}
+    _node(new, "combine")["selected"] = True
+
+    diff = diff_graph_data(old["nodes"], old["edges"], new["nodes"], new["edges"])
+
+    assert diff.is_empty
+
+
+def test_patch_keeps_the_components_of_unchanged_vertices():
+    payload = _flow_payload()
+    graph = _build(payload)
+    components = _components(graph)
+    _node(payload, "combine")["data"]["node"]["template"]["text2"]["value"] = "there"
+
+    affected = graph.patch(copy.deepcopy(payload))
+
+    assert affected == {"combine", "text_output"}
+    patched = _components(graph)
+    for vertex_id in affected:
+        assert patched[vertex_id] is not components[vertex_id]
+    assert patched["chat_input"] is components["chat_input"]
+    assert graph.get_vertex("combine").params["text2"] == "there"
+
+
+def test_patch_without_changes_affects_nothing():
+    payload = _flow_payload()
+    graph = _build(payload)
+    components = _components(graph)
+
+    assert graph.patch(copy.deepcopy(payload)) == set()
+    assert _components(graph) == components
+
+
+def test_patch_removes_nodes_and_their_edges():
+    payload = _flow_payload()
+    graph = _build(payload)
+    payload["nodes"] = [node for node in payload["nodes"] if node["id"] != "text_output"]
+    payload["edges"] = [edge for edge in payload["edges"] if edge["target"] != "text_output"]
+
+    assert graph.patch(copy.deepcopy(payload)) == set()
+
+    assert "text_output" not in graph.vertex_map
+    assert all("text_output" not in (edge.source_id, edge.target_id) for edge in graph.edges)
+    assert graph.successor_map["combine"] == []
+
+
+@pytest.mark.asyncio
+async def test_patched_graph_runs_like_a_new_graph():
+    payload = _flow_payload()
+    graph = _build(payload)
+    async for _ in graph.async_start():
+        pass
+    _node(payload, "combine")["data"]["node"]["template"]["text2"]["value"] = "there"
+
+    graph.patch(copy.deepcopy(payload))
+    results = {result.vertex.id: result async for result in graph.async_start() if hasattr(result, "vertex")}
+
+    assert results["text_output"].result_dict.results["text"].text == "hello there"
+
+
+def test_patch_gives_up_on_cycles():
+    payload = _flow_payload()
+    graph = _build(payload)
+    edge = copy.deepcopy(next(edge for edge in payload["edges"] if edge["target"] == "combine"))
+    edge["source"], edge["target"] = "text_output", "chat_input"
+    edge["data"]["sourceHandle"]["id"], edge["data"]["targetHandle"]["id"] = "text_output", "chat_input"
+    payload["edges"].append(edge)
+
+    assert graph.patch(payload) is None
+
+
+@pytest.mark.asyncio
+async def test_kept_vector_store_ingests_the_data_of_the_next_run():
+    chat_input = ChatInput(_id="chat_input", input_value="first", should_store_message=False)
+    vector_store = create_class(VECTOR_STORE_CODE, "MemoryVectorStoreComponent")(
+        _id="vector_store", _code=VECTOR_STORE_CODE
+    )
+    vector_store.set(text=chat_input.message_response)
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=vector_store.stored_texts, text2="!", delimiter="")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=combine.combine_texts)
+    payload = copy.deepcopy(Graph(chat_input, text_output).dump()["data"])
+    graph = _build(payload)
+
+    async for _ in graph.async_start():
+        pass
+    components = _components(graph)
+    _node(payload, "combine")["data"]["node"]["template"]["text2"]["value"] = "?"
+    affected = graph.patch(copy.deepcopy(payload))
+    graph.get_vertex("chat_input").update_raw_params({"input_value": "second"}, overwrite=True)
+    results = {result.vertex.id: result async for result in graph.async_start() if hasattr(result, "vertex")}
+
+    assert "vector_store" not in affected
+    assert _components(graph)["vector_store"] is components["vector_store"]
+    assert results["text_output"].result_dict.results["text"].text == "second?"
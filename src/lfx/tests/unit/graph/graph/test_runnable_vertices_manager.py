@@ -206,3 +206,24 @@ def test_add_to_vertices_being_run(data):
     manager.add_to_vertices_being_run(vertex_id)
 
     assert vertex_id in manager.vertices_being_run
+
+
+def test_from_dict_accepts_lists(data):
+    data["run_predecessors"] = {"A": [], "B": ["A"], "C": ["A"], "D": ["B", "C"]}
+    manager = RunnableVerticesManager.from_dict(data)
+
+    manager.remove_from_predecessors("B")
+
+    assert manager.run_predecessors["D"] == {"C"}
+    assert manager.run_map["A"] == {"B", "C"}
+
+
+def test_build_run_map_does_not_mutate_predecessor_map(data):
+    manager = RunnableVerticesManager.from_dict(data)
+    predecessor_map = {"X": ["Z"], "Y": ["Z", "X"]}
+
+    manager.build_run_map(predecessor_map, {"X", "Y", "Z"})
+    manager.remove_from_predecessors("Z")
+
+    assert manager.run_predecessors["Y"] == {"X"}
+    assert predecessor_map == {"X": ["Z"], "Y": ["Z", "X"]}
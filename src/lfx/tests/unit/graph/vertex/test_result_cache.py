@@ -0,0 +1,153 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from lfx.components.processing.dataframe_operations import DataFrameOperationsComponent
+from lfx.components.processing.parser import ParserComponent
+from lfx.components.processing.split_text import SplitTextComponent
+from lfx.custom.custom_component.component import Component
+from lfx.events.event_manager import create_default_event_manager
+from lfx.graph.graph.base import Graph
+from lfx.graph.vertex import result_cache
+from lfx.graph.vertex.result_cache import UncacheableValueError, _fingerprint
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+from lfx.services.cache.utils import CACHE_MISS
+
+
+class InMemoryResultCache:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key, CACHE_MISS)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+
+class SourceComponent(Component):
+    display_name = "Source"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text)
+
+
+class ParseComponent(Component):
+    display_name = "Parse"
+    cache_results = True
+    calls = 0
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Parsed", name="parsed", method="parse")]
+
+    def parse(self) -> Message:
+        type(self).calls += 1
+        return Message(text=self.text.upper())
+
+
+async def _run(text: str, event_manager=None) -> str:
+    source = SourceComponent(text=text)
+    parse = ParseComponent()
+    parse.set(text=source.build_message)
+    graph = Graph(source, parse)
+    results = [result async for result in graph.async_start(event_manager=event_manager)]
+    vertex = next(
+        result.vertex for result in results if getattr(result, "vertex", None) and result.vertex.id == parse._id
+    )
+    return vertex.built_object["parsed"].text
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = InMemoryResultCache()
+    monkeypatch.setattr(result_cache, "get_result_cache_service", lambda: cache)
+    ParseComponent.calls = 0
+    return cache
+
+
+def test_fingerprint_ignores_volatile_message_fields():
+    first = Message(text="hello", session_id="a")
+    second = Message(text="hello", session_id="b")
+
+    assert _fingerprint(first) == _fingerprint(second)
+    assert _fingerprint(first) != _fingerprint(Message(text="bye"))
+
+
+def test_fingerprint_rejects_unknown_objects():
+    with pytest.raises(UncacheableValueError):
+        _fingerprint({"client": object()})
+
+
+async def test_results_are_reused_across_runs(cache):
+    assert await _run("doc") == "DOC"
+    assert await _run("doc") == "DOC"
+
+    assert ParseComponent.calls == 1
+    assert len(cache.values) == 1
+
+
+@pytest.mark.usefixtures("cache")
+async def test_changed_inputs_miss():
+    await _run("first")
+    assert await _run("second") == "SECOND"
+
+    assert ParseComponent.calls == 2
+
+
+@pytest.mark.usefixtures("cache")
+async def test_hits_and_misses_are_streamed():
+    queue = asyncio.Queue()
+    event_manager = create_default_event_manager(queue)
+
+    await _run("doc", event_manager)
+    await _run("doc", event_manager)
+
+    statuses = []
+    while not queue.empty():
+        _, payload, _ = queue.get_nowait()
+        event = json.loads(payload)
+        if event["event"] == "result_cache":
+            statuses.append(event["data"]["status"])
+    assert statuses == ["miss", "hit"]
+
+
+def _vertex(component, *, frozen=False, user_id="user", flow_id="flow"):
+    return SimpleNamespace(
+        is_loop=False,
+        display_name=component.display_name,
+        frozen=frozen,
+        edges_source_names={"parsed"},
+        graph=SimpleNamespace(user_id=user_id, flow_id=flow_id),
+    )
+
+
+def test_frozen_vertices_do_not_use_the_result_cache():
+    assert not result_cache.should_cache_results(SourceComponent(), _vertex(SourceComponent(), frozen=True))
+    assert result_cache.should_cache_results(ParseComponent(), _vertex(ParseComponent()))
+
+
+def test_the_result_cache_can_be_disabled(monkeypatch):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(result_cache_enabled=False))
+    monkeypatch.setattr(result_cache, "get_settings_service", lambda: settings_service)
+
+    assert not result_cache.should_cache_results(ParseComponent(), _vertex(ParseComponent()))
+
+
+def test_results_are_shared_across_flows_but_not_users():
+    component = ParseComponent()
+    params = {"text": "doc"}
+
+    key = result_cache.build_result_cache_key(component, _vertex(component), params)
+
+    assert key == result_cache.build_result_cache_key(component, _vertex(component, flow_id="other"), params)
+    assert key != result_cache.build_result_cache_key(component, _vertex(component, user_id="other"), params)
+
+
+@pytest.mark.parametrize("component_class", [SplitTextComponent, ParserComponent, DataFrameOperationsComponent])
+def test_deterministic_built_ins_opt_in(component_class):
+    component = component_class()
+
+    assert result_cache.should_cache_results(component, _vertex(component))
@@ -71,3 +71,30 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_iter_records_matches_to_dict(self):
+        data_frame = DataFrame(
+            {
+                "name": ["John", "Jane"],
+                "age": [30, 25],
+                "score": [0.5, 1.5],
+                "joined": pd.to_datetime(["2024-01-01", "2024-02-01"]),
+            }
+        )
+
+        records = list(data_frame.iter_records())
+
+        assert records == data_frame.to_dict(orient="records")
+        assert type(records[0]["age"]) is int
+        assert list(data_frame.iter_records(columns=["age"])) == [{"age": 30}, {"age": 25}]
+
+    def test_format_rows(self, dataframe_with_metadata):
+        assert dataframe_with_metadata.format_rows("{name}: {text}") == ["John: name is John", "Jane: name is Jane"]
+        assert dataframe_with_metadata.format_rows("{name!r:>6} {{literal}}") == [
+            "'John' {literal}",
+            "'Jane' {literal}",
+        ]
+        assert dataframe_with_metadata.format_rows("no fields") == ["no fields", "no fields"]
+        assert DataFrame().format_rows("{name}") == []
+        with pytest.raises(KeyError, match="age"):
+            dataframe_with_metadata.format_rows("{name} is {age}")
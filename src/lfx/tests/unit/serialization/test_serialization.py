@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+from lfx.schema.data import Data
+from lfx.schema.message import Message
+from lfx.serialization import serialization
+from lfx.serialization.serialization import serialize
+from pydantic import BaseModel
+
+
+class Model(BaseModel):
+    value: str = "x"
+
+
+class CustomDict(dict):
+    pass
+
+
+def test_serializers_are_resolved_once_per_class():
+    assert serialize(CustomDict(a=1)) == {"a": 1}
+    assert serialize(Model(value="x" * 20), max_length=5) == {"value": "xxxxx..."}
+
+    assert serialization._DISPATCH_TABLE[CustomDict] is serialization._serialize_dict
+    assert serialization._DISPATCH_TABLE[Model] is serialization._serialize_pydantic
+
+
+def test_objects_reporting_another_class_are_not_cached():
+    proxy = MagicMock(spec=Model)
+    proxy.model_dump.return_value = {"value": "proxied"}
+
+    assert serialize(proxy) == {"value": "proxied"}
+    assert MagicMock not in serialization._DISPATCH_TABLE
+
+
+def test_fast_path_keeps_truncation():
+    nested = {"text": "a" * 40, "items": [1, 2.5, None, True, "b" * 10], "inner": {"n": list(range(10))}}
+
+    assert serialize(nested, max_length=30, max_items=3) == {
+        "text": "a" * 30 + "...",
+        "items": [1, 2.5, None, "... [truncated 2 items]"],
+        "inner": {"n": [0, 1, 2, "... [truncated 7 items]"]},
+    }
+    assert serialize("short", max_length=10) == "short"
+    assert serialize(7, max_length=1) == 7
+
+
+def test_schema_values_serialize_like_their_model_dump():
+    data = Data(data={"text": "hello", "score": 0.5})
+    message = Message(text="hello", sender="User", sender_name="User")
+    frame = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    assert serialize(data) == serialize(data.model_dump())
+    assert serialize(message)["text"] == "hello"
+    assert serialize(frame) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
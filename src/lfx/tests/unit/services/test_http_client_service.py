@@ -0,0 +1,188 @@
+"""Tests for the shared HTTP client service, against a local HTTP server."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from lfx.services.http_client.service import HTTPClientService
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+            body = self.headers.get("Cookie", "").encode()
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=secret")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def do_CONNECT(self):
+        # Acts as a proxy refusing to open tunnels, which is enough to see that clients went through it
+        with self.server.lock:
+            self.server.tunnels.append(self.path)
+        self.send_response(502)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = set()
+    httpd.in_flight = 0
+    httpd.max_in_flight = 0
+    httpd.tunnels = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+async def test_requests_reuse_the_connections_of_the_shared_client(server):
+    service = HTTPClientService()
+    try:
+        for _ in range(5):
+            response = await service.get_async_client().get(_url(server))
+            assert response.status_code == 200
+        for _ in range(5):
+            assert service.get_client().get(_url(server)).status_code == 200
+    finally:
+        await service.teardown()
+
+    assert len(server.connections) == 2
+
+
+def test_clients_are_shared_per_base_url_and_tls_settings():
+    service = HTTPClientService()
+
+    assert service.get_client() is service.get_client()
+    assert service.get_client("https://api.example.com") is service.get_client("https://api.example.com")
+    assert service.get_client("https://api.example.com") is not service.get_client()
+    assert service.get_client(verify=False) is not service.get_client()
+
+
+def test_async_clients_are_shared_per_event_loop():
+    service = HTTPClientService()
+
+    async def get_client():
+        return service.get_async_client(), service.get_async_client()
+
+    first, same = asyncio.run(get_client())
+    other, _ = asyncio.run(get_client())
+
+    assert first is same
+    assert first is not other
+
+
+async def test_response_cookies_are_not_sent_with_later_requests(server):
+    service = HTTPClientService()
+    try:
+        client = service.get_async_client()
+        await client.get(_url(server))
+        response = await client.get(_url(server))
+        with_cookies = await client.get(_url(server), cookies={"user": "alice"})
+    finally:
+        await service.teardown()
+
+    assert response.text == ""
+    assert with_cookies.text == "user=alice"
+
+
+async def test_requests_to_a_host_are_capped(server):
+    service = HTTPClientService(max_connections_per_host=2)
+    try:
+        client = service.get_async_client()
+        responses = await asyncio.gather(*(client.get(_url(server, "/slow")) for _ in range(6)))
+    finally:
+        await service.teardown()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert server.max_in_flight == 2
+
+
+def test_sync_requests_to_a_host_are_capped(server):
+    service = HTTPClientService(max_connections_per_host=2)
+    client = service.get_client()
+
+    with ThreadPoolExecutor(6) as executor:
+        responses = list(executor.map(lambda _: client.get(_url(server, "/slow")), range(6)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert server.max_in_flight == 2
+
+
+async def test_teardown_closes_the_clients():
+    service = HTTPClientService()
+    client = service.get_client()
+    async_client = service.get_async_client()
+
+    await service.teardown()
+
+    assert client.is_closed
+    assert async_client.is_closed
+    assert service.get_client() is not client
+
+
+@pytest.fixture
+def environment_proxies(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+async def test_https_requests_go_through_the_https_proxy_of_the_environment(server, environment_proxies):
+    environment_proxies.setenv("HTTPS_PROXY", _url(server))
+    service = HTTPClientService(max_connections_per_host=2)
+    try:
+        with pytest.raises(httpx.ProxyError):
+            service.get_client().get("https://example.invalid/")
+        with pytest.raises(httpx.ProxyError):
+            await service.get_async_client().get("https://example.invalid/")
+    finally:
+        await service.teardown()
+
+    assert server.tunnels == ["example.invalid:443", "example.invalid:443"]
+
+
+async def test_explicit_proxies_and_no_proxy_hosts_bypass_the_environment_proxy(server, environment_proxies):
+    environment_proxies.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    environment_proxies.setenv("NO_PROXY", "127.0.0.1")
+    service = HTTPClientService()
+    try:
+        assert service.get_client().get(_url(server)).status_code == 200
+        assert (await service.get_async_client().get(_url(server))).status_code == 200
+        with pytest.raises(httpx.ProxyError):
+            service.get_client(proxy=_url(server)).get("https://example.invalid/")
+    finally:
+        await service.teardown()
+
+    assert server.tunnels == ["example.invalid:443"]
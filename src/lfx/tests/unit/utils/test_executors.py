@@ -0,0 +1,112 @@
+"""Unit tests for the executor pools."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from lfx.components.processing.split_text import SplitTextComponent
+from lfx.custom.custom_component.component import Component
+from lfx.utils.executors import (
+    ExecutorPool,
+    configure_executor_pools,
+    executor_pool_stats,
+    get_component_pool_name,
+    get_executor_pool,
+    run_in_pool,
+)
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    configure_executor_pools()
+    yield
+    configure_executor_pools()
+
+
+async def test_run_in_pool_runs_in_a_pool_thread_with_the_caller_context():
+    request_id.set("abc")
+
+    thread_name, value = await run_in_pool("io", lambda: (threading.current_thread().name, request_id.get()))
+
+    assert thread_name.startswith("vetrai-io")
+    assert value == "abc"
+    stats = {stats.name: stats for stats in executor_pool_stats()}
+    assert stats["io"].completed == 1
+    assert stats["io"].running == stats["io"].queued == 0
+
+
+async def test_a_saturated_pool_does_not_delay_other_pools():
+    configure_executor_pools(sizes={"io": 2})
+    release = threading.Event()
+    blocked = [asyncio.create_task(run_in_pool("io", release.wait)) for _ in range(4)]
+    await asyncio.sleep(0.05)
+
+    try:
+        assert await asyncio.wait_for(run_in_pool("events", lambda: "sent"), timeout=1) == "sent"
+        stats = get_executor_pool("io").stats()
+        assert stats.running == 2
+        assert stats.queued == 2
+        assert stats.max_queued >= 2
+    finally:
+        release.set()
+        await asyncio.gather(*blocked)
+    assert get_executor_pool("io").stats().queued == 0
+
+
+async def test_flow_limit_keeps_one_flow_from_taking_the_whole_pool():
+    pool = ExecutorPool("test", max_workers=4, flow_limit=2)
+    release = threading.Event()
+    busy = [asyncio.create_task(pool.run(release.wait, flow_id="busy")) for _ in range(5)]
+    await asyncio.sleep(0.05)
+
+    try:
+        assert pool.stats().running == 2
+        assert pool.stats().waiting_for_flow == 3
+        assert await asyncio.wait_for(pool.run(lambda: "done", flow_id="other"), timeout=1) == "done"
+    finally:
+        release.set()
+        await asyncio.gather(*busy)
+    assert pool.stats().completed == 6
+    assert not pool._flow_slots
+    pool.shutdown()
+
+
+async def test_cancelled_calls_leave_the_queue():
+    pool = ExecutorPool("test", max_workers=1)
+    release = threading.Event()
+    running = asyncio.create_task(pool.run(release.wait))
+    queued = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    queued.cancel()
+    try:
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert pool.stats().queued == 0
+    finally:
+        release.set()
+        await running
+    pool.shutdown()
+
+
+def test_component_pools_can_be_declared_and_configured():
+    assert get_component_pool_name(Component) == "io"
+    assert get_component_pool_name(SplitTextComponent) == "cpu"
+
+    configure_executor_pools(sizes={"http": 8}, component_pools={"SplitTextComponent": "http"})
+
+    assert get_component_pool_name(SplitTextComponent) == "http"
+    assert get_executor_pool("http").max_workers == 8
+    with pytest.raises(ValueError, match="Unknown executor pool 'missing'"):
+        get_executor_pool("missing")
+
+
+async def test_sync_output_methods_run_in_the_component_pool():
+    component = SplitTextComponent(data_inputs=[], chunk_size=10)
+
+    await component._run_blocking(lambda: None)
+
+    assert {stats.name: stats.completed for stats in executor_pool_stats()} == {"cpu": 1}